@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+"""
+AEL iteration wall time benchmark
+
+Runs I iterations of the FAZA 28 AELController over N agents whose ticks
+await I/O-like delays (mostly fast, a few slow, one stuck):
+  - sequential             : ticks one after another (previous behaviour)
+  - concurrent             : asyncio.gather, bounded by max_concurrency
+  - concurrent + deadline  : as above, stuck ticks cancelled at the deadline
+
+Usage:
+    python benchmarks/bench_ael_tick.py
+    python benchmarks/bench_ael_tick.py --agents 200 --iterations 5
+"""
+
+import argparse
+import asyncio
+import logging
+import random
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from senti_os.core.faza28 import AELController, AgentBase, AgentManager, EventBus, StateContext
+
+
+class IOAgent(AgentBase):
+    priority = 10
+
+    def __init__(self, name: str, delay: float):
+        super().__init__()
+        self.name = name
+        self.delay = delay
+
+    async def on_tick(self, context):
+        await asyncio.sleep(self.delay)
+
+
+def build_manager(agents, rng):
+    manager = AgentManager()
+    for i in range(agents):
+        delay = 0.002 if rng.random() < 0.9 else 0.02
+        if i == 0:
+            delay = 0.5  # Stuck agent
+        manager.register(IOAgent(f"agent{i}", delay))
+    return manager
+
+
+def run(manager, iterations, **kwargs):
+    controller = AELController(
+        agent_manager=manager,
+        event_bus=EventBus(),
+        state_context=StateContext(),
+        **kwargs
+    )
+
+    async def loop():
+        for i in range(1, iterations + 1):
+            controller._iteration = i
+            start = time.perf_counter()
+            await controller._run_iteration()
+            controller.telemetry.record_iteration(time.perf_counter() - start)
+
+    asyncio.run(loop())
+    return controller.telemetry.get_stats()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--agents", type=int, default=100)
+    parser.add_argument("--iterations", type=int, default=3)
+    parser.add_argument("--concurrency", type=int, default=32)
+    parser.add_argument("--deadline", type=float, default=0.05)
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    logging.disable(logging.WARNING)
+    manager = build_manager(args.agents, random.Random(args.seed))
+
+    print(f"{args.agents} agents, {args.iterations} iterations")
+    print(f"{'mode':>22} | {'iter ms':>8} | {'worst p99 ms':>12} | {'misses':>6}")
+    print("-" * 58)
+    for label, kwargs in [
+        ("sequential", {}),
+        ("concurrent", {"tick_mode": "concurrent", "max_concurrency": args.concurrency}),
+        ("concurrent + deadline", {"tick_mode": "concurrent", "max_concurrency": args.concurrency,
+                                   "agent_deadline": args.deadline}),
+    ]:
+        stats = run(manager, args.iterations, **kwargs)
+        p99 = max(a["p99"] for a in stats["agents"].values())
+        print(f"{label:>22} | {stats['iteration_time_mean'] * 1e3:8.1f} | "
+              f"{p99 * 1e3:12.1f} | {stats['deadline_misses']:6d}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,112 @@
+#!/usr/bin/env python3
+"""
+Batch anomaly scoring benchmark
+
+Per-tick detection cost for A agents:
+  - FAZA 28.5: detect_all() per agent vs one detect_batch()
+  - FAZA 30:   detect_anomaly() per agent metric vs one detect_batch()
+  - score_windows on an agents x metrics x window matrix, pure Python
+    (nested lists) vs NumPy (array)
+
+Usage:
+    python benchmarks/bench_anomaly_batch.py
+    python benchmarks/bench_anomaly_batch.py --agents 1000 --ticks 50
+"""
+
+import argparse
+import logging
+import random
+import sys
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import numpy as np
+
+from senti_core_module.senti_stats import score_windows
+from senti_os.core.faza28_5.anomaly_detector import AnomalyDetector as MetaAnomalyDetector
+from senti_os.core.faza30.detection_engine import AnomalyDetector
+
+
+def bench_meta(agents, ticks, rng):
+    names = [f"agent{i}" for i in range(agents)]
+    ticks_scores = [{name: rng.gauss(0.7, 0.05) for name in names} for _ in range(ticks)]
+
+    timings = []
+    for batch in (False, True):
+        detector = MetaAnomalyDetector()
+        tick_time = datetime.now()
+        start = time.perf_counter()
+        for scores in ticks_scores:
+            tick_time += timedelta(seconds=1.0)
+            if batch:
+                detector.detect_batch(scores, tick_time=tick_time)
+            else:
+                for name, score in scores.items():
+                    detector.detect_all(name, score, tick_time)
+        timings.append((time.perf_counter() - start) / ticks)
+    return timings
+
+
+def bench_metric(agents, metrics, ticks, rng):
+    keys = [f"agent{a}.metric{m}" for a in range(agents) for m in range(metrics)]
+    ticks_samples = [{key: rng.gauss(50.0, 5.0) for key in keys} for _ in range(ticks)]
+
+    timings = []
+    for batch in (False, True):
+        detector = AnomalyDetector(window_size=20)
+        start = time.perf_counter()
+        for samples in ticks_samples:
+            if batch:
+                detector.detect_batch(samples)
+            else:
+                for key, value in samples.items():
+                    detector.detect_anomaly(key, value)
+        timings.append((time.perf_counter() - start) / ticks)
+    return timings
+
+
+def bench_windows(agents, metrics, window, rng):
+    windows = [[[rng.gauss(50.0, 5.0) for _ in range(window)] for _ in range(metrics)]
+               for _ in range(agents)]
+
+    start = time.perf_counter()
+    score_windows(windows, use_numpy=False)
+    python = time.perf_counter() - start
+
+    matrix = np.asarray(windows)
+    start = time.perf_counter()
+    score_windows(matrix, use_numpy=True)
+    return python, time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--agents", type=int, default=500)
+    parser.add_argument("--metrics", type=int, default=8)
+    parser.add_argument("--window", type=int, default=100)
+    parser.add_argument("--ticks", type=int, default=100)
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    logging.disable(logging.WARNING)
+    rng = random.Random(args.seed)
+
+    print(f"{args.agents} agents, {args.metrics} metrics, window {args.window}, {args.ticks} ticks")
+    print(f"{'case':>32} | {'loop ms':>9} | {'batch ms':>9}")
+    print("-" * 56)
+
+    loop, batch = bench_meta(args.agents, args.ticks, rng)
+    print(f"{'faza28_5 per tick':>32} | {loop * 1e3:9.2f} | {batch * 1e3:9.2f}")
+
+    loop, batch = bench_metric(args.agents, args.metrics, args.ticks, rng)
+    print(f"{'faza30 per tick':>32} | {loop * 1e3:9.2f} | {batch * 1e3:9.2f}")
+
+    python, vectorized = bench_windows(args.agents, args.metrics, args.window, rng)
+    print(f"{'score_windows python / numpy':>32} | {python * 1e3:9.2f} | {vectorized * 1e3:9.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,112 @@
+#!/usr/bin/env python3
+"""
+Anomaly detector per-sample cost benchmark
+
+Feeds M metrics x S samples through the FAZA 30 metric detector and the
+FAZA 28.5 score outlier check at several window sizes:
+  - legacy    : mean / stdev recomputed over the window on every sample
+  - streaming : senti_stats sliding windows (O(1) per sample)
+
+Usage:
+    python benchmarks/bench_anomaly_stats.py
+    python benchmarks/bench_anomaly_stats.py --metrics 100 --samples 500
+"""
+
+import argparse
+import logging
+import random
+import statistics
+import sys
+import time
+from collections import deque
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from senti_os.core.faza28_5.anomaly_detector import AnomalyDetector as MetaAnomalyDetector
+from senti_os.core.faza30.detection_engine import AnomalyDetector
+
+
+class LegacyAnomalyDetector:
+    """FAZA 30 detect_anomaly as it was before streaming statistics."""
+
+    def __init__(self, window_size: int, threshold: float = 3.0):
+        self.window_size = window_size
+        self.threshold = threshold
+        self.history = {}
+
+    def detect_anomaly(self, metric_name, value):
+        history = self.history.setdefault(metric_name, deque(maxlen=self.window_size))
+        if len(history) < self.window_size // 2:
+            history.append(value)
+            return False
+        mean = sum(history) / len(history)
+        std = (sum((x - mean) ** 2 for x in history) / len(history)) ** 0.5
+        history.append(value)
+        return std != 0 and abs((value - mean) / std) > self.threshold
+
+
+class LegacyMetaAnomalyDetector(MetaAnomalyDetector):
+    """FAZA 28.5 score outlier check on a list history (previous behaviour)."""
+
+    def _update_score_history(self, agent_name, score):
+        history = self.score_history.setdefault(agent_name, [])
+        history.append(score)
+        if len(history) > self.history_size:
+            self.score_history[agent_name] = history[-self.history_size:]
+
+    def _detect_statistical_anomalies(self, agent_name, current_score):
+        history = self.score_history.get(agent_name, [])
+        if len(history) < 30:
+            return []
+        mean = statistics.mean(history)
+        stdev = statistics.stdev(history)
+        return [] if stdev == 0 or abs(current_score - mean) / stdev <= self.outlier_z_score else [None]
+
+
+def run_metric(detector, samples):
+    start = time.perf_counter()
+    for metric_name, value in samples:
+        detector.detect_anomaly(metric_name, value)
+    return time.perf_counter() - start
+
+
+def run_meta(detector, samples):
+    start = time.perf_counter()
+    for agent_name, value in samples:
+        detector._update_score_history(agent_name, value)
+        detector._detect_statistical_anomalies(agent_name, value)
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--metrics", type=int, default=20)
+    parser.add_argument("--samples", type=int, default=2000)
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    logging.disable(logging.INFO)
+    rng = random.Random(args.seed)
+    samples = [
+        (f"metric{m}", rng.gauss(50.0, 5.0))
+        for _ in range(args.samples)
+        for m in range(args.metrics)
+    ]
+    count = len(samples)
+
+    print(f"{args.metrics} metrics x {args.samples} samples")
+    print(f"{'detector':>10} | {'window':>6} | {'legacy us':>9} | {'stream us':>9}")
+    print("-" * 45)
+    for window in (20, 100, 1000):
+        legacy = run_metric(LegacyAnomalyDetector(window), samples)
+        stream = run_metric(AnomalyDetector(window_size=window), samples)
+        print(f"{'faza30':>10} | {window:6d} | {legacy / count * 1e6:9.2f} | {stream / count * 1e6:9.2f}")
+    for window in (100, 1000):
+        legacy = run_meta(LegacyMetaAnomalyDetector(history_size=window), samples)
+        stream = run_meta(MetaAnomalyDetector(history_size=window), samples)
+        print(f"{'faza28_5':>10} | {window:6d} | {legacy / count * 1e6:9.2f} | {stream / count * 1e6:9.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,118 @@
+#!/usr/bin/env python3
+"""
+FAZA 44.2 - Task completion latency benchmark
+
+Measures the time from a task finishing to its waiter waking up:
+  - await.wait : AsyncAwaitCapability.wait() on a RuntimeDriver-run task
+                 (poll : previous 0.1s sleep loop, event : completion event)
+  - queue.get  : put() -> PriorityTaskQueue.get() hand-off to a waiting
+                 coroutine (poll : previous 0.1s sleep loop, event : waiter)
+
+Usage:
+    python benchmarks/bench_async_completion.py
+    python benchmarks/bench_async_completion.py --samples 50
+"""
+
+import argparse
+import asyncio
+import sys
+import threading
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from senti_core_module.senti_llm.runtime.async_exec import AsyncTaskManager, AsyncAwaitCapability
+from senti_core_module.senti_llm.runtime.runtime_driver import RuntimeDriver, latency_summary
+from senti_os.core.faza25 import PriorityTaskQueue, Task
+
+
+class PollingAwaitCapability(AsyncAwaitCapability):
+    """AsyncAwaitCapability.wait() as it was before completion events."""
+
+    def wait(self, task_id, timeout=30.0):
+        start = time.time()
+        while time.time() - start < timeout:
+            result = self.poll(task_id)
+            if result.get("is_done"):
+                return result
+            time.sleep(0.1)
+        return {"ok": False, "status": "timeout"}
+
+
+class PollingTaskQueue(PriorityTaskQueue):
+    """PriorityTaskQueue.get() as it was before waiter wakeups."""
+
+    async def get(self):
+        while True:
+            task = self.get_nowait()
+            if task is not None:
+                return task
+            await asyncio.sleep(0.1)
+
+
+def bench_wait(awaiter_cls, samples: int) -> dict:
+    manager = AsyncTaskManager()
+    driver = RuntimeDriver(None, manager, tick_interval=0.01)
+    awaiter = awaiter_cls(manager)
+    finished = {}
+
+    async def worker(delay):
+        await asyncio.sleep(delay)
+        finished["at"] = time.perf_counter()
+
+    latencies = []
+    driver.start()
+    try:
+        for i in range(samples):
+            # Vary the task duration so completions land at random poll phases
+            task_id = manager.create_task(worker(0.005 + (i * 37 % 50) / 1000))
+            awaiter.wait(task_id, timeout=5.0)
+            latencies.append(time.perf_counter() - finished["at"])
+    finally:
+        driver.stop()
+    return latency_summary(latencies)
+
+
+async def noop(task):
+    return None
+
+
+def bench_queue(queue_cls, samples: int) -> dict:
+    async def run():
+        queue = queue_cls()
+        latencies = []
+        for i in range(samples):
+            put_at = {}
+
+            def producer():
+                time.sleep(0.005 + (i * 37 % 50) / 1000)
+                put_at["at"] = time.perf_counter()
+                queue.put(Task(name="bench", executor=noop))
+
+            threading.Thread(target=producer).start()
+            await queue.get()
+            latencies.append(time.perf_counter() - put_at["at"])
+        return latency_summary(latencies)
+
+    return asyncio.run(run())
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--samples", type=int, default=30)
+    args = parser.parse_args()
+
+    print(f"{'path':>10} | {'mode':>5} | {'mean ms':>8} | {'p99 ms':>8}")
+    print("-" * 42)
+    for path, bench, legacy, current in (
+        ("await.wait", bench_wait, PollingAwaitCapability, AsyncAwaitCapability),
+        ("queue.get", bench_queue, PollingTaskQueue, PriorityTaskQueue),
+    ):
+        for mode, cls in (("poll", legacy), ("event", current)):
+            result = bench(cls, args.samples)
+            print(f"{path:>10} | {mode:>5} | {result['mean_ms']:8.2f} | {result['p99_ms']:8.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+"""
+FAZA 22 boot time benchmark
+
+Cold-boots the BootManager in a fresh interpreter per run (so every stack
+import is cold) and reports the median wall time of start():
+  - sequential        : one stack after another (previous behaviour)
+  - parallel          : dependency DAG on a thread pool
+  - parallel + lazy   : as above, FAZA 17 / 20 built on first access
+
+The io cases replace every stack constructor with a fixed sleep, modelling
+stacks whose init waits on disk or network rather than the GIL.
+
+Usage:
+    python benchmarks/bench_boot.py
+    python benchmarks/bench_boot.py --runs 10 --io-delay 0.2
+"""
+
+import argparse
+import json
+import logging
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from senti_os.core.faza22.boot_manager import BootManager
+
+CASES = [
+    ("sequential", {"parallel_boot": False}),
+    ("parallel", {"parallel_boot": True}),
+    ("parallel + lazy", {"parallel_boot": True, "enable_ux": False, "lazy_stacks": ["faza17"]}),
+]
+
+
+class IOStack:
+    def __init__(self, delay, **kwargs):
+        time.sleep(delay)
+
+
+def child(options, io_delay):
+    logging.disable(logging.CRITICAL)
+    BootManager.STATE_FILE = str(Path(tempfile.mkdtemp()) / "boot_state.json")
+    if io_delay:
+        BootManager._import_stack = lambda self, name: lambda **kwargs: IOStack(io_delay)
+
+    manager = BootManager(storage_dir=tempfile.mkdtemp(), **options)
+    start = time.perf_counter()
+    ok = manager.start()
+    elapsed = time.perf_counter() - start
+    manager.stop()
+    print(json.dumps({"ok": ok, "elapsed": elapsed}))
+
+
+def run(options, io_delay, runs):
+    timings = []
+    for _ in range(runs):
+        output = subprocess.run(
+            [sys.executable, __file__, "--child", json.dumps(options), "--io-delay", str(io_delay)],
+            capture_output=True, text=True, check=True
+        ).stdout
+        result = json.loads(output.strip().splitlines()[-1])
+        if not result["ok"]:
+            raise RuntimeError(f"Boot failed: {options}")
+        timings.append(result["elapsed"])
+    return statistics.median(timings)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--io-delay", type=float, default=0.1)
+    parser.add_argument("--child", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        child(json.loads(args.child), args.io_delay)
+        return
+
+    print(f"median of {args.runs} cold boots")
+    print(f"{'case':>16} | {'real ms':>8} | {f'io {args.io_delay * 1e3:.0f}ms':>8}")
+    print("-" * 38)
+    for label, options in CASES:
+        real = run(options, 0.0, args.runs)
+        io = run(options, args.io_delay, args.runs)
+        print(f"{label:>16} | {real * 1e3:8.1f} | {io * 1e3:8.1f}")
+
+
+if __name__ == "__main__":
+    main()
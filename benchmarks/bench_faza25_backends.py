@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+"""
+FAZA 25 - Execution backend throughput benchmark
+
+Submits N CPU-bound tasks (pure-Python loop) to an OrchestratorManager
+and measures wall time plus event loop stalls (how late a 10ms heartbeat
+coroutine wakes up while tasks run):
+  - asyncio : executors run on the worker event loop (previous behaviour)
+  - thread  : thread pool backend (GIL-bound for pure-Python work)
+  - process : process pool backend (one process per core)
+
+Usage:
+    python benchmarks/bench_faza25_backends.py
+    python benchmarks/bench_faza25_backends.py --tasks 32 --work 2000000
+"""
+
+import argparse
+import asyncio
+import logging
+import os
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from senti_os.core.faza25 import OrchestratorManager, TaskStatus
+
+
+def crunch(task):
+    total = 0
+    for i in range(task.context["work"]):
+        total += i * i
+    return total
+
+
+async def crunch_async(task):
+    return crunch(task)
+
+
+async def bench(mode: str, tasks: int, work: int, workers: int) -> dict:
+    orchestrator = OrchestratorManager(num_workers=workers)
+    await orchestrator.start()
+
+    stalls = []
+    running = True
+
+    async def heartbeat():
+        while running:
+            start = time.perf_counter()
+            await asyncio.sleep(0.01)
+            stalls.append(time.perf_counter() - start - 0.01)
+
+    beat = asyncio.create_task(heartbeat())
+    await asyncio.sleep(0.02)  # heartbeat is sleeping before work arrives
+    start = time.perf_counter()
+    task_ids = [
+        orchestrator.submit_task(
+            name=f"crunch {i}",
+            executor=crunch_async if mode == "asyncio" else crunch,
+            context={"work": work},
+            execution_mode=mode
+        )
+        for i in range(tasks)
+    ]
+    while any(orchestrator.tasks[t].status in (TaskStatus.QUEUED, TaskStatus.RUNNING) for t in task_ids):
+        await asyncio.sleep(0.005)
+    elapsed = time.perf_counter() - start
+
+    running = False
+    await beat
+    await orchestrator.stop()
+    return {"wall_s": elapsed, "stall_max_ms": max(stalls, default=0.0) * 1000}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--tasks", type=int, default=16)
+    parser.add_argument("--work", type=int, default=1_000_000)
+    parser.add_argument("--workers", type=int, default=3)
+    args = parser.parse_args()
+
+    logging.disable(logging.CRITICAL)
+    print(f"cpus={os.cpu_count()} tasks={args.tasks} work={args.work} workers={args.workers}")
+    print(f"{'mode':>8} | {'wall s':>7} | {'tasks/s':>7} | {'loop stall max ms':>17}")
+    print("-" * 48)
+    for mode in ("asyncio", "thread", "process"):
+        result = asyncio.run(bench(mode, args.tasks, args.work, args.workers))
+        print(f"{mode:>8} | {result['wall_s']:7.2f} | {args.tasks / result['wall_s']:7.1f} | "
+              f"{result['stall_max_ms']:17.1f}")
+
+
+if __name__ == "__main__":
+    main()
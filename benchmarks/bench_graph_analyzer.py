@@ -0,0 +1,112 @@
+#!/usr/bin/env python3
+"""
+FAZA 27 - GraphAnalyzer analytics benchmark
+
+Builds a random DAG (N nodes, E edges), then simulates a monitor that
+queries health, critical path and levels after every event while the
+graph changes by one edge (add or remove) every --every events:
+  - uncached    : fresh analyzer per query (previous behaviour: every
+                  query recomputes from scratch)
+  - cached      : one analyzer, results cached per graph version and
+                  levels / critical path updated incrementally
+
+Also times one full levels + influence computation, pure Python vs NumPy
+(CSR adjacency), if NumPy is installed.
+
+Usage:
+    python benchmarks/bench_graph_analyzer.py
+    python benchmarks/bench_graph_analyzer.py --nodes 5000 --edges 20000 --events 200
+"""
+
+import argparse
+import logging
+import random
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from senti_os.core.faza27 import GraphAnalyzer, TaskEdge, TaskGraph, TaskNode
+from senti_os.core.faza27 import graph_analyzer
+
+
+def build_graph(nodes: int, edges: int, seed: int) -> TaskGraph:
+    rng = random.Random(seed)
+    graph = TaskGraph()
+    for i in range(nodes):
+        node = TaskNode(f"n{i}", f"Node {i}")
+        node.cost_model.estimated_duration = rng.uniform(0.1, 5.0)
+        graph.add_node(node)
+
+    pairs = set()
+    while len(pairs) < edges:
+        a, b = sorted(rng.sample(range(nodes), 2))
+        pairs.add((a, b))
+    graph.add_edges(TaskEdge(f"n{a}", f"n{b}") for a, b in pairs)
+    return graph
+
+
+def query(analyzer: GraphAnalyzer) -> None:
+    analyzer.calculate_graph_health()
+    analyzer.find_critical_nodes()
+    analyzer.find_parallel_stages()
+
+
+def run_events(graph: TaskGraph, events: int, every: int, cached: bool, seed: int) -> float:
+    rng = random.Random(seed)
+    node_count = len(graph.nodes)
+    analyzer = GraphAnalyzer(graph, use_numpy=False)
+    query(analyzer)
+
+    start = time.perf_counter()
+    for event in range(events):
+        if event % every == 0:
+            a, b = sorted(rng.sample(range(node_count), 2))
+            if graph.has_edge(f"n{a}", f"n{b}"):
+                graph.remove_edge(f"n{a}", f"n{b}")
+            else:
+                graph.add_edge(TaskEdge(f"n{a}", f"n{b}"))
+        query(analyzer if cached else GraphAnalyzer(graph, use_numpy=False))
+    return time.perf_counter() - start
+
+
+def full_compute(graph: TaskGraph, use_numpy: bool) -> float:
+    analyzer = GraphAnalyzer(graph, use_numpy=use_numpy)
+    start = time.perf_counter()
+    analyzer.get_node_levels()
+    analyzer.calculate_influence_scores()
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--nodes", type=int, default=5000)
+    parser.add_argument("--edges", type=int, default=20000)
+    parser.add_argument("--events", type=int, default=200)
+    parser.add_argument("--every", type=int, default=10)
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    logging.disable(logging.INFO)
+
+    print(f"{args.nodes} nodes, {args.edges} edges, {args.events} queries, "
+          f"1 edge change per {args.every} queries")
+    print(f"{'mode':>10} | {'total s':>9} | {'per query ms':>12}")
+    print("-" * 38)
+    for mode in ("uncached", "cached"):
+        graph = build_graph(args.nodes, args.edges, args.seed)
+        elapsed = run_events(graph, args.events, args.every, mode == "cached", args.seed)
+        print(f"{mode:>10} | {elapsed:9.3f} | {elapsed / args.events * 1000:12.3f}")
+
+    print()
+    graph = build_graph(args.nodes, args.edges, args.seed)
+    print(f"full levels + influence, python: {full_compute(graph, False) * 1000:8.1f} ms")
+    if graph_analyzer.np is not None:
+        print(f"full levels + influence, numpy : {full_compute(graph, True) * 1000:8.1f} ms")
+    else:
+        print("full levels + influence, numpy : (NumPy not installed)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+"""
+FAZA D.1.1 - LoggingManager throughput benchmark
+
+Measures records/sec with 1, 8 and 32 concurrent logger threads for:
+  - legacy    : open/append/close per record (previous FileSink)
+  - direct    : FileSink with a kept-open file (buffered=False)
+  - buffered  : AsyncSink queue + background batch writer (default)
+Buffered timings include the final flush(), so every record is on disk.
+
+Usage:
+    python benchmarks/bench_logging_manager.py
+    python benchmarks/bench_logging_manager.py --records 20000 --threads 1 8 32
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from senti_core_module.senti_llm.runtime.logging_manager import (
+    LoggingManager,
+    LogRecord,
+    LogSink,
+)
+
+
+class LegacyFileSink(LogSink):
+    """The previous FileSink: one open/write/close per record."""
+
+    def __init__(self, filepath: str):
+        self.filepath = filepath
+        self._lock = threading.Lock()
+
+    def write(self, record: LogRecord):
+        with self._lock:
+            with open(self.filepath, "a", encoding="utf-8") as f:
+                f.write(record.format() + "\n")
+
+
+def bench(mode: str, threads: int, records: int, directory: str) -> dict:
+    """Return records/sec and drop count for one mode/thread combination."""
+    filepath = os.path.join(directory, f"{mode}_{threads}.log")
+    manager = LoggingManager()
+    if mode == "legacy":
+        manager.add_sink(LegacyFileSink(filepath))
+    else:
+        manager.enable_file_logging(
+            filepath,
+            buffered=(mode == "buffered"),
+            # Large enough that the benchmark measures throughput, not drops
+            queue_size=records * threads
+        )
+
+    per_thread = records
+    barrier = threading.Barrier(threads + 1)
+
+    def worker(index: int):
+        logger = manager.get_logger(f"bench_{index}", phase="FAZA D.1.1")
+        barrier.wait()
+        for i in range(per_thread):
+            logger.info("benchmark record", seq=i)
+
+    workers = [threading.Thread(target=worker, args=(i,)) for i in range(threads)]
+    for thread in workers:
+        thread.start()
+
+    barrier.wait()
+    start = time.perf_counter()
+    for thread in workers:
+        thread.join()
+    manager.flush()
+    elapsed = time.perf_counter() - start
+
+    dropped = manager.get_stats().get("dropped", 0)
+    manager.close()
+    return {
+        "rate": per_thread * threads / elapsed,
+        "dropped": dropped
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--records", type=int, default=5_000,
+                        help="records per logger thread")
+    parser.add_argument("--threads", type=int, nargs="+", default=[1, 8, 32])
+    args = parser.parse_args()
+
+    print(f"{'mode':>10} | {'threads':>7} | {'records/s':>12} | {'dropped':>7}")
+    print("-" * 46)
+    with tempfile.TemporaryDirectory() as directory:
+        for mode in ("legacy", "direct", "buffered"):
+            for threads in args.threads:
+                result = bench(mode, threads, args.records, directory)
+                print(f"{mode:>10} | {threads:>7} | {result['rate']:12,.0f} | "
+                      f"{result['dropped']:>7}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,79 @@
+#!/usr/bin/env python3
+"""
+FAZA 12 - MemoryStore write-cost benchmark
+
+Measures the per-write cost of recording an episodic event on top of an
+existing history of N events, for the JSON MemoryStore (full rewrite per
+write) and the WALMemoryStore (append per write).
+
+Usage:
+    python benchmarks/bench_memory_store_wal.py
+    python benchmarks/bench_memory_store_wal.py --sizes 1000 10000 100000 1000000
+"""
+
+import argparse
+import shutil
+import sys
+import tempfile
+import time
+from datetime import datetime
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from senti_core_module.senti_memory import MemoryStore, WALMemoryStore
+
+
+def make_event(i: int) -> dict:
+    return {
+        "event_type": f"type_{i % 16}",
+        "timestamp": datetime.now().isoformat(),
+        "payload": {"index": i, "message": f"event number {i}"}
+    }
+
+
+def bench(store_cls, history: int, writes: int) -> float:
+    """Return mean microseconds per write on top of `history` events."""
+    storage_dir = Path(tempfile.mkdtemp(prefix="bench_mem_"))
+    try:
+        store = store_cls(storage_dir)
+        events = [make_event(i) for i in range(history)]
+        store.save_episodic_events(events)
+
+        start = time.perf_counter()
+        for i in range(writes):
+            event = make_event(history + i)
+            events.append(event)
+            store.commit_episodic_event(event, events)
+        store.flush()
+        elapsed = time.perf_counter() - start
+
+        store.close()
+        return elapsed / writes * 1e6
+    finally:
+        shutil.rmtree(storage_dir, ignore_errors=True)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--sizes", type=int, nargs="+",
+                        default=[1_000, 10_000, 100_000, 1_000_000])
+    parser.add_argument("--writes", type=int, default=2_000)
+    parser.add_argument("--json-max", type=int, default=10_000,
+                        help="skip the JSON store above this history size")
+    args = parser.parse_args()
+
+    print(f"{'history':>10} | {'json us/write':>14} | {'wal us/write':>13}")
+    print("-" * 44)
+    for size in args.sizes:
+        if size <= args.json_max:
+            # The JSON store is O(history) per write; keep its run short.
+            json_cost = f"{bench(MemoryStore, size, max(20, args.writes // 50)):14.1f}"
+        else:
+            json_cost = f"{'skipped':>14}"
+        wal_cost = bench(WALMemoryStore, size, args.writes)
+        print(f"{size:>10} | {json_cost} | {wal_cost:13.1f}")
+
+
+if __name__ == "__main__":
+    main()
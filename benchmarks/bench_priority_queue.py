@@ -0,0 +1,167 @@
+#!/usr/bin/env python3
+"""
+FAZA 17 / FAZA 25 - Priority queue operation benchmark
+
+Fills a queue with N tasks and measures mean microseconds per operation:
+  - legacy  : previous list + heapq implementation (linear scan and
+              heapify per remove/update, aging scan per dequeue, sort per
+              get_position)
+  - indexed : IndexedPriorityQueue (id index, lazy deletion, aging via
+              virtual clock)
+
+Usage:
+    python benchmarks/bench_priority_queue.py
+    python benchmarks/bench_priority_queue.py --tasks 100000 --ops 50
+"""
+
+import argparse
+import heapq
+import logging
+import random
+import sys
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from senti_os.core.faza17.priority_queue import Priority, PriorityQueue, QueuedTask
+from senti_os.core.faza25 import PriorityTaskQueue, Task
+
+
+class LegacyFaza17Queue:
+    """faza17 PriorityQueue operations as they were before the index."""
+
+    def __init__(self):
+        self.queue = []
+
+    def enqueue(self, task):
+        heapq.heappush(self.queue, task)
+
+    def dequeue(self):
+        now = datetime.now()
+        threshold = timedelta(seconds=300)
+        for task in self.queue:
+            if now - task.submission_time > threshold and task.priority != Priority.HIGH:
+                task.priority = Priority(task.priority.value - 1)
+        return heapq.heappop(self.queue) if self.queue else None
+
+    def remove_task(self, task_id):
+        for i, task in enumerate(self.queue):
+            if task.task_id == task_id:
+                self.queue.pop(i)
+                heapq.heapify(self.queue)
+                return True
+        return False
+
+    def update_priority(self, task_id, new_priority):
+        for task in self.queue:
+            if task.task_id == task_id:
+                task.priority = new_priority
+                heapq.heapify(self.queue)
+                return True
+        return False
+
+    def get_position(self, task_id):
+        for i, task in enumerate(sorted(self.queue)):
+            if task.task_id == task_id:
+                return i
+        return None
+
+    def get_task(self, task_id):
+        for task in self.queue:
+            if task.task_id == task_id:
+                return task
+        return None
+
+    def get_statistics(self):
+        by_priority = {p: sum(1 for t in self.queue if t.priority == p) for p in Priority}
+        waits = [(datetime.now() - t.submission_time).total_seconds() for t in self.queue]
+        return by_priority, sum(waits) / len(waits)
+
+
+class LegacyTaskQueue:
+    """faza25 PriorityTaskQueue.remove_task as it was before the index."""
+
+    def __init__(self):
+        self._heap = []
+        self._counter = 0
+
+    def put(self, task):
+        heapq.heappush(self._heap, (task, self._counter))
+        self._counter += 1
+
+    def remove_task(self, task_id):
+        for i, (task, _) in enumerate(self._heap):
+            if task.id == task_id:
+                self._heap.pop(i)
+                heapq.heapify(self._heap)
+                return True
+        return False
+
+
+def timed(fn, args_list) -> float:
+    """Mean microseconds per call."""
+    start = time.perf_counter()
+    for args in args_list:
+        fn(*args)
+    return (time.perf_counter() - start) / len(args_list) * 1e6
+
+
+async def noop(task):
+    return None
+
+
+def bench_faza17(queue, tasks: int, ops: int) -> dict:
+    now = datetime.now()
+    ids = [f"task_{i}" for i in range(tasks)]
+    for i, task_id in enumerate(ids):
+        queue.enqueue(QueuedTask(task_id, random.choice(list(Priority)),
+                                 now - timedelta(seconds=i % 600), 60, 1.0))
+
+    picks = random.sample(ids, 4 * ops)
+    return {
+        "get_task": timed(queue.get_task, [(t,) for t in picks[:ops]]),
+        "get_position": timed(queue.get_position, [(t,) for t in picks[:ops // 10 or 1]]),
+        "update_priority": timed(queue.update_priority, [(t, Priority.HIGH) for t in picks[ops:2 * ops]]),
+        "remove_task": timed(queue.remove_task, [(t,) for t in picks[2 * ops:3 * ops]]),
+        "dequeue": timed(queue.dequeue, [()] * ops),
+        "get_statistics": timed(queue.get_statistics, [()] * (ops // 10 or 1)),
+    }
+
+
+def bench_faza25(queue, tasks: int, ops: int) -> dict:
+    items = [Task(name=str(i), executor=noop, priority=random.randint(0, 10)) for i in range(tasks)]
+    for task in items:
+        queue.put(task)
+    picks = random.sample(items, ops)
+    return {"remove_task": timed(queue.remove_task, [(t.id,) for t in picks])}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--tasks", type=int, default=100_000)
+    parser.add_argument("--ops", type=int, default=50)
+    args = parser.parse_args()
+
+    logging.disable(logging.CRITICAL)
+    PriorityQueue.MAX_QUEUE_SIZE = args.tasks
+    random.seed(7)
+
+    results = [
+        ("faza17", bench_faza17(LegacyFaza17Queue(), args.tasks, args.ops),
+         bench_faza17(PriorityQueue(), args.tasks, args.ops)),
+        ("faza25", bench_faza25(LegacyTaskQueue(), args.tasks, args.ops),
+         bench_faza25(PriorityTaskQueue(), args.tasks, args.ops)),
+    ]
+
+    print(f"tasks={args.tasks}")
+    print(f"{'queue':>7} | {'operation':>15} | {'legacy us/op':>12} | {'indexed us/op':>13}")
+    print("-" * 58)
+    for name, legacy, indexed in results:
+        for op in legacy:
+            print(f"{name:>7} | {op:>15} | {legacy[op]:12.1f} | {indexed[op]:13.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+"""
+FAZA 44.1 - Command latency and scheduler jitter benchmark
+
+Registers N interval tasks (each burns ~work_ms of CPU) on the
+orchestrator's scheduler and issues "query.status" actions:
+  - inline : execute() ticks scheduler + async manager before each action
+  - driver : RuntimeDriver ticks them in its own thread
+
+Reports execute() latency (mean/p99) and, for the driver, how late
+scheduled ticks ran (jitter).
+
+Usage:
+    python benchmarks/bench_runtime_driver.py
+    python benchmarks/bench_runtime_driver.py --tasks 20 --work-ms 1 --commands 200
+"""
+
+import argparse
+import contextlib
+import io
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from senti_core_module.senti_llm.runtime.action_model import RuntimeAction
+from senti_core_module.senti_llm.runtime.execution_orchestrator import ExecutionOrchestrator
+from senti_core_module.senti_llm.runtime.runtime_driver import RuntimeDriver
+
+
+def burn(seconds: float):
+    end = time.perf_counter() + seconds
+    while time.perf_counter() < end:
+        pass
+
+
+def bench(use_driver: bool, tasks: int, work_ms: float, commands: int) -> dict:
+    orchestrator = ExecutionOrchestrator()
+    scheduler = orchestrator.module_loader.scheduler
+    for _ in range(tasks):
+        scheduler.schedule_interval(lambda: burn(work_ms / 1000), interval=0.01)
+
+    driver = None
+    if use_driver:
+        driver = RuntimeDriver(
+            scheduler,
+            orchestrator.module_loader.async_manager,
+            tick_interval=0.01
+        )
+        driver.start()
+        orchestrator.driver = driver
+
+    action = RuntimeAction(action_type="query.status", payload={}, source="bench")
+    with contextlib.redirect_stdout(io.StringIO()):
+        for _ in range(commands):
+            orchestrator.execute(action)
+            time.sleep(0.005)
+
+    result = {"latency": orchestrator.get_latency_stats()}
+    if driver:
+        driver.stop()
+        result["jitter"] = driver.get_stats()["jitter"]
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--tasks", type=int, default=20)
+    parser.add_argument("--work-ms", type=float, default=1.0)
+    parser.add_argument("--commands", type=int, default=200)
+    args = parser.parse_args()
+
+    # The orchestrator's global logger writes under ./senti_data
+    with tempfile.TemporaryDirectory() as directory:
+        os.chdir(directory)
+        print(f"{'mode':>8} | {'cmd mean ms':>11} | {'cmd p99 ms':>10} | {'jitter p99 ms':>13}")
+        print("-" * 52)
+        for mode in ("inline", "driver"):
+            result = bench(mode == "driver", args.tasks, args.work_ms, args.commands)
+            latency = result["latency"]
+            jitter = result.get("jitter")
+            jitter_text = f"{jitter['p99_ms']:13.2f}" if jitter else f"{'-':>13}"
+            print(f"{mode:>8} | {latency['mean_ms']:11.2f} | {latency['p99_ms']:10.2f} | {jitter_text}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+"""
+FAZA 44 - Runtime EventBus publish-overhead benchmark
+
+Measures Scheduler.tick() + AsyncTaskManager tick-event cost with:
+  - no listeners       : has_listeners() short-circuits, no EventContext
+  - exact listener     : "system.scheduler.tick"
+  - wildcard listener  : "system.**"
+and raw EventBus.publish() throughput against N wildcard patterns.
+
+Usage:
+    python benchmarks/bench_runtime_event_bus.py
+    python benchmarks/bench_runtime_event_bus.py --ticks 200000 --patterns 100
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from senti_core_module.senti_llm.runtime.event_bus import EventBus
+from senti_core_module.senti_llm.runtime.event_context import EventContext
+from senti_core_module.senti_llm.runtime.scheduler import Scheduler
+
+
+def bench_ticks(pattern, ticks: int) -> float:
+    """Return mean microseconds per scheduler tick."""
+    event_bus = EventBus()
+    scheduler = Scheduler(event_bus=event_bus)
+    event_bus.set_scheduler(scheduler)
+    if pattern:
+        event_bus.subscribe(pattern, lambda ctx: None)
+
+    now = time.time()
+    start = time.perf_counter()
+    for i in range(ticks):
+        scheduler.tick(now + i)
+    return (time.perf_counter() - start) / ticks * 1e6
+
+
+def bench_publish(patterns: int, publishes: int) -> float:
+    """Return mean microseconds per publish with `patterns` subscriptions."""
+    event_bus = EventBus()
+    for i in range(patterns):
+        event_bus.subscribe(f"module_{i}.*", lambda ctx: None)
+    event_bus.subscribe("system.**", lambda ctx: None)
+
+    ctx = EventContext("system.scheduler.tick", "bench", {})
+    start = time.perf_counter()
+    for _ in range(publishes):
+        event_bus.publish("system.scheduler.tick", ctx)
+    return (time.perf_counter() - start) / publishes * 1e6
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--ticks", type=int, default=100_000)
+    parser.add_argument("--patterns", type=int, default=50)
+    args = parser.parse_args()
+
+    print(f"{'scenario':>20} | {'us/op':>8}")
+    print("-" * 31)
+    for name, pattern in (("no listeners", None),
+                          ("exact listener", "system.scheduler.tick"),
+                          ("wildcard listener", "system.**")):
+        print(f"{name:>20} | {bench_ticks(pattern, args.ticks):8.2f}")
+
+    cost = bench_publish(args.patterns, args.ticks)
+    print(f"{f'publish, {args.patterns} patterns':>20} | {cost:8.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,135 @@
+#!/usr/bin/env python3
+"""
+FAZA 12 - SemanticMemory concurrency benchmark
+
+Runs N reader threads (get_fact / fact_exists / get_facts_by_metadata
+on a sampled subset) and M writer threads (save_fact) against:
+  - global-lock : the previous design (one Lock, disk write inside it)
+  - sharded     : lock-striped shards, lock-free snapshot reads,
+                  write-through persistence outside the shard lock
+  - sharded+bg  : as above with the background flusher
+
+Usage:
+    python benchmarks/bench_semantic_memory_concurrency.py
+    python benchmarks/bench_semantic_memory_concurrency.py --readers 8 --writers 2 --facts 5000
+"""
+
+import argparse
+import random
+import shutil
+import sys
+import tempfile
+import threading
+import time
+from datetime import datetime
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from senti_core_module.senti_memory import MemoryStore, SemanticMemory
+
+
+class GlobalLockSemanticMemory:
+    """Reference copy of the previous locking scheme (hot paths only)."""
+
+    def __init__(self, memory_store):
+        self.store = memory_store
+        self.lock = threading.Lock()
+        self.facts = self.store.load_semantic_facts()
+
+    def save_fact(self, key, value, metadata=None):
+        with self.lock:
+            existing = self.facts.get(key)
+            self.facts[key] = {
+                "value": value,
+                "updated_at": datetime.now().isoformat(),
+                "created_at": existing.get("created_at") if existing else datetime.now().isoformat(),
+                "metadata": {**(existing or {}).get("metadata", {}), **(metadata or {})}
+            }
+            return self.store.save_semantic_facts(self.facts)
+
+    def get_fact(self, key):
+        with self.lock:
+            entry = self.facts.get(key)
+            return entry["value"] if entry else None
+
+    def fact_exists(self, key):
+        with self.lock:
+            return key in self.facts
+
+    def close(self):
+        pass
+
+
+def run(memory, readers: int, writers: int, facts: int, seconds: float) -> dict:
+    stop = threading.Event()
+    counts = {"reads": 0, "writes": 0}
+    counts_lock = threading.Lock()
+
+    def reader():
+        rng = random.Random()
+        done = 0
+        while not stop.is_set():
+            key = f"fact_{rng.randrange(facts)}"
+            memory.get_fact(key)
+            memory.fact_exists(key)
+            done += 2
+        with counts_lock:
+            counts["reads"] += done
+
+    def writer():
+        rng = random.Random()
+        done = 0
+        while not stop.is_set():
+            memory.save_fact(f"fact_{rng.randrange(facts)}", rng.random())
+            done += 1
+        with counts_lock:
+            counts["writes"] += done
+
+    threads = [threading.Thread(target=reader) for _ in range(readers)]
+    threads += [threading.Thread(target=writer) for _ in range(writers)]
+    for t in threads:
+        t.start()
+    time.sleep(seconds)
+    stop.set()
+    for t in threads:
+        t.join()
+    memory.close()
+
+    return {k: v / seconds for k, v in counts.items()}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--readers", type=int, default=8)
+    parser.add_argument("--writers", type=int, default=2)
+    parser.add_argument("--facts", type=int, default=2000)
+    parser.add_argument("--seconds", type=float, default=3.0)
+    args = parser.parse_args()
+
+    variants = [
+        ("global-lock", lambda store: GlobalLockSemanticMemory(store)),
+        ("sharded", lambda store: SemanticMemory(store)),
+        ("sharded+bg", lambda store: SemanticMemory(store, flush_interval=0.1)),
+    ]
+
+    print(f"readers={args.readers} writers={args.writers} facts={args.facts}")
+    print(f"{'variant':>12} | {'reads/s':>12} | {'writes/s':>10}")
+    print("-" * 41)
+
+    for name, factory in variants:
+        storage_dir = Path(tempfile.mkdtemp(prefix="bench_sem_"))
+        try:
+            store = MemoryStore(storage_dir)
+            store.save_semantic_facts({
+                f"fact_{i}": {"value": i, "created_at": "", "updated_at": "", "metadata": {}}
+                for i in range(args.facts)
+            })
+            result = run(factory(store), args.readers, args.writers, args.facts, args.seconds)
+            print(f"{name:>12} | {result['reads']:12.0f} | {result['writes']:10.0f}")
+        finally:
+            shutil.rmtree(storage_dir, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    main()
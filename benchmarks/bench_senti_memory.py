@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+"""
+SentiMemory store / recall benchmark
+
+Stores N items spread over the categories, then runs Q recall queries
+(rare term: few matches) with each backend:
+  - json   : category JSON files, rewritten per store; recall scans all
+  - sqlite : one table per category, FTS5 trigram index for recall
+
+Usage:
+    python benchmarks/bench_senti_memory.py
+    python benchmarks/bench_senti_memory.py --items 2000 --queries 200
+"""
+
+import argparse
+import random
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from modules.processing.senti_memory.senti_memory import CATEGORIES, SentiMemory
+
+
+METADATA = {"module": "bench", "timestamp": "2025-01-01T00:00:00Z"}
+WORDS = ["market", "trend", "signal", "report", "sensor", "status", "user", "cache", "index", "query"]
+
+
+def bench(backend: str, items: int, queries: int, seed: int) -> dict:
+    rng = random.Random(seed)
+    with tempfile.TemporaryDirectory() as directory:
+        memory = SentiMemory(backend=backend, memory_root=Path(directory))
+
+        start = time.perf_counter()
+        for i in range(items):
+            data = {
+                "analysis": " ".join(rng.choice(WORDS) for _ in range(12)),
+                "decision": f"ticket-{i:06d}"
+            }
+            memory.store(data, rng.choice(CATEGORIES), METADATA)
+        store_time = time.perf_counter() - start
+
+        start = time.perf_counter()
+        matches = 0
+        for _ in range(queries):
+            matches += len(memory.recall(f"TICKET-{rng.randrange(items):06d}")["results"])
+        recall_time = time.perf_counter() - start
+
+    return {
+        "store_ms": store_time / items * 1000,
+        "recall_ms": recall_time / queries * 1000,
+        "matches": matches
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--items", type=int, default=2000)
+    parser.add_argument("--queries", type=int, default=200)
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    print(f"{args.items} items, {args.queries} queries")
+    print(f"{'backend':>8} | {'store ms/item':>13} | {'recall ms/query':>15} | {'matches':>7}")
+    print("-" * 54)
+    for backend in ("json", "sqlite"):
+        result = bench(backend, args.items, args.queries, args.seed)
+        print(f"{backend:>8} | {result['store_ms']:13.3f} | {result['recall_ms']:15.3f} | {result['matches']:7d}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,179 @@
+#!/usr/bin/env python3
+"""
+StateContext read / write / history benchmark
+
+  - reads   : T threads doing get() while one thread keeps writing
+  - history : get_history(key) with a full history ring
+  - writes  : set() with history eviction (list.pop(0) vs ring buffer)
+  - iteration: A agents doing 10 reads + 1 write each; new = snapshot
+    reads and buffered writes committed at the end (with conflict checks)
+
+legacy = one Lock around every call, list history scanned per key
+(previous StateContext).
+
+Usage:
+    python benchmarks/bench_state_context.py
+    python benchmarks/bench_state_context.py --threads 16 --history 10000
+"""
+
+import argparse
+import logging
+import sys
+import threading
+import time
+from datetime import datetime
+from pathlib import Path
+from threading import Lock
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from senti_os.core.faza28.state_context import StateContext
+
+
+class LegacyStateContext:
+    """StateContext get / set / history as it was before versioning."""
+
+    def __init__(self, max_history: int = 100):
+        self._state = {}
+        self._lock = Lock()
+        self._history = []
+        self._max_history = max_history
+
+    def get(self, key, default=None):
+        with self._lock:
+            return self._state.get(key, default)
+
+    def set(self, key, value):
+        with self._lock:
+            old_value = self._state.get(key)
+            self._state[key] = value
+            self._history.append({
+                "timestamp": datetime.now().isoformat(),
+                "operation": "set",
+                "key": key,
+                "old_value": old_value,
+                "new_value": value
+            })
+            if len(self._history) > self._max_history:
+                self._history.pop(0)
+
+    def get_history(self, key=None):
+        with self._lock:
+            if key is None:
+                return list(self._history)
+            return [h for h in self._history if h.get("key") == key]
+
+
+def bench_reads(state, threads, reads):
+    for i in range(100):
+        state.set(f"key{i}", i)
+
+    stop = threading.Event()
+
+    def writer():
+        i = 0
+        while not stop.is_set():
+            state.set(f"key{i % 100}", i)
+            i += 1
+            time.sleep(0)
+
+    def reader():
+        get = state.get
+        for i in range(reads):
+            get(f"key{i % 100}")
+
+    writer_thread = threading.Thread(target=writer)
+    writer_thread.start()
+    workers = [threading.Thread(target=reader) for _ in range(threads)]
+    start = time.perf_counter()
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join()
+    elapsed = time.perf_counter() - start
+    stop.set()
+    writer_thread.join()
+    return elapsed / (threads * reads)
+
+
+def bench_history(state, history, queries):
+    for i in range(history):
+        state.set(f"key{i % 50}", i)
+    start = time.perf_counter()
+    for i in range(queries):
+        state.get_history(f"key{i % 50}")
+    return (time.perf_counter() - start) / queries
+
+
+def bench_writes(state, writes):
+    start = time.perf_counter()
+    for i in range(writes):
+        state.set(f"key{i % 100}", i)
+    return (time.perf_counter() - start) / writes
+
+
+def bench_iteration_legacy(agents, iterations):
+    state = LegacyStateContext()
+    for i in range(200):
+        state.set(f"key{i}", i)
+
+    start = time.perf_counter()
+    for it in range(iterations):
+        for a in range(agents):
+            for i in range(10):
+                state.get(f"key{(a + i) % 200}")
+            state.set(f"agent{a}_status", it)
+    return (time.perf_counter() - start) / iterations
+
+
+def bench_iteration(agents, iterations):
+    state = StateContext()
+    for i in range(200):
+        state.set(f"key{i}", i)
+
+    start = time.perf_counter()
+    for it in range(iterations):
+        snapshot = state.snapshot()
+        transactions = [state.transaction(f"agent{a}", snapshot) for a in range(agents)]
+        for a, transaction in enumerate(transactions):
+            for i in range(10):
+                transaction.get(f"key{(a + i) % 200}")
+            transaction.set(f"agent{a}_status", it)
+        for transaction in transactions:
+            state.commit(transaction)
+    return (time.perf_counter() - start) / iterations
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--threads", type=int, default=8)
+    parser.add_argument("--reads", type=int, default=100000)
+    parser.add_argument("--history", type=int, default=5000)
+    parser.add_argument("--writes", type=int, default=100000)
+    parser.add_argument("--agents", type=int, default=200)
+    args = parser.parse_args()
+
+    logging.disable(logging.INFO)
+
+    print(f"{'case':>28} | {'legacy us':>10} | {'new us':>10}")
+    print("-" * 54)
+
+    legacy = bench_reads(LegacyStateContext(), args.threads, args.reads)
+    new = bench_reads(StateContext(), args.threads, args.reads)
+    print(f"{f'get, {args.threads} threads + writer':>28} | {legacy * 1e6:10.3f} | {new * 1e6:10.3f}")
+
+    legacy = bench_history(LegacyStateContext(args.history), args.history, 500)
+    new = bench_history(StateContext(max_history=args.history), args.history, 500)
+    print(f"{f'get_history(key), {args.history}':>28} | {legacy * 1e6:10.1f} | {new * 1e6:10.1f}")
+
+    legacy = bench_writes(LegacyStateContext(args.history), args.writes)
+    new = bench_writes(StateContext(max_history=args.history), args.writes)
+    print(f"{f'set, history {args.history}':>28} | {legacy * 1e6:10.2f} | {new * 1e6:10.2f}")
+
+    legacy = bench_iteration_legacy(args.agents, 50)
+    new = bench_iteration(args.agents, 50)
+    print(f"{f'{args.agents}-agent iteration':>28} | {legacy * 1e6:10.0f} | {new * 1e6:10.0f}")
+
+
+if __name__ == "__main__":
+    main()
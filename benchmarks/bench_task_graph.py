@@ -0,0 +1,123 @@
+#!/usr/bin/env python3
+"""
+FAZA 27 - TaskGraph construction benchmark
+
+Builds a random DAG (N nodes, E edges; edges follow a hidden random
+order, so insertion order does not match node order and the maintained
+topological order must be repaired) and a FAZA 25 pipeline chain:
+  - legacy      : previous add_edge (full-graph DFS after every edge);
+                  timed on the first --legacy-edges edges and extrapolated
+  - incremental : add_edge with online topological order
+  - bulk        : add_edges(), one validation pass
+
+Usage:
+    python benchmarks/bench_task_graph.py
+    python benchmarks/bench_task_graph.py --nodes 10000 --edges 50000 --legacy-edges 500
+"""
+
+import argparse
+import logging
+import random
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from senti_os.core.faza25 import Task
+from senti_os.core.faza27 import EdgeType, GraphBuilder, TaskEdge, TaskGraph, TaskNode
+
+
+class LegacyTaskGraph(TaskGraph):
+    """add_edge / has_cycle as they were before incremental detection."""
+
+    def add_edge(self, edge):
+        self._check_edge(edge)
+        self._attach_edge(edge)
+        if edge.edge_type in [EdgeType.DEPENDENCY, EdgeType.CONSTRAINT] and self.has_cycle():
+            self._detach_edge(edge)
+            raise ValueError("creates cycle")
+        self._invalidate_cache()
+
+    def has_cycle(self):
+        visited, rec_stack = set(), set()
+
+        def dfs_cycle(node_id):
+            visited.add(node_id)
+            rec_stack.add(node_id)
+            for neighbor in self._adj_list.get(node_id, []):
+                if neighbor not in visited:
+                    if dfs_cycle(neighbor):
+                        return True
+                elif neighbor in rec_stack:
+                    return True
+            rec_stack.remove(node_id)
+            return False
+
+        return any(dfs_cycle(n) for n in self.nodes if n not in visited)
+
+
+def random_dag(nodes: int, edges: int, seed: int = 27):
+    rng = random.Random(seed)
+    ids = [f"n{i}" for i in range(nodes)]
+    rank = {node_id: r for r, node_id in enumerate(rng.sample(ids, nodes))}
+    pairs = set()
+    while len(pairs) < edges:
+        a, b = rng.sample(ids, 2)
+        pairs.add((a, b) if rank[a] < rank[b] else (b, a))
+    pairs = list(pairs)
+    rng.shuffle(pairs)
+    return ids, pairs
+
+
+def build(graph_cls, ids, pairs, bulk: bool = False) -> float:
+    graph = graph_cls()
+    for node_id in ids:
+        graph.add_node(TaskNode(node_id, node_id))
+
+    start = time.perf_counter()
+    edges = (TaskEdge(a, b) for a, b in pairs)
+    if bulk:
+        graph.add_edges(edges)
+    else:
+        for edge in edges:
+            graph.add_edge(edge)
+    return time.perf_counter() - start
+
+
+async def noop(task):
+    return None
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--nodes", type=int, default=10_000)
+    parser.add_argument("--edges", type=int, default=50_000)
+    parser.add_argument("--legacy-edges", type=int, default=500)
+    args = parser.parse_args()
+
+    logging.disable(logging.CRITICAL)
+    sys.setrecursionlimit(max(10_000, 2 * args.nodes))
+    ids, pairs = random_dag(args.nodes, args.edges)
+
+    legacy_sample = build(LegacyTaskGraph, ids, pairs[:args.legacy_edges])
+    legacy_estimate = legacy_sample / args.legacy_edges * args.edges
+    incremental = build(TaskGraph, ids, pairs)
+    bulk = build(TaskGraph, ids, pairs, bulk=True)
+
+    print(f"random DAG: {args.nodes} nodes / {args.edges} edges")
+    print(f"{'mode':>12} | {'total s':>9} | {'us/edge':>9}")
+    print("-" * 37)
+    print(f"{'legacy':>12} | {legacy_estimate:9.1f} | {legacy_estimate / args.edges * 1e6:9.1f}"
+          f"  (lower bound, extrapolated from first {args.legacy_edges} edges)")
+    for name, total in (("incremental", incremental), ("bulk", bulk)):
+        print(f"{name:>12} | {total:9.3f} | {total / args.edges * 1e6:9.1f}")
+
+    tasks = [Task(name=f"t{i}", executor=noop) for i in range(args.nodes)]
+    start = time.perf_counter()
+    GraphBuilder().from_faza25_tasks(tasks)
+    print(f"\nfrom_faza25_tasks({args.nodes} tasks): {time.perf_counter() - start:.3f}s")
+
+
+if __name__ == "__main__":
+    main()
@@ -10,6 +10,11 @@ Responsibilities:
 - recall()  -> retrieve items by query or category
 - categorize() -> decide memory category
 - score_priority() -> assign importance score
+
+Backends:
+- "json"   -> one JSON array file per category + index.json (default)
+- "sqlite" -> embedded SQLite store with indexed recall (sqlite_store.py);
+              existing JSON files are imported once on first use
 """
 
 import json
@@ -18,50 +23,55 @@ from datetime import datetime
 from pathlib import Path
 
 from modules.senti_validator.senti_validator import SentiValidator
+from modules.processing.senti_memory.sqlite_store import SQLiteCategoryStore, migrate_json_store
 from senti_core_module.senti_core.utils.validator import Validator
 
 
 PROJECT_ROOT = Path(__file__).resolve().parents[3]
 MEMORY_ROOT = PROJECT_ROOT / "memory_store"
 
+CATEGORIES = ["system", "trading", "seo", "os", "user", "misc"]
+
 
 class SentiMemory:
     """
     Long-term memory system with strict validation rules.
     """
 
-    def __init__(self):
+    def __init__(self, backend: str = "json", memory_root: Path = None):
+        if backend not in ("json", "sqlite"):
+            raise ValueError(f"Unknown memory backend: {backend}")
+
         self.name = "senti_memory"
         self.validator = SentiValidator()
-        self._ensure_structure()
+        self.backend = backend
+        self.memory_root = Path(memory_root) if memory_root else MEMORY_ROOT
+        self.sqlite_store = None
+
+        if backend == "sqlite":
+            self.sqlite_store = SQLiteCategoryStore(self.memory_root / "senti_memory.db", CATEGORIES)
+            migrate_json_store(self.memory_root, self.sqlite_store)
+        else:
+            self._ensure_structure()
 
     # ======================================================
     # INTERNAL: ensure memory_store structure exists
     # ======================================================
 
     def _ensure_structure(self):
-        if not MEMORY_ROOT.exists():
-            MEMORY_ROOT.mkdir(parents=True)
+        if not self.memory_root.exists():
+            self.memory_root.mkdir(parents=True)
 
-        categories = MEMORY_ROOT / "categories"
+        categories = self.memory_root / "categories"
         if not categories.exists():
             categories.mkdir()
 
-        category_files = [
-            "system.json",
-            "trading.json",
-            "seo.json",
-            "os.json",
-            "user.json",
-            "misc.json"
-        ]
-
-        for cf in category_files:
-            file_path = categories / cf
+        for category in CATEGORIES:
+            file_path = categories / f"{category}.json"
             if not file_path.exists():
                 file_path.write_text("[]")
 
-        index_file = MEMORY_ROOT / "index.json"
+        index_file = self.memory_root / "index.json"
         if not index_file.exists():
             index_file.write_text("[]")
 
@@ -76,8 +86,8 @@ class SentiMemory:
         1) validate data & metadata
         2) determine category
         3) assign priority
-        4) write to file
-        5) update index.json
+        4) write to file (sqlite: insert row)
+        5) update index.json (sqlite: table indexes)
         """
 
         # Validate raw memory through Senti Validator
@@ -105,8 +115,11 @@ class SentiMemory:
             "content": safe_data
         }
 
-        self._write_memory_item(memory_item)
-        self._update_index(memory_item)
+        if self.sqlite_store is not None:
+            self.sqlite_store.insert(memory_item)
+        else:
+            self._write_memory_item(memory_item)
+            self._update_index(memory_item)
 
         return {
             "memory_status": "stored",
@@ -120,6 +133,12 @@ class SentiMemory:
         Search memory items by text or category.
         """
 
+        if self.sqlite_store is not None:
+            return {
+                "status": "ok",
+                "results": self.sqlite_store.search(query, self.categorize(category) if category else None)
+            }
+
         category_file = self._category_to_file(category) if category else None
 
         if category_file:
@@ -144,9 +163,7 @@ class SentiMemory:
     # ======================================================
 
     def categorize(self, category: str) -> str:
-        allowed = ["system", "trading", "seo", "os", "user", "misc"]
-
-        if category not in allowed:
+        if category not in CATEGORIES:
             return "misc"
 
         return category
@@ -172,7 +189,7 @@ class SentiMemory:
         category_file.write_text(json.dumps(data, indent=2))
 
     def _update_index(self, item: dict):
-        index_file = MEMORY_ROOT / "index.json"
+        index_file = self.memory_root / "index.json"
         index_data = json.loads(index_file.read_text())
         index_data.append({
             "id": item["id"],
@@ -186,11 +203,11 @@ class SentiMemory:
     # ======================================================
 
     def _category_to_file(self, category: str) -> Path:
-        return MEMORY_ROOT / "categories" / f"{category}.json"
+        return self.memory_root / "categories" / f"{category}.json"
 
     def _load_all_categories(self):
         results = []
-        cat_dir = MEMORY_ROOT / "categories"
+        cat_dir = self.memory_root / "categories"
 
         for f in cat_dir.iterdir():
             if f.name.endswith(".json"):
@@ -0,0 +1,241 @@
+"""
+Senti Memory SQLite Store
+Location: modules/processing/senti_memory/sqlite_store.py
+
+Embedded SQLite backend for SentiMemory (stdlib sqlite3, WAL mode).
+
+Layout:
+- one table per category (memory_<category>), one row per memory item
+- (priority, timestamp) index per category for ordered recall
+- FTS5 trigram index over the JSON content per category, so recall's
+  case-insensitive substring match is an index lookup instead of a scan
+  (queries shorter than 3 characters fall back to LIKE)
+
+migrate_json_store() imports the legacy categories/*.json files once.
+"""
+
+import json
+import sqlite3
+import threading
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional
+
+
+class SQLiteCategoryStore:
+    """
+    Category-partitioned memory item store.
+    Thread-safe: one connection, serialized by a lock.
+    """
+
+    def __init__(self, db_path: Path, categories: Iterable[str]):
+        self.db_path = Path(db_path)
+        self.categories = list(categories)
+        self._lock = threading.Lock()
+
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(str(self.db_path), check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+
+        self.fts = self._fts_available()
+        self._ensure_schema()
+
+    # ======================================================
+    # SCHEMA
+    # ======================================================
+
+    def _fts_available(self) -> bool:
+        try:
+            self._conn.execute(
+                "CREATE VIRTUAL TABLE temp.fts_probe USING fts5(content, tokenize='trigram')"
+            )
+            self._conn.execute("DROP TABLE temp.fts_probe")
+            return True
+        except sqlite3.OperationalError:
+            return False
+
+    def _ensure_schema(self):
+        with self._lock, self._conn:
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT)"
+            )
+            for category in self.categories:
+                table = self._table(category)
+                self._conn.execute(f"""
+                    CREATE TABLE IF NOT EXISTS {table} (
+                        id TEXT NOT NULL UNIQUE,
+                        timestamp TEXT NOT NULL,
+                        source_module TEXT,
+                        priority REAL NOT NULL,
+                        content TEXT NOT NULL
+                    )
+                """)
+                self._conn.execute(
+                    f"CREATE INDEX IF NOT EXISTS {table}_order ON {table} (priority DESC, timestamp)"
+                )
+
+                if self.fts:
+                    # External-content index kept in sync by triggers
+                    self._conn.execute(f"""
+                        CREATE VIRTUAL TABLE IF NOT EXISTS {table}_fts USING fts5(
+                            content, content='{table}', content_rowid='rowid', tokenize='trigram'
+                        )
+                    """)
+                    self._conn.execute(f"""
+                        CREATE TRIGGER IF NOT EXISTS {table}_ai AFTER INSERT ON {table} BEGIN
+                            INSERT INTO {table}_fts (rowid, content) VALUES (new.rowid, new.content);
+                        END
+                    """)
+                    self._conn.execute(f"""
+                        CREATE TRIGGER IF NOT EXISTS {table}_ad AFTER DELETE ON {table} BEGIN
+                            INSERT INTO {table}_fts ({table}_fts, rowid, content)
+                            VALUES ('delete', old.rowid, old.content);
+                        END
+                    """)
+
+    def _table(self, category: str) -> str:
+        if category not in self.categories:
+            raise ValueError(f"Unknown memory category: {category}")
+        return f"memory_{category}"
+
+    # ======================================================
+    # WRITE
+    # ======================================================
+
+    def insert(self, item: dict):
+        """Insert one memory item (as built by SentiMemory.store)."""
+        self.insert_many([item])
+
+    def insert_many(self, items: Iterable[dict]) -> int:
+        """
+        Insert memory items in one transaction; items whose id is
+        already stored are skipped.
+
+        Returns:
+            Number of items inserted
+        """
+        inserted = 0
+        with self._lock, self._conn:
+            for item in items:
+                cursor = self._conn.execute(
+                    f"INSERT OR IGNORE INTO {self._table(item['category'])} "
+                    "(id, timestamp, source_module, priority, content) VALUES (?, ?, ?, ?, ?)",
+                    (
+                        item["id"],
+                        item["timestamp"],
+                        item.get("source_module", "unknown"),
+                        float(item["priority"]),
+                        json.dumps(item["content"])
+                    )
+                )
+                inserted += cursor.rowcount
+        return inserted
+
+    # ======================================================
+    # READ
+    # ======================================================
+
+    def search(self, query: str, category: Optional[str] = None) -> List[dict]:
+        """
+        Items whose JSON content contains query (case-insensitive),
+        highest priority first.
+        """
+        categories = [category] if category else self.categories
+        selects = []
+        params = []
+
+        for cat in categories:
+            table = self._table(cat)
+            columns = f"'{cat}', id, timestamp, source_module, priority, content"
+            if not query:
+                selects.append(f"SELECT {columns} FROM {table}")
+            elif self.fts and len(query) >= 3:
+                selects.append(
+                    f"SELECT {columns} FROM {table} WHERE rowid IN "
+                    f"(SELECT rowid FROM {table}_fts WHERE {table}_fts MATCH ?)"
+                )
+                params.append('"' + query.replace('"', '""') + '"')
+            else:
+                selects.append(f"SELECT {columns} FROM {table} WHERE instr(lower(content), ?) > 0")
+                params.append(query.lower())
+
+        sql = " UNION ALL ".join(selects) + " ORDER BY priority DESC, timestamp"
+        with self._lock:
+            rows = self._conn.execute(sql, params).fetchall()
+
+        return [self._row_to_item(row) for row in rows]
+
+    def count(self, category: Optional[str] = None) -> int:
+        """Number of stored items (in one category or all)."""
+        categories = [category] if category else self.categories
+        with self._lock:
+            return sum(
+                self._conn.execute(f"SELECT COUNT(*) FROM {self._table(cat)}").fetchone()[0]
+                for cat in categories
+            )
+
+    def _row_to_item(self, row) -> dict:
+        category, item_id, timestamp, source_module, priority, content = row
+        return {
+            "id": item_id,
+            "timestamp": timestamp,
+            "source_module": source_module,
+            "category": category,
+            "priority": priority,
+            "content": json.loads(content)
+        }
+
+    # ======================================================
+    # META
+    # ======================================================
+
+    def get_meta(self, key: str) -> Optional[str]:
+        with self._lock:
+            row = self._conn.execute("SELECT value FROM meta WHERE key = ?", (key,)).fetchone()
+        return row[0] if row else None
+
+    def set_meta(self, key: str, value: str):
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO meta (key, value) VALUES (?, ?)", (key, value)
+            )
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+
+def migrate_json_store(memory_root: Path, store: SQLiteCategoryStore, force: bool = False) -> Dict[str, int]:
+    """
+    One-shot import of the JSON category files (memory_root/categories)
+    into the SQLite store. The JSON files are left in place; the import
+    is recorded in the store and not repeated unless force is set.
+    Items of unknown categories go to "misc".
+
+    Returns:
+        Number of items imported per category
+    """
+    if store.get_meta("json_migrated") and not force:
+        return {}
+
+    by_category: Dict[str, List[dict]] = {}
+    categories_dir = Path(memory_root) / "categories"
+    if categories_dir.exists():
+        for category_file in sorted(categories_dir.glob("*.json")):
+            try:
+                items = json.loads(category_file.read_text())
+            except (OSError, ValueError):
+                continue
+
+            for item in items:
+                category = item.get("category", category_file.stem)
+                if category not in store.categories:
+                    category = "misc"
+                by_category.setdefault(category, []).append(dict(item, category=category))
+
+    imported = {
+        category: store.insert_many(items)
+        for category, items in by_category.items()
+    }
+    store.set_meta("json_migrated", "1")
+    return imported
@@ -8,9 +8,10 @@ with integration to FAZA 5, 8, 12, and 13.
 
 from datetime import datetime
 from typing import Dict, List, Any, Optional
-import statistics
 import math
 
+from senti_core_module.senti_stats import RunningStats
+
 
 class AnomalyResult:
     """
@@ -70,6 +71,7 @@ class AnomalyEngine:
         self.prediction_manager = prediction_manager
         self.detection_history = []
         self.baseline_stats = {}
+        self.baseline_trackers: Dict[str, RunningStats] = {}
 
     def detect_statistical_anomaly(self, data: List[float]) -> AnomalyResult:
         """
@@ -90,8 +92,10 @@ class AnomalyEngine:
             )
 
         try:
-            mean = statistics.mean(data)
-            stdev = statistics.stdev(data) if len(data) > 1 else 0
+            # Single pass (Welford) instead of separate mean / stdev passes
+            stats = RunningStats.from_values(data)
+            mean = stats.mean
+            stdev = stats.std()
 
             if stdev == 0:
                 return AnomalyResult(
@@ -407,15 +411,33 @@ class AnomalyEngine:
             return
 
         try:
-            self.baseline_stats[component] = {
-                "mean": statistics.mean(data),
-                "stdev": statistics.stdev(data) if len(data) > 1 else 0,
-                "count": len(data),
-                "updated": datetime.now().isoformat()
-            }
+            self.baseline_trackers[component] = RunningStats.from_values(data)
+            self._publish_baseline(component)
         except Exception as e:
             pass
 
+    def add_baseline_sample(self, component: str, value: float):
+        """
+        Add one data point to a component baseline (O(1), no recompute).
+
+        Args:
+            component: Component name
+            value: New data point
+        """
+        tracker = self.baseline_trackers.setdefault(component, RunningStats())
+        tracker.add(value)
+        if tracker.count >= 2:
+            self._publish_baseline(component)
+
+    def _publish_baseline(self, component: str):
+        tracker = self.baseline_trackers[component]
+        self.baseline_stats[component] = {
+            "mean": tracker.mean,
+            "stdev": tracker.std(),
+            "count": tracker.count,
+            "updated": datetime.now().isoformat()
+        }
+
     def get_baseline(self, component: str) -> Optional[Dict[str, Any]]:
         """
         Get baseline statistics for a component.
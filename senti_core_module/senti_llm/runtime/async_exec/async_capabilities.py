@@ -79,17 +79,7 @@ class AsyncAwaitCapability:
                     "error": "Task not found"
                 }
 
-            task_dict = task.to_dict()
-
-            return {
-                "ok": True,
-                "task_id": task.id,
-                "status": task.status.value,
-                "is_done": task.is_done(),
-                "result": task_dict.get("result"),
-                "error": task_dict.get("error"),
-                "metadata": task_dict.get("metadata")
-            }
+            return self._describe(task)
 
         except Exception as e:
             return {
@@ -97,11 +87,27 @@ class AsyncAwaitCapability:
                 "error": str(e)
             }
 
+    def _describe(self, task) -> Dict[str, Any]:
+        """Build the poll() result for a task."""
+        task_dict = task.to_dict()
+
+        return {
+            "ok": True,
+            "task_id": task.id,
+            "status": task.status.value,
+            "is_done": task.is_done(),
+            "result": task_dict.get("result"),
+            "error": task_dict.get("error"),
+            "metadata": task_dict.get("metadata")
+        }
+
     def wait(self, task_id: str, timeout: float = 30.0) -> Dict[str, Any]:
         """
         Wait for async task to complete (blocking).
 
         WARNING: This is a blocking operation and should be used sparingly.
+        The task only advances while the manager is ticked or driven by
+        a RuntimeDriver, so do not call this from the ticking thread.
 
         Args:
             task_id: Task ID to wait for
@@ -111,26 +117,57 @@ class AsyncAwaitCapability:
             Dict with task result
         """
         try:
-            import time
+            task = self.async_manager.get(task_id)
+
+            if not task:
+                return {
+                    "ok": False,
+                    "error": "Task not found"
+                }
+
+            # Woken by the task's completion event, no polling
+            if task.wait(timeout):
+                return self._describe(task)
+
+            # Timeout reached
+            return {
+                "ok": False,
+                "error": "Timeout waiting for task",
+                "status": "timeout"
+            }
+
+        except Exception as e:
+            return {
+                "ok": False,
+                "error": str(e)
+            }
 
-            start_time = time.time()
+    async def wait_async(self, task_id: str, timeout: float = 30.0) -> Dict[str, Any]:
+        """
+        Await async task completion from a coroutine (non-blocking).
 
-            while time.time() - start_time < timeout:
-                task = self.async_manager.get(task_id)
+        Args:
+            task_id: Task ID to wait for
+            timeout: Maximum wait time in seconds
 
-                if not task:
-                    return {
-                        "ok": False,
-                        "error": "Task not found"
-                    }
+        Returns:
+            Dict with task result
+        """
+        try:
+            import asyncio
 
-                if task.is_done():
-                    return self.poll(task_id)
+            task = self.async_manager.get(task_id)
+
+            if not task:
+                return {
+                    "ok": False,
+                    "error": "Task not found"
+                }
 
-                # Sleep briefly to avoid busy-waiting
-                time.sleep(0.1)
+            done, _ = await asyncio.wait([asyncio.wrap_future(task.future)], timeout=timeout)
+            if done:
+                return self._describe(task)
 
-            # Timeout reached
             return {
                 "ok": False,
                 "error": "Timeout waiting for task",
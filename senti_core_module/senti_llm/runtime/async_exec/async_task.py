@@ -8,6 +8,7 @@ Features:
 - Coroutine execution with local asyncio loop
 - Step-based execution (cooperative)
 - Result/error tracking
+- Completion notification (threading.Event + concurrent Future)
 - Serialization support
 
 Design:
@@ -20,6 +21,8 @@ Design:
 from __future__ import annotations
 
 import asyncio
+import concurrent.futures
+import threading
 import time
 import uuid
 from typing import Any, Callable, Coroutine, Dict, Optional
@@ -81,6 +84,12 @@ class AsyncTask:
         self._asyncio_task: Optional[asyncio.Task] = None
         self._loop: Optional[asyncio.AbstractEventLoop] = None
 
+        # Completion notification, set by mark_success / mark_failure /
+        # cancel: wait() blocks on the event, awaiting callers use the
+        # future (asyncio.wrap_future) from any thread or loop
+        self._done_event = threading.Event()
+        self._future: concurrent.futures.Future = concurrent.futures.Future()
+
     def start(self, loop: Optional[asyncio.AbstractEventLoop] = None):
         """
         Start the async task execution.
@@ -103,8 +112,10 @@ class AsyncTask:
 
             self._loop = loop
 
-            # Create asyncio task
+            # Create asyncio task; record the outcome as soon as it
+            # finishes instead of waiting for the next step()
             self._asyncio_task = loop.create_task(self.coroutine)
+            self._asyncio_task.add_done_callback(lambda _: self.step())
 
             # Update status
             self.status = AsyncTaskStatus.RUNNING
@@ -139,8 +150,7 @@ class AsyncTask:
                     result = self._asyncio_task.result()
                     self.mark_success(result)
                 except asyncio.CancelledError:
-                    self.status = AsyncTaskStatus.CANCELLED
-                    self.completed_at = time.time()
+                    self.mark_cancelled()
                 except Exception as e:
                     self.mark_failure(str(e))
 
@@ -164,17 +174,31 @@ class AsyncTask:
             if self.status in [AsyncTaskStatus.COMPLETED, AsyncTaskStatus.FAILED, AsyncTaskStatus.CANCELLED]:
                 return False  # Already finished
 
-            # Cancel asyncio task
+            # Cancel asyncio task (thread-safe when the loop runs elsewhere)
             if self._asyncio_task and not self._asyncio_task.done():
-                self._asyncio_task.cancel()
+                if self._loop is not None and self._loop.is_running() and not self._on_loop_thread():
+                    self._loop.call_soon_threadsafe(self._asyncio_task.cancel)
+                else:
+                    self._asyncio_task.cancel()
+
+            # Never started: close the coroutine so it is not reported
+            # as "never awaited" when it is garbage collected
+            if self._asyncio_task is None and asyncio.iscoroutine(self.coroutine):
+                self.coroutine.close()
 
-            self.status = AsyncTaskStatus.CANCELLED
-            self.completed_at = time.time()
+            self.mark_cancelled()
             return True
 
         except Exception:
             return False
 
+    def _on_loop_thread(self) -> bool:
+        """Check whether the caller runs on this task's event loop."""
+        try:
+            return asyncio.get_running_loop() is self._loop
+        except RuntimeError:
+            return False
+
     def mark_success(self, result: Any = None):
         """
         Mark task as successfully completed.
@@ -185,6 +209,7 @@ class AsyncTask:
         self.status = AsyncTaskStatus.COMPLETED
         self.result = result
         self.completed_at = time.time()
+        self._notify_done()
 
     def mark_failure(self, error: str):
         """
@@ -196,6 +221,49 @@ class AsyncTask:
         self.status = AsyncTaskStatus.FAILED
         self.error = error
         self.completed_at = time.time()
+        self._notify_done()
+
+    def mark_cancelled(self):
+        """Mark task as cancelled."""
+        self.status = AsyncTaskStatus.CANCELLED
+        self.completed_at = time.time()
+        self._notify_done()
+
+    def _notify_done(self):
+        """Resolve the completion future and wake wait() callers."""
+        try:
+            if not self._future.done():
+                if self.status == AsyncTaskStatus.COMPLETED:
+                    self._future.set_result(self.result)
+                elif self.status == AsyncTaskStatus.FAILED:
+                    self._future.set_exception(RuntimeError(self.error))
+                else:
+                    self._future.cancel()
+        except concurrent.futures.InvalidStateError:
+            # Already resolved by a concurrent mark_*
+            pass
+        self._done_event.set()
+
+    def wait(self, timeout: Optional[float] = None) -> bool:
+        """
+        Block until the task is done (no polling).
+
+        Args:
+            timeout: Maximum wait time in seconds (None = no limit)
+
+        Returns:
+            True if the task is done
+        """
+        return self._done_event.wait(timeout)
+
+    @property
+    def future(self) -> concurrent.futures.Future:
+        """
+        Completion future: result on success, RuntimeError(error) on
+        failure, cancelled on cancellation. Await it from a coroutine
+        with asyncio.wrap_future(task.future).
+        """
+        return self._future
 
     def is_done(self) -> bool:
         """
@@ -254,6 +322,9 @@ class AsyncTask:
         task.started_at = data.get("started_at")
         task.completed_at = data.get("completed_at")
 
+        if task.is_done():
+            task._notify_done()
+
         return task
 
     def __repr__(self) -> str:
@@ -9,6 +9,7 @@ Features:
 - Concurrency limits (16 running, 128 pending)
 - Cooperative tick() execution
 - Event-triggered async tasks
+- Native mode: coroutines run on a RuntimeDriver loop (attach_loop)
 - Never crashes runtime
 
 Design:
@@ -70,6 +71,10 @@ class AsyncTaskManager:
         self._loop: Optional[asyncio.AbstractEventLoop] = None
         self._tick_count = 0
 
+        # Native mode: _loop runs forever in a driver thread; tasks are
+        # started on it directly and finish through done callbacks
+        self._native = False
+
     def _ensure_loop(self):
         """Ensure asyncio event loop exists."""
         try:
@@ -114,6 +119,9 @@ class AsyncTaskManager:
                 self._tasks_by_id[task.id] = task
                 self._pending_tasks.append(task)
 
+                if self._native:
+                    self._loop.call_soon_threadsafe(self._start_native_tasks)
+
                 return task.id
 
         except Exception:
@@ -138,6 +146,11 @@ class AsyncTaskManager:
 
             self._tick_count += 1
 
+            if self._native:
+                # Tasks advance on the driver loop; only report the tick
+                self._publish_tick_event(now_timestamp)
+                return
+
             # Ensure event loop exists
             self._ensure_loop()
 
@@ -191,6 +204,95 @@ class AsyncTaskManager:
             # Never crash on tick
             pass
 
+    def attach_loop(self, loop: asyncio.AbstractEventLoop):
+        """
+        Switch to native mode on a loop running in another thread.
+
+        Called by RuntimeDriver from its loop thread. Pending tasks are
+        started on the loop right away (up to MAX_RUNNING_TASKS) and
+        completion is handled by done callbacks instead of tick().
+
+        Args:
+            loop: Running event loop owned by the driver
+        """
+        try:
+            with self._lock:
+                self._loop = loop
+                self._native = True
+            self._start_native_tasks()
+        except Exception:
+            pass
+
+    def detach_loop(self):
+        """
+        Leave native mode (RuntimeDriver stop).
+
+        Tasks still running on the driver loop are cancelled; pending
+        tasks stay queued for cooperative tick() processing.
+        """
+        try:
+            with self._lock:
+                loop = self._loop
+                self._native = False
+                self._loop = None
+                running = list(self._running_tasks)
+
+            pending = [
+                task._asyncio_task for task in running
+                if task._asyncio_task and not task._asyncio_task.done()
+            ]
+            for asyncio_task in pending:
+                asyncio_task.cancel()
+
+            # Let cancellations and done callbacks run before the loop
+            # closes (the driver calls this after its loop stopped)
+            if loop is not None and pending:
+                loop.run_until_complete(asyncio.wait(pending, timeout=1.0))
+                loop.run_until_complete(asyncio.sleep(0))
+        except Exception:
+            pass
+
+    def _start_native_tasks(self):
+        """Start pending tasks on the driver loop (loop thread only)."""
+        try:
+            with self._lock:
+                if not self._native:
+                    return
+
+                while (
+                    len(self._running_tasks) < self.MAX_RUNNING_TASKS
+                    and len(self._pending_tasks) > 0
+                ):
+                    task = self._pending_tasks.pop(0)
+                    task.start(self._loop)
+                    if task._asyncio_task is None:
+                        # start() failed and marked the task
+                        continue
+                    self._running_tasks.append(task)
+                    task._asyncio_task.add_done_callback(
+                        lambda _, task=task: self._on_native_done(task)
+                    )
+        except Exception:
+            pass
+
+    def _on_native_done(self, task: AsyncTask):
+        """Done callback for native tasks (loop thread only)."""
+        try:
+            # Collects result / error / cancellation into the task
+            task.step()
+
+            with self._lock:
+                if task in self._running_tasks:
+                    self._running_tasks.remove(task)
+                self._cleanup_old_tasks()
+
+            self._publish_task_event(task)
+        except Exception:
+            pass
+
+        # A running slot is free
+        self._start_native_tasks()
+
     def cancel(self, task_id: str) -> bool:
         """
         Cancel a task by ID.
@@ -334,7 +436,8 @@ class AsyncTaskManager:
                         1 for t in self._tasks_by_id.values()
                         if t.status == AsyncTaskStatus.FAILED
                     ),
-                    "event_types": len(self._event_handlers)
+                    "event_types": len(self._event_handlers),
+                    "native": self._native
                 }
         except Exception:
             return {}
@@ -378,7 +481,7 @@ class AsyncTaskManager:
             task: Completed task
         """
         try:
-            if self.event_bus:
+            if self.event_bus and self.event_bus.has_listeners("system.async.done"):
                 from ..event_context import EventContext
 
                 event_ctx = EventContext(
@@ -408,7 +511,7 @@ class AsyncTaskManager:
             timestamp: Current timestamp
         """
         try:
-            if self.event_bus:
+            if self.event_bus and self.event_bus.has_listeners("system.async.tick"):
                 from ..event_context import EventContext
 
                 event_ctx = EventContext(
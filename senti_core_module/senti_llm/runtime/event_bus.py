@@ -9,6 +9,8 @@ This module implements the central Event Bus used for:
 - Isolated per-module event routing
 - FAZA 43: Integration with Scheduler for event-triggered tasks
 - FAZA 44: Integration with AsyncTaskManager for async event handlers
+- Wildcard namespace subscriptions ("system.*", "system.**") via a
+  subscription trie, with per-event-type compiled handler lists
 
 This is the foundational component for FAZA 41, extended in FAZA 43 and 44.
 """
@@ -25,6 +27,23 @@ if TYPE_CHECKING:
     from .async_exec import AsyncTaskManager
 
 
+# Namespace wildcards: "*" matches exactly one segment, "**" matches
+# zero or more segments ("system.**" matches "system.scheduler.tick").
+WILDCARD_ONE = "*"
+WILDCARD_ANY = "**"
+
+
+class _TrieNode:
+    """One namespace segment of the subscription trie."""
+
+    __slots__ = ("children", "handlers")
+
+    def __init__(self):
+        self.children: Dict[str, _TrieNode] = {}
+        # (subscription sequence, handler) for patterns ending here
+        self.handlers: List[tuple] = []
+
+
 class EventBus:
     """
     Central event dispatcher for Senti OS modules.
@@ -39,9 +58,17 @@ class EventBus:
     """
 
     def __init__(self, scheduler: Optional['Scheduler'] = None, async_manager: Optional['AsyncTaskManager'] = None):
-        # event_type → list of handler functions
+        # event_type (or pattern) → list of handler functions
         self._subscribers: Dict[str, List[Callable]] = {}
 
+        # Subscription trie over dotted namespaces
+        self._trie = _TrieNode()
+        self._sequence = 0
+
+        # event_type → handlers matching it, in subscription order.
+        # Rebuilt lazily; cleared on subscribe/unsubscribe.
+        self._compiled: Dict[str, tuple] = {}
+
         # thread lock for safe registration and dispatching
         self._lock = threading.Lock()
 
@@ -89,7 +116,8 @@ class EventBus:
             def handler(event_context)
 
         Args:
-            event_type: Name of the event, e.g. "system.lifecycle.change"
+            event_type: Name of the event, e.g. "system.lifecycle.change",
+                or a pattern: "system.*" (one segment), "system.**" (any depth)
             handler: Callable that receives an EventContext instance
         """
         with self._lock:
@@ -97,6 +125,14 @@ class EventBus:
                 self._subscribers[event_type] = []
             self._subscribers[event_type].append(handler)
 
+            node = self._trie
+            for segment in event_type.split("."):
+                node = node.children.setdefault(segment, _TrieNode())
+            self._sequence += 1
+            node.handlers.append((self._sequence, handler))
+
+            self._compiled = {}
+
     def unsubscribe(self, event_type: str, handler: Callable) -> None:
         """
         Remove a handler from a given event subscription list.
@@ -106,6 +142,97 @@ class EventBus:
                 if handler in self._subscribers[event_type]:
                     self._subscribers[event_type].remove(handler)
 
+                    path = [self._trie]
+                    for segment in event_type.split("."):
+                        path.append(path[-1].children[segment])
+
+                    node = path[-1]
+                    for i, (_, h) in enumerate(node.handlers):
+                        if h == handler:
+                            del node.handlers[i]
+                            break
+
+                    # Prune empty branches
+                    segments = event_type.split(".")
+                    for depth in range(len(segments), 0, -1):
+                        node = path[depth]
+                        if node.handlers or node.children:
+                            break
+                        del path[depth - 1].children[segments[depth - 1]]
+
+                    self._compiled = {}
+
+    def _compile(self, event_type: str) -> tuple:
+        """
+        Collect every handler whose pattern matches event_type.
+
+        Returns:
+            Handlers ordered by subscription time
+        """
+        segments = event_type.split(".")
+        matches: Dict[int, Callable] = {}
+
+        # Walk the trie with a (node, segment index) frontier
+        stack = [(self._trie, 0)]
+        seen = set()
+        while stack:
+            node, i = stack.pop()
+            if (id(node), i) in seen:
+                continue
+            seen.add((id(node), i))
+
+            if i == len(segments):
+                for seq, handler in node.handlers:
+                    matches[seq] = handler
+
+            any_node = node.children.get(WILDCARD_ANY)
+            if any_node is not None:
+                # "**" consumes zero or more segments
+                for j in range(i, len(segments) + 1):
+                    stack.append((any_node, j))
+
+            if i < len(segments):
+                for key in (segments[i], WILDCARD_ONE):
+                    child = node.children.get(key)
+                    if child is not None:
+                        stack.append((child, i + 1))
+
+        return tuple(matches[seq] for seq in sorted(matches))
+
+    def get_handlers(self, event_type: str) -> tuple:
+        """
+        Return the compiled handler list for an event type.
+
+        Args:
+            event_type: Concrete event name (no wildcards)
+
+        Returns:
+            Tuple of handlers (exact and wildcard matches)
+        """
+        handlers = self._compiled.get(event_type)
+        if handlers is None:
+            with self._lock:
+                handlers = self._compile(event_type)
+                self._compiled[event_type] = handlers
+        return handlers
+
+    def has_listeners(self, event_type: str) -> bool:
+        """
+        Check whether publishing event_type would reach anyone.
+
+        Publishers use this to skip building EventContext payloads that
+        nobody consumes. O(1) once the event type has been compiled.
+
+        Args:
+            event_type: Concrete event name
+
+        Returns:
+            True if a subscriber or scheduler event task would receive it
+        """
+        if self.get_handlers(event_type):
+            return True
+        return self._scheduler is not None and self._scheduler_listens(event_type)
+
     # ----------------------------------------------------------------------
     # Event Publishing
     # ----------------------------------------------------------------------
@@ -123,8 +250,7 @@ class EventBus:
         """
         results = []
 
-        with self._lock:
-            handlers = list(self._subscribers.get(event_type, []))
+        handlers = self.get_handlers(event_type)
 
         # Dispatch to regular subscribers
         for handler in handlers:
@@ -161,7 +287,7 @@ class EventBus:
                 results.append({"error": str(e)})
 
         # FAZA 43: Trigger scheduler event-triggered tasks
-        if self._scheduler:
+        if self._scheduler and self._scheduler_listens(event_type):
             try:
                 self._scheduler.trigger_event(event_type, event_context)
             except Exception:
@@ -170,6 +296,12 @@ class EventBus:
 
         return results
 
+    def _scheduler_listens(self, event_type: str) -> bool:
+        try:
+            return self._scheduler.has_event_handlers(event_type)
+        except Exception:
+            return True
+
     # ----------------------------------------------------------------------
     # Introspection
     # ----------------------------------------------------------------------
@@ -17,6 +17,8 @@ Ne spreminja oblike rezultatov, ne lomi testov, in je popolnoma
 neinvazivna ter skladna s Senti arhitekturo.
 """
 
+import time
+from collections import deque
 from typing import Any, Dict, Optional
 from .action_model import RuntimeAction
 from .runtime_exceptions import OrchestratorError
@@ -24,6 +26,7 @@ from .module_loader import ModuleLoader
 from .llm_runtime_context import RuntimeContext
 from .module_manifest import ModuleManifest
 from .logging_manager import get_global_logging_manager
+from .runtime_driver import latency_summary
 
 
 class ExecutionOrchestrator:
@@ -45,6 +48,13 @@ class ExecutionOrchestrator:
             "list.modules": self._handle_list_modules,
         }
 
+        # FAZA 44.1: set by LLMRuntimeManager.start_driver(); while it
+        # runs, scheduler / async ticks no longer happen inline
+        self.driver = None
+
+        # Recent execute() latencies (seconds)
+        self._latencies = deque(maxlen=1000)
+
         # Initialize logging (safe)
         try:
             logging_mgr = get_global_logging_manager()
@@ -59,6 +69,17 @@ class ExecutionOrchestrator:
     def execute(self, action: RuntimeAction) -> Dict[str, Any]:
         """Universal action executor with strict result format."""
 
+        start = time.perf_counter()
+        try:
+            return self._execute(action)
+        finally:
+            self._latencies.append(time.perf_counter() - start)
+
+    def get_latency_stats(self) -> Dict[str, Any]:
+        """Summary of recent execute() latencies (ms)."""
+        return latency_summary(list(self._latencies))
+
+    def _execute(self, action: RuntimeAction) -> Dict[str, Any]:
         if action.action_type not in self.handlers:
             raise OrchestratorError(f"Unknown action: {action.action_type}")
 
@@ -67,21 +88,9 @@ class ExecutionOrchestrator:
         # Logging (always safe)
         self._log_action(action)
 
-        # FAZA 43: Tick scheduler on every execute (cooperative scheduling)
-        try:
-            if hasattr(self.module_loader, 'scheduler') and self.module_loader.scheduler:
-                self.module_loader.scheduler.tick()
-        except Exception:
-            # Scheduler errors must never crash execution
-            pass
-
-        # FAZA 44: Tick async_manager on every execute (cooperative async scheduling)
-        try:
-            if hasattr(self.module_loader, 'async_manager') and self.module_loader.async_manager:
-                self.module_loader.async_manager.tick()
-        except Exception:
-            # Async manager errors must never crash execution
-            pass
+        # Without a running driver, tick inline (cooperative scheduling)
+        if self.driver is None or not self.driver.is_running():
+            self._tick_inline()
 
         try:
             result = handler(action)
@@ -131,6 +140,23 @@ class ExecutionOrchestrator:
                 "error": str(exc),
             }
 
+    def _tick_inline(self) -> None:
+        # FAZA 43: Tick scheduler on every execute (cooperative scheduling)
+        try:
+            if hasattr(self.module_loader, 'scheduler') and self.module_loader.scheduler:
+                self.module_loader.scheduler.tick()
+        except Exception:
+            # Scheduler errors must never crash execution
+            pass
+
+        # FAZA 44: Tick async_manager on every execute (cooperative async scheduling)
+        try:
+            if hasattr(self.module_loader, 'async_manager') and self.module_loader.async_manager:
+                self.module_loader.async_manager.tick()
+        except Exception:
+            # Async manager errors must never crash execution
+            pass
+
     # ---------------------------------------------------------
     # ACTION HANDLERS
     # ---------------------------------------------------------
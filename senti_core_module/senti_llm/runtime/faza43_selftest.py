@@ -7,13 +7,17 @@ Comprehensive test suite for the Senti OS Scheduler.
 Tests:
 1. Scheduler initialization
 2. Task creation (interval, oneshot, event)
-3. Task execution (tick)
-4. Event-triggered tasks
-5. Task cancellation
-6. Task auto-disable on failures
-7. Scheduler stats
-8. Module integration
-9. Demo module execution
+3. Task registry operations
+4. Interval task execution (tick)
+5. Oneshot task execution
+6. Event-triggered tasks
+7. Task cancellation
+8. Task auto-disable on failures
+9. Scheduler stats
+10. Module integration and demo module execution
+11. EventBus + Scheduler integration
+12. EventBus wildcard subscriptions and has_listeners
+13. Due-time index: fair overflow across ticks
 """
 
 import sys
@@ -390,6 +394,88 @@ def test_event_bus_scheduler_integration():
     print(f"✓ EventBus + Scheduler integration working")
 
 
+def test_event_bus_wildcards():
+    """Test 12: Wildcard subscriptions and has_listeners fast path."""
+    event_bus = EventBus()
+    scheduler = Scheduler(event_bus=event_bus)
+    event_bus.set_scheduler(scheduler)
+
+    received = []
+
+    def exact_handler(event_context):
+        received.append(("exact", event_context.event_type))
+
+    def one_level_handler(event_context):
+        received.append(("one", event_context.event_type))
+
+    def any_depth_handler(event_context):
+        received.append(("any", event_context.event_type))
+
+    # Nothing subscribed: tick must not be published
+    assert not event_bus.has_listeners("system.scheduler.tick"), "No listeners expected"
+
+    event_bus.subscribe("system.**", any_depth_handler)
+    event_bus.subscribe("system.scheduler.tick", exact_handler)
+    event_bus.subscribe("system.*", one_level_handler)
+
+    assert event_bus.has_listeners("system.scheduler.tick"), "system.** should listen"
+    assert not event_bus.has_listeners("user.action"), "user.action has no listeners"
+
+    scheduler.tick(time.time())
+    assert received == [
+        ("any", "system.scheduler.tick"),
+        ("exact", "system.scheduler.tick")
+    ], f"Unexpected dispatch: {received}"
+
+    received.clear()
+    event_bus.publish("system.boot", EventContext("system.boot", "selftest", {}))
+    assert received == [("any", "system.boot"), ("one", "system.boot")], f"Unexpected dispatch: {received}"
+
+    # Unsubscribe invalidates the compiled handler lists
+    event_bus.unsubscribe("system.**", any_depth_handler)
+    event_bus.unsubscribe("system.scheduler.tick", exact_handler)
+    assert not event_bus.has_listeners("system.scheduler.tick"), "Handlers should be gone"
+
+    # Scheduler event tasks count as listeners
+    scheduler.schedule_event("module.ready", lambda ctx: None)
+    assert event_bus.has_listeners("module.ready"), "Scheduler event task should listen"
+
+    print("✓ Wildcard subscriptions and has_listeners working")
+
+
+def test_due_index_fair_overflow():
+    """Test 13: Due tasks beyond MAX_TASKS_PER_TICK carry over fairly."""
+    scheduler = Scheduler()
+    limit = Scheduler.MAX_TASKS_PER_TICK
+    runs = {}
+
+    def make_callback(index):
+        def callback():
+            runs[index] = runs.get(index, 0) + 1
+        return callback
+
+    now = time.time()
+    ids = [
+        scheduler.schedule_interval(make_callback(i), interval=0.005)
+        for i in range(3 * limit)
+    ]
+
+    # Tasks become due again before the next tick, so a plain scan
+    # would rerun the same 10; the due index runs the longest-waiting
+    for tick in range(3):
+        scheduler.tick(now + 1.0 + tick * 0.01)
+        assert sum(runs.values()) == (tick + 1) * limit, f"Tick {tick} ran {sum(runs.values())} tasks"
+    assert all(count == 1 for count in runs.values()) and len(runs) == 3 * limit, \
+        "Every task should run once before any runs twice"
+
+    # Cancelled tasks leave the index
+    scheduler.cancel(ids[0])
+    assert scheduler.registry.get_stats()["queued_tasks"] == 3 * limit - 1, "Cancelled task still queued"
+    assert scheduler.registry.next_due_time() >= now + 1.0, "Next due time should follow the reschedule"
+
+    print(f"✓ {3 * limit} due tasks spread over 3 ticks without starvation")
+
+
 # ================================================================
 #  MAIN TEST EXECUTION
 # ================================================================
@@ -426,6 +512,8 @@ def main():
     runner.run_test("9. Scheduler Statistics", test_scheduler_stats)
     runner.run_test("10. Module Integration", test_module_integration)
     runner.run_test("11. EventBus Integration", test_event_bus_scheduler_integration)
+    runner.run_test("12. EventBus Wildcards", test_event_bus_wildcards)
+    runner.run_test("13. Due Index Fair Overflow", test_due_index_fair_overflow)
 
     # Print summary and exit
     success = runner.print_summary()
@@ -16,6 +16,7 @@ Tests:
 9. Async event chains
 10. Concurrency limits
 11. Error handling
+12. Runtime driver (background loop thread)
 """
 
 import sys
@@ -32,6 +33,8 @@ from senti_core_module.senti_llm.runtime.event_context import EventContext
 from senti_core_module.senti_llm.runtime.llm_runtime_context import RuntimeContext
 from senti_core_module.senti_llm.runtime.action_model import RuntimeAction
 from senti_core_module.senti_llm.runtime.execution_orchestrator import ExecutionOrchestrator
+from senti_core_module.senti_llm.runtime.scheduler import Scheduler
+from senti_core_module.senti_llm.runtime.runtime_driver import RuntimeDriver
 
 
 class TestRunner:
@@ -337,6 +340,101 @@ def test_error_handling():
     print(f"✓ Error handled gracefully: {task.error[:50]}")
 
 
+def test_runtime_driver():
+    """Test 11: RuntimeDriver ticks scheduler and runs coroutines natively."""
+    scheduler = Scheduler()
+    manager = AsyncTaskManager()
+    driver = RuntimeDriver(scheduler, manager, tick_interval=0.01)
+    interval_runs = {"count": 0}
+
+    def interval_callback():
+        interval_runs["count"] += 1
+
+    async def worker():
+        await asyncio.sleep(0.05)
+        return "native"
+
+    async def long_worker():
+        await asyncio.sleep(10)
+
+    assert driver.start(), "Driver should start"
+    try:
+        scheduler.schedule_interval(interval_callback, interval=0.02)
+        task_id = manager.create_task(worker())
+        long_id = manager.create_task(long_worker())
+
+        # No manual tick() calls: the driver thread advances everything
+        deadline = time.time() + 2.0
+        while time.time() < deadline and not manager.get(task_id).is_done():
+            time.sleep(0.01)
+        time.sleep(0.1)
+
+        task = manager.get(task_id)
+        assert task.status == AsyncTaskStatus.COMPLETED, f"Task should complete natively ({task.status.value})"
+        assert task.result == "native", "Result should be collected"
+        assert interval_runs["count"] >= 2, f"Interval task should run in background ({interval_runs['count']})"
+        assert manager.get_stats()["native"], "Manager should be in native mode"
+    finally:
+        driver.stop()
+
+    assert not driver.is_running(), "Driver should stop"
+    assert manager.get(long_id).status == AsyncTaskStatus.CANCELLED, "Stop should cancel tasks left on the loop"
+    assert not manager.get_stats()["native"], "Manager should return to cooperative mode"
+
+    stats = driver.get_stats()
+    assert stats["jitter"]["count"] > 0, "Jitter should be recorded"
+
+    print(f"✓ Driver: {stats['tick_count']} ticks, jitter p99 {stats['jitter']['p99_ms']:.2f}ms")
+
+
+def test_completion_notification():
+    """Test 12: wait() / future / wait_async wake on completion, not by polling."""
+    from senti_core_module.senti_llm.runtime.async_exec import AsyncAwaitCapability
+
+    manager = AsyncTaskManager()
+    driver = RuntimeDriver(None, manager, tick_interval=0.01)
+    awaiter = AsyncAwaitCapability(manager)
+
+    async def worker():
+        await asyncio.sleep(0.05)
+        return "done"
+
+    async def failing_worker():
+        raise ValueError("boom")
+
+    assert driver.start(), "Driver should start"
+    try:
+        task_id = manager.create_task(worker())
+        start = time.perf_counter()
+        result = awaiter.wait(task_id, timeout=2.0)
+        elapsed = time.perf_counter() - start
+
+        assert result["status"] == "completed", f"Task should complete ({result['status']})"
+        assert result["result"] == "done", "Result should be returned"
+        assert elapsed < 0.09, f"wait() should wake on completion ({elapsed * 1000:.1f}ms)"
+        assert manager.get(task_id).future.result(timeout=0) == "done", "Future should hold result"
+
+        failed_id = manager.create_task(failing_worker())
+        assert manager.get(failed_id).wait(2.0), "Failed task should signal completion"
+        assert isinstance(manager.get(failed_id).future.exception(), RuntimeError), \
+            "Future should hold failure"
+
+        async_id = manager.create_task(worker())
+        async_result = asyncio.run(awaiter.wait_async(async_id, timeout=2.0))
+        assert async_result["result"] == "done", "wait_async() should return result"
+    finally:
+        driver.stop()
+
+    pending = AsyncTask(asyncio.sleep(10))
+    assert not pending.wait(0.01), "wait() should time out on pending task"
+    pending.cancel()
+    assert pending.wait(0), "Cancelled task should signal completion"
+    assert pending.future.cancelled(), "Future should be cancelled"
+    assert pending.coroutine.cr_frame is None, "Unstarted coroutine should be closed"
+
+    print(f"✓ wait() woke after {elapsed * 1000:.1f}ms")
+
+
 # ================================================================
 #  MAIN TEST EXECUTION
 # ================================================================
@@ -372,6 +470,8 @@ def main():
     runner.run_test("8. Async Event Handlers", test_async_event_handlers)
     runner.run_test("9. Concurrency Limits", test_concurrency_limits)
     runner.run_test("10. Error Handling", test_error_handling)
+    runner.run_test("11. Runtime Driver", test_runtime_driver)
+    runner.run_test("12. Completion Notification", test_completion_notification)
 
     # Print summary and exit
     success = runner.print_summary()
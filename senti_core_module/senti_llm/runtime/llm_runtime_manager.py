@@ -63,6 +63,12 @@ from senti_core_module.senti_llm.runtime.execution_router import ExecutionRouter
 from senti_core_module.senti_llm.runtime.execution_orchestrator import ExecutionOrchestrator
 from senti_core_module.senti_llm.runtime.action_model import RuntimeAction
 
+# ===============================
+#  RUNTIME DRIVER (FAZA 44.1)
+# ===============================
+
+from senti_core_module.senti_llm.runtime.runtime_driver import RuntimeDriver
+
 
 class LLMRuntimeManager:
     """
@@ -78,7 +84,11 @@ class LLMRuntimeManager:
         dinamičnega nalaganja modulov runtime.
     """
 
-    def __init__(self) -> None:
+    def __init__(
+        self,
+        enable_driver: bool = False,
+        driver_tick_interval: float = 0.05
+    ) -> None:
         # FAZA 31 — inicializacija osnovnih komponent
         self.preflight = LLMRuntimePreflight()
         self.context = RuntimeContext(prompt="", capability="execution")
@@ -92,8 +102,70 @@ class LLMRuntimeManager:
         self.exec_router = ExecutionRouter()
         self.exec_orchestrator = ExecutionOrchestrator(context=self.context)
 
+        # FAZA 44.1 — opcijski runtime driver (scheduler + async v ozadju)
+        self.driver_tick_interval = driver_tick_interval
+        self.driver: Optional[RuntimeDriver] = None
+        if enable_driver:
+            self.start_driver()
+
         print("[LLM Runtime Manager] Inicializiran (FAZA 36.2).")
 
+    # ================================================================
+    #             R U N T I M E   D R I V E R  (FAZA 44.1)
+    # ================================================================
+
+    def start_driver(self, tick_interval: Optional[float] = None) -> bool:
+        """
+        Zažene RuntimeDriver: Scheduler in AsyncTaskManager tečeta v
+        lastni niti z lastnim asyncio loopom, execute() ju ne tick-a več.
+
+        Args:
+            tick_interval: Največji razmik med scheduler tick-i (sekunde)
+
+        Returns:
+            True, če driver teče
+        """
+        if self.driver is not None and self.driver.is_running():
+            return True
+
+        loader = self.exec_orchestrator.module_loader
+        self.driver = RuntimeDriver(
+            scheduler=getattr(loader, "scheduler", None),
+            async_manager=getattr(loader, "async_manager", None),
+            tick_interval=tick_interval or self.driver_tick_interval
+        )
+
+        started = self.driver.start()
+        self.exec_orchestrator.driver = self.driver
+        return started
+
+    def stop_driver(self) -> None:
+        """
+        Ustavi RuntimeDriver; execute() spet tick-a inline (kooperativno).
+        """
+        if self.driver is None:
+            return
+
+        self.driver.stop()
+        self.exec_orchestrator.driver = None
+        self.driver = None
+
+    def shutdown(self) -> None:
+        """Čist zaključek runtime-a (ustavi driver)."""
+        self.stop_driver()
+
+    def get_runtime_stats(self) -> Dict[str, Any]:
+        """
+        Latenca ukazov (execute) in jitter scheduler-ja.
+
+        Returns:
+            Dict s command_latency in (če teče) driver statistiko
+        """
+        return {
+            "command_latency": self.exec_orchestrator.get_latency_stats(),
+            "driver": self.driver.get_stats() if self.driver else None
+        }
+
     # ================================================================
     #                J A V N I   A P I
     # ================================================================
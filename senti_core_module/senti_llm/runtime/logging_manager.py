@@ -10,6 +10,8 @@ Features:
 - Thread-safe operations
 - Non-blocking (never throws)
 - Context enrichment (timestamp, module, phase)
+- Buffered asynchronous sinks (bounded queue, background batch writer)
+- Size/time based file rotation with optional gzip of closed segments
 
 Design Philosophy:
 - NEVER throw exceptions from logging code
@@ -19,10 +21,16 @@ Design Philosophy:
 
 from __future__ import annotations
 
+import atexit
+import glob
+import gzip
 import os
+import re
+import shutil
 import time
 import threading
-from typing import Any, Dict, List, Optional
+from collections import deque
+from typing import Any, Dict, List, Optional, Tuple
 from datetime import datetime
 from enum import IntEnum
 
@@ -100,19 +108,58 @@ class LogSink:
         """Write log record to sink."""
         raise NotImplementedError
 
+    def write_batch(self, records: List[LogRecord]):
+        """Write several records (sinks override for one large write)."""
+        for record in records:
+            self.write(record)
+
+    def flush(self):
+        """Flush buffered output."""
+        pass
+
+    def close(self):
+        """Release resources."""
+        pass
+
+
+# Rotated segment suffix: <stamp>[-<n>][.gz]
+_SEGMENT_RE = re.compile(r"(\d{8}-\d{6})(?:-(\d+))?(?:\.gz)?")
+
 
 class FileSink(LogSink):
     """
     File-based log sink.
 
     Writes logs to specified file path.
-    Thread-safe with file locking.
+    Thread-safe with file locking. The file stays open between writes.
+
+    Rotation (optional):
+    - max_bytes: rotate before the file would exceed this size
+    - rotate_interval: rotate when the file is older than N seconds
+    - backup_count: keep at most N rotated segments
+    - compress: gzip rotated segments (<path>.<timestamp>.gz)
     """
 
-    def __init__(self, filepath: str):
+    def __init__(
+        self,
+        filepath: str,
+        max_bytes: int = 0,
+        rotate_interval: float = 0,
+        backup_count: int = 5,
+        compress: bool = False
+    ):
         self.filepath = filepath
+        self.max_bytes = max_bytes
+        self.rotate_interval = rotate_interval
+        self.backup_count = backup_count
+        self.compress = compress
         self._lock = threading.Lock()
 
+        self._file = None
+        self._size = 0
+        self._opened_at = 0.0
+        self.rotations = 0
+
         # Ensure directory exists
         try:
             os.makedirs(os.path.dirname(self.filepath), exist_ok=True)
@@ -122,14 +169,259 @@ class FileSink(LogSink):
 
     def write(self, record: LogRecord):
         """Write log record to file."""
+        self.write_batch([record])
+
+    def write_batch(self, records: List[LogRecord]):
+        """Write records to file, one write per rotation segment."""
         try:
+            lines = [record.format() + "\n" for record in records]
             with self._lock:
-                with open(self.filepath, "a", encoding="utf-8") as f:
-                    f.write(record.format() + "\n")
+                if self._file is None:
+                    self._open()
+
+                if not self.max_bytes:
+                    if self._should_rotate(self._size, 0):
+                        self._rotate()
+                    self._write("".join(lines))
+                    return
+
+                # Split the batch where the size limit would be crossed
+                chunk: List[str] = []
+                chunk_size = 0
+                for line in lines:
+                    if self._should_rotate(self._size + chunk_size, len(line)):
+                        if chunk:
+                            self._write("".join(chunk))
+                            chunk, chunk_size = [], 0
+                        self._rotate()
+                    chunk.append(line)
+                    chunk_size += len(line)
+                self._write("".join(chunk))
         except Exception:
             # Never throw from logging
             pass
 
+    def _write(self, data: str):
+        self._file.write(data)
+        self._size += len(data)
+
+    def _open(self):
+        self._file = open(self.filepath, "a", encoding="utf-8")
+        self._size = self._file.tell()
+        try:
+            # Age of an existing file counts towards time based rotation
+            self._opened_at = os.path.getmtime(self.filepath) if self._size else time.time()
+        except OSError:
+            self._opened_at = time.time()
+
+    def _should_rotate(self, pending: int, incoming: int) -> bool:
+        """
+        Args:
+            pending: Bytes already in (or about to be written to) the segment
+            incoming: Size of the next line
+        """
+        if not pending:
+            # Never rotate an empty segment; restart its clock instead
+            self._opened_at = time.time()
+            return False
+        if self.max_bytes and pending + incoming > self.max_bytes:
+            return True
+        if self.rotate_interval and time.time() - self._opened_at >= self.rotate_interval:
+            return True
+        return False
+
+    def _rotate(self):
+        """Close the current file, move it aside and start a new one."""
+        self._file.close()
+        self._file = None
+
+        # Segments rotated within the same second get increasing suffixes,
+        # never a freed lower one, so names keep sorting oldest first
+        stamp = datetime.now().strftime("%Y%m%d-%H%M%S")
+        taken = [seq for (seg_stamp, seq), _path in self._segments() if seg_stamp == stamp]
+        target = f"{self.filepath}.{stamp}-{max(taken) + 1}" if taken else f"{self.filepath}.{stamp}"
+
+        try:
+            os.replace(self.filepath, target)
+            if self.compress:
+                with open(target, "rb") as src, gzip.open(target + ".gz", "wb") as dst:
+                    shutil.copyfileobj(src, dst)
+                os.remove(target)
+            self.rotations += 1
+            self._prune()
+        except Exception:
+            pass
+
+        self._open()
+
+    def _segments(self) -> List[Tuple[Tuple[str, int], str]]:
+        """Rotated segments as ((stamp, seq), path), oldest first."""
+        segments = []
+        for segment in glob.glob(glob.escape(self.filepath) + ".*"):
+            match = _SEGMENT_RE.fullmatch(segment[len(self.filepath) + 1:])
+            if match:
+                segments.append(((match.group(1), int(match.group(2) or 0)), segment))
+        return sorted(segments)
+
+    def _prune(self):
+        # Order by the stamp in the name; mtimes can tie within a second
+        segments = [segment for _key, segment in self._segments()]
+        for segment in segments[:max(0, len(segments) - self.backup_count)]:
+            try:
+                os.remove(segment)
+            except OSError:
+                pass
+
+    def flush(self):
+        """Flush the open file."""
+        try:
+            with self._lock:
+                if self._file is not None:
+                    self._file.flush()
+        except Exception:
+            pass
+
+    def close(self):
+        """Close the open file."""
+        try:
+            with self._lock:
+                if self._file is not None:
+                    self._file.close()
+                    self._file = None
+        except Exception:
+            pass
+
+
+class AsyncSink(LogSink):
+    """
+    Buffered asynchronous wrapper around another sink.
+
+    Callers only append to a bounded in-memory queue (a deque append,
+    no lock on the hot path); a background writer thread hands records
+    to the wrapped sink in batches, waking when batch_size records are
+    queued or every flush_interval seconds. When the queue is full new
+    records are dropped and counted instead of blocking the caller.
+    """
+
+    def __init__(
+        self,
+        sink: LogSink,
+        queue_size: int = 10000,
+        batch_size: int = 256,
+        flush_interval: float = 0.5
+    ):
+        self.sink = sink
+        self.queue_size = queue_size
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+
+        self._queue: deque = deque()
+        self._wake = threading.Event()
+        self._drop_lock = threading.Lock()
+        self.dropped = 0
+        self.written = 0
+        self.batches = 0
+        self._closed = False
+
+        self._thread = threading.Thread(
+            target=self._run,
+            name="LogWriter",
+            daemon=True
+        )
+        self._thread.start()
+
+    def write(self, record: LogRecord):
+        """Queue a record for the writer thread."""
+        if self._closed or len(self._queue) >= self.queue_size:
+            with self._drop_lock:
+                self.dropped += 1
+            return
+
+        self._queue.append(record)
+        if len(self._queue) >= self.batch_size:
+            self._wake.set()
+
+    def _run(self):
+        while True:
+            self._wake.wait(self.flush_interval)
+            self._wake.clear()
+            if not self._drain():
+                return
+
+    def _drain(self) -> bool:
+        """
+        Write everything queued. Flush markers (threading.Event) are
+        acknowledged once the records queued before them are written.
+
+        Returns:
+            False once the close marker has been processed
+        """
+        batch: List[LogRecord] = []
+        running = True
+
+        while self._queue:
+            item = self._queue.popleft()
+            if isinstance(item, LogRecord):
+                batch.append(item)
+                if len(batch) >= self.batch_size:
+                    self._write_batch(batch)
+                    batch = []
+                continue
+
+            # Flush / close marker
+            self._write_batch(batch)
+            batch = []
+            self.sink.flush()
+            if item is _CLOSE:
+                running = False
+            else:
+                item.set()
+
+        self._write_batch(batch)
+        self.sink.flush()
+        return running
+
+    def _write_batch(self, batch: List[LogRecord]):
+        if not batch:
+            return
+        try:
+            self.sink.write_batch(batch)
+        except Exception:
+            pass
+        self.written += len(batch)
+        self.batches += 1
+
+    def flush(self, timeout: float = 5.0):
+        """Block until every record queued so far has been written."""
+        if self._closed or not self._thread.is_alive():
+            return
+        done = threading.Event()
+        self._queue.append(done)
+        self._wake.set()
+        done.wait(timeout)
+
+    def close(self, timeout: float = 5.0):
+        """Write what is queued, stop the writer and close the sink."""
+        if self._closed:
+            return
+        self._closed = True
+        self._queue.append(_CLOSE)
+        self._wake.set()
+        self._thread.join(timeout)
+        self.sink.close()
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            "queued": len(self._queue),
+            "written": self.written,
+            "batches": self.batches,
+            "dropped": self.dropped
+        }
+
+
+# Close marker for AsyncSink writer threads
+_CLOSE = threading.Event()
+
 
 class ConsoleSink(LogSink):
     """
@@ -305,20 +597,49 @@ class LoggingManager:
 
     def enable_file_logging(
         self,
-        filepath: str = "senti_data/logs/system.log"
+        filepath: str = "senti_data/logs/system.log",
+        buffered: bool = True,
+        max_bytes: int = 0,
+        rotate_interval: float = 0,
+        backup_count: int = 5,
+        compress: bool = False,
+        queue_size: int = 10000,
+        batch_size: int = 256,
+        flush_interval: float = 0.5
     ):
         """
         Enable file logging.
 
         Args:
             filepath: Path to log file
+            buffered: Write through a background AsyncSink
+            max_bytes: Rotate the file past this size (0 = never)
+            rotate_interval: Rotate the file after N seconds (0 = never)
+            backup_count: Rotated segments to keep
+            compress: gzip rotated segments
+            queue_size: AsyncSink queue bound (records beyond are dropped)
+            batch_size: Records per batched write
+            flush_interval: Max seconds a record waits in the queue
         """
         try:
             # Make path absolute if relative
             if not os.path.isabs(filepath):
                 filepath = os.path.join(os.getcwd(), filepath)
 
-            sink = FileSink(filepath)
+            sink = FileSink(
+                filepath,
+                max_bytes=max_bytes,
+                rotate_interval=rotate_interval,
+                backup_count=backup_count,
+                compress=compress
+            )
+            if buffered:
+                sink = AsyncSink(
+                    sink,
+                    queue_size=queue_size,
+                    batch_size=batch_size,
+                    flush_interval=flush_interval
+                )
             self.add_sink(sink)
         except Exception:
             # Never throw from logging
@@ -333,7 +654,8 @@ class LoggingManager:
         """
         try:
             with self._lock:
-                self._sinks.append(sink)
+                # Copy-on-write: _write_record reads the list without the lock
+                self._sinks = self._sinks + [sink]
         except Exception:
             pass
 
@@ -345,20 +667,35 @@ class LoggingManager:
             record: LogRecord to write
         """
         try:
-            with self._lock:
-                for sink in self._sinks:
-                    try:
-                        sink.write(record)
-                    except Exception:
-                        # Never let sink error break logging
-                        pass
+            # Sinks do their own locking; holding the manager lock here
+            # would serialize every logger on sink I/O.
+            for sink in self._sinks:
+                try:
+                    sink.write(record)
+                except Exception:
+                    # Never let sink error break logging
+                    pass
         except Exception:
             # Never throw from logging
             pass
 
     def flush(self):
-        """Flush all sinks (no-op for now)."""
-        pass
+        """Flush all sinks (waits for buffered sinks to write)."""
+        for sink in self._sinks:
+            try:
+                sink.flush()
+            except Exception:
+                pass
+
+    def close(self):
+        """Flush and close all sinks."""
+        with self._lock:
+            sinks, self._sinks = self._sinks, []
+        for sink in sinks:
+            try:
+                sink.close()
+            except Exception:
+                pass
 
     def get_stats(self) -> Dict[str, Any]:
         """
@@ -373,6 +710,7 @@ class LoggingManager:
                     "global_level": self.global_level.name,
                     "logger_count": len(self._loggers),
                     "sink_count": len(self._sinks),
+                    "dropped": sum(getattr(sink, "dropped", 0) for sink in self._sinks),
                     "modules": list(self._loggers.keys())
                 }
         except Exception:
@@ -403,4 +741,7 @@ def get_global_logging_manager() -> LoggingManager:
         # Enable file logging by default
         _global_logging_manager.enable_file_logging()
 
+        # Buffered records must reach disk before the process exits
+        atexit.register(_global_logging_manager.close)
+
     return _global_logging_manager
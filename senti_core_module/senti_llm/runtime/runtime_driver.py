@@ -0,0 +1,234 @@
+"""
+FAZA 44.1 — Runtime Driver
+---------------------------
+Background driver for the Scheduler and AsyncTaskManager.
+
+Without a driver, ExecutionOrchestrator.execute() ticks both inline
+before every action: command latency includes scheduled work, and
+scheduled work only advances when a command arrives.
+
+The driver (opt-in) owns a persistent asyncio event loop in its own
+thread:
+- Scheduler.tick() runs when the next task is due, at least every
+  tick_interval seconds
+- AsyncTaskManager runs in native mode: coroutines are started on the
+  driver loop and finish through done callbacks (no step() polling)
+- Lateness of scheduled ticks (jitter) and tick duration are recorded
+
+Lifecycle:
+    driver = RuntimeDriver(scheduler, async_manager, tick_interval=0.05)
+    driver.start()
+    ...
+    driver.stop()
+
+LLMRuntimeManager wires it up via start_driver() / stop_driver().
+"""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+from collections import deque
+from typing import Any, Dict, Iterable, Optional, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .scheduler import Scheduler
+    from .async_exec import AsyncTaskManager
+
+
+def latency_summary(samples: Iterable[float]) -> Dict[str, Any]:
+    """
+    Summarize latency samples (seconds) in milliseconds.
+
+    Args:
+        samples: Latency samples in seconds
+
+    Returns:
+        Dict with count, mean, p50, p99 and max (ms)
+    """
+    ordered = sorted(samples)
+    if not ordered:
+        return {"count": 0, "mean_ms": 0.0, "p50_ms": 0.0, "p99_ms": 0.0, "max_ms": 0.0}
+
+    def percentile(p: float) -> float:
+        return ordered[min(len(ordered) - 1, int(p * len(ordered)))] * 1000
+
+    return {
+        "count": len(ordered),
+        "mean_ms": sum(ordered) / len(ordered) * 1000,
+        "p50_ms": percentile(0.50),
+        "p99_ms": percentile(0.99),
+        "max_ms": ordered[-1] * 1000
+    }
+
+
+class RuntimeDriver:
+    """
+    Drives Scheduler ticks and async tasks from a dedicated thread.
+
+    Safety:
+    - All exceptions from ticks are caught
+    - stop() is idempotent and joins the thread
+    - Tasks still running on the loop at stop() are cancelled
+    """
+
+    SAMPLE_WINDOW = 1000
+
+    def __init__(
+        self,
+        scheduler: Optional['Scheduler'] = None,
+        async_manager: Optional['AsyncTaskManager'] = None,
+        tick_interval: float = 0.05
+    ):
+        """
+        Initialize runtime driver.
+
+        Args:
+            scheduler: Scheduler to tick
+            async_manager: AsyncTaskManager to run natively on the loop
+            tick_interval: Maximum seconds between scheduler ticks
+        """
+        self.scheduler = scheduler
+        self.async_manager = async_manager
+        self.tick_interval = tick_interval
+
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._thread: Optional[threading.Thread] = None
+        self._stop_event: Optional[asyncio.Event] = None
+        self._started = threading.Event()
+
+        self._tick_count = 0
+        self._jitter = deque(maxlen=self.SAMPLE_WINDOW)
+        self._tick_durations = deque(maxlen=self.SAMPLE_WINDOW)
+
+    def start(self, timeout: float = 5.0) -> bool:
+        """
+        Start the driver thread and wait until its loop runs.
+
+        Args:
+            timeout: Seconds to wait for startup
+
+        Returns:
+            True if the driver is running
+        """
+        if self.is_running():
+            return True
+
+        self._started.clear()
+        self._thread = threading.Thread(
+            target=self._run,
+            name="RuntimeDriver",
+            daemon=True
+        )
+        self._thread.start()
+        return self._started.wait(timeout)
+
+    def stop(self, timeout: float = 5.0):
+        """
+        Stop ticking, cancel tasks left on the loop and join the thread.
+
+        Args:
+            timeout: Seconds to wait for the thread
+        """
+        thread = self._thread
+        if thread is None:
+            return
+
+        loop = self._loop
+        if loop is not None and self._stop_event is not None:
+            try:
+                loop.call_soon_threadsafe(self._stop_event.set)
+            except RuntimeError:
+                # Loop already closed
+                pass
+
+        thread.join(timeout)
+        self._thread = None
+
+    def is_running(self) -> bool:
+        """Check whether the driver thread is alive."""
+        return self._thread is not None and self._thread.is_alive()
+
+    def _run(self):
+        """Thread body: own the loop for the driver's lifetime."""
+        loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(loop)
+        self._loop = loop
+
+        try:
+            loop.run_until_complete(self._main())
+        except Exception:
+            pass
+        finally:
+            if self.async_manager is not None:
+                self.async_manager.detach_loop()
+            try:
+                loop.run_until_complete(loop.shutdown_asyncgens())
+            except Exception:
+                pass
+            loop.close()
+            self._loop = None
+            self._stop_event = None
+
+    async def _main(self):
+        self._stop_event = asyncio.Event()
+        if self.async_manager is not None:
+            self.async_manager.attach_loop(self._loop)
+        self._started.set()
+
+        while not self._stop_event.is_set():
+            # Sleep until the next task is due, at most one interval
+            now = time.time()
+            target = now + self.tick_interval
+            due_at = None
+            if self.scheduler is not None:
+                due_at = self.scheduler.registry.next_due_time()
+                if due_at is not None and due_at < target:
+                    target = max(now, due_at)
+
+            try:
+                await asyncio.wait_for(self._stop_event.wait(), target - now)
+                break
+            except asyncio.TimeoutError:
+                pass
+
+            self._tick(due_at if due_at is not None and due_at <= target else None)
+
+    def _tick(self, due_at: Optional[float]):
+        """
+        Run one scheduler / async manager tick on the loop thread.
+
+        Args:
+            due_at: When a task was due (records jitter), or None
+        """
+        start = time.time()
+        if due_at is not None:
+            self._jitter.append(max(0.0, start - due_at))
+
+        try:
+            if self.scheduler is not None:
+                self.scheduler.tick(start)
+            if self.async_manager is not None:
+                self.async_manager.tick(start)
+        except Exception:
+            # Never crash the driver on tick failure
+            pass
+
+        self._tick_count += 1
+        self._tick_durations.append(time.time() - start)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get driver statistics.
+
+        Returns:
+            Stats dict with tick count, jitter and tick duration summaries
+        """
+        return {
+            "running": self.is_running(),
+            "tick_interval": self.tick_interval,
+            "tick_count": self._tick_count,
+            "jitter": latency_summary(list(self._jitter)),
+            "tick_duration": latency_summary(list(self._tick_durations))
+        }
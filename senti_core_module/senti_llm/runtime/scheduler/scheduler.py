@@ -12,7 +12,7 @@ Features:
 Design Principles:
 - Cooperative (no threading)
 - tick() called explicitly
-- Max 10 tasks per tick (safety limit)
+- Max 10 tasks per tick (safety limit), earliest due first
 - Auto-disable failed tasks
 - EventBus integration
 - Never crashes runtime
@@ -172,7 +172,8 @@ class Scheduler:
         """
         Execute scheduler tick.
 
-        Processes due tasks up to MAX_TASKS_PER_TICK limit.
+        Processes due tasks up to MAX_TASKS_PER_TICK limit, in next_run
+        order. Overflow carries over to the next tick.
 
         Args:
             now_timestamp: Current timestamp (defaults to time.time())
@@ -190,16 +191,20 @@ class Scheduler:
                 "timestamp": now_timestamp
             })
 
-            # Get due tasks
-            due_tasks = self.registry.list_due_tasks(now_timestamp)
-
-            # Safety limit: max 10 tasks per tick
-            if len(due_tasks) > self.MAX_TASKS_PER_TICK:
-                due_tasks = due_tasks[:self.MAX_TASKS_PER_TICK]
+            # Pop due tasks, earliest first. Safety limit: max 10 tasks per
+            # tick; the rest stay at the front of the due index and run
+            # first on the next tick.
+            due_tasks = self.registry.pop_due_tasks(
+                now_timestamp,
+                self.MAX_TASKS_PER_TICK
+            )
 
-            # Execute tasks
+            # Execute tasks and put them back into the due index
             for task in due_tasks:
-                self._execute_task(task, now_timestamp)
+                try:
+                    self._execute_task(task, now_timestamp)
+                finally:
+                    self.registry.requeue(task)
 
         except Exception:
             # Never crash on tick failure
@@ -246,6 +251,18 @@ class Scheduler:
             # Never crash on event trigger
             pass
 
+    def has_event_handlers(self, event_type: str) -> bool:
+        """
+        Check whether event-triggered tasks exist for an event type.
+
+        Args:
+            event_type: Event type
+
+        Returns:
+            True if trigger_event() would run at least one task
+        """
+        return self.registry.has_event_handlers(event_type)
+
     def _execute_task(self, task: Task, now_timestamp: float):
         """
         Execute a single task.
@@ -292,7 +309,8 @@ class Scheduler:
             payload: Event payload
         """
         try:
-            if self.event_bus:
+            # Skip building the payload when nobody listens
+            if self.event_bus and self.event_bus.has_listeners(event_type):
                 from ..event_context import EventContext
 
                 event_ctx = EventContext(
@@ -8,17 +8,21 @@ Responsibilities:
 - Query tasks by ID or type
 - List event handlers
 - Maintain task state
+- Index time-based tasks by next_run
 
 Design:
 - Thread-safe operations (with lock)
 - Fast lookups by ID
 - Event handler indexing
+- Due-time min-heap (lazy invalidation) for O(k log n) due queries
 """
 
 from __future__ import annotations
 
+import heapq
+import itertools
 import threading
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 
 from .task import Task, TaskType
 
@@ -30,12 +34,20 @@ class TaskRegistry:
     Maintains:
     - tasks_by_id: Fast ID lookup
     - event_handlers: Index of event -> tasks
+    - due_heap: (next_run, order, task_id) for time-based tasks
+
+    Heap entries are invalidated lazily: each queued task has exactly one
+    live entry (its order number is kept in _queued); entries for tasks
+    that were unregistered or requeued are skipped when they surface.
     """
 
     def __init__(self):
         """Initialize task registry."""
         self._tasks_by_id: Dict[str, Task] = {}
         self._event_handlers: Dict[str, List[Task]] = {}
+        self._due_heap: List[Tuple[float, int, str]] = []
+        self._queued: Dict[str, int] = {}
+        self._order = itertools.count()
         self._lock = threading.Lock()
 
     def register(self, task: Task) -> None:
@@ -49,6 +61,7 @@ class TaskRegistry:
             with self._lock:
                 # Store in main registry
                 self._tasks_by_id[task.id] = task
+                self._queue(task)
 
                 # Index event handlers
                 if task.type == TaskType.EVENT and task.event_type:
@@ -78,8 +91,9 @@ class TaskRegistry:
                 if not task:
                     return False
 
-                # Remove from main registry
+                # Remove from main registry (its heap entry goes stale)
                 del self._tasks_by_id[task_id]
+                self._queued.pop(task_id, None)
 
                 # Remove from event handler index
                 if task.type == TaskType.EVENT and task.event_type:
@@ -127,10 +141,108 @@ class TaskRegistry:
         except Exception:
             return []
 
+    def _queue(self, task: Task) -> None:
+        """
+        Push a heap entry for a time-based task. Caller holds the lock.
+
+        Args:
+            task: Registered task
+        """
+        if task.type == TaskType.EVENT or not task.enabled:
+            self._queued.pop(task.id, None)
+            return
+
+        order = next(self._order)
+        self._queued[task.id] = order
+        heapq.heappush(self._due_heap, (task.next_run, order, task.id))
+
+        # Compact once stale entries dominate the heap
+        if len(self._due_heap) > 2 * len(self._queued) + 64:
+            self._due_heap = [
+                entry for entry in self._due_heap
+                if self._queued.get(entry[2]) == entry[1]
+            ]
+            heapq.heapify(self._due_heap)
+
+    def requeue(self, task: Task) -> None:
+        """
+        Re-index a task after its next_run or enabled flag changed.
+
+        Called by the scheduler after executing a popped task; disabled
+        and unregistered tasks are not queued again.
+
+        Args:
+            task: Task to re-index
+        """
+        try:
+            with self._lock:
+                if self._tasks_by_id.get(task.id) is task:
+                    self._queue(task)
+        except Exception:
+            pass
+
+    def pop_due_tasks(self, now_timestamp: float, limit: Optional[int] = None) -> List[Task]:
+        """
+        Remove and return due tasks, earliest next_run first.
+
+        Costs O(k log n) for k due tasks instead of a full scan. Tasks
+        left over by the limit stay at the front of the heap, so they
+        run first on the next call. Popped tasks must be passed back
+        to requeue() once they have run.
+
+        Args:
+            now_timestamp: Current timestamp
+            limit: Maximum number of tasks to pop (None = all due)
+
+        Returns:
+            List of due tasks
+        """
+        try:
+            with self._lock:
+                heap = self._due_heap
+                due: List[Task] = []
+
+                while heap and heap[0][0] <= now_timestamp:
+                    if limit is not None and len(due) >= limit:
+                        break
+
+                    _, order, task_id = heapq.heappop(heap)
+                    if self._queued.get(task_id) != order:
+                        # Stale entry (unregistered or requeued)
+                        continue
+                    del self._queued[task_id]
+
+                    task = self._tasks_by_id[task_id]
+                    if task.due(now_timestamp):
+                        due.append(task)
+
+                return due
+        except Exception:
+            return []
+
+    def next_due_time(self) -> Optional[float]:
+        """
+        Earliest next_run among queued tasks.
+
+        Returns:
+            Timestamp, or None if no time-based task is queued
+        """
+        try:
+            with self._lock:
+                heap = self._due_heap
+                # Drop stale entries from the top
+                while heap and self._queued.get(heap[0][2]) != heap[0][1]:
+                    heapq.heappop(heap)
+                return heap[0][0] if heap else None
+        except Exception:
+            return None
+
     def list_due_tasks(self, now_timestamp: float) -> List[Task]:
         """
         List all tasks due for execution.
 
+        Scans every task; Scheduler.tick() uses pop_due_tasks() instead.
+
         Args:
             now_timestamp: Current timestamp
 
@@ -164,6 +276,21 @@ class TaskRegistry:
         except Exception:
             return []
 
+    def has_event_handlers(self, event_type: str) -> bool:
+        """
+        Check whether any task is registered for an event type.
+
+        Lock-free dict lookup; used by EventBus.has_listeners() on the
+        publish hot path.
+
+        Args:
+            event_type: Event type identifier
+
+        Returns:
+            True if at least one event task exists for this type
+        """
+        return bool(self._event_handlers.get(event_type))
+
     def count(self) -> int:
         """
         Count total registered tasks.
@@ -196,6 +323,8 @@ class TaskRegistry:
             with self._lock:
                 self._tasks_by_id.clear()
                 self._event_handlers.clear()
+                self._due_heap.clear()
+                self._queued.clear()
         except Exception:
             pass
 
@@ -212,6 +341,7 @@ class TaskRegistry:
                     "total_tasks": len(self._tasks_by_id),
                     "enabled_tasks": sum(1 for t in self._tasks_by_id.values() if t.enabled),
                     "event_types": len(self._event_handlers),
+                    "queued_tasks": len(self._queued),
                     "failed_tasks": sum(1 for t in self._tasks_by_id.values() if t.failure_count > 0)
                 }
         except Exception:
@@ -32,22 +32,27 @@ __author__ = "Senti OS Team"
 from .memory_manager import MemoryManager
 from .memory_engine import MemoryEngine
 from .memory_store import MemoryStore
+from .wal_memory_store import WALMemoryStore
 from .working_memory import WorkingMemory
 from .episodic_memory import EpisodicMemory
 from .semantic_memory import SemanticMemory
+from .text_index import InvertedIndex
 from .memory_rules import MemoryRules
 from .memory_events import MemoryEvents, MemoryEventListener
-from .consolidation_service import ConsolidationService
+from .consolidation_service import ConsolidationService, ActivityAccumulator
 
 __all__ = [
     "MemoryManager",
     "MemoryEngine",
     "MemoryStore",
+    "WALMemoryStore",
     "WorkingMemory",
     "EpisodicMemory",
     "SemanticMemory",
+    "InvertedIndex",
     "MemoryRules",
     "MemoryEvents",
     "MemoryEventListener",
     "ConsolidationService",
+    "ActivityAccumulator",
 ]
@@ -7,12 +7,126 @@ Converts episodic memory to semantic memory.
 - Extracts key facts
 - Stores in semantic memory
 - Prunes old episodic data
+- Single-pass streaming accumulation, optional incremental mode
 """
 
 import time
-from typing import Dict, List, Any, Optional
+from typing import Dict, Iterable, Iterator, Any, Optional
 from datetime import datetime, timedelta
-from collections import Counter
+from collections import Counter, deque
+
+from .episodic_memory import event_id
+
+
+class ActivityAccumulator:
+    """
+    Single-pass accumulator for consolidation facts.
+    Each event is visited once; its payload is stringified once and
+    timestamps are compared as ISO strings (only min/max get parsed).
+    """
+
+    def __init__(self, recent_hours: int = 1):
+        self.recent_hours = recent_hours
+        self.recent_cutoff = (datetime.now() - timedelta(hours=recent_hours)).isoformat()
+
+        self.count = 0
+        self.type_counts: Counter = Counter()
+        self.start: Optional[str] = None
+        self.end: Optional[str] = None
+        self.module_count = 0
+        self.error_count = 0
+        self.success_count = 0
+        self.recent = deque()
+
+    def add(self, event: Dict[str, Any]) -> None:
+        timestamp = event["timestamp"]
+
+        self.count += 1
+        self.type_counts[event["event_type"]] += 1
+
+        if self.start is None or timestamp < self.start:
+            self.start = timestamp
+        if self.end is None or timestamp > self.end:
+            self.end = timestamp
+
+        payload_str = str(event.get("payload", "")).lower()
+        if "module" in payload_str:
+            self.module_count += 1
+        if "error" in payload_str:
+            self.error_count += 1
+        if "success" in payload_str:
+            self.success_count += 1
+
+        if timestamp >= self.recent_cutoff:
+            self.recent.append(timestamp)
+
+    def add_all(self, events: Iterable[Dict[str, Any]]) -> "ActivityAccumulator":
+        for event in events:
+            self.add(event)
+        return self
+
+    def merge(self, other: "ActivityAccumulator") -> None:
+        """Fold a later batch into this accumulator."""
+        self.count += other.count
+        self.type_counts.update(other.type_counts)
+
+        if other.start is not None and (self.start is None or other.start < self.start):
+            self.start = other.start
+        if other.end is not None and (self.end is None or other.end > self.end):
+            self.end = other.end
+
+        self.module_count += other.module_count
+        self.error_count += other.error_count
+        self.success_count += other.success_count
+        self.recent.extend(other.recent)
+
+    def facts(self) -> Dict[str, Any]:
+        """Materialize semantic facts (same keys as full extraction)."""
+        facts: Dict[str, Any] = {}
+
+        # Event type frequency
+        facts["event_type_frequency"] = dict(self.type_counts)
+        facts["most_common_event_type"] = (
+            self.type_counts.most_common(1)[0][0] if self.type_counts else None
+        )
+
+        if not self.count:
+            return facts
+
+        # Time range
+        facts["memory_time_range"] = {"start": self.start, "end": self.end}
+
+        # Patterns
+        if self.module_count:
+            facts["module_activity_count"] = self.module_count
+
+        if self.error_count:
+            facts["error_count"] = self.error_count
+            facts["has_errors"] = True
+
+        if self.success_count:
+            facts["success_count"] = self.success_count
+
+        # Activity
+        try:
+            span = datetime.fromisoformat(self.end) - datetime.fromisoformat(self.start)
+            hours = span.total_seconds() / 3600
+        except Exception:
+            hours = 0
+
+        if hours > 0:
+            facts["events_per_hour"] = round(self.count / hours, 2)
+
+        # Age out recent timestamps that passed the window since added
+        cutoff = (datetime.now() - timedelta(hours=self.recent_hours)).isoformat()
+        while self.recent and self.recent[0] < cutoff:
+            self.recent.popleft()
+
+        if self.recent:
+            facts["recent_activity_count"] = len(self.recent)
+            facts["recent_activity_percentage"] = round(len(self.recent) / self.count * 100, 2)
+
+        return facts
 
 
 class ConsolidationService:
@@ -26,7 +140,8 @@ class ConsolidationService:
         episodic_memory,
         semantic_memory,
         memory_events,
-        logger=None
+        logger=None,
+        incremental: bool = False
     ):
         """
         Initialize consolidation service.
@@ -36,44 +151,67 @@ class ConsolidationService:
             semantic_memory: SemanticMemory instance
             memory_events: MemoryEvents publisher
             logger: Optional logger
+            incremental: Default mode - only process events not yet seen
+                past the high-water mark and fold them into running totals
         """
         self.episodic = episodic_memory
         self.semantic = semantic_memory
         self.events = memory_events
         self.logger = logger
+        self.incremental = incremental
 
         self.last_consolidation = None
 
+        # Incremental state: newest consolidated timestamp, ids of the events
+        # consolidated at exactly that timestamp, running totals
+        self.high_water_mark: Optional[str] = None
+        self._high_water_ids: Counter = Counter()
+        self._totals: Optional[ActivityAccumulator] = None
+
     # =====================================================
     # MAIN CONSOLIDATION
     # =====================================================
 
-    def consolidate(self, min_events: int = 10) -> Dict[str, Any]:
+    def consolidate(self, min_events: int = 10, incremental: Optional[bool] = None) -> Dict[str, Any]:
         """
         Perform memory consolidation.
 
         Args:
             min_events: Minimum events needed to trigger consolidation
+            incremental: Only process events added since the last run
+                (defaults to the service's mode)
 
         Returns:
             Consolidation result dictionary
         """
         start_time = time.time()
+        if incremental is None:
+            incremental = self.incremental
 
         try:
-            # Get episodic events
-            events = self.episodic.get_events()
-
-            if len(events) < min_events:
-                self._log("info", f"Not enough events for consolidation ({len(events)} < {min_events})")
+            # Stream episodic events through a single-pass accumulator
+            cursor = {"timestamp": None, "ids": Counter()}
+            since = self.high_water_mark if incremental else None
+            batch = ActivityAccumulator().add_all(self._new_events(since, cursor))
+            event_count = batch.count
+
+            if event_count < min_events:
+                self._log("info", f"Not enough events for consolidation ({event_count} < {min_events})")
                 return {
                     "status": "skipped",
                     "reason": "insufficient_events",
-                    "event_count": len(events)
+                    "event_count": event_count
                 }
 
+            if incremental and self._totals is not None:
+                self._totals.merge(batch)
+            else:
+                self._totals = batch
+            self.high_water_mark = cursor["timestamp"]
+            self._high_water_ids = cursor["ids"]
+
             # Extract facts from events
-            facts = self._extract_facts(events)
+            facts = self._totals.facts()
 
             # Save facts to semantic memory
             facts_saved = 0
@@ -82,27 +220,29 @@ class ConsolidationService:
                     facts_saved += 1
 
             # Prune old episodic events (keep last 50%)
-            keep_count = len(events) // 2
+            keep_count = self._episodic_count() // 2
             pruned_count = self.episodic.prune_old_events(keep_count=keep_count)
 
             duration_ms = (time.time() - start_time) * 1000
 
             # Publish event
             self.events.publish_memory_consolidated(
-                episodic_count=len(events),
+                episodic_count=event_count,
                 semantic_count=facts_saved,
                 duration_ms=duration_ms
             )
 
             self.last_consolidation = datetime.now().isoformat()
 
-            self._log("info", f"Consolidation complete: {len(events)} events -> {facts_saved} facts (pruned {pruned_count})")
+            self._log("info", f"Consolidation complete: {event_count} events -> {facts_saved} facts (pruned {pruned_count})")
 
             return {
                 "status": "success",
-                "events_processed": len(events),
+                "mode": "incremental" if incremental else "full",
+                "events_processed": event_count,
                 "facts_created": facts_saved,
                 "events_pruned": pruned_count,
+                "high_water_mark": self.high_water_mark,
                 "duration_ms": duration_ms,
                 "timestamp": self.last_consolidation
             }
@@ -117,148 +257,56 @@ class ConsolidationService:
                 "error": str(e)
             }
 
-    # =====================================================
-    # FACT EXTRACTION
-    # =====================================================
-
-    def _extract_facts(self, events: List[Dict[str, Any]]) -> Dict[str, Any]:
+    def _new_events(self, since: Optional[str], cursor: Dict[str, Any]) -> Iterator[Dict[str, Any]]:
         """
-        Extract semantic facts from episodic events.
+        Stream events at or after since, skipping those already consolidated
+        at exactly since. The bound is inclusive so events that arrive later
+        with the high-water timestamp are not lost.
 
         Args:
-            events: List of episodic events
-
-        Returns:
-            Dictionary of facts
+            since: High-water mark (None streams everything)
+            cursor: Filled with the newest timestamp seen and the ids of the
+                events carrying it
         """
-        facts = {}
+        seen = Counter(self._high_water_ids) if since is not None else Counter()
 
-        # Event type frequency
-        event_types = [e["event_type"] for e in events]
-        type_counts = Counter(event_types)
+        for event in self.episodic.iter_events(since=since):
+            timestamp = event["timestamp"]
+            eid = event_id(event)
 
-        facts["event_type_frequency"] = dict(type_counts)
-        facts["most_common_event_type"] = type_counts.most_common(1)[0][0] if type_counts else None
+            if timestamp != cursor["timestamp"]:
+                cursor["timestamp"] = timestamp
+                cursor["ids"] = Counter()
+            cursor["ids"][eid] += 1
 
-        # Time range
-        if events:
-            timestamps = [e["timestamp"] for e in events]
-            facts["memory_time_range"] = {
-                "start": min(timestamps),
-                "end": max(timestamps)
-            }
+            if timestamp == since and seen[eid] > 0:
+                seen[eid] -= 1
+                continue
 
-        # Extract patterns from event payloads
-        pattern_facts = self._extract_patterns(events)
-        facts.update(pattern_facts)
+            yield event
 
-        # System activity summary
-        activity_facts = self._summarize_activity(events)
-        facts.update(activity_facts)
-
-        return facts
-
-    def _extract_patterns(self, events: List[Dict[str, Any]]) -> Dict[str, Any]:
-        """
-        Extract patterns from event payloads.
-
-        Args:
-            events: List of events
-
-        Returns:
-            Dictionary of pattern facts
-        """
-        patterns = {}
-
-        # Count specific event categories
-        module_events = [e for e in events if "module" in str(e.get("payload", "")).lower()]
-        error_events = [e for e in events if "error" in str(e.get("payload", "")).lower()]
-        success_events = [e for e in events if "success" in str(e.get("payload", "")).lower()]
-
-        if module_events:
-            patterns["module_activity_count"] = len(module_events)
-
-        if error_events:
-            patterns["error_count"] = len(error_events)
-            patterns["has_errors"] = True
-
-        if success_events:
-            patterns["success_count"] = len(success_events)
-
-        return patterns
+    # =====================================================
+    # FACT EXTRACTION
+    # =====================================================
 
-    def _summarize_activity(self, events: List[Dict[str, Any]]) -> Dict[str, Any]:
+    def _extract_facts(self, events: Iterable[Dict[str, Any]]) -> Dict[str, Any]:
         """
-        Summarize system activity from events.
+        Extract semantic facts from episodic events in one pass.
 
         Args:
-            events: List of events
+            events: Iterable of episodic events
 
         Returns:
-            Dictionary of activity facts
+            Dictionary of facts
         """
-        activity = {}
-
-        # Events per hour (rough estimate)
-        if events:
-            time_range = self._calculate_time_range(events)
-            if time_range > 0:
-                events_per_hour = len(events) / time_range
-                activity["events_per_hour"] = round(events_per_hour, 2)
-
-        # Recent activity burst detection
-        recent_events = [
-            e for e in events
-            if self._is_recent(e["timestamp"], hours=1)
-        ]
-
-        if recent_events:
-            activity["recent_activity_count"] = len(recent_events)
-            activity["recent_activity_percentage"] = round(len(recent_events) / len(events) * 100, 2)
-
-        return activity
+        return ActivityAccumulator().add_all(events).facts()
 
     # =====================================================
     # UTILITY METHODS
     # =====================================================
 
-    def _calculate_time_range(self, events: List[Dict[str, Any]]) -> float:
-        """
-        Calculate time range of events in hours.
-
-        Args:
-            events: List of events
-
-        Returns:
-            Time range in hours
-        """
-        if not events:
-            return 0
-
-        try:
-            timestamps = [datetime.fromisoformat(e["timestamp"]) for e in events]
-            time_diff = max(timestamps) - min(timestamps)
-            return time_diff.total_seconds() / 3600
-        except Exception:
-            return 0
-
-    def _is_recent(self, timestamp: str, hours: int = 1) -> bool:
-        """
-        Check if timestamp is within recent hours.
-
-        Args:
-            timestamp: ISO timestamp string
-            hours: Hours threshold
-
-        Returns:
-            True if recent
-        """
-        try:
-            event_time = datetime.fromisoformat(timestamp)
-            cutoff = datetime.now() - timedelta(hours=hours)
-            return event_time >= cutoff
-        except Exception:
-            return False
+    def _episodic_count(self) -> int:
+        return self.episodic.get_stats().get("total_events", 0)
 
     def _log(self, level: str, message: str) -> None:
         """Log message if logger available."""
@@ -327,6 +375,7 @@ class ConsolidationService:
         """
         return {
             "last_consolidation": self.last_consolidation,
-            "episodic_events": len(self.episodic.get_events()),
+            "high_water_mark": self.high_water_mark,
+            "episodic_events": self._episodic_count(),
             "semantic_facts": len(self.semantic.get_all_keys())
         }
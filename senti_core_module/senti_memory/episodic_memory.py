@@ -3,20 +3,100 @@ Episodic Memory - FAZA 12
 Location: senti_core_module/senti_memory/episodic_memory.py
 
 Time-ordered event storage for system history.
-- Chronologically organized events
-- Category/type filtering
+- Chronologically organized events (hourly time buckets)
+- Category/type filtering via per-type posting lists
 - Persistent storage via MemoryStore
+- Inverted text index for search
 """
 
+import hashlib
+import json
 import threading
-from typing import Any, Dict, List, Optional
-from datetime import datetime
+from bisect import bisect_left, bisect_right
+from collections import Counter
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional
+from datetime import datetime, timedelta
+
+from .text_index import InvertedIndex, flatten_text, tokenize
+
+
+# ISO timestamp prefix used as bucket key: "YYYY-MM-DDTHH" -> one bucket per hour
+BUCKET_KEY_LENGTH = 13
+
+
+def event_id(event: Dict[str, Any]) -> str:
+    """Stable id for an event: timestamp plus a digest of type and payload."""
+    content = json.dumps([event["event_type"], event.get("payload")], sort_keys=True, default=str)
+    digest = hashlib.sha1(content.encode("utf-8")).hexdigest()[:12]
+    return f"{event['timestamp']}#{digest}"
+
+
+class _TimeBucket:
+    """
+    Events whose timestamps share one bucket key, kept in timestamp order
+    with per-type posting lists of positions inside the bucket.
+    """
+
+    __slots__ = ("key", "events", "timestamps", "by_type")
+
+    def __init__(self, key: str):
+        self.key = key
+        self.events: List[Dict[str, Any]] = []
+        self.timestamps: List[str] = []
+        self.by_type: Dict[str, List[int]] = {}
+
+    def add(self, event: Dict[str, Any]) -> bool:
+        """Insert event; returns True if it was appended at the end."""
+        timestamp = event["timestamp"]
+
+        if not self.timestamps or timestamp >= self.timestamps[-1]:
+            self.by_type.setdefault(event["event_type"], []).append(len(self.events))
+            self.events.append(event)
+            self.timestamps.append(timestamp)
+            return True
+
+        position = bisect_right(self.timestamps, timestamp)
+        self.events.insert(position, event)
+        self.timestamps.insert(position, timestamp)
+        self._reindex()
+        return False
+
+    def drop_front(self, count: int) -> List[Dict[str, Any]]:
+        """Remove the oldest count events and return them."""
+        removed = self.events[:count]
+        del self.events[:count]
+        del self.timestamps[:count]
+        self._reindex()
+        return removed
+
+    def drop_type(self, event_type: str) -> List[Dict[str, Any]]:
+        """Remove all events of one type and return them."""
+        positions = self.by_type.get(event_type)
+        if not positions:
+            return []
+
+        removed = [self.events[p] for p in positions]
+        kept = [e for e in self.events if e["event_type"] != event_type]
+        self.events = kept
+        self.timestamps = [e["timestamp"] for e in kept]
+        self._reindex()
+        return removed
+
+    def _reindex(self) -> None:
+        self.by_type = {}
+        for position, event in enumerate(self.events):
+            self.by_type.setdefault(event["event_type"], []).append(position)
 
 
 class EpisodicMemory:
     """
     Event-based chronological memory.
     Records system events in time order.
+
+    Events are indexed by hourly time buckets (bisect range lookup,
+    bucket-granular pruning) and per-type posting lists, so filtered
+    queries cost O(log n + k) instead of a copy-filter-sort of all events.
     """
 
     def __init__(self, memory_store):
@@ -29,8 +109,164 @@ class EpisodicMemory:
         self.store = memory_store
         self.lock = threading.Lock()
 
+        self._buckets: List[_TimeBucket] = []
+        self._bucket_keys: List[str] = []
+        self._type_counts: Counter = Counter()
+        self._count = 0
+
+        # Flat chronological list, kept in step with the buckets for
+        # persistence; rebuilt lazily after out-of-order inserts.
+        self._events: List[Dict[str, Any]] = []
+        self._events_dirty = False
+
+        # Text index: doc ids are derived from event content (timestamp plus
+        # a digest of type and payload) so a persisted index can never map an
+        # id to a different event; events are immutable so ids never need
+        # re-indexing.
+        self._doc_ids: Dict[int, str] = {}
+        self._doc_events: Dict[str, Dict[str, Any]] = {}
+        storage_dir = getattr(self.store, "storage_dir", None)
+        self.index_file = Path(storage_dir) / "episodic_index.json" if storage_dir else None
+        self.text_index = InvertedIndex.load(self.index_file) if self.index_file else InvertedIndex()
+
         # Load existing events from storage
-        self.events = self.store.load_episodic_events()
+        loaded = self.store.load_episodic_events()
+        for event in sorted(loaded, key=lambda e: e["timestamp"]):
+            self._index_event(event, index_text=False)
+
+        self.text_index.sync(
+            dict.fromkeys(self._doc_events),
+            lambda doc_id: self._event_text(self._doc_events[doc_id])
+        )
+
+    @property
+    def events(self) -> List[Dict[str, Any]]:
+        """All events in chronological order."""
+        if self._events_dirty:
+            self._events = [e for bucket in self._buckets for e in bucket.events]
+            self._events_dirty = False
+        return self._events
+
+    # =====================================================
+    # INDEX MAINTENANCE
+    # =====================================================
+
+    @staticmethod
+    def _event_text(event: Dict[str, Any]) -> str:
+        return f"{event['event_type']} {flatten_text(event.get('payload'))}"
+
+    def _index_event(self, event: Dict[str, Any], index_text: bool = True) -> None:
+        """Add event to bucket index, counters, flat list and text index."""
+        key = event["timestamp"][:BUCKET_KEY_LENGTH]
+
+        if self._bucket_keys and key == self._bucket_keys[-1]:
+            bucket = self._buckets[-1]
+        else:
+            position = bisect_left(self._bucket_keys, key)
+            if position < len(self._bucket_keys) and self._bucket_keys[position] == key:
+                bucket = self._buckets[position]
+            else:
+                bucket = _TimeBucket(key)
+                self._buckets.insert(position, bucket)
+                self._bucket_keys.insert(position, key)
+
+        in_order = bucket.add(event) and bucket is self._buckets[-1]
+        if in_order and not self._events_dirty:
+            self._events.append(event)
+        else:
+            self._events_dirty = True
+
+        self._type_counts[event["event_type"]] += 1
+        self._count += 1
+
+        doc_id = base_id = event_id(event)
+        suffix = 0
+        while doc_id in self._doc_events:
+            suffix += 1
+            doc_id = f"{base_id}.{suffix}"
+        self._doc_ids[id(event)] = doc_id
+        self._doc_events[doc_id] = event
+        if index_text:
+            self.text_index.add(doc_id, self._event_text(event))
+
+    def _unindex_text(self, event: Dict[str, Any]) -> None:
+        doc_id = self._doc_ids.pop(id(event), None)
+        if doc_id is not None:
+            del self._doc_events[doc_id]
+            self.text_index.remove(doc_id)
+
+    def _drop_buckets(self, count: int) -> int:
+        """Drop the oldest count buckets wholesale; returns events removed."""
+        removed = 0
+        for bucket in self._buckets[:count]:
+            for event_type, positions in bucket.by_type.items():
+                self._discount(event_type, len(positions))
+            for event in bucket.events:
+                self._unindex_text(event)
+            removed += len(bucket.events)
+
+        del self._buckets[:count]
+        del self._bucket_keys[:count]
+        self._drop_flat_front(removed)
+        return removed
+
+    def _trim_bucket_front(self, bucket_index: int, count: int) -> int:
+        """Drop the oldest count events from one bucket."""
+        bucket = self._buckets[bucket_index]
+        for event in bucket.drop_front(count):
+            self._discount(event["event_type"], 1)
+            self._unindex_text(event)
+
+        if not bucket.events:
+            del self._buckets[bucket_index]
+            del self._bucket_keys[bucket_index]
+
+        self._drop_flat_front(count)
+        return count
+
+    def _drop_flat_front(self, count: int) -> None:
+        if not self._events_dirty:
+            del self._events[:count]
+
+    def _discount(self, event_type: str, count: int) -> None:
+        self._count -= count
+        self._type_counts[event_type] -= count
+        if self._type_counts[event_type] <= 0:
+            del self._type_counts[event_type]
+
+    def _reset_index(self) -> None:
+        self._buckets = []
+        self._bucket_keys = []
+        self._type_counts = Counter()
+        self._count = 0
+        self._events = []
+        self._events_dirty = False
+        self._doc_ids = {}
+        self._doc_events = {}
+        self.text_index.clear()
+
+    def _iter_newest_first(
+        self,
+        since: Optional[str] = None,
+        filter_type: Optional[str] = None
+    ):
+        """Yield events newest first, stopping at the since boundary."""
+        first_bucket = 0
+        if since:
+            first_bucket = bisect_left(self._bucket_keys, since[:BUCKET_KEY_LENGTH])
+
+        for bucket_index in range(len(self._buckets) - 1, first_bucket - 1, -1):
+            bucket = self._buckets[bucket_index]
+
+            if filter_type is None:
+                positions = range(len(bucket.events) - 1, -1, -1)
+            else:
+                positions = reversed(bucket.by_type.get(filter_type, ()))
+
+            for position in positions:
+                if since and bucket.timestamps[position] < since:
+                    return
+                yield bucket.events[position]
 
     # =====================================================
     # CORE OPERATIONS
@@ -55,10 +291,10 @@ class EpisodicMemory:
                     "payload": payload
                 }
 
-                self.events.append(event)
+                self._index_event(event)
 
                 # Persist to storage
-                return self.store.save_episodic_events(self.events)
+                return self.store.commit_episodic_event(event, self.events)
             except Exception as e:
                 print(f"[EpisodicMemory] Failed to record event: {e}")
                 return False
@@ -81,37 +317,64 @@ class EpisodicMemory:
             List of events (most recent first)
         """
         with self.lock:
-            filtered_events = self.events.copy()
-
-            # Filter by timestamp
+            since_ts = None
             if since:
                 try:
-                    since_dt = datetime.fromisoformat(since)
-                    filtered_events = [
-                        e for e in filtered_events
-                        if datetime.fromisoformat(e["timestamp"]) >= since_dt
-                    ]
+                    since_ts = datetime.fromisoformat(since).isoformat()
                 except Exception as e:
                     print(f"[EpisodicMemory] Invalid since timestamp: {e}")
 
-            # Filter by type
-            if filter_type:
-                filtered_events = [
-                    e for e in filtered_events
-                    if e["event_type"] == filter_type
-                ]
+            results = []
+            for event in self._iter_newest_first(since_ts, filter_type):
+                if limit and len(results) >= limit:
+                    break
+                results.append(event)
+
+            return results
 
-            # Sort by timestamp (most recent first)
-            filtered_events.sort(
-                key=lambda e: e["timestamp"],
-                reverse=True
-            )
+    def iter_events(
+        self,
+        after: Optional[str] = None,
+        since: Optional[str] = None
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Stream events oldest first without copying the whole history.
+        The lock is taken per bucket chunk, never across a yield.
 
-            # Apply limit
-            if limit:
-                filtered_events = filtered_events[:limit]
+        Args:
+            after: ISO timestamp - only yield events strictly newer
+            since: ISO timestamp - only yield events at or after it
+                (takes precedence over after)
 
-            return filtered_events
+        Yields:
+            Events in chronological order
+        """
+        inclusive = since is not None
+        cursor = since if inclusive else after
+        while True:
+            with self.lock:
+                bucket_index = 0
+                if cursor is not None:
+                    bucket_index = bisect_left(self._bucket_keys, cursor[:BUCKET_KEY_LENGTH])
+
+                chunk: List[Dict[str, Any]] = []
+                while bucket_index < len(self._buckets) and not chunk:
+                    bucket = self._buckets[bucket_index]
+                    if cursor is None:
+                        start = 0
+                    elif inclusive:
+                        start = bisect_left(bucket.timestamps, cursor)
+                    else:
+                        start = bisect_right(bucket.timestamps, cursor)
+                    chunk = bucket.events[start:]
+                    bucket_index += 1
+
+            if not chunk:
+                return
+
+            yield from chunk
+            cursor = chunk[-1]["timestamp"]
+            inclusive = False
 
     def get_event_types(self) -> List[str]:
         """
@@ -121,8 +384,7 @@ class EpisodicMemory:
             List of event type strings
         """
         with self.lock:
-            types = set(e["event_type"] for e in self.events)
-            return sorted(list(types))
+            return sorted(self._type_counts.keys())
 
     # =====================================================
     # MANAGEMENT OPERATIONS
@@ -139,24 +401,27 @@ class EpisodicMemory:
             Number of events removed
         """
         with self.lock:
-            original_count = len(self.events)
+            excess = self._count - keep_count
 
-            if original_count <= keep_count:
+            if excess <= 0:
                 return 0
 
-            # Sort by timestamp (newest first)
-            self.events.sort(
-                key=lambda e: e["timestamp"],
-                reverse=True
-            )
+            # Whole buckets first, then trim the boundary bucket
+            whole = 0
+            covered = 0
+            while (whole < len(self._buckets)
+                   and covered + len(self._buckets[whole].events) <= excess):
+                covered += len(self._buckets[whole].events)
+                whole += 1
 
-            # Keep only the most recent
-            self.events = self.events[:keep_count]
+            removed = self._drop_buckets(whole)
+            if removed < excess:
+                removed += self._trim_bucket_front(0, excess - removed)
 
             # Persist
             self.store.save_episodic_events(self.events)
 
-            return original_count - len(self.events)
+            return removed
 
     def prune_by_age(self, days: int) -> int:
         """
@@ -169,20 +434,21 @@ class EpisodicMemory:
             Number of events removed
         """
         with self.lock:
-            from datetime import timedelta
+            cutoff = (datetime.now() - timedelta(days=days)).isoformat()
 
-            cutoff_time = datetime.now() - timedelta(days=days)
-            original_count = len(self.events)
+            # Buckets entirely before the cutoff go wholesale
+            whole = bisect_left(self._bucket_keys, cutoff[:BUCKET_KEY_LENGTH])
+            removed = self._drop_buckets(whole)
 
-            self.events = [
-                e for e in self.events
-                if datetime.fromisoformat(e["timestamp"]) >= cutoff_time
-            ]
+            if self._buckets:
+                stale = bisect_left(self._buckets[0].timestamps, cutoff)
+                if stale:
+                    removed += self._trim_bucket_front(0, stale)
 
             # Persist
             self.store.save_episodic_events(self.events)
 
-            return original_count - len(self.events)
+            return removed
 
     def clear(self) -> int:
         """
@@ -192,8 +458,8 @@ class EpisodicMemory:
             Number of events cleared
         """
         with self.lock:
-            count = len(self.events)
-            self.events = []
+            count = self._count
+            self._reset_index()
             self.store.clear_episodic()
             return count
 
@@ -208,17 +474,26 @@ class EpisodicMemory:
             Number of events removed
         """
         with self.lock:
-            original_count = len(self.events)
+            removed = 0
 
-            self.events = [
-                e for e in self.events
-                if e["event_type"] != event_type
-            ]
+            for bucket in self._buckets:
+                for event in bucket.drop_type(event_type):
+                    self._unindex_text(event)
+                    removed += 1
+
+            if removed:
+                empty = [i for i, b in enumerate(self._buckets) if not b.events]
+                for bucket_index in reversed(empty):
+                    del self._buckets[bucket_index]
+                    del self._bucket_keys[bucket_index]
+
+                self._discount(event_type, removed)
+                self._events_dirty = True
 
             # Persist
             self.store.save_episodic_events(self.events)
 
-            return original_count - len(self.events)
+            return removed
 
     # =====================================================
     # QUERY & STATISTICS
@@ -232,7 +507,7 @@ class EpisodicMemory:
             Stats dictionary
         """
         with self.lock:
-            if not self.events:
+            if not self._count:
                 return {
                     "total_events": 0,
                     "event_types": 0,
@@ -240,36 +515,49 @@ class EpisodicMemory:
                     "newest_event": None
                 }
 
-            type_counts = {}
-            for event in self.events:
-                event_type = event["event_type"]
-                type_counts[event_type] = type_counts.get(event_type, 0) + 1
-
-            timestamps = [e["timestamp"] for e in self.events]
-
             return {
-                "total_events": len(self.events),
-                "event_types": len(type_counts),
-                "type_distribution": type_counts,
-                "oldest_event": min(timestamps),
-                "newest_event": max(timestamps)
+                "total_events": self._count,
+                "event_types": len(self._type_counts),
+                "type_distribution": dict(self._type_counts),
+                "oldest_event": self._buckets[0].timestamps[0],
+                "newest_event": self._buckets[-1].timestamps[-1]
             }
 
-    def search(self, query: str) -> List[Dict[str, Any]]:
+    def search(self, query: str, ranked: bool = False, substring: bool = False) -> List[Dict[str, Any]]:
         """
-        Search events by text in payload.
+        Search events by text in event type and payload.
+
+        By default the query is answered from the text index only: every
+        query token must match a token of the event type or payload
+        keys/values as a prefix, so "start" matches "service_start" but not
+        "service_restart". Pass substring=True for the old case-insensitive
+        substring scan over every event. Queries without alphanumeric
+        tokens cannot be indexed and are always scanned.
 
         Args:
             query: Search string
+            ranked: Order by BM25 relevance instead of recency (index only)
+            substring: Match query as a substring anywhere (O(n) scan)
 
         Returns:
-            Matching events
+            Matching events (most recent first unless ranked)
         """
         with self.lock:
+            if not substring and tokenize(query):
+                if ranked:
+                    return [
+                        self._doc_events[doc_id]
+                        for doc_id, _score in self.text_index.search(query)
+                    ]
+                results = [self._doc_events[d] for d in self.text_index.match(query)]
+                results.sort(key=lambda e: e["timestamp"], reverse=True)
+                return results
+
             query_lower = query.lower()
             results = []
 
-            for event in self.events:
+            # Newest first
+            for event in self._iter_newest_first():
                 # Search in event_type
                 if query_lower in event["event_type"].lower():
                     results.append(event)
@@ -280,6 +568,16 @@ class EpisodicMemory:
                 if query_lower in payload_str:
                     results.append(event)
 
-            # Return most recent first
-            results.sort(key=lambda e: e["timestamp"], reverse=True)
             return results
+
+    def save_index(self) -> bool:
+        """
+        Persist the text index next to the store files.
+
+        Returns:
+            Success status
+        """
+        with self.lock:
+            if not self.index_file:
+                return False
+            return self.text_index.save(self.index_file)
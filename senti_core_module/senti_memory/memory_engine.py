@@ -233,19 +233,21 @@ class MemoryEngine:
     # CONSOLIDATION
     # =====================================================
 
-    def consolidate(self, min_events: int = 10) -> Dict[str, Any]:
+    def consolidate(self, min_events: int = 10, incremental: Optional[bool] = None) -> Dict[str, Any]:
         """
         Trigger memory consolidation.
 
         Args:
             min_events: Minimum events needed
+            incremental: Only consolidate events newer than the last run
+                (None = consolidation service default)
 
         Returns:
             Consolidation result
         """
         try:
             self._log("info", "Starting memory consolidation...")
-            result = self.consolidation.consolidate(min_events=min_events)
+            result = self.consolidation.consolidate(min_events=min_events, incremental=incremental)
             return result
         except Exception as e:
             self._log("error", f"Consolidation failed: {e}")
@@ -13,6 +13,7 @@ from pathlib import Path
 from typing import Optional
 
 from .memory_store import MemoryStore
+from .wal_memory_store import WALMemoryStore
 from .working_memory import WorkingMemory
 from .episodic_memory import EpisodicMemory
 from .semantic_memory import SemanticMemory
@@ -33,7 +34,12 @@ class MemoryManager:
         project_root: Path,
         event_bus,
         logger=None,
-        storage_subdir: str = "memory_data"
+        storage_subdir: str = "memory_data",
+        store_backend: str = "json",
+        working_max_items: Optional[int] = None,
+        working_max_bytes: Optional[int] = None,
+        incremental_consolidation: bool = False,
+        semantic_flush_interval: Optional[float] = None
     ):
         """
         Initialize memory manager.
@@ -43,11 +49,22 @@ class MemoryManager:
             event_bus: EventBus instance from Senti Core
             logger: Optional logger
             storage_subdir: Subdirectory for memory storage
+            store_backend: Storage backend ("json" or "wal")
+            working_max_items: Optional working memory item limit (LRU)
+            working_max_bytes: Optional working memory size limit (LRU)
+            incremental_consolidation: Consolidate only new events each run
+            semantic_flush_interval: Persist semantic facts from a background
+                flusher at most this many seconds late (None = write-through)
         """
         self.project_root = Path(project_root)
         self.event_bus = event_bus
         self.logger = logger
         self.storage_dir = self.project_root / storage_subdir
+        self.store_backend = store_backend
+        self.working_max_items = working_max_items
+        self.working_max_bytes = working_max_bytes
+        self.incremental_consolidation = incremental_consolidation
+        self.semantic_flush_interval = semantic_flush_interval
 
         # Ensure storage directory exists
         self.storage_dir.mkdir(parents=True, exist_ok=True)
@@ -81,13 +98,25 @@ class MemoryManager:
             self._log("info", "Initializing FAZA 12 Memory System...")
 
             # 1. Initialize storage layer
-            self.store = MemoryStore(self.storage_dir)
-            self._log("info", "Memory store initialized")
+            if self.store_backend == "wal":
+                self.store = WALMemoryStore(self.storage_dir)
+            elif self.store_backend == "json":
+                self.store = MemoryStore(self.storage_dir)
+            else:
+                raise ValueError(f"Unknown store backend: {self.store_backend}")
+            self._log("info", f"Memory store initialized (backend: {self.store_backend})")
 
             # 2. Initialize memory layers
-            self.working = WorkingMemory(default_ttl_seconds=180)
+            self.working = WorkingMemory(
+                default_ttl_seconds=180,
+                max_items=self.working_max_items,
+                max_bytes=self.working_max_bytes
+            )
             self.episodic = EpisodicMemory(self.store)
-            self.semantic = SemanticMemory(self.store)
+            self.semantic = SemanticMemory(
+                self.store,
+                flush_interval=self.semantic_flush_interval
+            )
             self._log("info", "Memory layers initialized (working, episodic, semantic)")
 
             # 3. Initialize security rules
@@ -103,7 +132,8 @@ class MemoryManager:
                 episodic_memory=self.episodic,
                 semantic_memory=self.semantic,
                 memory_events=self.events,
-                logger=self.logger
+                logger=self.logger,
+                incremental=self.incremental_consolidation
             )
             self._log("info", "Consolidation service initialized")
 
@@ -162,8 +192,19 @@ class MemoryManager:
                 self.store.save_episodic_events(self.episodic.events)
 
             if self.semantic and self.store:
+                self.semantic.close()
                 self.store.save_semantic_facts(self.semantic.facts)
 
+            # Persist text indexes so the next start skips re-tokenizing
+            if self.episodic:
+                self.episodic.save_index()
+
+            if self.semantic:
+                self.semantic.save_index()
+
+            if self.store:
+                self.store.close()
+
             self._log("info", "Memory data persisted")
 
             self._initialized = False
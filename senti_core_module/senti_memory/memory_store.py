@@ -12,7 +12,7 @@ import json
 import os
 import threading
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Callable, Dict, List, Optional
 from datetime import datetime
 
 
@@ -92,6 +92,19 @@ class MemoryStore:
         events.append(event)
         return self.save_episodic_events(events)
 
+    def commit_episodic_event(self, event: Dict[str, Any], events: List[Dict[str, Any]]) -> bool:
+        """
+        Persist an event that the caller already appended to its list.
+
+        Args:
+            event: Newly recorded event
+            events: Caller's complete event list (including event)
+
+        Returns:
+            Success status
+        """
+        return self.save_episodic_events(events)
+
     # =====================================================
     # SEMANTIC MEMORY STORAGE
     # =====================================================
@@ -147,6 +160,38 @@ class MemoryStore:
         facts[key] = value
         return self.save_semantic_facts(facts)
 
+    def delete_semantic_fact(self, key: str) -> bool:
+        """
+        Delete single semantic fact.
+
+        Args:
+            key: Fact key
+
+        Returns:
+            Success status
+        """
+        facts = self.load_semantic_facts()
+        facts.pop(key, None)
+        return self.save_semantic_facts(facts)
+
+    def commit_semantic_facts(
+        self,
+        changes: Dict[str, Optional[Dict[str, Any]]],
+        snapshot: Callable[[], Dict[str, Any]]
+    ) -> bool:
+        """
+        Persist facts that the caller already changed.
+
+        Args:
+            changes: Changed key -> new entry (None = deleted)
+            snapshot: Returns the caller's complete facts dictionary;
+                only called by backends that rewrite the whole file
+
+        Returns:
+            Success status
+        """
+        return self.save_semantic_facts(snapshot())
+
     # =====================================================
     # UTILITY METHODS
     # =====================================================
@@ -174,6 +219,12 @@ class MemoryStore:
                 temp_file.unlink()
             raise e
 
+    def flush(self) -> None:
+        """Flush pending writes (JSON writes are synchronous)."""
+
+    def close(self) -> None:
+        """Release storage resources."""
+
     def clear_episodic(self) -> bool:
         """Clear all episodic memory."""
         return self.save_episodic_events([])
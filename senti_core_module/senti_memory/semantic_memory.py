@@ -6,31 +6,209 @@ Long-term consolidated knowledge storage.
 - Structured fact storage
 - Deduplication and merging
 - Persistent via MemoryStore
+- Inverted text index for search (regex fallback)
+- Lock-striped shards with copy-on-write snapshots (lock-free reads)
+- Optional background flusher (persistence off the caller's path)
 """
 
 import threading
 import re
-from typing import Any, Dict, List, Optional
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional
 from datetime import datetime
 
+from .text_index import InvertedIndex, tokenize
+
+
+# Characters that make a search pattern a "true" regex
+_REGEX_META = frozenset(".^$*+?{}[]\\|()")
+
+
+class _FactShard:
+    """
+    One lock stripe. `facts` is never mutated in place: writers build a
+    new dict under `lock` and swap the reference, so readers can use
+    whatever dict they grabbed without locking.
+    """
+
+    __slots__ = ("lock", "facts")
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.facts: Dict[str, Dict[str, Any]] = {}
+
+    def commit(self, updates: Dict[str, Optional[Dict[str, Any]]]) -> None:
+        """Apply updates (None = delete) and publish a new snapshot."""
+        facts = dict(self.facts)
+        for key, entry in updates.items():
+            if entry is None:
+                facts.pop(key, None)
+            else:
+                facts[key] = entry
+        self.facts = facts
+
 
 class SemanticMemory:
     """
     Long-term memory for consolidated knowledge and facts.
+
+    Writers serialize per shard (key hash); readers never lock. With
+    flush_interval set, writes return after the in-memory commit and a
+    background thread persists dirty keys at most flush_interval later.
     """
 
-    def __init__(self, memory_store):
+    def __init__(
+        self,
+        memory_store,
+        shards: int = 16,
+        flush_interval: Optional[float] = None,
+        flush_batch: int = 256
+    ):
         """
         Initialize semantic memory.
 
         Args:
             memory_store: MemoryStore instance for persistence
+            shards: Number of lock stripes
+            flush_interval: Max persistence staleness in seconds
+                (None = write-through on the caller's thread)
+            flush_batch: Wake the flusher early at this many dirty keys
         """
         self.store = memory_store
-        self.lock = threading.Lock()
+        self._shards = [_FactShard() for _ in range(max(1, shards))]
+
+        # Lock order: shard locks (ascending) -> _index_lock; _persist_lock
+        # is only taken with no shard lock held.
+        self._index_lock = threading.Lock()
+        self._persist_lock = threading.Lock()
 
         # Load existing facts from storage
-        self.facts = self.store.load_semantic_facts()
+        for key, entry in self.store.load_semantic_facts().items():
+            self._shard(key).facts[key] = entry
+
+        # Text index, persisted next to the store files; only facts whose
+        # updated_at changed since the last save are re-tokenized.
+        storage_dir = getattr(self.store, "storage_dir", None)
+        self.index_file = Path(storage_dir) / "semantic_index.json" if storage_dir else None
+        self.text_index = InvertedIndex.load(self.index_file) if self.index_file else InvertedIndex()
+        facts = self.facts
+        self.text_index.sync(
+            {key: entry.get("updated_at") for key, entry in facts.items()},
+            lambda key: self._fact_text(key, facts[key])
+        )
+
+        # Background flusher
+        self.flush_interval = flush_interval
+        self.flush_batch = flush_batch
+        self._dirty_keys = set()
+        self._dirty_lock = threading.Lock()
+        self._flush_wakeup = threading.Event()
+        self._flusher_stop = False
+        self._flusher = None
+
+        if flush_interval is not None:
+            self._flusher = threading.Thread(
+                target=self._flush_loop,
+                name="SemanticMemoryFlusher",
+                daemon=True
+            )
+            self._flusher.start()
+
+    # =====================================================
+    # SHARDING & SNAPSHOTS
+    # =====================================================
+
+    def _shard(self, key: str) -> _FactShard:
+        return self._shards[hash(key) % len(self._shards)]
+
+    def _locked_shards(self, keys: Iterable[str]) -> List[_FactShard]:
+        """Shards covering keys, in a deadlock-free acquisition order."""
+        indexes = sorted({hash(k) % len(self._shards) for k in keys})
+        return [self._shards[i] for i in indexes]
+
+    def _entry(self, key: str) -> Optional[Dict[str, Any]]:
+        return self._shard(key).facts.get(key)
+
+    @property
+    def facts(self) -> Dict[str, Dict[str, Any]]:
+        """Merged copy of all shard snapshots."""
+        merged: Dict[str, Dict[str, Any]] = {}
+        for shard in self._shards:
+            merged.update(shard.facts)
+        return merged
+
+    @staticmethod
+    def _fact_text(key: str, entry: Dict[str, Any]) -> str:
+        """Searchable text of a fact: key plus string value."""
+        value = entry.get("value")
+        return f"{key} {value}" if isinstance(value, str) else key
+
+    def _reindex(self, updates: Dict[str, Optional[Dict[str, Any]]]) -> None:
+        """Apply committed updates to the text index (caller holds shard locks)."""
+        with self._index_lock:
+            for key, entry in updates.items():
+                if entry is None:
+                    self.text_index.remove(key)
+                else:
+                    self.text_index.add(key, self._fact_text(key, entry), entry.get("updated_at"))
+
+    # =====================================================
+    # PERSISTENCE
+    # =====================================================
+
+    def _persist(self, keys: List[str]) -> bool:
+        """Persist changed keys now, or hand them to the flusher."""
+        if self._flusher is not None:
+            with self._dirty_lock:
+                self._dirty_keys.update(keys)
+                if len(self._dirty_keys) >= self.flush_batch:
+                    self._flush_wakeup.set()
+            return True
+
+        # Facts are read under the persist lock, so the last writer to get
+        # here always persists the newest state.
+        with self._persist_lock:
+            return self._commit(keys)
+
+    def flush(self) -> bool:
+        """
+        Persist all keys changed since the last flush.
+
+        Returns:
+            Success status
+        """
+        with self._dirty_lock:
+            keys = list(self._dirty_keys)
+            self._dirty_keys.clear()
+
+        if not keys:
+            return True
+
+        with self._persist_lock:
+            return self._commit(keys)
+
+    def _commit(self, keys: List[str]) -> bool:
+        """Hand only the changed entries to the store (caller holds _persist_lock)."""
+        changes = {key: self._entry(key) for key in keys}
+        return self.store.commit_semantic_facts(changes, lambda: self.facts)
+
+    def _flush_loop(self) -> None:
+        while not self._flusher_stop:
+            self._flush_wakeup.wait(self.flush_interval)
+            self._flush_wakeup.clear()
+            try:
+                self.flush()
+            except Exception as e:
+                print(f"[SemanticMemory] Background flush failed: {e}")
+
+    def close(self) -> None:
+        """Stop the background flusher and persist pending changes."""
+        if self._flusher is not None:
+            self._flusher_stop = True
+            self._flush_wakeup.set()
+            self._flusher.join()
+            self._flusher = None
+        self.flush()
 
     # =====================================================
     # CORE OPERATIONS
@@ -48,8 +226,9 @@ class SemanticMemory:
         Returns:
             Success status
         """
-        with self.lock:
-            try:
+        shard = self._shard(key)
+        try:
+            with shard.lock:
                 fact_entry = {
                     "value": value,
                     "updated_at": datetime.now().isoformat(),
@@ -57,20 +236,22 @@ class SemanticMemory:
                 }
 
                 # If fact already exists, merge metadata
-                if key in self.facts:
-                    existing_metadata = self.facts[key].get("metadata", {})
+                existing = shard.facts.get(key)
+                if existing is not None:
+                    existing_metadata = existing.get("metadata", {})
                     fact_entry["metadata"] = {**existing_metadata, **(metadata or {})}
-                    fact_entry["created_at"] = self.facts[key].get("created_at")
+                    fact_entry["created_at"] = existing.get("created_at")
                 else:
                     fact_entry["created_at"] = datetime.now().isoformat()
 
-                self.facts[key] = fact_entry
+                shard.commit({key: fact_entry})
+                self._reindex({key: fact_entry})
 
-                # Persist to storage
-                return self.store.save_semantic_facts(self.facts)
-            except Exception as e:
-                print(f"[SemanticMemory] Failed to save fact: {e}")
-                return False
+            # Persist to storage
+            return self._persist([key])
+        except Exception as e:
+            print(f"[SemanticMemory] Failed to save fact: {e}")
+            return False
 
     def get_fact(self, key: str) -> Optional[Any]:
         """
@@ -82,10 +263,8 @@ class SemanticMemory:
         Returns:
             Fact value or None
         """
-        with self.lock:
-            if key in self.facts:
-                return self.facts[key]["value"]
-            return None
+        entry = self._entry(key)
+        return entry["value"] if entry is not None else None
 
     def get_fact_with_metadata(self, key: str) -> Optional[Dict[str, Any]]:
         """
@@ -97,8 +276,7 @@ class SemanticMemory:
         Returns:
             Complete fact entry or None
         """
-        with self.lock:
-            return self.facts.get(key)
+        return self._entry(key)
 
     def fact_exists(self, key: str) -> bool:
         """
@@ -110,8 +288,7 @@ class SemanticMemory:
         Returns:
             True if exists
         """
-        with self.lock:
-            return key in self.facts
+        return key in self._shard(key).facts
 
     def delete_fact(self, key: str) -> bool:
         """
@@ -123,33 +300,55 @@ class SemanticMemory:
         Returns:
             True if deleted, False if not found
         """
-        with self.lock:
-            if key in self.facts:
-                del self.facts[key]
-                self.store.save_semantic_facts(self.facts)
-                return True
-            return False
+        shard = self._shard(key)
+        with shard.lock:
+            if key not in shard.facts:
+                return False
+            shard.commit({key: None})
+            self._reindex({key: None})
+
+        self._persist([key])
+        return True
 
     # =====================================================
     # SEARCH & QUERY
     # =====================================================
 
-    def search(self, pattern: str) -> Dict[str, Any]:
+    def search(self, pattern: str, substring: bool = False) -> Dict[str, Any]:
         """
-        Search facts by key pattern (regex supported).
+        Search facts by key/value text.
+
+        Plain patterns are answered from the inverted index only: every
+        token must match a key or value token as a prefix, so "start"
+        matches "service_start" but not "service_restart" (results
+        BM25-ranked). Patterns containing regex metacharacters, patterns
+        without alphanumeric tokens, and any pattern with substring=True
+        are matched as a case-insensitive regex against every fact.
 
         Args:
             pattern: Search pattern (can be regex)
+            substring: Scan all facts instead of using the index
 
         Returns:
             Dictionary of matching facts
         """
-        with self.lock:
-            try:
-                regex = re.compile(pattern, re.IGNORECASE)
-                results = {}
+        if not substring and _REGEX_META.isdisjoint(pattern) and tokenize(pattern):
+            with self._index_lock:
+                hits = self.text_index.search(pattern)
+
+            results = {}
+            for key, _score in hits:
+                entry = self._entry(key)
+                if entry is not None:
+                    results[key] = entry["value"]
+            return results
 
-                for key, fact_entry in self.facts.items():
+        try:
+            regex = re.compile(pattern, re.IGNORECASE)
+            results = {}
+
+            for shard in self._shards:
+                for key, fact_entry in shard.facts.items():
                     # Search in key
                     if regex.search(key):
                         results[key] = fact_entry["value"]
@@ -160,10 +359,10 @@ class SemanticMemory:
                         if regex.search(fact_entry["value"]):
                             results[key] = fact_entry["value"]
 
-                return results
-            except Exception as e:
-                print(f"[SemanticMemory] Search failed: {e}")
-                return {}
+            return results
+        except Exception as e:
+            print(f"[SemanticMemory] Search failed: {e}")
+            return {}
 
     def get_all_keys(self) -> List[str]:
         """
@@ -172,8 +371,7 @@ class SemanticMemory:
         Returns:
             List of keys
         """
-        with self.lock:
-            return list(self.facts.keys())
+        return [key for shard in self._shards for key in shard.facts]
 
     def get_facts_by_metadata(self, metadata_key: str, metadata_value: Any) -> Dict[str, Any]:
         """
@@ -186,15 +384,15 @@ class SemanticMemory:
         Returns:
             Dictionary of matching facts
         """
-        with self.lock:
-            results = {}
+        results = {}
 
-            for key, fact_entry in self.facts.items():
+        for shard in self._shards:
+            for key, fact_entry in shard.facts.items():
                 metadata = fact_entry.get("metadata", {})
                 if metadata.get(metadata_key) == metadata_value:
                     results[key] = fact_entry["value"]
 
-            return results
+        return results
 
     # =====================================================
     # BULK OPERATIONS
@@ -210,28 +408,41 @@ class SemanticMemory:
         Returns:
             Success status
         """
-        with self.lock:
-            try:
-                timestamp = datetime.now().isoformat()
+        shards = self._locked_shards(facts_dict)
+        for shard in shards:
+            shard.lock.acquire()
+
+        try:
+            timestamp = datetime.now().isoformat()
+            updates: Dict[_FactShard, Dict[str, Dict[str, Any]]] = {}
+
+            for key, value in facts_dict.items():
+                shard = self._shard(key)
+                fact_entry = {
+                    "value": value,
+                    "updated_at": timestamp,
+                    "metadata": {}
+                }
 
-                for key, value in facts_dict.items():
-                    fact_entry = {
-                        "value": value,
-                        "updated_at": timestamp,
-                        "metadata": {}
-                    }
+                existing = shard.facts.get(key)
+                if existing is not None:
+                    fact_entry["created_at"] = existing.get("created_at")
+                else:
+                    fact_entry["created_at"] = timestamp
 
-                    if key in self.facts:
-                        fact_entry["created_at"] = self.facts[key].get("created_at")
-                    else:
-                        fact_entry["created_at"] = timestamp
+                updates.setdefault(shard, {})[key] = fact_entry
 
-                    self.facts[key] = fact_entry
+            for shard, shard_updates in updates.items():
+                shard.commit(shard_updates)
+                self._reindex(shard_updates)
+        except Exception as e:
+            print(f"[SemanticMemory] Batch save failed: {e}")
+            return False
+        finally:
+            for shard in reversed(shards):
+                shard.lock.release()
 
-                return self.store.save_semantic_facts(self.facts)
-            except Exception as e:
-                print(f"[SemanticMemory] Batch save failed: {e}")
-                return False
+        return self._persist(list(facts_dict.keys()))
 
     def merge_facts(self, source_key: str, target_key: str, delete_source: bool = True) -> bool:
         """
@@ -245,30 +456,40 @@ class SemanticMemory:
         Returns:
             Success status
         """
-        with self.lock:
-            if source_key not in self.facts or target_key not in self.facts:
+        shards = self._locked_shards([source_key, target_key])
+        for shard in shards:
+            shard.lock.acquire()
+
+        try:
+            source_fact = self._entry(source_key)
+            target_fact = self._entry(target_key)
+            if source_fact is None or target_fact is None:
                 return False
 
-            try:
-                source_fact = self.facts[source_key]
-                target_fact = self.facts[target_key]
-
-                # Merge metadata
-                merged_metadata = {
+            # Merge metadata (new entry; snapshots are immutable)
+            merged_fact = {
+                **target_fact,
+                "metadata": {
                     **source_fact.get("metadata", {}),
                     **target_fact.get("metadata", {})
-                }
+                },
+                "updated_at": datetime.now().isoformat()
+            }
 
-                target_fact["metadata"] = merged_metadata
-                target_fact["updated_at"] = datetime.now().isoformat()
+            self._shard(target_key).commit({target_key: merged_fact})
+            self._reindex({target_key: merged_fact})
 
-                if delete_source:
-                    del self.facts[source_key]
+            if delete_source and source_key != target_key:
+                self._shard(source_key).commit({source_key: None})
+                self._reindex({source_key: None})
+        except Exception as e:
+            print(f"[SemanticMemory] Merge failed: {e}")
+            return False
+        finally:
+            for shard in reversed(shards):
+                shard.lock.release()
 
-                return self.store.save_semantic_facts(self.facts)
-            except Exception as e:
-                print(f"[SemanticMemory] Merge failed: {e}")
-                return False
+        return self._persist([source_key, target_key])
 
     # =====================================================
     # MANAGEMENT
@@ -281,11 +502,24 @@ class SemanticMemory:
         Returns:
             Number of facts cleared
         """
-        with self.lock:
-            count = len(self.facts)
-            self.facts = {}
+        for shard in self._shards:
+            shard.lock.acquire()
+
+        try:
+            count = sum(len(shard.facts) for shard in self._shards)
+            for shard in self._shards:
+                shard.facts = {}
+            with self._index_lock:
+                self.text_index.clear()
+        finally:
+            for shard in reversed(self._shards):
+                shard.lock.release()
+
+        with self._dirty_lock:
+            self._dirty_keys.clear()
+        with self._persist_lock:
             self.store.clear_semantic()
-            return count
+        return count
 
     def get_stats(self) -> Dict[str, Any]:
         """
@@ -294,26 +528,43 @@ class SemanticMemory:
         Returns:
             Stats dictionary
         """
-        with self.lock:
-            if not self.facts:
-                return {
-                    "total_facts": 0,
-                    "oldest_fact": None,
-                    "newest_fact": None
-                }
-
-            timestamps = []
-            for fact_entry in self.facts.values():
-                if "created_at" in fact_entry:
-                    timestamps.append(fact_entry["created_at"])
-
+        facts = self.facts
+        if not facts:
             return {
-                "total_facts": len(self.facts),
-                "oldest_fact": min(timestamps) if timestamps else None,
-                "newest_fact": max(timestamps) if timestamps else None,
-                "keys_sample": list(self.facts.keys())[:10]
+                "total_facts": 0,
+                "oldest_fact": None,
+                "newest_fact": None
             }
 
+        timestamps = []
+        for fact_entry in facts.values():
+            if "created_at" in fact_entry:
+                timestamps.append(fact_entry["created_at"])
+
+        with self._dirty_lock:
+            pending = len(self._dirty_keys)
+
+        return {
+            "total_facts": len(facts),
+            "oldest_fact": min(timestamps) if timestamps else None,
+            "newest_fact": max(timestamps) if timestamps else None,
+            "keys_sample": list(facts.keys())[:10],
+            "shards": len(self._shards),
+            "pending_flush": pending
+        }
+
+    def save_index(self) -> bool:
+        """
+        Persist the text index next to the store files.
+
+        Returns:
+            Success status
+        """
+        if not self.index_file:
+            return False
+        with self._index_lock:
+            return self.text_index.save(self.index_file)
+
     def export_facts(self) -> Dict[str, Any]:
         """
         Export all facts (with metadata).
@@ -321,5 +572,4 @@ class SemanticMemory:
         Returns:
             Complete facts dictionary
         """
-        with self.lock:
-            return self.facts.copy()
+        return self.facts
@@ -0,0 +1,278 @@
+"""
+Text Index - FAZA 12
+Location: senti_core_module/senti_memory/text_index.py
+
+Incremental full-text inverted index for episodic and semantic memory.
+- Lowercase alphanumeric tokenization
+- Prefix and term-AND queries
+- BM25 ranking
+- JSON persistence with per-document versions for cheap startup repair
+"""
+
+import json
+import math
+import re
+from bisect import bisect_left, insort
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Optional, Set, Tuple
+
+
+_TOKEN_RE = re.compile(r"[a-z0-9]+")
+
+# BM25 parameters
+BM25_K1 = 1.2
+BM25_B = 0.75
+
+
+def tokenize(text: str) -> List[str]:
+    """Split text into lowercase alphanumeric tokens."""
+    return _TOKEN_RE.findall(text.lower())
+
+
+def flatten_text(value: Any) -> str:
+    """Collect keys and scalar leaves of a nested structure into one string."""
+    parts: List[str] = []
+    stack = [value]
+
+    while stack:
+        item = stack.pop()
+        if isinstance(item, dict):
+            for k, v in item.items():
+                parts.append(str(k))
+                stack.append(v)
+        elif isinstance(item, (list, tuple, set)):
+            stack.extend(item)
+        elif item is not None:
+            parts.append(str(item))
+
+    return " ".join(parts)
+
+
+class InvertedIndex:
+    """
+    Term -> {doc_id: term frequency} index maintained per document.
+    Not thread-safe; owners call it under their own lock.
+    """
+
+    def __init__(self):
+        self.postings: Dict[str, Dict[str, int]] = {}
+        self.doc_terms: Dict[str, Dict[str, int]] = {}
+        self.doc_lengths: Dict[str, int] = {}
+        self.versions: Dict[str, Any] = {}
+        self.total_length = 0
+
+        # Sorted vocabulary for prefix lookups
+        self._terms: List[str] = []
+
+    # =====================================================
+    # MAINTENANCE
+    # =====================================================
+
+    def add(self, doc_id: str, text: str, version: Any = None) -> None:
+        """Index (or re-index) a document."""
+        if doc_id in self.doc_terms:
+            self.remove(doc_id)
+
+        tokens = tokenize(text)
+        freqs: Dict[str, int] = {}
+        for token in tokens:
+            freqs[token] = freqs.get(token, 0) + 1
+
+        for term, tf in freqs.items():
+            posting = self.postings.get(term)
+            if posting is None:
+                posting = self.postings[term] = {}
+                insort(self._terms, term)
+            posting[doc_id] = tf
+
+        self.doc_terms[doc_id] = freqs
+        self.doc_lengths[doc_id] = len(tokens)
+        self.versions[doc_id] = version
+        self.total_length += len(tokens)
+
+    def remove(self, doc_id: str) -> bool:
+        """Drop a document from the index."""
+        freqs = self.doc_terms.pop(doc_id, None)
+        if freqs is None:
+            return False
+
+        for term in freqs:
+            posting = self.postings[term]
+            del posting[doc_id]
+            if not posting:
+                del self.postings[term]
+                del self._terms[bisect_left(self._terms, term)]
+
+        self.total_length -= self.doc_lengths.pop(doc_id)
+        self.versions.pop(doc_id, None)
+        return True
+
+    def clear(self) -> None:
+        self.__init__()
+
+    def sync(self, docs: Dict[str, Any], text_for: Callable[[str], str]) -> int:
+        """
+        Reconcile with the authoritative document set.
+
+        Args:
+            docs: doc_id -> version for every live document
+            text_for: Returns the text of a doc_id that needs (re)indexing
+
+        Returns:
+            Number of documents added, re-indexed or removed
+        """
+        changed = 0
+
+        for doc_id in [d for d in self.doc_terms if d not in docs]:
+            self.remove(doc_id)
+            changed += 1
+
+        for doc_id, version in docs.items():
+            if doc_id not in self.doc_terms or self.versions.get(doc_id) != version:
+                self.add(doc_id, text_for(doc_id), version)
+                changed += 1
+
+        return changed
+
+    def __len__(self) -> int:
+        return len(self.doc_terms)
+
+    def __contains__(self, doc_id: str) -> bool:
+        return doc_id in self.doc_terms
+
+    # =====================================================
+    # QUERY
+    # =====================================================
+
+    def expand(self, term: str, prefix: bool = True) -> List[str]:
+        """Vocabulary terms matching term (exactly or as prefix)."""
+        if not prefix:
+            return [term] if term in self.postings else []
+
+        matches = []
+        for i in range(bisect_left(self._terms, term), len(self._terms)):
+            candidate = self._terms[i]
+            if not candidate.startswith(term):
+                break
+            matches.append(candidate)
+        return matches
+
+    def match(self, query: str, prefix: bool = True) -> Set[str]:
+        """Doc ids containing every query term (AND)."""
+        return set(self._match(tokenize(query), prefix)[0])
+
+    def search(
+        self,
+        query: str,
+        prefix: bool = True,
+        limit: Optional[int] = None
+    ) -> List[Tuple[str, float]]:
+        """
+        BM25-ranked AND query.
+
+        Args:
+            query: Free text; every token must match
+            prefix: Treat each token as a prefix
+            limit: Maximum results
+
+        Returns:
+            List of (doc_id, score), best first
+        """
+        docs, expansions = self._match(tokenize(query), prefix)
+        if not docs:
+            return []
+
+        n_docs = len(self.doc_terms)
+        avg_length = self.total_length / n_docs if n_docs else 0.0
+
+        scores = dict.fromkeys(docs, 0.0)
+        for terms in expansions:
+            for term in terms:
+                posting = self.postings[term]
+                df = len(posting)
+                idf = math.log(1 + (n_docs - df + 0.5) / (df + 0.5))
+                for doc_id in docs.intersection(posting):
+                    tf = posting[doc_id]
+                    norm = 1 - BM25_B + BM25_B * self.doc_lengths[doc_id] / (avg_length or 1)
+                    scores[doc_id] += idf * tf * (BM25_K1 + 1) / (tf + BM25_K1 * norm)
+
+        ranked = sorted(scores.items(), key=lambda item: (-item[1], item[0]))
+        return ranked[:limit] if limit else ranked
+
+    def _match(self, tokens: Iterable[str], prefix: bool) -> Tuple[Set[str], List[List[str]]]:
+        expansions = []
+        for token in dict.fromkeys(tokens):
+            terms = self.expand(token, prefix)
+            if not terms:
+                return set(), []
+            expansions.append(terms)
+
+        if not expansions:
+            return set(), []
+
+        # Intersect smallest candidate sets first
+        candidate_sets = []
+        for terms in expansions:
+            docs: Set[str] = set()
+            for term in terms:
+                docs.update(self.postings[term])
+            candidate_sets.append(docs)
+        candidate_sets.sort(key=len)
+
+        result = candidate_sets[0]
+        for docs in candidate_sets[1:]:
+            result = result & docs
+            if not result:
+                break
+
+        return result, expansions
+
+    # =====================================================
+    # PERSISTENCE
+    # =====================================================
+
+    def save(self, path: Path) -> bool:
+        """Persist index atomically (temp file + rename)."""
+        path = Path(path)
+        temp_file = path.with_suffix('.tmp')
+        try:
+            with open(temp_file, 'w') as f:
+                json.dump({
+                    "doc_terms": self.doc_terms,
+                    "versions": self.versions
+                }, f, separators=(',', ':'), default=str)
+            temp_file.replace(path)
+            return True
+        except Exception as e:
+            if temp_file.exists():
+                temp_file.unlink()
+            print(f"[InvertedIndex] Failed to save index: {e}")
+            return False
+
+    @classmethod
+    def load(cls, path: Path) -> "InvertedIndex":
+        """Load a persisted index; returns an empty index if unavailable."""
+        index = cls()
+        path = Path(path)
+        if not path.exists():
+            return index
+
+        try:
+            with open(path, 'r') as f:
+                data = json.load(f)
+        except Exception as e:
+            print(f"[InvertedIndex] Failed to load index: {e}")
+            return index
+
+        versions = data.get("versions", {})
+        for doc_id, freqs in data.get("doc_terms", {}).items():
+            for term, tf in freqs.items():
+                index.postings.setdefault(term, {})[doc_id] = tf
+            length = sum(freqs.values())
+            index.doc_terms[doc_id] = freqs
+            index.doc_lengths[doc_id] = length
+            index.versions[doc_id] = versions.get(doc_id)
+            index.total_length += length
+
+        index._terms = sorted(index.postings)
+        return index
@@ -0,0 +1,417 @@
+"""
+WAL Memory Store - FAZA 12
+Location: senti_core_module/senti_memory/wal_memory_store.py
+
+Append-only storage backend for episodic and semantic memory.
+- Segmented JSONL write-ahead log (one record per mutation)
+- Group-commit fsync batching
+- Periodic compaction into a snapshot
+- Crash-safe replay on startup (torn tails are truncated)
+
+Drop-in replacement for MemoryStore: same public API, so MemoryEngine
+and MemoryManager work unchanged. Select it with
+MemoryManager(..., store_backend="wal").
+"""
+
+import json
+import os
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
+from .memory_store import MemoryStore
+
+
+class _WALLog:
+    """
+    Single write-ahead log stream (snapshot + ordered JSONL segments).
+    Not thread-safe on its own; WALMemoryStore serializes access.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        wal_dir: Path,
+        snapshot_file: Path,
+        legacy_file: Path,
+        empty_factory: Callable[[], Any],
+        apply_record: Callable[[Any, Dict[str, Any]], None],
+        segment_max_bytes: int,
+        fsync_every: int,
+        fsync_interval: float
+    ):
+        self.name = name
+        self.wal_dir = wal_dir
+        self.snapshot_file = snapshot_file
+        self.legacy_file = legacy_file
+        self.empty_factory = empty_factory
+        self.apply_record = apply_record
+        self.segment_max_bytes = segment_max_bytes
+        self.fsync_every = fsync_every
+        self.fsync_interval = fsync_interval
+
+        self.seq = 0
+        self.snapshot_seq = 0
+        self.snapshot_size = 0
+        self.records_since_snapshot = 0
+
+        self._segment = None
+        self._segment_bytes = 0
+        self._unsynced = 0
+        self._last_sync = time.monotonic()
+
+        self._recover()
+
+    # -------------------------------------------------
+    # Recovery
+    # -------------------------------------------------
+
+    def _segments(self) -> List[Path]:
+        return sorted(self.wal_dir.glob(f"{self.name}-*.jsonl"))
+
+    def _read_snapshot(self) -> Dict[str, Any]:
+        if self.snapshot_file.exists():
+            with open(self.snapshot_file, 'r') as f:
+                return json.load(f)
+
+        # First start on a directory written by the JSON MemoryStore
+        if self.legacy_file.exists():
+            with open(self.legacy_file, 'r') as f:
+                return {"seq": 0, "data": json.load(f)}
+
+        return {"seq": 0, "data": self.empty_factory()}
+
+    def _recover(self) -> None:
+        """Scan segments, truncate a torn tail and restore counters."""
+        snapshot = self._read_snapshot()
+        self.snapshot_seq = snapshot.get("seq", 0)
+        self.snapshot_size = len(snapshot.get("data") or ())
+        self.seq = self.snapshot_seq
+
+        segments = self._segments()
+        for index, segment in enumerate(segments):
+            is_last = index == len(segments) - 1
+            good_offset = 0
+
+            with open(segment, 'rb') as f:
+                for line in f:
+                    try:
+                        record = json.loads(line)
+                    except ValueError:
+                        if is_last:
+                            break
+                        print(f"[WALMemoryStore] Skipping corrupt record in {segment.name}")
+                        good_offset += len(line)
+                        continue
+
+                    good_offset += len(line)
+                    if record["seq"] > self.snapshot_seq:
+                        self.records_since_snapshot += 1
+                    self.seq = max(self.seq, record["seq"])
+
+            if is_last and good_offset < segment.stat().st_size:
+                print(f"[WALMemoryStore] Truncating torn tail of {segment.name}")
+                with open(segment, 'r+b') as f:
+                    f.truncate(good_offset)
+                    os.fsync(f.fileno())
+
+    def replay(self) -> Any:
+        """Materialize current state: snapshot + all newer WAL records."""
+        snapshot = self._read_snapshot()
+        state = snapshot.get("data")
+        if state is None:
+            state = self.empty_factory()
+        snapshot_seq = snapshot.get("seq", 0)
+
+        for segment in self._segments():
+            with open(segment, 'rb') as f:
+                for line in f:
+                    try:
+                        record = json.loads(line)
+                    except ValueError:
+                        continue
+                    if record["seq"] > snapshot_seq:
+                        self.apply_record(state, record)
+
+        return state
+
+    # -------------------------------------------------
+    # Append path
+    # -------------------------------------------------
+
+    def append(self, records: List[Dict[str, Any]]) -> None:
+        """Append records to the active segment (group-committed)."""
+        if self._segment is None:
+            path = self.wal_dir / f"{self.name}-{self.seq + 1:012d}.jsonl"
+            self._segment = open(path, 'ab')
+            self._segment_bytes = self._segment.tell()
+
+        lines = []
+        for record in records:
+            self.seq += 1
+            record["seq"] = self.seq
+            lines.append(json.dumps(record, separators=(',', ':'), default=str))
+
+        data = ("\n".join(lines) + "\n").encode("utf-8")
+        self._segment.write(data)
+        self._segment.flush()
+
+        self._segment_bytes += len(data)
+        self._unsynced += len(records)
+        self.records_since_snapshot += len(records)
+
+        now = time.monotonic()
+        if (self._unsynced >= self.fsync_every or
+                now - self._last_sync >= self.fsync_interval):
+            self.sync()
+
+        if self._segment_bytes >= self.segment_max_bytes:
+            self._close_segment()
+
+    def sync(self) -> None:
+        """fsync the active segment."""
+        if self._segment is not None and self._unsynced:
+            os.fsync(self._segment.fileno())
+        self._unsynced = 0
+        self._last_sync = time.monotonic()
+
+    def _close_segment(self) -> None:
+        if self._segment is not None:
+            self.sync()
+            self._segment.close()
+            self._segment = None
+            self._segment_bytes = 0
+
+    # -------------------------------------------------
+    # Snapshot / compaction
+    # -------------------------------------------------
+
+    def write_snapshot(self, state: Any) -> None:
+        """Persist state as the new snapshot and drop covered segments."""
+        self._close_segment()
+
+        temp_file = self.snapshot_file.with_suffix('.tmp')
+        try:
+            with open(temp_file, 'w') as f:
+                json.dump({"seq": self.seq, "data": state}, f,
+                          separators=(',', ':'), default=str)
+                f.flush()
+                os.fsync(f.fileno())
+            temp_file.replace(self.snapshot_file)
+        except Exception:
+            if temp_file.exists():
+                temp_file.unlink()
+            raise
+
+        # Every record up to self.seq is now in the snapshot; replay skips
+        # them even if we crash before the unlinks below complete.
+        for segment in self._segments():
+            segment.unlink()
+
+        self.snapshot_seq = self.seq
+        self.snapshot_size = len(state)
+        self.records_since_snapshot = 0
+
+    def compact(self) -> None:
+        self.write_snapshot(self.replay())
+
+    def close(self) -> None:
+        self._close_segment()
+
+    def get_stats(self) -> Dict[str, Any]:
+        segments = self._segments()
+        return {
+            "last_seq": self.seq,
+            "snapshot_seq": self.snapshot_seq,
+            "wal_records": self.records_since_snapshot,
+            "wal_segments": len(segments),
+            "wal_size_bytes": sum(s.stat().st_size for s in segments)
+        }
+
+
+def _apply_episodic(events: List[Dict[str, Any]], record: Dict[str, Any]) -> None:
+    if record["op"] == "append":
+        events.append(record["event"])
+
+
+def _apply_semantic(facts: Dict[str, Any], record: Dict[str, Any]) -> None:
+    if record["op"] == "set":
+        facts[record["key"]] = record["value"]
+    elif record["op"] == "del":
+        facts.pop(record["key"], None)
+
+
+class WALMemoryStore(MemoryStore):
+    """
+    Write-ahead-log storage for memory systems.
+    Single mutations are O(1) appends; full rewrites only happen on
+    compaction, which is amortized against WAL growth.
+    """
+
+    def __init__(
+        self,
+        storage_dir: Path,
+        segment_max_bytes: int = 4 * 1024 * 1024,
+        fsync_every: int = 64,
+        fsync_interval: float = 0.05,
+        compact_min_records: int = 1000,
+        compact_ratio: float = 1.0
+    ):
+        """
+        Initialize WAL memory store.
+
+        Args:
+            storage_dir: Directory for storing memory files
+            segment_max_bytes: Roll to a new WAL segment past this size
+            fsync_every: fsync after this many unsynced records
+            fsync_interval: ...or after this many seconds since last fsync
+            compact_min_records: Never compact below this many WAL records
+            compact_ratio: Compact once WAL records exceed this fraction
+                of the snapshot size (keeps compaction amortized O(1))
+        """
+        super().__init__(storage_dir)
+
+        self.wal_dir = self.storage_dir / "wal"
+        self.wal_dir.mkdir(parents=True, exist_ok=True)
+
+        self.compact_min_records = compact_min_records
+        self.compact_ratio = compact_ratio
+
+        self.episodic_snapshot_file = self.storage_dir / "episodic_snapshot.json"
+        self.semantic_snapshot_file = self.storage_dir / "semantic_snapshot.json"
+
+        with self.lock:
+            self._episodic_log = _WALLog(
+                "episodic", self.wal_dir, self.episodic_snapshot_file,
+                self.episodic_file, list, _apply_episodic,
+                segment_max_bytes, fsync_every, fsync_interval
+            )
+            self._semantic_log = _WALLog(
+                "semantic", self.wal_dir, self.semantic_snapshot_file,
+                self.semantic_file, dict, _apply_semantic,
+                segment_max_bytes, fsync_every, fsync_interval
+            )
+
+    # =====================================================
+    # EPISODIC MEMORY STORAGE
+    # =====================================================
+
+    def save_episodic_events(self, events: List[Dict[str, Any]]) -> bool:
+        with self.lock:
+            try:
+                self._episodic_log.write_snapshot(events)
+                return True
+            except Exception as e:
+                print(f"[WALMemoryStore] Failed to save episodic events: {e}")
+                return False
+
+    def load_episodic_events(self) -> List[Dict[str, Any]]:
+        with self.lock:
+            try:
+                return self._episodic_log.replay()
+            except Exception as e:
+                print(f"[WALMemoryStore] Failed to load episodic events: {e}")
+                return []
+
+    def append_episodic_event(self, event: Dict[str, Any]) -> bool:
+        return self._append(self._episodic_log, [{"op": "append", "event": event}])
+
+    def commit_episodic_event(self, event: Dict[str, Any], events: List[Dict[str, Any]]) -> bool:
+        return self.append_episodic_event(event)
+
+    # =====================================================
+    # SEMANTIC MEMORY STORAGE
+    # =====================================================
+
+    def save_semantic_facts(self, facts: Dict[str, Any]) -> bool:
+        with self.lock:
+            try:
+                self._semantic_log.write_snapshot(facts)
+                return True
+            except Exception as e:
+                print(f"[WALMemoryStore] Failed to save semantic facts: {e}")
+                return False
+
+    def load_semantic_facts(self) -> Dict[str, Any]:
+        with self.lock:
+            try:
+                return self._semantic_log.replay()
+            except Exception as e:
+                print(f"[WALMemoryStore] Failed to load semantic facts: {e}")
+                return {}
+
+    def save_semantic_fact(self, key: str, value: Any) -> bool:
+        return self._append(self._semantic_log, [{"op": "set", "key": key, "value": value}])
+
+    def delete_semantic_fact(self, key: str) -> bool:
+        return self._append(self._semantic_log, [{"op": "del", "key": key}])
+
+    def commit_semantic_facts(
+        self,
+        changes: Dict[str, Optional[Dict[str, Any]]],
+        snapshot: Callable[[], Dict[str, Any]]
+    ) -> bool:
+        records = [
+            {"op": "set", "key": key, "value": entry} if entry is not None
+            else {"op": "del", "key": key}
+            for key, entry in changes.items()
+        ]
+        return self._append(self._semantic_log, records)
+
+    # =====================================================
+    # WAL MAINTENANCE
+    # =====================================================
+
+    def _append(self, log: _WALLog, records: List[Dict[str, Any]]) -> bool:
+        with self.lock:
+            try:
+                log.append(records)
+                threshold = max(self.compact_min_records,
+                                int(log.snapshot_size * self.compact_ratio))
+                if log.records_since_snapshot >= threshold:
+                    log.compact()
+                return True
+            except Exception as e:
+                print(f"[WALMemoryStore] Failed to append to {log.name} WAL: {e}")
+                return False
+
+    def compact(self) -> bool:
+        """Fold all WAL records into fresh snapshots."""
+        with self.lock:
+            try:
+                self._episodic_log.compact()
+                self._semantic_log.compact()
+                return True
+            except Exception as e:
+                print(f"[WALMemoryStore] Compaction failed: {e}")
+                return False
+
+    def flush(self) -> None:
+        with self.lock:
+            self._episodic_log.sync()
+            self._semantic_log.sync()
+
+    def close(self) -> None:
+        with self.lock:
+            self._episodic_log.close()
+            self._semantic_log.close()
+
+    def get_storage_stats(self) -> Dict[str, Any]:
+        stats = {
+            "backend": "wal",
+            "episodic_count": len(self.load_episodic_events()),
+            "semantic_count": len(self.load_semantic_facts()),
+            "storage_dir": str(self.storage_dir)
+        }
+
+        with self.lock:
+            stats["episodic_wal"] = self._episodic_log.get_stats()
+            stats["semantic_wal"] = self._semantic_log.get_stats()
+
+        if self.episodic_snapshot_file.exists():
+            stats["episodic_size_bytes"] = self.episodic_snapshot_file.stat().st_size
+
+        if self.semantic_snapshot_file.exists():
+            stats["semantic_size_bytes"] = self.semantic_snapshot_file.stat().st_size
+
+        return stats
@@ -5,12 +5,17 @@ Location: senti_core_module/senti_memory/working_memory.py
 Short-term, volatile memory with TTL expiration.
 - Clears on system restart
 - Automatic expiration (default: 3 minutes)
+- Min-heap of expiry deadlines (amortized O(log n) expiry)
+- Optional max_items / max_bytes bound with LRU eviction
 - Thread-safe operations
 """
 
+import heapq
+import sys
 import threading
 import time
-from typing import Any, Dict, Optional
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Tuple
 from datetime import datetime, timedelta
 
 
@@ -18,19 +23,85 @@ class WorkingMemory:
     """
     Short-term memory with automatic expiration.
     Not persisted to disk - volatile memory only.
+
+    Expired items are reclaimed lazily: get() drops its own key, and
+    every add() pops whatever is due from the deadline heap. With
+    max_items/max_bytes set it behaves as a bounded LRU cache.
     """
 
-    def __init__(self, default_ttl_seconds: int = 180):
+    def __init__(
+        self,
+        default_ttl_seconds: int = 180,
+        max_items: Optional[int] = None,
+        max_bytes: Optional[int] = None
+    ):
         """
         Initialize working memory.
 
         Args:
             default_ttl_seconds: Default time-to-live in seconds (default: 180 = 3 minutes)
+            max_items: Optional item limit (LRU eviction beyond it)
+            max_bytes: Optional size limit (LRU eviction beyond it)
         """
         self.default_ttl = default_ttl_seconds
-        self.memory: Dict[str, Dict[str, Any]] = {}
+        self.max_items = max_items
+        self.max_bytes = max_bytes
+
+        # Insertion/access order = LRU order (oldest first)
+        self.memory: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
         self.lock = threading.Lock()
 
+        # (deadline, key) heap; entries whose deadline no longer matches
+        # self._deadlines[key] are stale and skipped when popped.
+        self._expiry_heap: List[Tuple[float, str]] = []
+        self._deadlines: Dict[str, float] = {}
+        self._sizes: Dict[str, int] = {}
+        self._total_bytes = 0
+
+        # Counters
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+
+    # =====================================================
+    # INTERNAL BOOKKEEPING
+    # =====================================================
+
+    def _delete(self, key: str) -> None:
+        del self.memory[key]
+        del self._deadlines[key]
+        self._total_bytes -= self._sizes.pop(key, 0)
+
+    def _expire_due(self, now: float) -> int:
+        """Pop all due deadlines off the heap; returns items removed."""
+        removed = 0
+        heap = self._expiry_heap
+
+        while heap and heap[0][0] < now:
+            deadline, key = heapq.heappop(heap)
+            if self._deadlines.get(key) == deadline:
+                self._delete(key)
+                removed += 1
+
+        # Drop stale entries once they dominate the heap
+        if len(heap) > 2 * len(self._deadlines) + 64:
+            self._expiry_heap = [(d, k) for k, d in self._deadlines.items()]
+            heapq.heapify(self._expiry_heap)
+
+        self.expirations += removed
+        return removed
+
+    def _evict_over_limit(self) -> None:
+        """Evict least recently used items until within limits."""
+        while self.memory and (
+            (self.max_items is not None and len(self.memory) > self.max_items) or
+            (self.max_bytes is not None and self._total_bytes > self.max_bytes)
+        ):
+            key = next(iter(self.memory))
+            self._delete(key)
+            self.evictions += 1
+
     # =====================================================
     # CORE OPERATIONS
     # =====================================================
@@ -50,14 +121,30 @@ class WorkingMemory:
         with self.lock:
             try:
                 ttl = ttl_seconds if ttl_seconds is not None else self.default_ttl
-                expiry_time = datetime.now() + timedelta(seconds=ttl)
+                now = time.time()
+                self._expire_due(now)
+
+                expiry_time = datetime.fromtimestamp(now) + timedelta(seconds=ttl)
+                deadline = now + ttl
+
+                if key in self.memory:
+                    self._delete(key)
 
                 self.memory[key] = {
                     "value": value,
-                    "created_at": datetime.now().isoformat(),
+                    "created_at": datetime.fromtimestamp(now).isoformat(),
                     "expires_at": expiry_time.isoformat(),
                     "ttl_seconds": ttl
                 }
+                self._deadlines[key] = deadline
+                heapq.heappush(self._expiry_heap, (deadline, key))
+
+                if self.max_bytes is not None:
+                    size = sys.getsizeof(str(value))
+                    self._sizes[key] = size
+                    self._total_bytes += size
+
+                self._evict_over_limit()
                 return True
             except Exception as e:
                 print(f"[WorkingMemory] Failed to add item: {e}")
@@ -76,17 +163,19 @@ class WorkingMemory:
         """
         with self.lock:
             if key not in self.memory:
+                self.misses += 1
                 return None
 
-            item = self.memory[key]
-            expires_at = datetime.fromisoformat(item["expires_at"])
-
             # Check if expired
-            if datetime.now() > expires_at:
-                del self.memory[key]
+            if time.time() > self._deadlines[key]:
+                self._delete(key)
+                self.expirations += 1
+                self.misses += 1
                 return None
 
-            return item["value"]
+            self.memory.move_to_end(key)
+            self.hits += 1
+            return self.memory[key]["value"]
 
     def remove(self, key: str) -> bool:
         """
@@ -100,7 +189,7 @@ class WorkingMemory:
         """
         with self.lock:
             if key in self.memory:
-                del self.memory[key]
+                self._delete(key)
                 return True
             return False
 
@@ -121,6 +210,14 @@ class WorkingMemory:
 
             # Preserve expiry time
             self.memory[key]["value"] = value
+            self.memory.move_to_end(key)
+
+            if self.max_bytes is not None:
+                size = sys.getsizeof(str(value))
+                self._total_bytes += size - self._sizes.get(key, 0)
+                self._sizes[key] = size
+                self._evict_over_limit()
+
             return True
 
     # =====================================================
@@ -135,18 +232,7 @@ class WorkingMemory:
             Number of items removed
         """
         with self.lock:
-            now = datetime.now()
-            expired_keys = []
-
-            for key, item in self.memory.items():
-                expires_at = datetime.fromisoformat(item["expires_at"])
-                if now > expires_at:
-                    expired_keys.append(key)
-
-            for key in expired_keys:
-                del self.memory[key]
-
-            return len(expired_keys)
+            return self._expire_due(time.time())
 
     def clear(self) -> int:
         """
@@ -158,6 +244,10 @@ class WorkingMemory:
         with self.lock:
             count = len(self.memory)
             self.memory.clear()
+            self._expiry_heap = []
+            self._deadlines.clear()
+            self._sizes.clear()
+            self._total_bytes = 0
             return count
 
     # =====================================================
@@ -184,15 +274,8 @@ class WorkingMemory:
             List of keys
         """
         with self.lock:
-            now = datetime.now()
-            valid_keys = []
-
-            for key, item in self.memory.items():
-                expires_at = datetime.fromisoformat(item["expires_at"])
-                if now <= expires_at:
-                    valid_keys.append(key)
-
-            return valid_keys
+            self._expire_due(time.time())
+            return list(self.memory.keys())
 
     def get_stats(self) -> Dict[str, Any]:
         """
@@ -202,22 +285,23 @@ class WorkingMemory:
             Stats dictionary
         """
         with self.lock:
-            now = datetime.now()
-            valid_count = 0
-            expired_count = 0
-
-            for item in self.memory.values():
-                expires_at = datetime.fromisoformat(item["expires_at"])
-                if now <= expires_at:
-                    valid_count += 1
-                else:
-                    expired_count += 1
+            total_count = len(self.memory)
+            expired_count = self._expire_due(time.time())
+            lookups = self.hits + self.misses
 
             return {
-                "total_items": len(self.memory),
-                "valid_items": valid_count,
+                "total_items": total_count,
+                "valid_items": len(self.memory),
                 "expired_items": expired_count,
-                "default_ttl_seconds": self.default_ttl
+                "default_ttl_seconds": self.default_ttl,
+                "max_items": self.max_items,
+                "max_bytes": self.max_bytes,
+                "total_bytes": self._total_bytes if self.max_bytes is not None else None,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+                "evictions": self.evictions,
+                "expirations": self.expirations
             }
 
     def get_item_info(self, key: str) -> Optional[Dict[str, Any]]:
@@ -235,14 +319,12 @@ class WorkingMemory:
                 return None
 
             item = self.memory[key]
-            expires_at = datetime.fromisoformat(item["expires_at"])
-            now = datetime.now()
 
             return {
                 "key": key,
                 "created_at": item["created_at"],
                 "expires_at": item["expires_at"],
                 "ttl_seconds": item["ttl_seconds"],
-                "is_expired": now > expires_at,
+                "is_expired": time.time() > self._deadlines[key],
                 "has_value": True
             }
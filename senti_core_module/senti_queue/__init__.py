@@ -0,0 +1,24 @@
+"""
+Senti Queue - Indexed Priority Queue
+Shared task-queue primitive for the FAZA 17 and FAZA 25 task queues,
+kept outside both layers so neither depends on the other.
+
+Components:
+- IndexedPriorityQueue: binary heap with an id index, O(log n)
+  remove / update via lazy deletion, per-group counters
+- aging_key: virtual-clock heap key for priority aging
+
+Example usage:
+    from senti_core_module.senti_queue import IndexedPriorityQueue
+
+    queue = IndexedPriorityQueue()
+    queue.push("task-1", task, key=(priority, created_at))
+    task_id, task = queue.pop()
+"""
+
+from .indexed_queue import IndexedPriorityQueue, aging_key
+
+__all__ = [
+    "IndexedPriorityQueue",
+    "aging_key"
+]
@@ -0,0 +1,225 @@
+"""
+Indexed Priority Queue
+Location: senti_core_module/senti_queue/indexed_queue.py
+
+Binary heap with an id -> entry index, shared by the FAZA 17 and FAZA 25
+task queues:
+- push / pop / remove / update in O(log n) (lazy deletion: removed or
+  re-prioritized entries are tombstoned and skipped on pop)
+- O(1) lookup by id and per-group counters (e.g. tasks per priority)
+- Tombstones are compacted once they outnumber live entries
+
+Keys are any orderable values (smallest first); ties are broken by
+insertion order. Aging is expressed through the key itself (virtual
+clock, see aging_key()) so no entry is ever rewritten.
+
+Not thread-safe: callers hold their own lock.
+"""
+
+import heapq
+import itertools
+from collections import Counter
+from typing import Any, Dict, Generic, Hashable, Iterator, List, Optional, Tuple, TypeVar
+
+
+T = TypeVar("T")
+
+_REMOVED = object()  # Tombstone marker in the item slot of an entry
+
+
+def aging_key(level: float, enqueued_at: float, aging_interval: float) -> float:
+    """
+    Heap key for priority aging on a virtual clock.
+
+    A task gains one priority level per aging_interval seconds waited:
+    its effective level at time t is level - (t - enqueued_at) / interval.
+    Ordering by effective level is the same at every t, so the key is
+    level * interval + enqueued_at and never has to be updated.
+
+    Args:
+        level: Priority level, lower runs first
+        enqueued_at: Enqueue timestamp (seconds)
+        aging_interval: Seconds of waiting worth one priority level
+
+    Returns:
+        Static heap key (smaller first)
+    """
+    return level * aging_interval + enqueued_at
+
+
+class IndexedPriorityQueue(Generic[T]):
+    """
+    Min-heap of items addressed by id.
+
+    Entries are [key, seq, item_id, item]; removing or re-keying an item
+    tombstones its entry instead of searching and re-heapifying.
+    """
+
+    def __init__(self):
+        self._heap: List[list] = []
+        self._entries: Dict[Hashable, list] = {}
+        self._groups: Dict[Hashable, Hashable] = {}
+        self._group_counts: Counter = Counter()
+        self._seq = itertools.count()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, item_id: Hashable) -> bool:
+        return item_id in self._entries
+
+    def push(self, item_id: Hashable, item: T, key: Any, group: Hashable = None) -> None:
+        """
+        Add an item, replacing any queued item with the same id.
+
+        Args:
+            item_id: Unique item id
+            item: Item payload
+            key: Ordering key (smallest pops first)
+            group: Optional group for counters (e.g. priority level)
+        """
+        if item_id in self._entries:
+            self.remove(item_id)
+
+        entry = [key, next(self._seq), item_id, item]
+        self._entries[item_id] = entry
+        self._groups[item_id] = group
+        self._group_counts[group] += 1
+        heapq.heappush(self._heap, entry)
+
+    def pop(self) -> Optional[Tuple[Hashable, T]]:
+        """
+        Remove and return the item with the smallest key.
+
+        Returns:
+            (item_id, item) or None if empty
+        """
+        while self._heap:
+            entry = heapq.heappop(self._heap)
+            if entry[3] is not _REMOVED:
+                self._forget(entry[2])
+                return entry[2], entry[3]
+        return None
+
+    def peek(self) -> Optional[Tuple[Hashable, T]]:
+        """
+        Return the item with the smallest key without removing it.
+
+        Returns:
+            (item_id, item) or None if empty
+        """
+        while self._heap and self._heap[0][3] is _REMOVED:
+            heapq.heappop(self._heap)
+        if not self._heap:
+            return None
+        return self._heap[0][2], self._heap[0][3]
+
+    def remove(self, item_id: Hashable) -> Optional[T]:
+        """
+        Remove an item by id.
+
+        Args:
+            item_id: Item id
+
+        Returns:
+            Removed item or None if not queued
+        """
+        entry = self._entries.get(item_id)
+        if entry is None:
+            return None
+
+        item = entry[3]
+        entry[3] = _REMOVED
+        self._forget(item_id)
+        self._maybe_compact()
+        return item
+
+    def update(self, item_id: Hashable, key: Any, group: Hashable = None) -> bool:
+        """
+        Change an item's key (and group). A re-keyed item queues behind
+        items that already have the new key.
+
+        Args:
+            item_id: Item id
+            key: New ordering key
+            group: New group for counters
+
+        Returns:
+            True if updated, False if not queued
+        """
+        entry = self._entries.get(item_id)
+        if entry is None:
+            return False
+
+        self._group_counts[self._groups[item_id]] -= 1
+        self._groups[item_id] = group
+        self._group_counts[group] += 1
+        if key == entry[0]:
+            return True
+
+        new_entry = [key, next(self._seq), item_id, entry[3]]
+        entry[3] = _REMOVED
+        self._entries[item_id] = new_entry
+        heapq.heappush(self._heap, new_entry)
+        self._maybe_compact()
+        return True
+
+    def get(self, item_id: Hashable) -> Optional[T]:
+        """Get a queued item by id (O(1))."""
+        entry = self._entries.get(item_id)
+        return entry[3] if entry is not None else None
+
+    def rank(self, item_id: Hashable) -> Optional[int]:
+        """
+        Position an item would be popped at (0 = next).
+
+        Counts live entries ordered before it: O(n), no sorting.
+
+        Args:
+            item_id: Item id
+
+        Returns:
+            0-indexed position or None if not queued
+        """
+        entry = self._entries.get(item_id)
+        if entry is None:
+            return None
+
+        order = (entry[0], entry[1])
+        return sum(
+            1 for other in self._entries.values()
+            if (other[0], other[1]) < order
+        )
+
+    def count(self, group: Hashable) -> int:
+        """Number of queued items in a group (O(1))."""
+        return self._group_counts.get(group, 0)
+
+    def group_counts(self) -> Dict[Hashable, int]:
+        """Queued item count per group."""
+        return {group: n for group, n in self._group_counts.items() if n}
+
+    def items(self) -> Iterator[T]:
+        """Iterate queued items (insertion order, not pop order)."""
+        return (entry[3] for entry in self._entries.values())
+
+    def ordered(self) -> List[T]:
+        """Queued items in pop order (O(n log n))."""
+        return [entry[3] for entry in sorted(self._entries.values(), key=lambda e: (e[0], e[1]))]
+
+    def clear(self) -> None:
+        """Remove all items."""
+        self._heap.clear()
+        self._entries.clear()
+        self._groups.clear()
+        self._group_counts.clear()
+
+    def _forget(self, item_id: Hashable) -> None:
+        del self._entries[item_id]
+        self._group_counts[self._groups.pop(item_id)] -= 1
+
+    def _maybe_compact(self) -> None:
+        # Rebuild once tombstones outnumber live entries (amortized O(1))
+        if len(self._heap) > 64 and len(self._heap) > 2 * len(self._entries):
+            self._heap = list(self._entries.values())
+            heapq.heapify(self._heap)
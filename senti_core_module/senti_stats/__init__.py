@@ -0,0 +1,41 @@
+"""
+Senti Stats - Streaming Statistics
+Shared constant-time statistics for the anomaly detectors
+(FAZA 14, FAZA 28.5, FAZA 30).
+
+Components:
+- RunningStats: Welford mean / variance (add, remove, replace, merge)
+- EWMStats: exponentially weighted mean / variance
+- SlidingWindow: ring buffer of the last N samples with O(1) moments
+  (NumPy-backed when available)
+- P2Quantile: P-square streaming quantile sketch
+- RobustZScore: median / MAD z-score on P2 sketches
+- score_windows / score_moments: vectorized batch scoring of many
+  agents x metrics, returning compact BatchAnomaly records
+
+Example usage:
+    from senti_core_module.senti_stats import SlidingWindow
+
+    window = SlidingWindow(100)
+    for value in samples:
+        z = window.zscore(value)
+        window.push(value)
+"""
+
+from .streaming import RunningStats, EWMStats
+from .window import SlidingWindow
+from .quantiles import P2Quantile, RobustZScore
+from .batch import BatchAnomaly, score_moments, score_windows
+
+__all__ = [
+    "RunningStats",
+    "EWMStats",
+    "SlidingWindow",
+    "P2Quantile",
+    "RobustZScore",
+    "BatchAnomaly",
+    "score_moments",
+    "score_windows"
+]
+
+__version__ = "1.0.0"
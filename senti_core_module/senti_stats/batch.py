@@ -0,0 +1,283 @@
+"""
+Senti Stats - Batch Scoring
+Location: senti_core_module/senti_stats/batch.py
+
+Scores many series in one vectorized pass instead of one Python call per
+agent and metric:
+- score_windows: raw samples, agents x metrics x window
+- score_moments: current samples against precomputed center / scale
+  (streamed window moments, or median / MAD for robust scores)
+
+Both flag z-score threshold breaches and, when thresholds are given,
+sudden drops / spikes against the previous sample. Only flagged cells are
+returned, as compact BatchAnomaly records. Batches smaller than
+NUMPY_MIN_SIZE cells (or installs without NumPy) take an equivalent
+pure-Python path.
+"""
+
+import math
+from typing import Any, List, NamedTuple, Optional, Tuple
+
+try:
+    import numpy as np
+except ImportError:  # Optional: pure-Python scoring
+    np = None
+
+OUTLIER = "outlier"
+DROP = "drop"
+SPIKE = "spike"
+
+NUMPY_MIN_SIZE = 64  # Below this many cells the pure-Python path is faster
+
+
+class BatchAnomaly(NamedTuple):
+    """
+    One flagged cell.
+
+    Attributes:
+        agent: Row (agent) index
+        metric: Column (metric) index, 0 for 1-D input
+        kind: OUTLIER, DROP or SPIKE
+        value: Current sample
+        expected: Center (OUTLIER) or previous sample (DROP / SPIKE)
+        score: Z-score (OUTLIER) or change from the previous sample
+    """
+    agent: int
+    metric: int
+    kind: str
+    value: float
+    expected: float
+    score: float
+
+
+def score_moments(
+    values: Any,
+    center: Any,
+    scale: Any,
+    previous: Any = None,
+    threshold: float = 3.0,
+    drop_threshold: Optional[float] = None,
+    spike_threshold: Optional[float] = None,
+    use_numpy: Optional[bool] = None
+) -> List[BatchAnomaly]:
+    """
+    Score current samples against precomputed moments.
+
+    All inputs share one shape: 1-D (agents) or 2-D (agents x metrics).
+    None / NaN marks a missing entry; a cell is only z-scored when its
+    scale is positive, and only checked for drops / spikes when it has a
+    previous sample.
+
+    Args:
+        values: Current samples
+        center: Expected values (mean or median)
+        scale: Standard deviations (or MAD / 0.6745)
+        previous: Previous samples, for drop / spike detection
+        threshold: Absolute z-score above which a cell is an OUTLIER
+        drop_threshold: Change below -drop_threshold is a DROP (None = off)
+        spike_threshold: Change above spike_threshold is a SPIKE (None = off)
+        use_numpy: Force (True) or disable (False) the NumPy path;
+            None uses it for NUMPY_MIN_SIZE cells or more
+
+    Returns:
+        Flagged cells, ordered by agent, metric (DROP / SPIKE before OUTLIER)
+    """
+    if _numpy_enabled(use_numpy, _cells(values)):
+        return _score_numpy(
+            np.asarray(values, dtype=np.float64),
+            center, scale, previous,
+            threshold, drop_threshold, spike_threshold
+        )
+
+    flat, columns = _flatten(values)
+    return _score_python(
+        flat, columns,
+        _flatten(center)[0], _flatten(scale)[0],
+        _flatten(previous)[0] if previous is not None else None,
+        threshold, drop_threshold, spike_threshold
+    )
+
+
+def score_windows(
+    windows: Any,
+    threshold: float = 3.0,
+    drop_threshold: Optional[float] = None,
+    spike_threshold: Optional[float] = None,
+    ddof: int = 1,
+    include_current: bool = True,
+    min_samples: int = 2,
+    use_numpy: Optional[bool] = None
+) -> List[BatchAnomaly]:
+    """
+    Score the newest sample of every series in a sample matrix.
+
+    windows is agents x metrics x window (or agents x window for a single
+    metric), oldest sample first; the last sample is the one scored.
+    Shorter histories are padded at the front with NaN (or, on the
+    pure-Python path, may simply be shorter lists).
+
+    Args:
+        windows: Sample matrix
+        threshold: Absolute z-score above which a cell is an OUTLIER
+        drop_threshold: Change below -drop_threshold is a DROP (None = off)
+        spike_threshold: Change above spike_threshold is a SPIKE (None = off)
+        ddof: Delta degrees of freedom for the standard deviation
+        include_current: Include the scored sample in the mean / std
+        min_samples: Minimum samples in the mean / std to z-score a cell
+        use_numpy: Force (True) or disable (False) the NumPy path
+
+    Returns:
+        Flagged cells, as for score_moments
+    """
+    if _numpy_enabled(use_numpy, _cells(windows)):
+        data = np.asarray(windows, dtype=np.float64)
+        if data.ndim == 2:
+            data = data[:, None, :]
+        current = data[..., -1]
+        previous = data[..., -2] if data.shape[-1] > 1 else np.full(current.shape, np.nan)
+        sample = data if include_current else data[..., :-1]
+
+        valid = ~np.isnan(sample)
+        count = valid.sum(axis=-1)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            if valid.all():
+                # No padding: plain reductions
+                mean = sample.mean(axis=-1)
+                std = sample.std(axis=-1, ddof=ddof)
+            else:
+                mean = np.where(valid, sample, 0.0).sum(axis=-1) / count
+                deviation = np.where(valid, sample - mean[..., None], 0.0)
+                std = np.sqrt((deviation * deviation).sum(axis=-1) / (count - ddof))
+        std[(count < min_samples) | (count <= ddof)] = np.nan
+
+        return _score_numpy(current, mean, std, previous,
+                            threshold, drop_threshold, spike_threshold)
+
+    rows = [row if row and _is_sequence(row[0]) else [row] for row in windows]
+    columns = len(rows[0]) if rows else 1
+    current, previous, centers, scales = [], [], [], []
+    for row in rows:
+        for series in row:
+            series = [x for x in series if not _missing(x)]
+            current.append(series[-1] if series else None)
+            previous.append(series[-2] if len(series) > 1 else None)
+            sample = series if include_current else series[:-1]
+            count = len(sample)
+            if count < min_samples or count <= ddof:
+                centers.append(None)
+                scales.append(None)
+                continue
+            mean = sum(sample) / count
+            centers.append(mean)
+            scales.append(math.sqrt(sum((x - mean) ** 2 for x in sample) / (count - ddof)))
+
+    return _score_python(current, columns, centers, scales, previous,
+                         threshold, drop_threshold, spike_threshold)
+
+
+def _numpy_enabled(use_numpy: Optional[bool], cells: int) -> bool:
+    if use_numpy and np is None:
+        raise ImportError("NumPy is required for use_numpy=True")
+    if use_numpy is not None:
+        return use_numpy
+    return np is not None and cells >= NUMPY_MIN_SIZE
+
+
+def _cells(data: Any) -> int:
+    """Number of scored cells (agents x metrics) in an input."""
+    if np is not None and isinstance(data, np.ndarray):
+        return int(np.prod(data.shape[:2]))
+    rows = len(data)
+    return rows * len(data[0]) if rows and _is_sequence(data[0]) else rows
+
+
+def _score_numpy(
+    values: Any,
+    center: Any,
+    scale: Any,
+    previous: Any,
+    threshold: float,
+    drop_threshold: Optional[float],
+    spike_threshold: Optional[float]
+) -> List[BatchAnomaly]:
+    values = np.atleast_1d(values)
+    columns = values.shape[1] if values.ndim == 2 else 1
+    values = values.reshape(-1)
+    center = np.broadcast_to(np.asarray(center, dtype=np.float64).reshape(-1), values.shape)
+    scale = np.broadcast_to(np.asarray(scale, dtype=np.float64).reshape(-1), values.shape)
+
+    # (flat index, kind order, record): DROP / SPIKE sort before OUTLIER
+    found = []
+    if previous is not None and (drop_threshold is not None or spike_threshold is not None):
+        previous = np.broadcast_to(np.asarray(previous, dtype=np.float64).reshape(-1), values.shape)
+        change = values - previous
+        if drop_threshold is not None:
+            for i in np.flatnonzero(change < -drop_threshold).tolist():
+                found.append((i, 0, DROP, previous[i], change[i]))
+        if spike_threshold is not None:
+            spikes = change > spike_threshold
+            if drop_threshold is not None:
+                spikes &= ~(change < -drop_threshold)
+            for i in np.flatnonzero(spikes).tolist():
+                found.append((i, 0, SPIKE, previous[i], change[i]))
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        z = (values - center) / scale
+    for i in np.flatnonzero((scale > 0) & (np.abs(z) > threshold)).tolist():
+        found.append((i, 1, OUTLIER, center[i], z[i]))
+
+    found.sort(key=lambda item: (item[0], item[1]))
+    return [
+        BatchAnomaly(i // columns, i % columns, kind, float(values[i]), float(expected), float(score))
+        for i, _, kind, expected, score in found
+    ]
+
+
+def _score_python(
+    values: List[Any],
+    columns: int,
+    center: List[Any],
+    scale: List[Any],
+    previous: Optional[List[Any]],
+    threshold: float,
+    drop_threshold: Optional[float],
+    spike_threshold: Optional[float]
+) -> List[BatchAnomaly]:
+    records = []
+    for i, value in enumerate(values):
+        if _missing(value):
+            continue
+        agent, metric = divmod(i, columns)
+
+        prev = previous[i] if previous is not None else None
+        if not _missing(prev):
+            change = value - prev
+            if drop_threshold is not None and change < -drop_threshold:
+                records.append(BatchAnomaly(agent, metric, DROP, float(value), float(prev), change))
+            elif spike_threshold is not None and change > spike_threshold:
+                records.append(BatchAnomaly(agent, metric, SPIKE, float(value), float(prev), change))
+
+        std = scale[i]
+        if not _missing(std) and std > 0 and not _missing(center[i]):
+            z = (value - center[i]) / std
+            if abs(z) > threshold:
+                records.append(BatchAnomaly(agent, metric, OUTLIER, float(value), float(center[i]), z))
+    return records
+
+
+def _flatten(data: Any) -> Tuple[List[Any], int]:
+    """Row-major flat list and column count of a 1-D / 2-D input."""
+    if np is not None and isinstance(data, np.ndarray):
+        return data.reshape(-1).tolist(), (data.shape[1] if data.ndim == 2 else 1)
+    data = list(data)
+    if data and _is_sequence(data[0]):
+        return [x for row in data for x in row], len(data[0])
+    return data, 1
+
+
+def _is_sequence(value: Any) -> bool:
+    return isinstance(value, (list, tuple)) or (np is not None and isinstance(value, np.ndarray))
+
+
+def _missing(value: Any) -> bool:
+    return value is None or value != value
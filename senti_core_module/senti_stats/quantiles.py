@@ -0,0 +1,153 @@
+"""
+Senti Stats - Quantile Sketches
+Location: senti_core_module/senti_stats/quantiles.py
+
+- P2Quantile: P-square streaming quantile estimate (Jain & Chlamtac),
+  five markers, O(1) memory and update
+- RobustZScore: median / MAD z-score from two P2 sketches, insensitive
+  to the outliers it is meant to detect
+"""
+
+import bisect
+from typing import List, Optional
+
+
+class P2Quantile:
+    """
+    Streaming estimate of one quantile.
+
+    Exact for the first five samples; afterwards five markers track the
+    minimum, q/2, q, (1+q)/2 quantiles and maximum, adjusted with
+    piecewise-parabolic interpolation.
+    """
+
+    __slots__ = ("q", "count", "_heights", "_positions", "_desired", "_increments")
+
+    def __init__(self, q: float = 0.5):
+        """
+        Initialize sketch.
+
+        Args:
+            q: Quantile to track (0 < q < 1), 0.5 = median
+        """
+        if not 0.0 < q < 1.0:
+            raise ValueError("q must be in (0, 1)")
+
+        self.q = q
+        self.count = 0
+        self._heights: List[float] = []
+        self._positions = [1, 2, 3, 4, 5]
+        self._desired = [1.0, 1 + 2 * q, 1 + 4 * q, 3 + 2 * q, 5.0]
+        self._increments = [0.0, q / 2, q, (1 + q) / 2, 1.0]
+
+    def add(self, value: float) -> None:
+        """Add a sample."""
+        self.count += 1
+        heights = self._heights
+        if self.count <= 5:
+            bisect.insort(heights, value)
+            return
+
+        # Find the marker cell and extend the extremes
+        if value < heights[0]:
+            heights[0] = value
+            cell = 0
+        elif value >= heights[4]:
+            heights[4] = value
+            cell = 3
+        else:
+            cell = bisect.bisect_right(heights, value) - 1
+
+        positions = self._positions
+        for i in range(cell + 1, 5):
+            positions[i] += 1
+        for i in range(5):
+            self._desired[i] += self._increments[i]
+
+        # Move the middle markers towards their desired positions
+        for i in (1, 2, 3):
+            offset = self._desired[i] - positions[i]
+            if (offset >= 1 and positions[i + 1] - positions[i] > 1) or \
+                    (offset <= -1 and positions[i - 1] - positions[i] < -1):
+                step = 1 if offset > 0 else -1
+                height = self._parabolic(i, step)
+                if not heights[i - 1] < height < heights[i + 1]:
+                    height = self._linear(i, step)
+                heights[i] = height
+                positions[i] += step
+
+    def _parabolic(self, i: int, step: int) -> float:
+        h, n = self._heights, self._positions
+        return h[i] + step / (n[i + 1] - n[i - 1]) * (
+            (n[i] - n[i - 1] + step) * (h[i + 1] - h[i]) / (n[i + 1] - n[i]) +
+            (n[i + 1] - n[i] - step) * (h[i] - h[i - 1]) / (n[i] - n[i - 1])
+        )
+
+    def _linear(self, i: int, step: int) -> float:
+        h, n = self._heights, self._positions
+        return h[i] + step * (h[i + step] - h[i]) / (n[i + step] - n[i])
+
+    @property
+    def value(self) -> Optional[float]:
+        """Current quantile estimate, or None before any sample."""
+        if self.count == 0:
+            return None
+        if self.count > 5:
+            return self._heights[2]
+
+        # Few samples: interpolate the sorted values exactly
+        position = self.q * (self.count - 1)
+        lower = int(position)
+        upper = min(lower + 1, self.count - 1)
+        fraction = position - lower
+        return self._heights[lower] + (self._heights[upper] - self._heights[lower]) * fraction
+
+    def __len__(self) -> int:
+        return self.count
+
+    def __repr__(self) -> str:
+        return f"<P2Quantile: q={self.q} value={self.value} n={self.count}>"
+
+
+class RobustZScore:
+    """
+    Robust z-score: 0.6745 * (x - median) / MAD.
+
+    Median and median absolute deviation are streamed with P2 sketches
+    (the deviation is taken from the current median estimate).
+    """
+
+    SCALE = 0.6745  # MAD of a normal distribution in standard deviations
+
+    __slots__ = ("_median", "_mad")
+
+    def __init__(self):
+        self._median = P2Quantile(0.5)
+        self._mad = P2Quantile(0.5)
+
+    def add(self, value: float) -> None:
+        """Add a sample."""
+        self._median.add(value)
+        self._mad.add(abs(value - self._median.value))
+
+    @property
+    def count(self) -> int:
+        return self._median.count
+
+    @property
+    def median(self) -> Optional[float]:
+        return self._median.value
+
+    @property
+    def mad(self) -> Optional[float]:
+        return self._mad.value
+
+    def score(self, value: float) -> Optional[float]:
+        """Robust z-score of value, or None if MAD is zero / no samples."""
+        mad = self._mad.value
+        if not mad:
+            return None
+        return self.SCALE * (value - self._median.value) / mad
+
+    def __len__(self) -> int:
+        return self.count
@@ -0,0 +1,182 @@
+"""
+Senti Stats - Streaming Moments
+Location: senti_core_module/senti_stats/streaming.py
+
+O(1)-update estimators:
+- RunningStats: Welford mean / variance with add, remove and replace
+  (the basis of sliding windows) and Chan's parallel merge
+- EWMStats: exponentially weighted mean and variance
+"""
+
+import math
+from typing import Iterable, Optional
+
+
+class RunningStats:
+    """
+    Welford running mean and variance.
+
+    Numerically stable for long streams; remove() and replace() undo
+    earlier samples so the same accumulator can track a sliding window.
+    """
+
+    __slots__ = ("count", "mean", "_m2")
+
+    def __init__(self):
+        self.count = 0
+        self.mean = 0.0
+        self._m2 = 0.0
+
+    @classmethod
+    def from_values(cls, values: Iterable[float]) -> "RunningStats":
+        """Accumulate values in a single pass."""
+        stats = cls()
+        for value in values:
+            stats.add(value)
+        return stats
+
+    def add(self, value: float) -> None:
+        """Add a sample."""
+        self.count += 1
+        delta = value - self.mean
+        self.mean += delta / self.count
+        self._m2 += delta * (value - self.mean)
+
+    def remove(self, value: float) -> None:
+        """Remove a sample that was previously added."""
+        if self.count <= 1:
+            self.clear()
+            return
+
+        self.count -= 1
+        delta = value - self.mean
+        self.mean -= delta / self.count
+        self._m2 = max(0.0, self._m2 - delta * (value - self.mean))
+
+    def replace(self, old: float, new: float) -> None:
+        """Replace a previously added sample (count stays the same)."""
+        if self.count == 0:
+            self.add(new)
+            return
+
+        old_mean = self.mean
+        delta = new - old
+        self.mean += delta / self.count
+        self._m2 = max(0.0, self._m2 + delta * (new - self.mean + old - old_mean))
+
+    def merge(self, other: "RunningStats") -> None:
+        """Combine with another accumulator (Chan et al.)."""
+        if other.count == 0:
+            return
+        if self.count == 0:
+            self.count, self.mean, self._m2 = other.count, other.mean, other._m2
+            return
+
+        count = self.count + other.count
+        delta = other.mean - self.mean
+        self.mean += delta * other.count / count
+        self._m2 += other._m2 + delta * delta * self.count * other.count / count
+        self.count = count
+
+    def reset(self, count: int, mean: float, m2: float) -> None:
+        """Overwrite the state (e.g. after an exact recomputation)."""
+        self.count = count
+        self.mean = mean
+        self._m2 = max(0.0, m2)
+
+    def clear(self) -> None:
+        """Forget all samples."""
+        self.count = 0
+        self.mean = 0.0
+        self._m2 = 0.0
+
+    def variance(self, ddof: int = 1) -> float:
+        """
+        Variance of the samples.
+
+        Args:
+            ddof: Delta degrees of freedom (1 = sample, 0 = population)
+
+        Returns:
+            Variance, 0.0 with too few samples
+        """
+        if self.count <= ddof:
+            return 0.0
+        return self._m2 / (self.count - ddof)
+
+    def std(self, ddof: int = 1) -> float:
+        """Standard deviation (see variance())."""
+        return math.sqrt(self.variance(ddof))
+
+    def zscore(self, value: float, ddof: int = 1) -> Optional[float]:
+        """Z-score of value, or None if the deviation is zero."""
+        std = self.std(ddof)
+        if std == 0:
+            return None
+        return (value - self.mean) / std
+
+    def __len__(self) -> int:
+        return self.count
+
+    def __repr__(self) -> str:
+        return f"<RunningStats: n={self.count} mean={self.mean:.4g} std={self.std():.4g}>"
+
+
+class EWMStats:
+    """
+    Exponentially weighted mean and variance.
+
+    Recent samples weigh more: alpha is the weight of the newest sample
+    (alpha = 2 / (span + 1) for a span-sample equivalent window).
+    """
+
+    __slots__ = ("alpha", "count", "mean", "var")
+
+    def __init__(self, alpha: float = 0.1):
+        if not 0.0 < alpha <= 1.0:
+            raise ValueError("alpha must be in (0, 1]")
+        self.alpha = alpha
+        self.count = 0
+        self.mean = 0.0
+        self.var = 0.0
+
+    @classmethod
+    def from_span(cls, span: float) -> "EWMStats":
+        """Create with alpha = 2 / (span + 1)."""
+        return cls(2.0 / (span + 1.0))
+
+    def add(self, value: float) -> None:
+        """Add a sample."""
+        self.count += 1
+        if self.count == 1:
+            self.mean = value
+            self.var = 0.0
+            return
+
+        diff = value - self.mean
+        increment = self.alpha * diff
+        self.mean += increment
+        self.var = (1.0 - self.alpha) * (self.var + diff * increment)
+
+    def std(self) -> float:
+        """Exponentially weighted standard deviation."""
+        return math.sqrt(self.var)
+
+    def zscore(self, value: float) -> Optional[float]:
+        """Z-score of value, or None if the deviation is zero."""
+        std = self.std()
+        if std == 0:
+            return None
+        return (value - self.mean) / std
+
+    def clear(self) -> None:
+        """Forget all samples."""
+        self.count = 0
+        self.mean = 0.0
+        self.var = 0.0
+
+    def __len__(self) -> int:
+        return self.count
+
+    def __repr__(self) -> str:
+        return f"<EWMStats: alpha={self.alpha} mean={self.mean:.4g} std={self.std():.4g}>"
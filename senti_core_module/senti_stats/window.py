@@ -0,0 +1,142 @@
+"""
+Senti Stats - Sliding Window
+Location: senti_core_module/senti_stats/window.py
+
+Fixed-size ring buffer of the last N samples with O(1) push and O(1)
+mean / variance (Welford add / replace). Once per N evictions the moments
+are recomputed exactly from the buffer, so rounding error from removals
+never accumulates (amortized O(1)).
+
+The buffer is a NumPy array when NumPy is installed (vectorized exact
+recomputation and values()), a list otherwise.
+"""
+
+from typing import Iterator, List, Optional
+
+try:
+    import numpy as np
+except ImportError:  # Optional: list-backed ring buffer
+    np = None
+
+from .streaming import RunningStats
+
+
+class SlidingWindow:
+    """
+    Last `size` samples with running moments.
+
+    Supports len(), iteration (oldest first) and indexing (window[-1] is
+    the newest sample), so it can stand in for a trimmed history list.
+    """
+
+    def __init__(self, size: int):
+        """
+        Initialize window.
+
+        Args:
+            size: Number of samples kept
+        """
+        if size < 1:
+            raise ValueError("size must be >= 1")
+
+        self.size = size
+        self._buffer = np.zeros(size, dtype=np.float64) if np is not None else [0.0] * size
+        self._start = 0
+        self._count = 0
+        self._evictions = 0
+        self.stats = RunningStats()
+
+    def push(self, value: float) -> Optional[float]:
+        """
+        Add a sample, evicting the oldest one if the window is full.
+
+        Args:
+            value: Sample value
+
+        Returns:
+            Evicted sample, or None
+        """
+        value = float(value)
+        if self._count < self.size:
+            self._buffer[(self._start + self._count) % self.size] = value
+            self._count += 1
+            self.stats.add(value)
+            return None
+
+        evicted = float(self._buffer[self._start])
+        self._buffer[self._start] = value
+        self._start = (self._start + 1) % self.size
+        self.stats.replace(evicted, value)
+
+        self._evictions += 1
+        if self._evictions >= self.size:
+            self._resync()
+        return evicted
+
+    def _resync(self) -> None:
+        """Recompute the moments exactly from the buffer."""
+        self._evictions = 0
+        if np is not None:
+            values = self._buffer[:self._count]
+            mean = float(values.mean())
+            m2 = float(np.dot(values - mean, values - mean))
+        else:
+            values = self._buffer[:self._count]
+            mean = sum(values) / self._count
+            m2 = sum((x - mean) ** 2 for x in values)
+        self.stats.reset(self._count, mean, m2)
+
+    @property
+    def mean(self) -> float:
+        """Mean of the window."""
+        return self.stats.mean
+
+    def variance(self, ddof: int = 1) -> float:
+        """Variance of the window (ddof=1 sample, ddof=0 population)."""
+        return self.stats.variance(ddof)
+
+    def std(self, ddof: int = 1) -> float:
+        """Standard deviation of the window."""
+        return self.stats.std(ddof)
+
+    def zscore(self, value: float, ddof: int = 1) -> Optional[float]:
+        """Z-score of value against the window, or None if no deviation."""
+        return self.stats.zscore(value, ddof)
+
+    def is_full(self) -> bool:
+        """True once `size` samples have been pushed."""
+        return self._count == self.size
+
+    def values(self) -> List[float]:
+        """Samples, oldest first."""
+        end = self._start + self._count
+        if np is not None:
+            if end <= self.size:
+                return self._buffer[self._start:end].tolist()
+            return np.concatenate((self._buffer[self._start:], self._buffer[:end - self.size])).tolist()
+        if end <= self.size:
+            return self._buffer[self._start:end]
+        return self._buffer[self._start:] + self._buffer[:end - self.size]
+
+    def clear(self) -> None:
+        """Remove all samples."""
+        self._start = 0
+        self._count = 0
+        self._evictions = 0
+        self.stats.clear()
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __getitem__(self, index: int) -> float:
+        if index < 0:
+            index += self._count
+        if not 0 <= index < self._count:
+            raise IndexError("window index out of range")
+        return float(self._buffer[(self._start + index) % self.size])
+
+    def __iter__(self) -> Iterator[float]:
+        return iter(self.values())
+
+    def __repr__(self) -> str:
+        return f"<SlidingWindow: {self._count}/{self.size} mean={self.mean:.4g}>"
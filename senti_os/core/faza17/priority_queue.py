@@ -8,14 +8,18 @@ This module manages task prioritization and scheduling:
 - Queue statistics and monitoring
 
 Ensures critical tasks are processed first while preventing task starvation.
+Queued tasks live in an indexed heap (shared senti_queue IndexedPriorityQueue):
+remove / update_priority are O(log n), lookups O(1), and aging is
+applied through the heap key (virtual clock) instead of rewriting tasks.
 """
 
 import logging
 from typing import Dict, List, Optional
 from dataclasses import dataclass, field
-from datetime import datetime, timedelta
+from datetime import datetime
 from enum import Enum
-import heapq
+
+from senti_core_module.senti_queue import IndexedPriorityQueue, aging_key
 
 
 logging.basicConfig(level=logging.INFO)
@@ -66,7 +70,10 @@ class PriorityQueue:
     Priority-based task queue for SENTI OS orchestration.
 
     This queue ensures high-priority tasks are processed first while
-    preventing low-priority task starvation through aging mechanisms.
+    preventing low-priority task starvation through aging mechanisms:
+    a task gains one priority level per STARVATION_THRESHOLD_SECONDS
+    waited, so it overtakes higher-priority tasks submitted more than
+    that much later.
     """
 
     STARVATION_THRESHOLD_SECONDS = 300
@@ -74,14 +81,18 @@ class PriorityQueue:
 
     def __init__(self):
         """Initialize the priority queue."""
-        self.queue: List[QueuedTask] = []
+        self.queue: IndexedPriorityQueue[QueuedTask] = IndexedPriorityQueue()
         self.in_progress: Dict[str, QueuedTask] = {}
         self.completed: List[QueuedTask] = []
         self.failed: List[QueuedTask] = []
+        self._finished: Dict[str, QueuedTask] = {}  # completed + failed by ID
 
         self.total_enqueued = 0
         self.total_dequeued = 0
 
+        # Sum of queued submission timestamps (O(1) average wait)
+        self._submission_sum = 0.0
+
         logger.info("Priority Queue initialized")
 
     def enqueue(self, task: QueuedTask) -> bool:
@@ -98,7 +109,7 @@ class PriorityQueue:
             logger.warning(f"Queue full, cannot enqueue task {task.task_id}")
             return False
 
-        heapq.heappush(self.queue, task)
+        self._push(task)
         self.total_enqueued += 1
 
         logger.debug(f"Task {task.task_id} enqueued with priority {task.priority.value}")
@@ -111,12 +122,12 @@ class PriorityQueue:
         Returns:
             QueuedTask if available, None if queue is empty
         """
-        self._apply_aging()
-
-        if not self.queue:
+        popped = self.queue.pop()
+        if popped is None:
             return None
 
-        task = heapq.heappop(self.queue)
+        task = popped[1]
+        self._submission_sum -= task.submission_time.timestamp()
         self.in_progress[task.task_id] = task
         self.total_dequeued += 1
 
@@ -136,6 +147,7 @@ class PriorityQueue:
         if task_id in self.in_progress:
             task = self.in_progress.pop(task_id)
             self.completed.append(task)
+            self._finished[task_id] = task
             logger.info(f"Task {task_id} marked as completed")
             return True
 
@@ -165,34 +177,45 @@ class PriorityQueue:
             self.enqueue(task)
         else:
             self.failed.append(task)
+            self._finished[task_id] = task
             logger.warning(f"Task {task_id} failed permanently")
 
         return True
 
-    def _apply_aging(self) -> None:
+    def _key(self, task: QueuedTask) -> float:
         """
-        Apply priority aging to prevent starvation.
+        Heap key with priority aging.
 
-        Low-priority tasks that have waited too long get priority boost.
+        One priority level is worth STARVATION_THRESHOLD_SECONDS of
+        waiting; the key is static, so aging never touches queued tasks.
         """
-        current_time = datetime.now()
-        threshold = timedelta(seconds=self.STARVATION_THRESHOLD_SECONDS)
+        return aging_key(
+            task.priority.value,
+            task.submission_time.timestamp(),
+            self.STARVATION_THRESHOLD_SECONDS
+        )
+
+    def _push(self, task: QueuedTask) -> None:
+        self.queue.push(task.task_id, task, self._key(task), group=task.priority)
+        self._submission_sum += task.submission_time.timestamp()
 
-        aged_tasks = []
+    def get_effective_priority(self, task_id: str) -> Optional[Priority]:
+        """
+        Get the aged priority of a queued task.
 
-        for task in self.queue:
-            wait_time = current_time - task.submission_time
+        Args:
+            task_id: ID of task
 
-            if wait_time > threshold and task.priority != Priority.HIGH:
-                if task.priority == Priority.LOW:
-                    task.priority = Priority.NORMAL
-                    logger.debug(f"Task {task.task_id} priority boosted: LOW -> NORMAL")
-                elif task.priority == Priority.NORMAL:
-                    task.priority = Priority.HIGH
-                    logger.debug(f"Task {task.task_id} priority boosted: NORMAL -> HIGH")
+        Returns:
+            Priority after aging or None if not queued
+        """
+        task = self.queue.get(task_id)
+        if task is None:
+            return None
 
-        if aged_tasks:
-            heapq.heapify(self.queue)
+        waited = (datetime.now() - task.submission_time).total_seconds()
+        boost = int(waited // self.STARVATION_THRESHOLD_SECONDS)
+        return Priority(max(Priority.HIGH.value, task.priority.value - boost))
 
     def get_position(self, task_id: str) -> Optional[int]:
         """
@@ -204,11 +227,7 @@ class PriorityQueue:
         Returns:
             Position (0-indexed) or None if not found
         """
-        for i, task in enumerate(sorted(self.queue)):
-            if task.task_id == task_id:
-                return i
-
-        return None
+        return self.queue.rank(task_id)
 
     def get_task(self, task_id: str) -> Optional[QueuedTask]:
         """
@@ -220,22 +239,14 @@ class PriorityQueue:
         Returns:
             QueuedTask if found, None otherwise
         """
-        for task in self.queue:
-            if task.task_id == task_id:
-                return task
+        task = self.queue.get(task_id)
+        if task is not None:
+            return task
 
         if task_id in self.in_progress:
             return self.in_progress[task_id]
 
-        for task in self.completed:
-            if task.task_id == task_id:
-                return task
-
-        for task in self.failed:
-            if task.task_id == task_id:
-                return task
-
-        return None
+        return self._finished.get(task_id)
 
     def peek(self) -> Optional[QueuedTask]:
         """
@@ -244,10 +255,8 @@ class PriorityQueue:
         Returns:
             Next QueuedTask or None if empty
         """
-        if not self.queue:
-            return None
-
-        return min(self.queue)
+        peeked = self.queue.peek()
+        return peeked[1] if peeked else None
 
     def size(self) -> int:
         """
@@ -270,6 +279,7 @@ class PriorityQueue:
     def clear(self) -> None:
         """Clear all tasks from the queue."""
         self.queue.clear()
+        self._submission_sum = 0.0
         logger.info("Queue cleared")
 
     def get_statistics(self) -> QueueStatistics:
@@ -280,23 +290,23 @@ class PriorityQueue:
             QueueStatistics instance
         """
         tasks_by_priority = {
-            "high": sum(1 for t in self.queue if t.priority == Priority.HIGH),
-            "normal": sum(1 for t in self.queue if t.priority == Priority.NORMAL),
-            "low": sum(1 for t in self.queue if t.priority == Priority.LOW),
+            "high": self.queue.count(Priority.HIGH),
+            "normal": self.queue.count(Priority.NORMAL),
+            "low": self.queue.count(Priority.LOW),
         }
 
-        wait_times = [
-            (datetime.now() - task.submission_time).total_seconds()
-            for task in self.queue
-        ]
-        avg_wait = sum(wait_times) / len(wait_times) if wait_times else 0.0
+        size = len(self.queue)
+        avg_wait = (
+            datetime.now().timestamp() - self._submission_sum / size
+            if size else 0.0
+        )
 
         return QueueStatistics(
             total_enqueued=self.total_enqueued,
             total_dequeued=self.total_dequeued,
             total_completed=len(self.completed),
             total_failed=len(self.failed),
-            current_size=len(self.queue),
+            current_size=size,
             average_wait_time=round(avg_wait, 2),
             tasks_by_priority=tasks_by_priority,
         )
@@ -311,7 +321,7 @@ class PriorityQueue:
         Returns:
             List of matching tasks
         """
-        return [task for task in self.queue if task.priority == priority]
+        return [task for task in self.queue.ordered() if task.priority == priority]
 
     def remove_task(self, task_id: str) -> bool:
         """
@@ -323,14 +333,13 @@ class PriorityQueue:
         Returns:
             True if removed, False if not found
         """
-        for i, task in enumerate(self.queue):
-            if task.task_id == task_id:
-                self.queue.pop(i)
-                heapq.heapify(self.queue)
-                logger.info(f"Task {task_id} removed from queue")
-                return True
+        task = self.queue.remove(task_id)
+        if task is None:
+            return False
 
-        return False
+        self._submission_sum -= task.submission_time.timestamp()
+        logger.info(f"Task {task_id} removed from queue")
+        return True
 
     def update_priority(self, task_id: str, new_priority: Priority) -> bool:
         """
@@ -343,15 +352,15 @@ class PriorityQueue:
         Returns:
             True if updated, False if not found
         """
-        for task in self.queue:
-            if task.task_id == task_id:
-                old_priority = task.priority
-                task.priority = new_priority
-                heapq.heapify(self.queue)
-                logger.info(f"Task {task_id} priority updated: {old_priority.value} -> {new_priority.value}")
-                return True
+        task = self.queue.get(task_id)
+        if task is None:
+            return False
 
-        return False
+        old_priority = task.priority
+        task.priority = new_priority
+        self.queue.update(task_id, self._key(task), group=new_priority)
+        logger.info(f"Task {task_id} priority updated: {old_priority.value} -> {new_priority.value}")
+        return True
 
 
 def create_queue() -> PriorityQueue:
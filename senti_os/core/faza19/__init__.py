@@ -169,7 +169,7 @@ class FAZA19Stack:
                 "active_connections": len(self.websocket_server.get_active_connections())
             },
             "event_bus": {
-                "event_count": len(self.event_bus._event_history)
+                "event_count": self.event_bus.get_stats()["events_published"]
             }
         }
 
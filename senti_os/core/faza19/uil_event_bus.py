@@ -11,7 +11,17 @@ from typing import Dict, List, Callable, Any, Optional
 from dataclasses import dataclass
 from datetime import datetime
 from enum import Enum
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
+import bisect
 import threading
+import time
+
+
+# Delivery modes
+DELIVERY_THREADED = "threaded"  # callbacks run on the bus's worker pool
+DELIVERY_SYNC = "sync"          # callbacks run on the publisher's thread
 
 
 class EventCategory(Enum):
@@ -39,21 +49,124 @@ class UILEvent:
     source_device_id: Optional[str] = None
 
 
+class LatencyHistogram:
+    """
+    Fixed-bucket latency histogram (milliseconds).
+
+    Buckets are upper bounds; the last bucket collects everything slower.
+    """
+
+    BUCKETS_MS = (0.01, 0.05, 0.1, 0.5, 1.0, 5.0, 10.0, 50.0, 100.0, 500.0, 1000.0)
+
+    def __init__(self):
+        self.counts = [0] * (len(self.BUCKETS_MS) + 1)
+        self.count = 0
+        self.total_ms = 0.0
+        self.max_ms = 0.0
+
+    def record(self, latency_ms: float):
+        """Record one sample."""
+        self.counts[bisect.bisect_left(self.BUCKETS_MS, latency_ms)] += 1
+        self.count += 1
+        self.total_ms += latency_ms
+        if latency_ms > self.max_ms:
+            self.max_ms = latency_ms
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Export histogram."""
+        labels = [f"<={b}ms" for b in self.BUCKETS_MS] + [f">{self.BUCKETS_MS[-1]}ms"]
+        return {
+            "count": self.count,
+            "avg_ms": self.total_ms / self.count if self.count else 0.0,
+            "max_ms": self.max_ms,
+            "buckets": dict(zip(labels, self.counts))
+        }
+
+
+class _Subscription:
+    """Subscriber callback with its own bounded delivery queue."""
+
+    def __init__(self, subscription_id: str, category: EventCategory,
+                 callback: Callable[[UILEvent], None], queue_size: int):
+        self.subscription_id = subscription_id
+        self.category = category
+        self.callback = callback
+        self.queue: deque = deque(maxlen=queue_size)
+        self.lock = threading.Lock()
+        self.idle = threading.Condition(self.lock)
+        self.draining = False
+
+        self.delivered = 0
+        self.dropped = 0
+        self.errors = 0
+        self.callback_latency = LatencyHistogram()
+
+
 class UILEventBus:
     """
     Event bus for Unified Interaction Layer.
 
     Implements publish/subscribe pattern for real-time communication
     across multiple devices.
+
+    Publishing only enqueues: each subscriber has a bounded queue (oldest
+    events are dropped when it is full) drained by at most one worker at
+    a time, so a slow device callback never blocks publishers or other
+    subscribers and each subscriber sees events in publish order. Use
+    flush() to wait for delivery.
+
+    delivery="sync" is an opt-in mode that runs callbacks on the
+    publisher's thread, delivering at most max_inline events per
+    subscriber per publish; anything left is delivered by the next
+    publish or flush().
     """
 
-    def __init__(self):
-        """Initialize event bus."""
-        self._subscribers: Dict[EventCategory, List[Callable]] = {}
-        self._event_history: List[UILEvent] = []
+    def __init__(
+        self,
+        history_size: int = 1000,
+        queue_size: int = 1000,
+        delivery: str = DELIVERY_THREADED,
+        max_workers: int = 4,
+        max_inline: int = 100
+    ):
+        """
+        Initialize event bus.
+
+        Args:
+            history_size: Events kept in the global and per-category rings.
+            queue_size: Per-subscriber delivery queue bound.
+            delivery: 'threaded' (worker pool) or 'sync' (publisher thread).
+            max_workers: Delivery worker threads (threaded delivery).
+            max_inline: Events delivered per subscriber per publish (sync
+                delivery) or per worker turn before yielding (threaded).
+
+        Raises:
+            ValueError: If delivery is not a known mode.
+        """
+        if delivery not in (DELIVERY_THREADED, DELIVERY_SYNC):
+            raise ValueError(f"Unknown delivery mode: {delivery}")
+
+        self._subscribers: Dict[EventCategory, List[_Subscription]] = {}
+        self._event_history: deque = deque(maxlen=history_size)
+        self._history_by_category: Dict[EventCategory, deque] = {}
+        self._history_size = history_size
+        self._queue_size = queue_size
         self._event_counter = 0
         self._lock = threading.Lock()
 
+        # Per-category latency histograms
+        self._stats_lock = threading.Lock()
+        self._publish_latency: Dict[EventCategory, LatencyHistogram] = {}
+        self._deliver_latency: Dict[EventCategory, LatencyHistogram] = {}
+
+        # Delivery
+        self.delivery = delivery
+        self.max_inline = max(max_inline, 1)
+        self._executor: Optional[ThreadPoolExecutor] = None
+        if delivery == DELIVERY_THREADED:
+            self._executor = ThreadPoolExecutor(max_workers=max_workers,
+                                                thread_name_prefix="UILEventBus")
+
     def subscribe(
         self,
         category: EventCategory,
@@ -70,10 +183,12 @@ class UILEventBus:
             Subscription ID.
         """
         with self._lock:
-            if category not in self._subscribers:
-                self._subscribers[category] = []
-            self._subscribers[category].append(callback)
-            return f"sub_{category.value}_{len(self._subscribers[category])}"
+            # Copy-on-write so publishers can iterate a snapshot unlocked
+            subscribers = list(self._subscribers.get(category, []))
+            subscription_id = f"sub_{category.value}_{len(subscribers) + 1}"
+            subscribers.append(_Subscription(subscription_id, category, callback, self._queue_size))
+            self._subscribers[category] = subscribers
+            return subscription_id
 
     def publish(
         self,
@@ -94,6 +209,8 @@ class UILEventBus:
         Returns:
             Event ID.
         """
+        start = time.perf_counter()
+
         with self._lock:
             self._event_counter += 1
             event_id = f"evt_{self._event_counter}"
@@ -109,34 +226,194 @@ class UILEventBus:
 
             # Store in history
             self._event_history.append(event)
+            ring = self._history_by_category.get(category)
+            if ring is None:
+                ring = self._history_by_category[category] = deque(maxlen=self._history_size)
+            ring.append(event)
 
-            # Notify subscribers
             subscribers = self._subscribers.get(category, [])
-            for callback in subscribers:
-                try:
-                    callback(event)
-                except Exception:
-                    # Subscriber error should not break event bus
-                    pass
 
-            return event_id
+        # Hand the event to each subscriber's queue (outside the bus lock)
+        for subscription in subscribers:
+            with subscription.lock:
+                if len(subscription.queue) == subscription.queue.maxlen:
+                    subscription.dropped += 1
+                subscription.queue.append((event, start))
+                if subscription.draining:
+                    continue
+                subscription.draining = True
+            self._schedule_drain(subscription)
+
+        self._record_latency(self._publish_latency, category,
+                             (time.perf_counter() - start) * 1000)
+        return event_id
+
+    def _schedule_drain(self, subscription: _Subscription):
+        """Start delivery for a subscriber this thread has claimed."""
+        executor = self._executor
+        if executor is not None:
+            try:
+                executor.submit(self._drain, subscription, self.max_inline)
+                return
+            except RuntimeError:
+                # Shut down concurrently: deliver on this thread instead
+                pass
+        self._drain(subscription, self.max_inline)
+
+    def _drain(self, subscription: _Subscription, limit: Optional[int]):
+        """
+        Deliver up to `limit` queued events to one subscriber.
+
+        The caller must have claimed the subscriber (draining=True). If
+        events remain after `limit`, a worker keeps the claim and
+        re-submits itself so other subscribers get a turn; an inline
+        (sync) drain releases the claim for the next publish or flush().
+        """
+        delivered = 0
+        while True:
+            with subscription.lock:
+                if not subscription.queue:
+                    subscription.draining = False
+                    subscription.idle.notify_all()
+                    return
+                if limit is not None and delivered >= limit:
+                    break
+                event, published_at = subscription.queue.popleft()
+
+            callback_start = time.perf_counter()
+            try:
+                subscription.callback(event)
+                subscription.delivered += 1
+            except Exception:
+                # Subscriber error should not break event bus
+                subscription.errors += 1
+            now = time.perf_counter()
+
+            delivered += 1
+            subscription.callback_latency.record((now - callback_start) * 1000)
+            self._record_latency(self._deliver_latency, subscription.category,
+                                 (now - published_at) * 1000)
+
+        executor = self._executor
+        if executor is not None:
+            try:
+                executor.submit(self._drain, subscription, limit)
+                return
+            except RuntimeError:
+                pass
+        with subscription.lock:
+            subscription.draining = False
+            subscription.idle.notify_all()
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """
+        Wait until every subscriber queue has been delivered.
+
+        With sync delivery, events left over by the max_inline cap are
+        delivered on the calling thread.
+
+        Args:
+            timeout: Max seconds to wait per subscriber.
+
+        Returns:
+            True if all queues are empty and idle.
+        """
+        with self._lock:
+            subscriptions = [s for subs in self._subscribers.values() for s in subs]
+
+        idle = True
+        for subscription in subscriptions:
+            if self._executor is None:
+                with subscription.lock:
+                    claimed = bool(subscription.queue) and not subscription.draining
+                    if claimed:
+                        subscription.draining = True
+                if claimed:
+                    self._drain(subscription, None)
+
+            with subscription.lock:
+                idle = subscription.idle.wait_for(
+                    lambda: not subscription.queue and not subscription.draining,
+                    timeout=timeout
+                ) and idle
+        return idle
+
+    def shutdown(self, wait: bool = True):
+        """
+        Stop the delivery workers; later publishes deliver inline.
+
+        Args:
+            wait: Deliver queued events before returning.
+        """
+        executor = self._executor
+        if executor is None:
+            return
+        if wait:
+            self.flush()
+        self._executor = None
+        self.delivery = DELIVERY_SYNC
+        executor.shutdown(wait=wait)
+
+    def _record_latency(self, histograms: Dict[EventCategory, LatencyHistogram],
+                        category: EventCategory, latency_ms: float):
+        with self._stats_lock:
+            histogram = histograms.get(category)
+            if histogram is None:
+                histogram = histograms[category] = LatencyHistogram()
+            histogram.record(latency_ms)
 
     def get_event_history(
         self,
         category: Optional[EventCategory] = None,
         limit: int = 100
     ) -> List[UILEvent]:
-        """Get event history."""
+        """Get event history (oldest first, at most `limit` newest events)."""
         with self._lock:
-            events = self._event_history
-            if category:
-                events = [e for e in events if e.category == category]
-            return events[-limit:]
+            events = self._history_by_category.get(category, ()) if category else self._event_history
+            newest = list(islice(reversed(events), max(limit, 0)))
+        newest.reverse()
+        return newest
 
     def clear_history(self):
         """Clear event history."""
         with self._lock:
             self._event_history.clear()
+            self._history_by_category.clear()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get event bus statistics.
+
+        Returns:
+            Published event count, per-category publish/deliver latency
+            histograms and per-subscriber queue/latency statistics.
+        """
+        with self._lock:
+            subscriptions = [s for subs in self._subscribers.values() for s in subs]
+            events_published = self._event_counter
+            history_size = len(self._event_history)
+
+        with self._stats_lock:
+            publish_latency = {c.value: h.to_dict() for c, h in self._publish_latency.items()}
+            deliver_latency = {c.value: h.to_dict() for c, h in self._deliver_latency.items()}
+
+        return {
+            "delivery": self.delivery,
+            "events_published": events_published,
+            "history_size": history_size,
+            "publish_latency": publish_latency,
+            "deliver_latency": deliver_latency,
+            "subscribers": {
+                s.subscription_id: {
+                    "queued": len(s.queue),
+                    "delivered": s.delivered,
+                    "dropped": s.dropped,
+                    "errors": s.errors,
+                    "callback_latency": s.callback_latency.to_dict()
+                }
+                for s in subscriptions
+            }
+        }
 
 
 def get_info() -> Dict[str, str]:
@@ -144,6 +421,6 @@ def get_info() -> Dict[str, str]:
     return {
         "module": "uil_event_bus",
         "faza": "19",
-        "version": "1.0.0",
+        "version": "1.1.0",
         "description": "Event bus for Unified Interaction Layer"
     }
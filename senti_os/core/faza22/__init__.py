@@ -52,7 +52,7 @@ License: Proprietary
 Version: 1.0.0
 """
 
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, List
 
 # Import all components
 from senti_os.core.faza22.boot_manager import (
@@ -90,6 +90,8 @@ from senti_os.core.faza22.logs_manager import (
     get_logs_manager
 )
 
+from senti_os.core.faza22.log_store import SegmentedLogStore
+
 from senti_os.core.faza22.sentinel_process import (
     SentinelProcess,
     SentinelState,
@@ -136,6 +138,7 @@ __all__ = [
     "LogLevel",
     "LogEntry",
     "get_logs_manager",
+    "SegmentedLogStore",
 
     # Sentinel Process
     "SentinelProcess",
@@ -170,6 +173,8 @@ class FAZA22Stack:
         enable_orchestration: bool = True,
         enable_llm_control: bool = True,
         enable_auth_flow: bool = True,
+        parallel_boot: bool = False,
+        lazy_stacks: Optional[List[str]] = None,
     ):
         """
         Initialize FAZA 22 stack.
@@ -183,6 +188,8 @@ class FAZA22Stack:
             enable_orchestration: Enable FAZA 17.
             enable_llm_control: Enable FAZA 16.
             enable_auth_flow: Enable FAZA 18.
+            parallel_boot: Boot independent stacks concurrently (opt-in).
+            lazy_stacks: Stacks to construct on first access.
         """
         self.storage_dir = storage_dir
 
@@ -194,7 +201,9 @@ class FAZA22Stack:
             enable_ux=enable_ux,
             enable_orchestration=enable_orchestration,
             enable_llm_control=enable_llm_control,
-            enable_auth_flow=enable_auth_flow
+            enable_auth_flow=enable_auth_flow,
+            parallel_boot=parallel_boot,
+            lazy_stacks=lazy_stacks
         )
 
         self.logs_manager = get_logs_manager()
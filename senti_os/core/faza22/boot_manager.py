@@ -4,7 +4,7 @@ FAZA 22 - Boot Manager
 Main orchestrator for SENTI OS lifecycle management.
 
 Responsibilities:
-- Initialize all FAZA stacks in correct order
+- Initialize all FAZA stacks in dependency order
 - Manage system start/stop/restart lifecycle
 - Emit status events to FAZA 19 event bus
 - Track stack health and dependencies
@@ -18,15 +18,30 @@ Boot Order:
     FAZA 16 (LLM Control) →
     FAZA 18 (Auth Flow)
 
+Stack Dependencies (boot DAG):
+    faza21, faza16, faza18  (no dependencies)
+    faza19 → faza21
+    faza17 → faza16
+    faza20 → faza21, faza19, faza16, faza17, faza18
+
+Each boot phase (load, initialize, start) runs stacks on a thread pool as
+soon as their dependencies have finished that phase, so independent stacks
+boot concurrently. Lazy stacks are skipped at boot and built on first
+get_stack() access, unless an eager stack depends on them.
+
 Author: SENTI OS Core Team
 License: Proprietary
 Version: 1.0.0
 """
 
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Optional, List, Callable
 from enum import Enum
 from dataclasses import dataclass, field
 from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, wait
+import importlib
+import threading
+import time
 import traceback
 
 
@@ -65,6 +80,8 @@ class StackInfo:
     initialized_at: Optional[datetime] = None
     started_at: Optional[datetime] = None
     stopped_at: Optional[datetime] = None
+    lazy: bool = False
+    timings: Dict[str, float] = field(default_factory=dict)  # Phase -> seconds
 
 
 @dataclass
@@ -96,6 +113,37 @@ class BootManager:
         "faza18",  # Auth Flow Handler
     ]
 
+    # Stacks that must finish each boot phase before a stack starts it
+    STACK_DEPENDENCIES: Dict[str, List[str]] = {
+        "faza21": [],
+        "faza19": ["faza21"],
+        "faza20": ["faza21", "faza19", "faza16", "faza17", "faza18"],
+        "faza17": ["faza16"],
+        "faza16": [],
+        "faza18": [],
+    }
+
+    # Module and factory per stack (None = nothing to construct)
+    STACK_FACTORIES: Dict[str, Optional[tuple]] = {
+        "faza21": ("senti_os.core.faza21", "FAZA21Stack"),
+        "faza19": ("senti_os.core.faza19", "FAZA19Stack"),
+        "faza20": ("senti_os.core.faza20", "FAZA20Stack"),
+        "faza17": ("senti_os.core.faza17", "create_orchestration_manager"),
+        "faza16": ("senti_os.core.faza16", "create_manager"),
+        "faza18": None,  # Utility collection, no Stack class
+    }
+
+    STACK_LABELS = {
+        "faza21": "FAZA 21 Persistence Layer",
+        "faza19": "FAZA 19 UIL",
+        "faza20": "FAZA 20 UX Layer",
+        "faza17": "FAZA 17 Orchestration",
+        "faza16": "FAZA 16 LLM Control",
+        "faza18": "FAZA 18 Auth Flow",
+    }
+
+    STATE_FILE = "/home/pisarna/senti_system/data/faza22/boot_state.json"
+
     def __init__(
         self,
         storage_dir: str = "/home/pisarna/senti_system/data/faza21",
@@ -105,6 +153,9 @@ class BootManager:
         enable_orchestration: bool = True,
         enable_llm_control: bool = True,
         enable_auth_flow: bool = True,
+        parallel_boot: bool = False,
+        max_workers: Optional[int] = None,
+        lazy_stacks: Optional[List[str]] = None,
     ):
         """
         Initialize Boot Manager.
@@ -117,6 +168,14 @@ class BootManager:
             enable_orchestration: Enable FAZA 17.
             enable_llm_control: Enable FAZA 16.
             enable_auth_flow: Enable FAZA 18.
+            parallel_boot: Boot independent stacks concurrently (opt-in;
+                stack constructors then run on worker threads).
+            max_workers: Boot thread pool size (None = one per stack).
+            lazy_stacks: Stacks to construct on first get_stack() access.
+
+        Raises:
+            ValueError: If lazy_stacks names an unknown stack or the stack
+                dependencies contain a cycle.
         """
         self.storage_dir = storage_dir
 
@@ -129,14 +188,25 @@ class BootManager:
             "faza16": enable_llm_control,
             "faza18": enable_auth_flow,
         }
+        self.parallel_boot = parallel_boot
+        self.max_workers = max_workers or len(self.BOOT_ORDER)
+        self.lazy_stacks = set(lazy_stacks or [])
+
+        unknown = self.lazy_stacks - set(self.BOOT_ORDER)
+        if unknown:
+            raise ValueError(f"Unknown lazy stacks: {', '.join(sorted(unknown))}")
+        self.boot_sequence = self._resolve_boot_sequence()
 
         # State
         self.state = BootState.UNINITIALIZED
         self.stacks: Dict[str, StackInfo] = {}
         self.boot_events: List[BootEvent] = []
+        self.phase_timings: Dict[str, float] = {}
+        self._events_lock = threading.Lock()
+        self._lazy_lock = threading.RLock()
 
         # NEW: Try to load existing boot_state.json for CLI sync
-        state_file = "/home/pisarna/senti_system/data/faza22/boot_state.json"
+        state_file = self.STATE_FILE
         try:
             import json, os
             if os.path.exists(state_file):
@@ -155,6 +225,33 @@ class BootManager:
         self.boot_started_at: Optional[datetime] = None
         self.boot_completed_at: Optional[datetime] = None
 
+    def _resolve_boot_sequence(self) -> List[str]:
+        """
+        Topologically sort the stacks, breaking ties by BOOT_ORDER.
+
+        Returns:
+            Stack names with every stack after its dependencies.
+
+        Raises:
+            ValueError: If the stack dependencies contain a cycle.
+        """
+        remaining = {
+            name: set(self.STACK_DEPENDENCIES.get(name, [])) & set(self.BOOT_ORDER)
+            for name in self.BOOT_ORDER
+        }
+        sequence = []
+        while remaining:
+            ready = [name for name in self.BOOT_ORDER if name in remaining and not remaining[name]]
+            if not ready:
+                raise ValueError(
+                    f"Stack dependency cycle between: {', '.join(sorted(remaining))}"
+                )
+            sequence.append(ready[0])
+            del remaining[ready[0]]
+            for dependencies in remaining.values():
+                dependencies.discard(ready[0])
+        return sequence
+
     def _emit_event(
         self,
         event_type: str,
@@ -181,7 +278,8 @@ class BootManager:
             message=message,
             error=error
         )
-        self.boot_events.append(event)
+        with self._events_lock:
+            self.boot_events.append(event)
 
         # Emit to FAZA 19 event bus if available
         faza19_stack = self.stacks.get("faza19")
@@ -205,174 +303,312 @@ class BootManager:
                 # Silently ignore event bus errors during boot
                 pass
 
-    def load_all_stacks(self) -> bool:
+    def _boot_stacks(self) -> List[str]:
         """
-        Load all FAZA stack classes.
+        Get the stacks booted eagerly.
+
+        Enabled non-lazy stacks, plus any enabled stacks they depend on
+        (a lazy stack an eager stack depends on is booted eagerly).
 
         Returns:
-            True if all enabled stacks loaded successfully.
+            Stack names in boot sequence.
         """
-        self._emit_event("load_started", message="Loading FAZA stacks")
+        needed = set()
+        pending = [
+            name for name in self.BOOT_ORDER
+            if self.enabled_stacks[name] and name not in self.lazy_stacks
+        ]
+        while pending:
+            stack_name = pending.pop()
+            if stack_name in needed:
+                continue
+            needed.add(stack_name)
+            pending.extend(
+                dep for dep in self.STACK_DEPENDENCIES.get(stack_name, [])
+                if self.enabled_stacks.get(dep, False)
+            )
+        return [name for name in self.boot_sequence if name in needed]
+
+    def _run_phase(
+        self,
+        phase: str,
+        stack_names: List[str],
+        action: Callable[[str], bool],
+        stop_on_error: bool = False
+    ) -> bool:
+        """
+        Run one boot phase over a set of stacks.
 
+        A stack runs once all of its dependencies in stack_names have
+        finished the phase; with parallel_boot, independent stacks run
+        concurrently on a thread pool.
+
+        Args:
+            phase: Phase name, recorded in phase_timings.
+            stack_names: Stacks to run the phase for.
+            action: Per-stack action, returns True on success.
+            stop_on_error: Schedule no further stacks after a failure.
+
+        Returns:
+            True if the action succeeded for every stack.
+        """
+        names = [name for name in self.boot_sequence if name in stack_names]
+        started = time.perf_counter()
         success = True
 
-        # Load FAZA 21 - Persistence Layer
-        if self.enabled_stacks["faza21"]:
-            try:
-                from senti_os.core.faza21 import FAZA21Stack
-                stack_info = self.stacks["faza21"]
-                stack_info.instance = FAZA21Stack(storage_dir=self.storage_dir)
-                stack_info.status = StackStatus.LOADED
-                self._emit_event(
-                    "stack_loaded",
-                    stack_name="faza21",
-                    status="loaded",
-                    message="FAZA 21 Persistence Layer loaded"
-                )
-            except Exception as e:
-                self.stacks["faza21"].status = StackStatus.ERROR
-                self.stacks["faza21"].error = str(e)
-                self._emit_event(
-                    "stack_error",
-                    stack_name="faza21",
-                    status="error",
-                    error=str(e)
-                )
-                success = False
+        if not self.parallel_boot or len(names) < 2:
+            for stack_name in names:
+                if not action(stack_name):
+                    success = False
+                    if stop_on_error:
+                        break
+            self.phase_timings[phase] = time.perf_counter() - started
+            return success
+
+        waiting = {
+            name: set(self.STACK_DEPENDENCIES.get(name, [])) & set(names)
+            for name in names
+        }
+        finished = set()
+        running = {}
+
+        with ThreadPoolExecutor(
+            max_workers=self.max_workers,
+            thread_name_prefix="senti-boot"
+        ) as pool:
+            while waiting or running:
+                if success or not stop_on_error:
+                    for stack_name in [n for n in names if n in waiting and waiting[n] <= finished]:
+                        del waiting[stack_name]
+                        running[pool.submit(action, stack_name)] = stack_name
+                if not running:
+                    break
+
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in done:
+                    finished.add(running.pop(future))
+                    if not future.result():
+                        success = False
+
+        self.phase_timings[phase] = time.perf_counter() - started
+        return success
 
-        # Load FAZA 19 - UIL & Multi-Device
-        if self.enabled_stacks["faza19"]:
-            try:
-                from senti_os.core.faza19 import FAZA19Stack
-                stack_info = self.stacks["faza19"]
-                stack_info.instance = FAZA19Stack()
-                stack_info.status = StackStatus.LOADED
-                self._emit_event(
-                    "stack_loaded",
-                    stack_name="faza19",
-                    status="loaded",
-                    message="FAZA 19 UIL loaded"
-                )
-            except Exception as e:
-                self.stacks["faza19"].status = StackStatus.ERROR
-                self.stacks["faza19"].error = str(e)
-                self._emit_event(
-                    "stack_error",
-                    stack_name="faza19",
-                    status="error",
-                    error=str(e)
-                )
-                success = False
+    def _stack_arguments(self, stack_name: str) -> Dict[str, Any]:
+        """Constructor arguments for a stack factory."""
+        if stack_name == "faza21":
+            return {"storage_dir": self.storage_dir}
+
+        if stack_name == "faza20":
+            # Get references to other stacks for integration
+            def instance(name):
+                return self.stacks[name].instance if self.enabled_stacks[name] else None
+
+            return {
+                "faza16_llm_control": instance("faza16"),
+                "faza17_orchestration": instance("faza17"),
+                "faza18_auth_flow": instance("faza18"),
+                "faza19_uil": instance("faza19"),
+                "faza21_persistence": instance("faza21"),
+            }
 
-        # Load FAZA 20 - UX Layer
-        if self.enabled_stacks["faza20"]:
-            try:
-                from senti_os.core.faza20 import FAZA20Stack
-
-                # Get references to other stacks for integration
-                faza16 = self.stacks["faza16"].instance if self.enabled_stacks["faza16"] else None
-                faza17 = self.stacks["faza17"].instance if self.enabled_stacks["faza17"] else None
-                faza18 = self.stacks["faza18"].instance if self.enabled_stacks["faza18"] else None
-                faza19 = self.stacks["faza19"].instance if self.enabled_stacks["faza19"] else None
-                faza21 = self.stacks["faza21"].instance if self.enabled_stacks["faza21"] else None
-
-                stack_info = self.stacks["faza20"]
-                stack_info.instance = FAZA20Stack(
-                    faza16_llm_control=faza16,
-                    faza17_orchestration=faza17,
-                    faza18_auth_flow=faza18,
-                    faza19_uil=faza19,
-                    faza21_persistence=faza21
-                )
-                stack_info.status = StackStatus.LOADED
-                self._emit_event(
-                    "stack_loaded",
-                    stack_name="faza20",
-                    status="loaded",
-                    message="FAZA 20 UX Layer loaded"
-                )
-            except Exception as e:
-                self.stacks["faza20"].status = StackStatus.ERROR
-                self.stacks["faza20"].error = str(e)
-                self._emit_event(
-                    "stack_error",
-                    stack_name="faza20",
-                    status="error",
-                    error=str(e)
-                )
-                success = False
+        return {}
 
-        # Load FAZA 17 - Multi-Model Orchestration
-        if self.enabled_stacks["faza17"]:
-            try:
-                from senti_os.core.faza17 import create_orchestration_manager
-                stack_info = self.stacks["faza17"]
-                stack_info.instance = create_orchestration_manager()
-                stack_info.status = StackStatus.LOADED
-                self._emit_event(
-                    "stack_loaded",
-                    stack_name="faza17",
-                    status="loaded",
-                    message="FAZA 17 Orchestration loaded"
-                )
-            except Exception as e:
-                self.stacks["faza17"].status = StackStatus.ERROR
-                self.stacks["faza17"].error = str(e)
-                self._emit_event(
-                    "stack_error",
-                    stack_name="faza17",
-                    status="error",
-                    error=str(e)
-                )
-                success = False
+    def _import_stack(self, stack_name: str) -> Optional[Callable[..., Any]]:
+        """
+        Import the factory for a stack.
 
-        # Load FAZA 16 - LLM Control Layer
-        if self.enabled_stacks["faza16"]:
-            try:
-                from senti_os.core.faza16 import create_manager
-                stack_info = self.stacks["faza16"]
-                stack_info.instance = create_manager()
-                stack_info.status = StackStatus.LOADED
-                self._emit_event(
-                    "stack_loaded",
-                    stack_name="faza16",
-                    status="loaded",
-                    message="FAZA 16 LLM Control loaded"
-                )
-            except Exception as e:
-                self.stacks["faza16"].status = StackStatus.ERROR
-                self.stacks["faza16"].error = str(e)
-                self._emit_event(
-                    "stack_error",
-                    stack_name="faza16",
-                    status="error",
-                    error=str(e)
-                )
-                success = False
+        Returns:
+            Stack class or factory function, None if nothing to construct.
+        """
+        target = self.STACK_FACTORIES.get(stack_name)
+        if target is None:
+            return None
+        module_name, attribute = target
+        return getattr(importlib.import_module(module_name), attribute)
 
-        # Load FAZA 18 - Auth Flow Handler
-        # Note: FAZA 18 doesn't have a Stack class, it's a collection of utilities
-        if self.enabled_stacks["faza18"]:
-            try:
-                # FAZA 18 is more of a utility collection, mark as loaded
-                stack_info = self.stacks["faza18"]
-                stack_info.status = StackStatus.LOADED
-                self._emit_event(
-                    "stack_loaded",
-                    stack_name="faza18",
-                    status="loaded",
-                    message="FAZA 18 Auth Flow loaded"
-                )
-            except Exception as e:
-                self.stacks["faza18"].status = StackStatus.ERROR
-                self.stacks["faza18"].error = str(e)
-                self._emit_event(
-                    "stack_error",
-                    stack_name="faza18",
-                    status="error",
-                    error=str(e)
-                )
-                success = False
+    def _load_stack(self, stack_name: str) -> bool:
+        """
+        Import and construct a single stack.
+
+        Returns:
+            True if the stack loaded successfully.
+        """
+        stack_info = self.stacks[stack_name]
+        stack_info.timings = {}
+
+        try:
+            started = time.perf_counter()
+            factory = self._import_stack(stack_name)
+            imported = time.perf_counter()
+            stack_info.timings["import"] = imported - started
+
+            if factory is not None:
+                stack_info.instance = factory(**self._stack_arguments(stack_name))
+            stack_info.timings["load"] = time.perf_counter() - imported
+
+            stack_info.status = StackStatus.LOADED
+            self._emit_event(
+                "stack_loaded",
+                stack_name=stack_name,
+                status="loaded",
+                message=f"{self.STACK_LABELS.get(stack_name, stack_name)} loaded"
+            )
+            return True
+
+        except Exception as e:
+            stack_info.status = StackStatus.ERROR
+            stack_info.error = str(e)
+            self._emit_event(
+                "stack_error",
+                stack_name=stack_name,
+                status="error",
+                error=str(e)
+            )
+            return False
+
+    def _initialize_stack(self, stack_name: str) -> bool:
+        """
+        Initialize a single loaded stack.
+
+        Returns:
+            True if the stack initialized successfully.
+        """
+        stack_info = self.stacks[stack_name]
+
+        try:
+            started = time.perf_counter()
+            stack_info.status = StackStatus.INITIALIZING
+            self._emit_event(
+                "stack_initializing",
+                stack_name=stack_name,
+                message=f"Initializing {stack_name}"
+            )
+
+            # Initialize based on stack type
+            if stack_name == "faza21":
+                # Initialize persistence with no passphrase (simulated)
+                if hasattr(stack_info.instance, 'initialize'):
+                    stack_info.instance.initialize(passphrase=None)
+
+            elif stack_name == "faza19":
+                # FAZA 19 doesn't require explicit initialization
+                pass
+
+            elif stack_name == "faza20":
+                # Initialize UX layer with module references
+                if hasattr(stack_info.instance, 'initialize'):
+                    stack_info.instance.initialize()
+
+            elif stack_name in ["faza16", "faza17"]:
+                # These don't have explicit initialize methods
+                pass
+
+            elif stack_name == "faza18":
+                # FAZA 18 is utility collection, no initialization needed
+                pass
+
+            stack_info.status = StackStatus.INITIALIZED
+            stack_info.initialized_at = datetime.now()
+            stack_info.timings["init"] = time.perf_counter() - started
+
+            self._emit_event(
+                "stack_initialized",
+                stack_name=stack_name,
+                status="initialized",
+                message=f"{stack_name} initialized successfully"
+            )
+            return True
+
+        except Exception as e:
+            stack_info.status = StackStatus.ERROR
+            stack_info.error = f"Initialization failed: {str(e)}"
+
+            self._emit_event(
+                "stack_error",
+                stack_name=stack_name,
+                status="error",
+                error=str(e)
+            )
+            return False
+
+    def _start_stack(self, stack_name: str) -> bool:
+        """
+        Start a single initialized stack.
+
+        Returns:
+            True if the stack started successfully.
+        """
+        stack_info = self.stacks[stack_name]
+
+        try:
+            started = time.perf_counter()
+            stack_info.status = StackStatus.STARTING
+
+            # Start services that support it
+            if hasattr(stack_info.instance, 'start'):
+                stack_info.instance.start()
+
+            stack_info.status = StackStatus.RUNNING
+            stack_info.started_at = datetime.now()
+            stack_info.timings["start"] = time.perf_counter() - started
+
+            self._emit_event(
+                "stack_started",
+                stack_name=stack_name,
+                status="running",
+                message=f"{stack_name} started successfully"
+            )
+            return True
+
+        except Exception as e:
+            stack_info.status = StackStatus.ERROR
+            stack_info.error = f"Start failed: {str(e)}"
+
+            self._emit_event(
+                "stack_error",
+                stack_name=stack_name,
+                status="error",
+                error=str(e)
+            )
+            return False
+
+    def _load_lazy_stack(self, stack_name: str):
+        """Load, initialize and start a lazy stack on first access."""
+        with self._lazy_lock:
+            stack_info = self.stacks[stack_name]
+            if stack_info.status != StackStatus.NOT_LOADED:
+                return
+
+            # Lazy dependencies are built first, eager ones are already up
+            for dep in self.STACK_DEPENDENCIES.get(stack_name, []):
+                if self.enabled_stacks.get(dep, False) and self.stacks[dep].lazy:
+                    self.get_stack(dep)
+
+            if self._load_stack(stack_name) and self._initialize_stack(stack_name):
+                self._start_stack(stack_name)
+
+    def load_all_stacks(self) -> bool:
+        """
+        Load all FAZA stack classes.
+
+        Stacks are imported and constructed in dependency order,
+        concurrently where independent. Lazy stacks are left unloaded.
+
+        Returns:
+            True if all eagerly booted stacks loaded successfully.
+        """
+        self._emit_event("load_started", message="Loading FAZA stacks")
+
+        boot_stacks = self._boot_stacks()
+        for stack_name, stack_info in self.stacks.items():
+            stack_info.lazy = self.enabled_stacks[stack_name] and stack_name not in boot_stacks
+            if stack_info.lazy:
+                # (Re)built on the next get_stack()
+                stack_info.status = StackStatus.NOT_LOADED
+                stack_info.instance = None
+                stack_info.timings = {}
+
+        success = self._run_phase("load", boot_stacks, self._load_stack)
 
         if success:
             self._emit_event("load_completed", message="All stacks loaded successfully")
@@ -385,7 +621,8 @@ class BootManager:
         """
         Start SENTI OS.
 
-        Initializes and starts all enabled FAZA stacks in correct order.
+        Initializes and starts all enabled FAZA stacks in dependency order,
+        concurrently where independent.
 
         Returns:
             True if system started successfully.
@@ -395,6 +632,7 @@ class BootManager:
 
         self.state = BootState.INITIALIZING
         self.boot_started_at = datetime.now()
+        self.phase_timings = {}
 
         self._emit_event("boot_started", message="SENTI OS boot sequence initiated")
 
@@ -404,69 +642,14 @@ class BootManager:
             self._emit_event("boot_failed", message="Failed to load stacks")
             return False
 
-        # Initialize stacks in boot order
-        for stack_name in self.BOOT_ORDER:
-            if not self.enabled_stacks[stack_name]:
-                continue
-
-            stack_info = self.stacks[stack_name]
-            if stack_info.status != StackStatus.LOADED:
-                continue
-
-            try:
-                stack_info.status = StackStatus.INITIALIZING
-                self._emit_event(
-                    "stack_initializing",
-                    stack_name=stack_name,
-                    message=f"Initializing {stack_name}"
-                )
-
-                # Initialize based on stack type
-                if stack_name == "faza21":
-                    # Initialize persistence with no passphrase (simulated)
-                    if hasattr(stack_info.instance, 'initialize'):
-                        stack_info.instance.initialize(passphrase=None)
-
-                elif stack_name == "faza19":
-                    # FAZA 19 doesn't require explicit initialization
-                    pass
-
-                elif stack_name == "faza20":
-                    # Initialize UX layer with module references
-                    if hasattr(stack_info.instance, 'initialize'):
-                        stack_info.instance.initialize()
-
-                elif stack_name in ["faza16", "faza17"]:
-                    # These don't have explicit initialize methods
-                    pass
-
-                elif stack_name == "faza18":
-                    # FAZA 18 is utility collection, no initialization needed
-                    pass
-
-                stack_info.status = StackStatus.INITIALIZED
-                stack_info.initialized_at = datetime.now()
-
-                self._emit_event(
-                    "stack_initialized",
-                    stack_name=stack_name,
-                    status="initialized",
-                    message=f"{stack_name} initialized successfully"
-                )
-
-            except Exception as e:
-                stack_info.status = StackStatus.ERROR
-                stack_info.error = f"Initialization failed: {str(e)}"
-                self.state = BootState.ERROR
-
-                self._emit_event(
-                    "stack_error",
-                    stack_name=stack_name,
-                    status="error",
-                    error=str(e)
-                )
-
-                return False
+        # Initialize stacks in dependency order
+        loaded = [
+            name for name in self._boot_stacks()
+            if self.stacks[name].status == StackStatus.LOADED
+        ]
+        if not self._run_phase("init", loaded, self._initialize_stack, stop_on_error=True):
+            self.state = BootState.ERROR
+            return False
 
         self.state = BootState.INITIALIZED
 
@@ -474,50 +657,19 @@ class BootManager:
         self.state = BootState.STARTING
         self._emit_event("system_starting", message="Starting SENTI OS services")
 
-        for stack_name in self.BOOT_ORDER:
-            if not self.enabled_stacks[stack_name]:
-                continue
-
-            stack_info = self.stacks[stack_name]
-            if stack_info.status != StackStatus.INITIALIZED:
-                continue
-
-            try:
-                stack_info.status = StackStatus.STARTING
-
-                # Start services that support it
-                if hasattr(stack_info.instance, 'start'):
-                    stack_info.instance.start()
-
-                stack_info.status = StackStatus.RUNNING
-                stack_info.started_at = datetime.now()
-
-                self._emit_event(
-                    "stack_started",
-                    stack_name=stack_name,
-                    status="running",
-                    message=f"{stack_name} started successfully"
-                )
-
-            except Exception as e:
-                stack_info.status = StackStatus.ERROR
-                stack_info.error = f"Start failed: {str(e)}"
-
-                self._emit_event(
-                    "stack_error",
-                    stack_name=stack_name,
-                    status="error",
-                    error=str(e)
-                )
-
-                # Continue with other stacks
+        # Failed starts are reported per stack, others continue
+        initialized = [
+            name for name in self._boot_stacks()
+            if self.stacks[name].status == StackStatus.INITIALIZED
+        ]
+        self._run_phase("start", initialized, self._start_stack)
 
         self.state = BootState.RUNNING
         self.boot_completed_at = datetime.now()
 
         # NEW: persist running state so CLI can read correct status
         try:
-            state_file = "/home/pisarna/senti_system/data/faza22/boot_state.json"
+            state_file = self.STATE_FILE
             os.makedirs(os.path.dirname(state_file), exist_ok=True)
             with open(state_file, "w") as f:
                 json.dump({"state": "running"}, f)
@@ -537,7 +689,7 @@ class BootManager:
         """
         Stop SENTI OS.
 
-        Stops all running stacks in reverse order.
+        Stops all running stacks in reverse dependency order.
 
         Returns:
             True if system stopped successfully.
@@ -548,8 +700,8 @@ class BootManager:
         self.state = BootState.STOPPING
         self._emit_event("shutdown_started", message="SENTI OS shutdown initiated")
 
-        # Stop in reverse boot order
-        for stack_name in reversed(self.BOOT_ORDER):
+        # Stop dependents before their dependencies
+        for stack_name in reversed(self.boot_sequence):
             if not self.enabled_stacks[stack_name]:
                 continue
 
@@ -635,6 +787,14 @@ class BootManager:
                     if self.boot_completed_at and self.state == BootState.RUNNING
                     else None
                 ),
+                "boot_seconds": (
+                    (self.boot_completed_at - self.boot_started_at).total_seconds()
+                    if self.boot_completed_at and self.boot_started_at
+                    and self.boot_completed_at >= self.boot_started_at
+                    else None
+                ),
+                "parallel_boot": self.parallel_boot,
+                "phase_seconds": dict(self.phase_timings),
             },
             "stacks": {
                 stack_name: {
@@ -653,6 +813,9 @@ class BootManager:
                         stack_info.stopped_at.isoformat()
                         if stack_info.stopped_at else None
                     ),
+                    "lazy": stack_info.lazy,
+                    "dependencies": list(self.STACK_DEPENDENCIES.get(stack_name, [])),
+                    "timings": dict(stack_info.timings),
                 }
                 for stack_name, stack_info in self.stacks.items()
             },
@@ -688,6 +851,9 @@ class BootManager:
         """
         Get a specific stack instance.
 
+        A lazy stack is loaded, initialized and started on first access
+        while the system is running.
+
         Args:
             stack_name: Name of stack (e.g., "faza21").
 
@@ -695,9 +861,14 @@ class BootManager:
             Stack instance or None if not loaded.
         """
         stack_info = self.stacks.get(stack_name)
-        if stack_info:
-            return stack_info.instance
-        return None
+        if not stack_info:
+            return None
+
+        pending = stack_info.lazy and stack_info.status == StackStatus.NOT_LOADED
+        if pending and self.state == BootState.RUNNING:
+            self._load_lazy_stack(stack_name)
+
+        return stack_info.instance
 
     def is_running(self) -> bool:
         """Check if system is running."""
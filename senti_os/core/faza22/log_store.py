@@ -0,0 +1,351 @@
+"""
+FAZA 22 - Segmented Log Store
+
+On-disk log format for LogsManager persistence.
+
+Layout:
+- <directory>/<name>-<first seq, 12 digits>.jsonl
+- One JSON object per line (LogEntry.to_dict() plus "seq")
+- A new segment is started once the current one reaches segment_max_bytes
+- Within and across segments, seq and timestamp only increase
+
+Reads never load a whole file:
+- tail(count) reads blocks backwards from the end of the newest segments
+- read_range(since, until) picks the segment by its first timestamp and
+  binary searches byte offsets inside it before scanning forward
+- read_since_seq(seq) picks the segment by the seq in its file name
+
+Author: SENTI OS Core Team
+License: Proprietary
+Version: 1.0.0
+"""
+
+from typing import List, Dict, Any, Optional, Iterator, Tuple
+from datetime import datetime
+from pathlib import Path
+import bisect
+import json
+import os
+import threading
+
+
+class SegmentedLogStore:
+    """
+    Append-only segmented JSONL log file.
+
+    Thread-safe. The current segment stays open between appends.
+    """
+
+    _BLOCK_SIZE = 64 * 1024
+
+    def __init__(
+        self,
+        directory: str,
+        name: str = "senti_os",
+        segment_max_bytes: int = 8 * 1024 * 1024,
+        max_segments: int = 0
+    ):
+        """
+        Initialize segmented log store.
+
+        Args:
+            directory: Directory holding the segments.
+            name: Segment file name prefix.
+            segment_max_bytes: Start a new segment past this size.
+            max_segments: Segments to keep (0 = keep all).
+        """
+        self.directory = Path(directory)
+        self.name = name
+        self.segment_max_bytes = segment_max_bytes
+        self.max_segments = max_segments
+
+        self._lock = threading.Lock()
+        self._file = None
+        self._segment_bytes = 0
+
+        # Segment path -> (first seq, first timestamp); filled lazily
+        self._first_cache: Dict[Path, Tuple[int, Optional[datetime]]] = {}
+
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.last_seq = self._recover_last_seq()
+
+    # -------------------------------------------------
+    # Segments
+    # -------------------------------------------------
+
+    def _segments(self) -> List[Path]:
+        return sorted(self.directory.glob(f"{self.name}-*.jsonl"))
+
+    def _segment_path(self, first_seq: int) -> Path:
+        return self.directory / f"{self.name}-{first_seq:012d}.jsonl"
+
+    @staticmethod
+    def _segment_seq(segment: Path) -> int:
+        return int(segment.stem.rsplit("-", 1)[1])
+
+    def _segment_start_time(self, segment: Path) -> Optional[datetime]:
+        cached = self._first_cache.get(segment)
+        if cached is not None:
+            return cached[1]
+
+        first_time = None
+        try:
+            with open(segment, "rb") as f:
+                record = self._parse(f.readline())
+                if record is not None:
+                    first_time = datetime.fromisoformat(record["timestamp"])
+        except OSError:
+            pass
+
+        if first_time is not None:
+            self._first_cache[segment] = (self._segment_seq(segment), first_time)
+        return first_time
+
+    def _recover_last_seq(self) -> int:
+        """Seq of the newest persisted record (0 for an empty store)."""
+        for record in self._iter_reverse(self._segments()):
+            return record.get("seq", 0)
+        return 0
+
+    # -------------------------------------------------
+    # Writing
+    # -------------------------------------------------
+
+    def append(self, record: Dict[str, Any]):
+        """
+        Append one record. Records must arrive in seq order.
+
+        Args:
+            record: Log entry dictionary including "seq".
+        """
+        line = json.dumps(record) + "\n"
+        with self._lock:
+            if self._file is None or self._segment_bytes >= self.segment_max_bytes:
+                self._start_segment(record["seq"])
+            self._file.write(line)
+            self._file.flush()
+            self._segment_bytes += len(line)
+            self.last_seq = record["seq"]
+
+    def _start_segment(self, first_seq: int):
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+        segments = self._segments()
+        # Keep filling the newest segment after a restart while it has room
+        if segments and self._file is None and self._segment_bytes == 0:
+            newest = segments[-1]
+            size = newest.stat().st_size
+            if size < self.segment_max_bytes:
+                self._file = open(newest, "a")
+                self._segment_bytes = size
+                return
+
+        path = self._segment_path(first_seq)
+        self._file = open(path, "a")
+        self._segment_bytes = 0
+        self._prune(segments + [path])
+
+    def _prune(self, segments: List[Path]):
+        if not self.max_segments:
+            return
+        for segment in segments[:max(0, len(segments) - self.max_segments)]:
+            try:
+                segment.unlink()
+            except OSError:
+                pass
+            self._first_cache.pop(segment, None)
+
+    def close(self):
+        """Close the open segment."""
+        with self._lock:
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+                self._segment_bytes = 0
+
+    # -------------------------------------------------
+    # Reading
+    # -------------------------------------------------
+
+    @staticmethod
+    def _parse(line: bytes) -> Optional[Dict[str, Any]]:
+        try:
+            return json.loads(line)
+        except ValueError:
+            # Torn or empty line
+            return None
+
+    def _iter_reverse(self, segments: List[Path]) -> Iterator[Dict[str, Any]]:
+        """Yield records newest first, reading segments backwards in blocks."""
+        for segment in reversed(segments):
+            try:
+                f = open(segment, "rb")
+            except OSError:
+                continue
+            with f:
+                position = f.seek(0, os.SEEK_END)
+                remainder = b""
+                while position > 0:
+                    step = min(self._BLOCK_SIZE, position)
+                    position -= step
+                    f.seek(position)
+                    lines = (f.read(step) + remainder).split(b"\n")
+                    # The first piece may be the tail of an earlier line
+                    remainder = lines.pop(0)
+                    for line in reversed(lines):
+                        record = self._parse(line)
+                        if record is not None:
+                            yield record
+                record = self._parse(remainder)
+                if record is not None:
+                    yield record
+
+    def tail(self, count: int) -> List[Dict[str, Any]]:
+        """
+        Read the newest records.
+
+        Args:
+            count: Number of records.
+
+        Returns:
+            Up to count records, oldest first.
+        """
+        with self._lock:
+            if self._file is not None:
+                self._file.flush()
+            segments = self._segments()
+
+        records = []
+        if count > 0:
+            for record in self._iter_reverse(segments):
+                records.append(record)
+                if len(records) >= count:
+                    break
+        records.reverse()
+        return records
+
+    def _seek_time(self, f, size: int, since: datetime) -> int:
+        """Offset of a line start at or before the first record >= since."""
+        lo, hi = 0, size
+        while lo < hi:
+            mid = (lo + hi) // 2
+            f.seek(mid)
+            if mid:
+                f.readline()
+            start = f.tell()
+            line = f.readline()
+            record = self._parse(line) if line else None
+            if record is None:
+                hi = mid
+            elif datetime.fromisoformat(record["timestamp"]) < since:
+                lo = start + len(line)
+            else:
+                hi = mid
+        return lo
+
+    def read_range(
+        self,
+        since: Optional[datetime] = None,
+        until: Optional[datetime] = None,
+        limit: Optional[int] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Read records with since <= timestamp < until.
+
+        Args:
+            since: Inclusive lower bound (None = from the oldest record).
+            until: Exclusive upper bound (None = to the newest record).
+            limit: Maximum records to return (the oldest ones).
+
+        Returns:
+            Matching records, oldest first.
+        """
+        with self._lock:
+            if self._file is not None:
+                self._file.flush()
+            segments = self._segments()
+
+        start_index = 0
+        if since is not None and segments:
+            starts = [self._segment_start_time(s) or datetime.min for s in segments]
+            start_index = max(0, bisect.bisect_right(starts, since) - 1)
+
+        records = []
+        for index, segment in enumerate(segments[start_index:]):
+            try:
+                f = open(segment, "rb")
+            except OSError:
+                continue
+            with f:
+                if index == 0 and since is not None:
+                    size = f.seek(0, os.SEEK_END)
+                    f.seek(self._seek_time(f, size, since))
+                for line in f:
+                    record = self._parse(line)
+                    if record is None:
+                        continue
+                    timestamp = datetime.fromisoformat(record["timestamp"])
+                    if since is not None and timestamp < since:
+                        continue
+                    if until is not None and timestamp >= until:
+                        return records
+                    records.append(record)
+                    if limit and len(records) >= limit:
+                        return records
+        return records
+
+    def read_since_seq(
+        self,
+        seq: int,
+        limit: Optional[int] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Read records with a seq greater than the given one.
+
+        Args:
+            seq: Cursor (last seq already seen).
+            limit: Maximum records to return (the oldest ones).
+
+        Returns:
+            Records after the cursor, oldest first.
+        """
+        with self._lock:
+            if self._file is not None:
+                self._file.flush()
+            segments = self._segments()
+
+        firsts = [self._segment_seq(s) for s in segments]
+        start_index = max(0, bisect.bisect_right(firsts, seq) - 1)
+
+        records = []
+        for segment in segments[start_index:]:
+            try:
+                f = open(segment, "rb")
+            except OSError:
+                continue
+            with f:
+                for line in f:
+                    record = self._parse(line)
+                    if record is None or record.get("seq", 0) <= seq:
+                        continue
+                    records.append(record)
+                    if limit and len(records) >= limit:
+                        return records
+        return records
+
+    def get_statistics(self) -> Dict[str, Any]:
+        """
+        Get store statistics.
+
+        Returns:
+            Dictionary with segment count, size and last seq.
+        """
+        segments = self._segments()
+        return {
+            "directory": str(self.directory),
+            "segments": len(segments),
+            "bytes": sum(s.stat().st_size for s in segments if s.exists()),
+            "last_seq": self.last_seq
+        }
@@ -7,9 +7,11 @@ Responsibilities:
 - Centralized log collection
 - Log level filtering (info, warning, error)
 - Rolling window storage (max 10,000 entries)
+- Per-level / per-component index rings and seq cursors
 - Thread-safe operations
-- Optional disk persistence
+- Optional disk persistence (segmented JSONL, see log_store.py)
 - Log statistics and querying
+- Push subscriptions for new entries
 
 Privacy Guarantee:
 - NO sensitive data logging (passwords, biometrics, etc.)
@@ -21,15 +23,19 @@ License: Proprietary
 Version: 1.0.0
 """
 
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Callable, Iterator
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
 from collections import deque
+import heapq
+import itertools
 import threading
 import json
 from pathlib import Path
 
+from senti_os.core.faza22.log_store import SegmentedLogStore
+
 
 class LogLevel(Enum):
     """Log severity levels."""
@@ -59,10 +65,12 @@ class LogEntry:
     message: str
     component: Optional[str] = None
     details: Optional[Dict[str, Any]] = None
+    seq: Optional[int] = None
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary."""
         return {
+            "seq": self.seq,
             "timestamp": self.timestamp.isoformat(),
             "level": self.level.value,
             "message": self.message,
@@ -78,7 +86,8 @@ class LogEntry:
             level=LogLevel(data["level"]),
             message=data["message"],
             component=data.get("component"),
-            details=data.get("details")
+            details=data.get("details"),
+            seq=data.get("seq")
         )
 
 
@@ -88,13 +97,21 @@ class LogsManager:
 
     Provides centralized, thread-safe log management with
     rolling window storage and filtering capabilities.
+
+    Every entry gets a monotonically increasing sequence number. Besides
+    the main ring, entries are indexed in per-level and per-component
+    rings that are evicted in step with it, so filtered queries only
+    walk matching entries, newest first, and stop at the limit.
+    Summary counters are maintained on append and eviction.
     """
 
     def __init__(
         self,
         max_entries: int = 10000,
         persist_to_disk: bool = False,
-        log_file: Optional[str] = None
+        log_file: Optional[str] = None,
+        segment_max_bytes: int = 8 * 1024 * 1024,
+        max_segments: int = 0
     ):
         """
         Initialize logs manager.
@@ -102,25 +119,53 @@ class LogsManager:
         Args:
             max_entries: Maximum number of log entries to retain.
             persist_to_disk: If True, persist logs to disk.
-            log_file: Path to log file (if persist_to_disk is True).
+            log_file: Path to log file (if persist_to_disk is True). Its
+                directory holds the segments, its stem prefixes their names.
+            segment_max_bytes: Start a new on-disk segment past this size.
+            max_segments: On-disk segments to keep (0 = keep all).
         """
         self.max_entries = max_entries
         self.persist_to_disk = persist_to_disk
         self.log_file = log_file or "/home/pisarna/senti_system/data/faza22/senti_os.log"
 
         # Thread-safe log storage
-        self._logs: deque[LogEntry] = deque(maxlen=max_entries)
+        self._logs: deque[LogEntry] = deque()
         self._lock = threading.Lock()
 
+        # Index rings (same entries as _logs, evicted in step)
+        self._by_level: Dict[LogLevel, deque] = {
+            level: deque() for level in LogLevel
+        }
+        self._by_component: Dict[str, deque] = {}
+
         # Statistics
         self._total_logs_count = 0
         self._logs_by_level: Dict[LogLevel, int] = {
             level: 0 for level in LogLevel
         }
 
-        # Ensure log directory exists if persisting
+        # Subscribers notified of every new entry (copy-on-write list)
+        self._subscribers: List[Callable[[Dict[str, Any]], None]] = []
+
+        # Segmented on-disk store; seq numbers continue across restarts
+        self._store: Optional[SegmentedLogStore] = None
+        self._persist_lock = threading.Lock()
+        self._seq = 0
+
+        # Newest timestamp indexed so far and the seq of the last entry
+        # indexed with an older one (imports keep their timestamps).
+        # Entries after that seq are newer than everything before them.
+        self._max_timestamp: Optional[datetime] = None
+        self._unordered_seq = 0
         if self.persist_to_disk:
-            Path(self.log_file).parent.mkdir(parents=True, exist_ok=True)
+            log_path = Path(self.log_file)
+            self._store = SegmentedLogStore(
+                directory=str(log_path.parent),
+                name=log_path.stem,
+                segment_max_bytes=segment_max_bytes,
+                max_segments=max_segments
+            )
+            self._seq = self._store.last_seq
 
     def append_log(
         self,
@@ -144,24 +189,147 @@ class LogsManager:
         except ValueError:
             log_level = LogLevel.INFO
 
-        # Create log entry
-        entry = LogEntry(
-            timestamp=datetime.now(),
-            level=log_level,
-            message=message,
-            component=component,
-            details=details
-        )
-
-        # Thread-safe append
+        # Thread-safe append; seq and timestamp are assigned under the
+        # lock so both only increase in memory and on disk
         with self._lock:
-            self._logs.append(entry)
+            entry = LogEntry(
+                timestamp=datetime.now(),
+                level=log_level,
+                message=message,
+                component=component,
+                details=details
+            )
+            self._index_entry(entry)
             self._total_logs_count += 1
             self._logs_by_level[log_level] += 1
 
+            if self._store is not None:
+                # Taken before releasing _lock: disk order follows seq
+                # order without holding _lock during the write
+                self._persist_lock.acquire()
+
+        entry_dict = None
+
         # Persist to disk if enabled
-        if self.persist_to_disk:
-            self._persist_entry(entry)
+        if self._store is not None:
+            try:
+                entry_dict = entry.to_dict()
+                self._persist_entry(entry_dict)
+            finally:
+                self._persist_lock.release()
+
+        # Notify subscribers (outside the lock)
+        subscribers = self._subscribers
+        if subscribers:
+            if entry_dict is None:
+                entry_dict = entry.to_dict()
+            for callback in subscribers:
+                try:
+                    callback(entry_dict)
+                except Exception:
+                    # Subscriber errors must not break logging
+                    pass
+
+    def _index_entry(self, entry: LogEntry):
+        """
+        Assign a seq and add the entry to every ring. Caller holds _lock.
+
+        Args:
+            entry: LogEntry to index.
+        """
+        self._seq += 1
+        entry.seq = self._seq
+
+        if self._max_timestamp is None or entry.timestamp >= self._max_timestamp:
+            self._max_timestamp = entry.timestamp
+        else:
+            self._unordered_seq = entry.seq
+
+        if len(self._logs) >= self.max_entries:
+            self._evict_oldest()
+
+        self._logs.append(entry)
+        self._by_level[entry.level].append(entry)
+        if entry.component is not None:
+            ring = self._by_component.get(entry.component)
+            if ring is None:
+                ring = self._by_component[entry.component] = deque()
+            ring.append(entry)
+
+    def _evict_oldest(self):
+        """Drop the oldest entry from every ring. Caller holds _lock."""
+        oldest = self._logs.popleft()
+        # The oldest entry is also the oldest in its index rings
+        self._by_level[oldest.level].popleft()
+        if oldest.component is not None:
+            ring = self._by_component[oldest.component]
+            ring.popleft()
+            if not ring:
+                del self._by_component[oldest.component]
+
+    @staticmethod
+    def _newest(
+        ring: deque,
+        limit: Optional[int],
+        offset: int = 0,
+        predicate: Optional[Callable[[LogEntry], bool]] = None
+    ) -> List[LogEntry]:
+        """
+        Collect matching entries from the end of a ring. Caller holds _lock.
+
+        Args:
+            ring: Ring to walk (oldest first).
+            limit: Maximum entries to return (None = all).
+            offset: Number of matching entries to skip from the end.
+            predicate: Optional extra filter.
+
+        Returns:
+            Matching entries, oldest first.
+        """
+        wanted = None if not limit else limit + offset
+        collected = []
+        for entry in reversed(ring):
+            if predicate is not None and not predicate(entry):
+                continue
+            collected.append(entry)
+            if wanted is not None and len(collected) >= wanted:
+                break
+        collected = collected[offset:]
+        collected.reverse()
+        return collected
+
+    @staticmethod
+    def _level_filter(level: LogLevel) -> Callable[[LogEntry], bool]:
+        def matches(entry: LogEntry) -> bool:
+            return entry.level == level
+        return matches
+
+    @staticmethod
+    def _component_filter(component: str) -> Callable[[LogEntry], bool]:
+        def matches(entry: LogEntry) -> bool:
+            return entry.component == component
+        return matches
+
+    def subscribe(self, callback: Callable[[Dict[str, Any]], None]):
+        """
+        Subscribe to new log entries.
+
+        Args:
+            callback: Called with each new entry as a dictionary, on the
+                thread that appended it.
+        """
+        with self._lock:
+            self._subscribers = self._subscribers + [callback]
+
+    def unsubscribe(self, callback: Callable[[Dict[str, Any]], None]):
+        """
+        Remove a log entry subscriber.
+
+        Args:
+            callback: Previously subscribed callback.
+        """
+        with self._lock:
+            self._subscribers = [cb for cb in self._subscribers if cb != callback]
 
     def get_logs(
         self,
@@ -182,41 +350,32 @@ class LogsManager:
         Returns:
             List of log entries as dictionaries.
         """
-        with self._lock:
-            # Convert deque to list for slicing
-            logs_list = list(self._logs)
-
-        # Filter by level
+        filter_level = None
         if level:
             try:
                 filter_level = LogLevel(level.lower())
-                logs_list = [
-                    entry for entry in logs_list
-                    if entry.level == filter_level
-                ]
             except ValueError:
                 pass
 
-        # Filter by component
-        if component:
-            logs_list = [
-                entry for entry in logs_list
-                if entry.component == component
-            ]
-
-        # Apply offset and limit
-        total_count = len(logs_list)
-
-        if offset > 0:
-            # Skip entries from the end
-            logs_list = logs_list[:max(0, total_count - offset)]
-
-        if limit:
-            # Take last N entries
-            logs_list = logs_list[-limit:]
+        with self._lock:
+            # Walk the smallest ring that covers the filters
+            ring = self._logs
+            predicate = None
+            if filter_level is not None:
+                ring = self._by_level[filter_level]
+            if component:
+                component_ring = self._by_component.get(component, ())
+                if filter_level is None or len(component_ring) < len(ring):
+                    ring = component_ring
+                    if filter_level is not None:
+                        predicate = self._level_filter(filter_level)
+                else:
+                    predicate = self._component_filter(component)
+
+            entries = self._newest(ring, limit, offset, predicate)
 
         # Convert to dictionaries
-        return [entry.to_dict() for entry in logs_list]
+        return [entry.to_dict() for entry in entries]
 
     def get_recent_logs(self, count: int = 50) -> List[Dict[str, Any]]:
         """
@@ -258,16 +417,12 @@ class LogsManager:
             List of error log entries.
         """
         with self._lock:
-            logs_list = list(self._logs)
-
-        # Filter errors and critical
-        error_logs = [
-            entry for entry in logs_list
-            if entry.level in [LogLevel.ERROR, LogLevel.CRITICAL]
-        ]
+            errors = self._newest(self._by_level[LogLevel.ERROR], limit)
+            criticals = self._newest(self._by_level[LogLevel.CRITICAL], limit)
 
-        # Take last N entries
-        error_logs = error_logs[-limit:]
+        # Merge both rings by seq and take last N entries
+        error_logs = list(heapq.merge(errors, criticals, key=lambda e: e.seq))
+        error_logs = error_logs[-limit:] if limit else error_logs
 
         return [entry.to_dict() for entry in error_logs]
 
@@ -281,11 +436,13 @@ class LogsManager:
         with self._lock:
             current_count = len(self._logs)
             logs_by_level = self._logs_by_level.copy()
+            last_seq = self._seq
 
         return {
             "current_entries": current_count,
             "max_entries": self.max_entries,
             "total_logged": self._total_logs_count,
+            "last_seq": last_seq,
             "logs_by_level": {
                 level.value: count
                 for level, count in logs_by_level.items()
@@ -298,6 +455,11 @@ class LogsManager:
         """Clear all log entries (use with caution)."""
         with self._lock:
             self._logs.clear()
+            for ring in self._by_level.values():
+                ring.clear()
+            self._by_component.clear()
+            self._max_timestamp = None
+            self._unordered_seq = 0
 
     def search_logs(
         self,
@@ -314,18 +476,14 @@ class LogsManager:
         Returns:
             List of matching log entries.
         """
-        with self._lock:
-            logs_list = list(self._logs)
-
-        # Case-insensitive search
+        # Case-insensitive search, newest first, stops at the limit
         query_lower = query.lower()
-        matching_logs = [
-            entry for entry in logs_list
-            if query_lower in entry.message.lower()
-        ]
-
-        # Take last N matching entries
-        matching_logs = matching_logs[-limit:]
+        with self._lock:
+            matching_logs = self._newest(
+                self._logs,
+                limit,
+                predicate=lambda entry: query_lower in entry.message.lower()
+            )
 
         return [entry.to_dict() for entry in matching_logs]
 
@@ -344,35 +502,108 @@ class LogsManager:
         Returns:
             List of log entries since timestamp.
         """
+        # Timestamps only increase after the last out-of-order entry: walk
+        # back to `since` there, filter entry by entry before it
         with self._lock:
-            logs_list = list(self._logs)
+            filtered_logs = []
+            for entry in reversed(self._logs):
+                if entry.timestamp < since:
+                    if entry.seq > self._unordered_seq:
+                        break
+                    continue
+                filtered_logs.append(entry)
+                if limit and len(filtered_logs) >= limit:
+                    break
+
+        filtered_logs.reverse()
+        return [entry.to_dict() for entry in filtered_logs]
 
-        # Filter by timestamp
-        filtered_logs = [
-            entry for entry in logs_list
-            if entry.timestamp >= since
-        ]
+    def get_logs_since_seq(
+        self,
+        seq: int,
+        limit: Optional[int] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Get logs after a sequence number cursor.
 
-        if limit:
-            filtered_logs = filtered_logs[-limit:]
+        Pass the "seq" of the last entry already seen; 0 starts from the
+        oldest entry. With disk persistence, entries that already left
+        the in-memory window are read from disk.
 
-        return [entry.to_dict() for entry in filtered_logs]
+        Args:
+            seq: Last seq already seen.
+            limit: Optional maximum entries to return (the oldest ones,
+                so callers can page forward).
+
+        Returns:
+            List of log entries with a greater seq, oldest first.
+        """
+        with self._lock:
+            oldest_seq = self._logs[0].seq if self._logs else self._seq + 1
+            if self._store is None or seq + 1 >= oldest_seq:
+                # In memory; seqs in the ring are contiguous
+                start = max(0, seq + 1 - oldest_seq)
+                stop = len(self._logs) if not limit else min(len(self._logs), start + limit)
+                return [
+                    entry.to_dict()
+                    for entry in itertools.islice(self._logs, start, stop)
+                ]
+
+        return self._store.read_since_seq(seq, limit)
+
+    def get_persisted_logs(
+        self,
+        since: Optional[datetime] = None,
+        until: Optional[datetime] = None,
+        limit: Optional[int] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Read a time range of persisted logs without loading whole files.
+
+        Args:
+            since: Inclusive lower bound (None = oldest).
+            until: Exclusive upper bound (None = newest).
+            limit: Optional maximum entries to return (the oldest ones).
+
+        Returns:
+            List of log entries, oldest first ([] without persistence).
+        """
+        if self._store is None:
+            return []
+        return self._store.read_range(since, until, limit)
 
-    def _persist_entry(self, entry: LogEntry):
+    def tail_persisted_logs(self, count: int = 50) -> List[Dict[str, Any]]:
+        """
+        Read the newest persisted logs from the end of the segments.
+
+        Args:
+            count: Number of entries.
+
+        Returns:
+            List of log entries, oldest first ([] without persistence).
+        """
+        if self._store is None:
+            return []
+        return self._store.tail(count)
+
+    def _persist_entry(self, entry: Dict[str, Any]):
         """
         Persist a single log entry to disk.
 
         Args:
-            entry: LogEntry to persist.
+            entry: Log entry dictionary to persist.
         """
         try:
-            with open(self.log_file, 'a') as f:
-                json.dump(entry.to_dict(), f)
-                f.write('\n')
+            self._store.append(entry)
         except Exception:
             # Silently ignore persistence errors to avoid infinite loops
             pass
 
+    def close(self):
+        """Close the on-disk store."""
+        if self._store is not None:
+            self._store.close()
+
     def export_logs(
         self,
         output_file: str,
@@ -381,6 +612,8 @@ class LogsManager:
         """
         Export logs to a file.
 
+        Writes a JSON array, or one entry per line for *.jsonl files.
+
         Args:
             output_file: Path to output file.
             level: Optional level filter.
@@ -395,16 +628,66 @@ class LogsManager:
             Path(output_file).parent.mkdir(parents=True, exist_ok=True)
 
             with open(output_file, 'w') as f:
-                json.dump(logs, f, indent=2)
+                if output_file.endswith(".jsonl"):
+                    for log in logs:
+                        f.write(json.dumps(log) + "\n")
+                else:
+                    json.dump(logs, f, indent=2)
 
             return True
         except Exception:
             return False
 
+    @staticmethod
+    def _iter_import_records(f) -> Iterator[Dict[str, Any]]:
+        """
+        Stream records from a JSON array or a JSONL file.
+
+        Args:
+            f: Text file positioned at the start.
+
+        Yields:
+            Record dictionaries, in file order.
+        """
+        head = f.read(1)
+        while head and head.isspace():
+            head = f.read(1)
+
+        if head != "[":
+            # JSONL (LogsManager segments or *.jsonl exports)
+            first_line = head + f.readline()
+            for line in itertools.chain([first_line], f):
+                if line.strip():
+                    yield json.loads(line)
+            return
+
+        # JSON array: decode one element at a time from a sliding buffer
+        decoder = json.JSONDecoder()
+        buffer = ""
+        eof = False
+        while True:
+            buffer = buffer.lstrip().lstrip(",").lstrip()
+            if buffer.startswith("]"):
+                return
+            try:
+                record, end = decoder.raw_decode(buffer)
+            except ValueError:
+                if eof:
+                    raise
+                chunk = f.read(64 * 1024)
+                eof = not chunk
+                buffer += chunk
+                continue
+            yield record
+            buffer = buffer[end:]
+
     def import_logs(self, input_file: str) -> bool:
         """
         Import logs from a file.
 
+        Accepts export_logs output (JSON array or JSONL) and persisted
+        segments. Entries are streamed and get new seq numbers.
+
         Args:
             input_file: Path to input file.
 
@@ -413,17 +696,15 @@ class LogsManager:
         """
         try:
             with open(input_file, 'r') as f:
-                logs_data = json.load(f)
-
-            with self._lock:
-                for log_data in logs_data:
+                for log_data in self._iter_import_records(f):
                     try:
                         entry = LogEntry.from_dict(log_data)
-                        self._logs.append(entry)
-                        self._total_logs_count += 1
-                        self._logs_by_level[entry.level] += 1
                     except Exception:
                         continue
+                    with self._lock:
+                        self._index_entry(entry)
+                        self._total_logs_count += 1
+                        self._logs_by_level[entry.level] += 1
 
             return True
         except Exception:
@@ -454,42 +735,33 @@ class LogsManager:
             Dictionary with log summary.
         """
         with self._lock:
-            logs_list = list(self._logs)
-
-        if not logs_list:
-            return {
-                "total_entries": 0,
-                "oldest_entry": None,
-                "newest_entry": None,
-                "error_count": 0,
-                "warning_count": 0,
-                "info_count": 0
+            if not self._logs:
+                return {
+                    "total_entries": 0,
+                    "oldest_entry": None,
+                    "newest_entry": None,
+                    "error_count": 0,
+                    "warning_count": 0,
+                    "info_count": 0
+                }
+
+            # Level rings hold exactly the retained entries per level
+            by_level = {
+                level: len(ring) for level, ring in self._by_level.items()
             }
-
-        # Count by level
-        error_count = sum(
-            1 for entry in logs_list
-            if entry.level in [LogLevel.ERROR, LogLevel.CRITICAL]
-        )
-        warning_count = sum(
-            1 for entry in logs_list
-            if entry.level == LogLevel.WARNING
-        )
-        info_count = sum(
-            1 for entry in logs_list
-            if entry.level == LogLevel.INFO
-        )
+            total_entries = len(self._logs)
+            oldest_entry = self._logs[0].timestamp
+            newest_entry = self._logs[-1].timestamp
 
         return {
-            "total_entries": len(logs_list),
-            "oldest_entry": logs_list[0].timestamp.isoformat(),
-            "newest_entry": logs_list[-1].timestamp.isoformat(),
-            "error_count": error_count,
-            "warning_count": warning_count,
-            "info_count": info_count,
+            "total_entries": total_entries,
+            "oldest_entry": oldest_entry.isoformat(),
+            "newest_entry": newest_entry.isoformat(),
+            "error_count": by_level[LogLevel.ERROR] + by_level[LogLevel.CRITICAL],
+            "warning_count": by_level[LogLevel.WARNING],
+            "info_count": by_level[LogLevel.INFO],
             "by_level": {
-                level.value: sum(1 for e in logs_list if e.level == level)
-                for level in LogLevel
+                level.value: count for level, count in by_level.items()
             }
         }
 
@@ -263,6 +263,12 @@ class SentinelProcess:
             health_record.last_error_time = current_time
             return HealthCheckResult.CRASHED
 
+        # Lazy stacks are idle until first accessed
+        if stack_info.lazy and stack_info.status.value == "not_loaded":
+            health_record.last_heartbeat = current_time
+            health_record.status = HealthCheckResult.HEALTHY
+            return HealthCheckResult.HEALTHY
+
         # Check heartbeat timeout
         time_since_heartbeat = current_time - health_record.last_heartbeat
         if time_since_heartbeat.total_seconds() > self.config.heartbeat_timeout_seconds:
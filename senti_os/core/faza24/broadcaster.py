@@ -0,0 +1,362 @@
+"""
+FAZA 24 - Dashboard Broadcaster
+
+Shared push fan-out for the dashboard WebSockets.
+- One status snapshot per interval, serialized once for every client
+- JSON-patch style deltas (RFC 6902 add/remove/replace) between snapshots
+- Log entries pushed from a LogsManager subscription instead of polling
+- Bounded per-client send queues so slow clients never stall the rest
+
+Framework independent: any object with async send_text()/receive_text()
+(e.g. a Starlette WebSocket) can be served.
+"""
+
+import asyncio
+import json
+import threading
+from collections import deque
+from typing import Any, Callable, Dict, List, Optional, Set
+
+
+# =====================================================
+# JSON PATCH
+# =====================================================
+
+def _escape(key: Any) -> str:
+    return str(key).replace("~", "~0").replace("/", "~1")
+
+
+def _unescape(token: str) -> str:
+    return token.replace("~1", "/").replace("~0", "~")
+
+
+def json_diff(old: Any, new: Any, path: str = "") -> List[Dict[str, Any]]:
+    """
+    Compute JSON-patch operations turning old into new.
+
+    Dicts are diffed per key; lists and scalars are replaced as a whole.
+
+    Args:
+        old: Previous JSON document.
+        new: Current JSON document.
+        path: JSON pointer of the documents (root = "").
+
+    Returns:
+        List of {"op", "path", ["value"]} operations.
+    """
+    if isinstance(old, dict) and isinstance(new, dict):
+        ops = []
+        for key in old:
+            if key not in new:
+                ops.append({"op": "remove", "path": f"{path}/{_escape(key)}"})
+        for key, value in new.items():
+            child = f"{path}/{_escape(key)}"
+            if key not in old:
+                ops.append({"op": "add", "path": child, "value": value})
+            elif old[key] != value:
+                ops.extend(json_diff(old[key], value, child))
+        return ops
+
+    if old != new:
+        return [{"op": "replace", "path": path, "value": new}]
+    return []
+
+
+def apply_patch(document: Any, ops: List[Dict[str, Any]]) -> Any:
+    """
+    Apply operations produced by json_diff() in place.
+
+    Args:
+        document: JSON document (dict).
+        ops: Patch operations.
+
+    Returns:
+        The patched document (a new object when the root is replaced).
+    """
+    for op in ops:
+        if op["path"] == "":
+            document = op.get("value")
+            continue
+
+        tokens = [_unescape(t) for t in op["path"].split("/")[1:]]
+        target = document
+        for token in tokens[:-1]:
+            target = target[token]
+
+        if op["op"] == "remove":
+            target.pop(tokens[-1], None)
+        else:
+            target[tokens[-1]] = op["value"]
+
+    return document
+
+
+# =====================================================
+# CLIENT QUEUES
+# =====================================================
+
+class ClientQueue:
+    """Bounded per-client send queue (messages are pre-serialized text)."""
+
+    def __init__(self, maxsize: int):
+        self.queue: asyncio.Queue = asyncio.Queue(maxsize)
+        self.sent = 0
+        self.dropped = 0
+
+    def offer(self, message: str) -> bool:
+        """
+        Enqueue a message without waiting.
+
+        Returns:
+            False if the queue was full (caller decides how to recover).
+        """
+        try:
+            self.queue.put_nowait(message)
+            return True
+        except asyncio.QueueFull:
+            return False
+
+    def drop_oldest(self, message: str):
+        """Make room by discarding the oldest message, then enqueue."""
+        try:
+            self.queue.get_nowait()
+            self.dropped += 1
+        except asyncio.QueueEmpty:
+            pass
+        self.queue.put_nowait(message)
+
+    def reset(self, message: str):
+        """Discard everything queued and enqueue a single message."""
+        while not self.queue.empty():
+            self.queue.get_nowait()
+            self.dropped += 1
+        self.queue.put_nowait(message)
+
+
+class _Broadcaster:
+    """Client registry and per-client send loop shared by broadcasters."""
+
+    def __init__(self, queue_size: int):
+        self.queue_size = queue_size
+        self._clients: Set[ClientQueue] = set()
+
+    async def serve(self, ws):
+        """
+        Stream messages to one connected socket until it disconnects.
+
+        Args:
+            ws: Accepted socket with async send_text()/receive_text().
+        """
+        client = ClientQueue(self.queue_size)
+        client.offer(self._initial_message())
+        self._clients.add(client)
+        self._on_client_added()
+
+        sender = asyncio.ensure_future(self._send_loop(ws, client))
+        receiver = asyncio.ensure_future(self._receive_loop(ws))
+        try:
+            done, pending = await asyncio.wait(
+                {sender, receiver}, return_when=asyncio.FIRST_COMPLETED
+            )
+            for task in pending:
+                task.cancel()
+            for task in done:
+                # Disconnects surface here; nothing else to do with them
+                task.exception()
+        finally:
+            self._clients.discard(client)
+            self._on_client_removed()
+
+    async def _send_loop(self, ws, client: ClientQueue):
+        while True:
+            message = await client.queue.get()
+            await ws.send_text(message)
+            client.sent += 1
+
+    async def _receive_loop(self, ws):
+        # Dashboards never send; reading is how a disconnect is noticed
+        # even when nothing is being broadcast.
+        while True:
+            await ws.receive_text()
+
+    def client_count(self) -> int:
+        return len(self._clients)
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            "clients": len(self._clients),
+            "queued": sum(c.queue.qsize() for c in self._clients),
+            "dropped": sum(c.dropped for c in self._clients)
+        }
+
+    def _initial_message(self) -> str:
+        raise NotImplementedError
+
+    def _on_client_added(self):
+        pass
+
+    def _on_client_removed(self):
+        pass
+
+
+# =====================================================
+# STATUS
+# =====================================================
+
+class StatusBroadcaster(_Broadcaster):
+    """
+    Polls the status source once per interval for all clients.
+
+    Messages:
+        {"type": "snapshot", "data": {...}}  first message / resync
+        {"type": "patch", "ops": [...]}      changes since previous tick
+    """
+
+    def __init__(
+        self,
+        get_status: Callable[[], Dict[str, Any]],
+        interval: float = 1.0,
+        queue_size: int = 16
+    ):
+        super().__init__(queue_size)
+        self.get_status = get_status
+        self.interval = interval
+
+        self._state: Optional[Dict[str, Any]] = None
+        self._state_text: Optional[str] = None
+        self._task: Optional[asyncio.Task] = None
+
+    def refresh(self) -> Optional[str]:
+        """
+        Take one status snapshot and fan the change out to every client.
+
+        Returns:
+            The message broadcast, or None if nothing changed.
+        """
+        try:
+            text = json.dumps(self.get_status(), default=str)
+        except Exception:
+            return None
+
+        if text == self._state_text:
+            return None
+
+        # Round-trip so the diff sees exactly what clients see
+        state = json.loads(text)
+        previous = self._state
+        self._state, self._state_text = state, text
+
+        snapshot = self._snapshot_message()
+        if previous is None:
+            message = snapshot
+        else:
+            message = json.dumps({"type": "patch", "ops": json_diff(previous, state)}, default=str)
+            if len(message) >= len(snapshot):
+                message = snapshot
+
+        for client in list(self._clients):
+            if not client.offer(message):
+                # A dropped patch would desync the client; resync instead
+                client.reset(snapshot)
+
+        return message
+
+    def _snapshot_message(self) -> str:
+        return '{"type": "snapshot", "data": ' + self._state_text + '}'
+
+    def _initial_message(self) -> str:
+        if self._state_text is None:
+            self.refresh()
+        if self._state_text is None:
+            return json.dumps({"type": "snapshot", "data": None})
+        return self._snapshot_message()
+
+    def _on_client_added(self):
+        if self._task is None or self._task.done():
+            self._task = asyncio.ensure_future(self._run())
+
+    async def _run(self):
+        while self._clients:
+            await asyncio.sleep(self.interval)
+            self.refresh()
+
+
+# =====================================================
+# LOGS
+# =====================================================
+
+class LogBroadcaster(_Broadcaster):
+    """
+    Pushes new LogsManager entries to all clients as they are appended.
+
+    Entries arriving from any thread are coalesced into one
+    {"type": "append", "entries": [...]} message per event-loop turn.
+    The first message is {"type": "snapshot", "entries": [...]}.
+    """
+
+    def __init__(self, logs_manager, backlog: int = 50, queue_size: int = 64):
+        super().__init__(queue_size)
+        self.logs_manager = logs_manager
+        self.backlog = backlog
+
+        self._pending: deque = deque()
+        self._pending_lock = threading.Lock()
+        self._flush_scheduled = False
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._subscribed = False
+
+    def _on_log(self, entry: Dict[str, Any]):
+        """LogsManager subscriber; may run on any thread."""
+        with self._pending_lock:
+            self._pending.append(entry)
+            if self._flush_scheduled or self._loop is None:
+                return
+            self._flush_scheduled = True
+
+        try:
+            self._loop.call_soon_threadsafe(self.flush)
+        except RuntimeError:
+            # Loop closed
+            with self._pending_lock:
+                self._flush_scheduled = False
+
+    def flush(self) -> Optional[str]:
+        """
+        Broadcast pending entries.
+
+        Returns:
+            The message broadcast, or None if nothing was pending.
+        """
+        with self._pending_lock:
+            entries = list(self._pending)
+            self._pending.clear()
+            self._flush_scheduled = False
+
+        if not entries:
+            return None
+
+        message = json.dumps({"type": "append", "entries": entries}, default=str)
+        for client in list(self._clients):
+            if not client.offer(message):
+                client.drop_oldest(message)
+        return message
+
+    def _initial_message(self) -> str:
+        if not self._subscribed:
+            self._loop = asyncio.get_running_loop()
+            self.logs_manager.subscribe(self._on_log)
+            self._subscribed = True
+        else:
+            # Deliver what is pending to existing clients first so the
+            # new client's snapshot and later appends do not overlap.
+            self.flush()
+
+        entries = self.logs_manager.get_logs(limit=self.backlog)
+        return json.dumps({"type": "snapshot", "entries": entries}, default=str)
+
+    def _on_client_removed(self):
+        if not self._clients and self._subscribed:
+            self.logs_manager.unsubscribe(self._on_log)
+            self._subscribed = False
+            with self._pending_lock:
+                self._pending.clear()
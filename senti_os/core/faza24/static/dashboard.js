@@ -8,6 +8,34 @@ function getWebSocketURL(endpoint) {
     return `${protocol}//${host}/ws${endpoint}`;
 }
 
+// Latest system status and log lines (kept in sync from pushed messages)
+let systemState = null;
+let logLines = [];
+const MAX_LOG_LINES = 50;
+
+// Apply JSON-patch style operations ({op, path, value}) to a document
+function applyPatch(doc, ops) {
+    for (const op of ops) {
+        if (op.path === "") {
+            doc = op.value;
+            continue;
+        }
+        const tokens = op.path.split("/").slice(1)
+            .map((t) => t.replace(/~1/g, "/").replace(/~0/g, "~"));
+        let target = doc;
+        for (const token of tokens.slice(0, -1)) {
+            target = target[token];
+        }
+        const last = tokens[tokens.length - 1];
+        if (op.op === "remove") {
+            delete target[last];
+        } else {
+            target[last] = op.value;
+        }
+    }
+    return doc;
+}
+
 // WebSocket connection with auto-reconnect and error handling
 function connectSystemWS() {
     const url = getWebSocketURL("/system");
@@ -21,7 +49,12 @@ function connectSystemWS() {
     ws.onmessage = (msg) => {
         try {
             const data = JSON.parse(msg.data);
-            sysEl.textContent = JSON.stringify(data, null, 2);
+            if (data.type === "patch") {
+                systemState = applyPatch(systemState, data.ops);
+            } else {
+                systemState = data.data;
+            }
+            sysEl.textContent = JSON.stringify(systemState, null, 2);
         } catch (e) {
             console.error("Failed to parse system data:", e);
             sysEl.textContent = "Error parsing system data";
@@ -52,7 +85,12 @@ function connectLogsWS() {
     ws.onmessage = (msg) => {
         try {
             const data = JSON.parse(msg.data);
-            logEl.textContent = JSON.stringify(data, null, 2);
+            if (data.type === "append") {
+                logLines = logLines.concat(data.entries).slice(-MAX_LOG_LINES);
+            } else {
+                logLines = data.entries;
+            }
+            logEl.textContent = JSON.stringify(logLines, null, 2);
         } catch (e) {
             console.error("Failed to parse log data:", e);
             logEl.textContent = "Error parsing log data";
@@ -1,38 +1,34 @@
 from fastapi import FastAPI, WebSocket
 from fastapi.websockets import WebSocketDisconnect
-import json
-import asyncio
 
 from senti_os.core.faza22.service_registry import ServiceRegistry
-from senti_os.core.faza22.logs_manager import LogsManager
+from senti_os.core.faza22.logs_manager import get_logs_manager
+from senti_os.core.faza24.broadcaster import StatusBroadcaster, LogBroadcaster
 
 websocket_app = FastAPI()
-logs_manager = LogsManager()
+logs_manager = get_logs_manager()
+
+# One snapshot / one log subscription shared by every connected dashboard
+status_broadcaster = StatusBroadcaster(
+    lambda: ServiceRegistry().get_boot_manager().get_status(),
+    interval=1.0
+)
+log_broadcaster = LogBroadcaster(logs_manager, backlog=50)
 
 @websocket_app.websocket("/system")
 async def websocket_system(ws: WebSocket):
     await ws.accept()
-    manager = ServiceRegistry().get_boot_manager()
 
     try:
-        while True:
-            status = manager.get_status()
-            await ws.send_text(json.dumps(status))
-            await asyncio.sleep(1)
+        await status_broadcaster.serve(ws)
     except WebSocketDisconnect:
         return
 
 @websocket_app.websocket("/logs")
 async def websocket_logs(ws: WebSocket):
     await ws.accept()
-    last_count = 0
 
     try:
-        while True:
-            logs = logs_manager.get_logs(limit=50)
-            if len(logs) != last_count:
-                await ws.send_text(json.dumps(logs))
-                last_count = len(logs)
-            await asyncio.sleep(1)
+        await log_broadcaster.serve(ws)
     except WebSocketDisconnect:
         return
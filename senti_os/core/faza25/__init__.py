@@ -6,7 +6,9 @@ Provides task orchestration, execution, and management capabilities for Senti OS
 Key Components:
 - Task Model: Task data structure with status tracking
 - Priority Queue: Thread-safe task queue with priority ordering
+- Indexed Priority Queue: id-indexed heap shared with FAZA 17
 - Workers: Asynchronous task execution workers
+- Backends: asyncio / thread pool / process pool execution backends
 - Orchestrator: Main API for task management
 
 Usage:
@@ -35,12 +37,27 @@ Usage:
     status = orchestrator.get_task_status(task_id)
     print(status)
 
+    # CPU-bound work runs in the process pool (module-level executor)
+    task_id = orchestrator.submit_task(
+        name="Crunch",
+        executor=crunch_numbers,
+        execution_mode="process"
+    )
+
     # Stop orchestrator
     await orchestrator.stop()
 """
 
-from senti_os.core.faza25.task_model import Task, TaskStatus
+from senti_os.core.faza25.task_model import Task, TaskStatus, ExecutionMode
 from senti_os.core.faza25.task_queue import PriorityTaskQueue
+from senti_core_module.senti_queue import IndexedPriorityQueue, aging_key
+from senti_os.core.faza25.backends import (
+    ExecutionBackend,
+    AsyncioBackend,
+    ThreadPoolBackend,
+    ProcessPoolBackend,
+    create_default_backends
+)
 from senti_os.core.faza25.worker import TaskWorker, WorkerPool
 from senti_os.core.faza25.orchestrator import OrchestratorManager, get_orchestrator
 from senti_os.core.faza25.pipeline_integration import (
@@ -54,9 +71,19 @@ __all__ = [
     # Task Model
     "Task",
     "TaskStatus",
+    "ExecutionMode",
 
     # Queue
     "PriorityTaskQueue",
+    "IndexedPriorityQueue",
+    "aging_key",
+
+    # Execution backends
+    "ExecutionBackend",
+    "AsyncioBackend",
+    "ThreadPoolBackend",
+    "ProcessPoolBackend",
+    "create_default_backends",
 
     # Workers
     "TaskWorker",
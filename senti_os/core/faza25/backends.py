@@ -0,0 +1,255 @@
+"""
+FAZA 25 - Orchestration Execution Engine
+Execution Backends
+
+Pluggable backends that run Task executors for the worker pool:
+- AsyncioBackend: awaits the executor on the worker's event loop (default)
+- ThreadPoolBackend: runs the executor in a thread (blocking I/O)
+- ProcessPoolBackend: runs the executor in a child process (CPU-bound)
+
+Tasks are routed by Task.execution_mode. Thread and process executors may
+be plain or async functions; process executors must be picklable
+(module-level) and receive a pickled copy of the task - only the return
+value (also pickled) comes back.
+"""
+
+import asyncio
+import inspect
+import logging
+import os
+from abc import ABC, abstractmethod
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Any, Dict, Optional
+
+from senti_os.core.faza25.task_model import ExecutionMode, Task
+
+
+logger = logging.getLogger(__name__)
+
+
+def _invoke_executor(task: Task) -> Any:
+    """
+    Call a task executor outside the event loop.
+
+    Runs in a pool thread or child process; async executors get their
+    own short-lived event loop.
+
+    Args:
+        task: Task (or its pickled copy) to execute
+
+    Returns:
+        Executor result
+    """
+    result = task.executor(task)
+    if inspect.iscoroutine(result):
+        return asyncio.run(result)
+    return result
+
+
+class ExecutionBackend(ABC):
+    """
+    Base class for execution backends.
+
+    Workers reserve a slot with acquire() before dispatching a task, so
+    the backend never queues more work than it has workers for; tasks
+    waiting for a slot are reported as queue depth.
+    """
+
+    mode: ExecutionMode = ExecutionMode.ASYNCIO
+    inline = False  # True: runs on the worker's loop, the worker awaits it
+
+    def __init__(self, max_workers: int):
+        """
+        Initialize backend.
+
+        Args:
+            max_workers: Number of tasks the backend runs concurrently
+        """
+        self.max_workers = max_workers
+        self._slots: Optional[asyncio.Semaphore] = None
+        self._waiting = 0
+        self._active = 0
+        self._completed = 0
+        self._failed = 0
+
+    def start(self) -> None:
+        """Prepare the backend for a worker pool run (on its event loop)."""
+        self._slots = asyncio.Semaphore(self.max_workers)
+
+    def shutdown(self) -> None:
+        """Release backend resources."""
+        self._slots = None
+
+    async def acquire(self) -> None:
+        """Wait for a free execution slot."""
+        self._waiting += 1
+        try:
+            await self._slots.acquire()
+        finally:
+            self._waiting -= 1
+
+    def release(self) -> None:
+        """Return an execution slot."""
+        if self._slots is not None:
+            self._slots.release()
+
+    async def run(self, task: Task) -> Any:
+        """
+        Execute a task and return its result.
+
+        Args:
+            task: Task to execute
+
+        Returns:
+            Executor result
+        """
+        self._active += 1
+        try:
+            result = await self._run(task)
+            self._completed += 1
+            return result
+        except asyncio.CancelledError:
+            raise
+        except Exception:
+            self._failed += 1
+            raise
+        finally:
+            self._active -= 1
+
+    @abstractmethod
+    async def _run(self, task: Task) -> Any:
+        """Execute the task on this backend."""
+        pass
+
+    def get_status(self) -> Dict[str, Any]:
+        """
+        Get backend status.
+
+        Returns:
+            Dictionary with queue depth, active tasks and utilization
+        """
+        return {
+            "mode": self.mode.value,
+            "max_workers": self.max_workers,
+            "queue_depth": self._waiting,
+            "active": self._active,
+            "utilization": self._active / self.max_workers if self.max_workers else 0.0,
+            "completed": self._completed,
+            "failed": self._failed
+        }
+
+
+class AsyncioBackend(ExecutionBackend):
+    """
+    Runs executors as coroutines on the worker's event loop.
+
+    Concurrency is bounded by the number of workers, which await each task
+    themselves; max_workers is set by the WorkerPool.
+    """
+
+    mode = ExecutionMode.ASYNCIO
+    inline = True
+
+    def __init__(self, max_workers: int = 1):
+        super().__init__(max_workers)
+
+    async def _run(self, task: Task) -> Any:
+        return await task.run()
+
+
+class PoolBackend(ExecutionBackend):
+    """Base for backends that run executors on a concurrent.futures pool."""
+
+    def __init__(self, max_workers: int):
+        super().__init__(max_workers)
+        self._executor: Optional[Executor] = None
+
+    @abstractmethod
+    def _create_executor(self) -> Executor:
+        """Create the concurrent.futures pool."""
+        pass
+
+    def start(self) -> None:
+        super().start()
+        if self._executor is None:
+            self._executor = self._create_executor()
+
+    def shutdown(self) -> None:
+        super().shutdown()
+        if self._executor is not None:
+            # Running tasks finish in the background; queued ones are dropped
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+    async def _run(self, task: Task) -> Any:
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, _invoke_executor, task)
+
+
+class ThreadPoolBackend(PoolBackend):
+    """Runs executors in a thread pool (for blocking I/O tasks)."""
+
+    mode = ExecutionMode.THREAD
+
+    def __init__(self, max_workers: Optional[int] = None):
+        """
+        Initialize thread pool backend.
+
+        Args:
+            max_workers: Pool size (default: min(32, CPU count + 4))
+        """
+        super().__init__(max_workers or min(32, (os.cpu_count() or 1) + 4))
+
+    def _create_executor(self) -> Executor:
+        return ThreadPoolExecutor(
+            max_workers=self.max_workers,
+            thread_name_prefix="faza25-task"
+        )
+
+
+class ProcessPoolBackend(PoolBackend):
+    """
+    Runs executors in a process pool (for CPU-bound tasks).
+
+    Executor, task and result cross the process boundary by pickling;
+    unpicklable tasks fail with the pickling error as task error.
+    """
+
+    mode = ExecutionMode.PROCESS
+
+    def __init__(self, max_workers: Optional[int] = None, mp_context=None):
+        """
+        Initialize process pool backend.
+
+        Args:
+            max_workers: Pool size (default: CPU count)
+            mp_context: Optional multiprocessing context (e.g. "spawn")
+        """
+        super().__init__(max_workers or os.cpu_count() or 1)
+        self.mp_context = mp_context
+
+    def _create_executor(self) -> Executor:
+        return ProcessPoolExecutor(
+            max_workers=self.max_workers,
+            mp_context=self.mp_context
+        )
+
+
+def create_default_backends(num_workers: int) -> Dict[ExecutionMode, ExecutionBackend]:
+    """
+    Create the default backend set: asyncio, thread pool and process pool.
+
+    Pools are sized from the CPU count; their threads and processes are
+    only spawned when tasks are routed to them.
+
+    Args:
+        num_workers: Number of workers (asyncio backend concurrency)
+
+    Returns:
+        Backends by execution mode
+    """
+    return {
+        ExecutionMode.ASYNCIO: AsyncioBackend(num_workers),
+        ExecutionMode.THREAD: ThreadPoolBackend(),
+        ExecutionMode.PROCESS: ProcessPoolBackend(),
+    }
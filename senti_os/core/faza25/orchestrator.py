@@ -7,9 +7,10 @@ Main API for task orchestration, submission, and management.
 
 import asyncio
 import logging
-from typing import Dict, List, Optional, Any, Callable, Awaitable
+from typing import Dict, List, Optional, Any, Callable, Awaitable, Union
 
-from senti_os.core.faza25.task_model import Task, TaskStatus
+from senti_os.core.faza25.backends import ExecutionBackend
+from senti_os.core.faza25.task_model import ExecutionMode, Task, TaskStatus
 from senti_os.core.faza25.task_queue import PriorityTaskQueue
 from senti_os.core.faza25.worker import WorkerPool
 
@@ -25,16 +26,26 @@ class OrchestratorManager:
     Coordinates workers and task queue.
     """
 
-    def __init__(self, num_workers: int = 3):
+    def __init__(
+        self,
+        num_workers: int = 3,
+        backends: Optional[Dict[ExecutionMode, ExecutionBackend]] = None
+    ):
         """
         Initialize orchestrator manager.
 
         Args:
             num_workers: Number of worker tasks to create (default: 3)
+            backends: Execution backends by mode (default: asyncio, thread
+                and process pools)
         """
         self.num_workers = num_workers
         self.task_queue = PriorityTaskQueue()
-        self.worker_pool = WorkerPool(num_workers=num_workers, task_queue=self.task_queue)
+        self.worker_pool = WorkerPool(
+            num_workers=num_workers,
+            task_queue=self.task_queue,
+            backends=backends
+        )
 
         # Task registry: track all tasks by ID
         self.tasks: Dict[str, Task] = {}
@@ -77,17 +88,21 @@ class OrchestratorManager:
         executor: Callable[[Task], Awaitable[Any]],
         priority: int = 5,
         task_type: str = "generic",
-        context: Optional[Dict[str, Any]] = None
+        context: Optional[Dict[str, Any]] = None,
+        execution_mode: Union[ExecutionMode, str] = ExecutionMode.ASYNCIO
     ) -> str:
         """
         Submit a new task for execution.
 
         Args:
             name: Human-readable task name
-            executor: Async function that executes the task
+            executor: Function that executes the task (async for "asyncio";
+                plain or async for "thread"/"process", module-level for
+                "process" so it can be pickled)
             priority: Priority level (0-10, higher = more important)
             task_type: Type of task (e.g., "pipeline", "generic", "service")
             context: Additional parameters for task execution
+            execution_mode: Backend to run on ("asyncio", "thread", "process")
 
         Returns:
             Task ID
@@ -95,12 +110,17 @@ class OrchestratorManager:
         if not self._is_running:
             raise RuntimeError("OrchestratorManager is not running. Call start() first.")
 
+        execution_mode = ExecutionMode(execution_mode)
+        if execution_mode not in self.worker_pool.backends:
+            raise ValueError(f"No backend configured for execution mode '{execution_mode.value}'")
+
         task = Task(
             name=name,
             executor=executor,
             priority=priority,
             task_type=task_type,
-            context=context or {}
+            context=context or {},
+            execution_mode=execution_mode
         )
 
         # Register task
@@ -109,7 +129,10 @@ class OrchestratorManager:
         # Add to queue
         self.task_queue.put(task)
 
-        logger.info(f"Task submitted: {task.id} ({task.name}) with priority {priority}")
+        logger.info(
+            f"Task submitted: {task.id} ({task.name}) with priority {priority} "
+            f"on {execution_mode.value} backend"
+        )
         return task.id
 
     def cancel_task(self, task_id: str) -> bool:
@@ -145,6 +168,24 @@ class OrchestratorManager:
         logger.info(f"Task {task_id} is already in state {task.status.value}")
         return False
 
+    def update_task_priority(self, task_id: str, priority: int) -> bool:
+        """
+        Change the priority of a queued task.
+
+        Args:
+            task_id: ID of task
+            priority: New priority level (0-10, higher = more important)
+
+        Returns:
+            True if updated, False if task is not queued
+        """
+        if not self.task_queue.update_priority(task_id, priority):
+            logger.warning(f"Cannot reprioritize task {task_id}: not queued")
+            return False
+
+        logger.info(f"Task {task_id} priority updated to {priority}")
+        return True
+
     def get_task_status(self, task_id: str) -> Optional[Dict[str, Any]]:
         """
         Get status of a specific task.
@@ -200,6 +241,7 @@ class OrchestratorManager:
         return {
             "queue_size": self.task_queue.size(),
             "is_empty": self.task_queue.is_empty(),
+            "queued_by_priority": self.task_queue.get_statistics()["tasks_by_priority"],
             "total_tasks": len(self.tasks),
             "tasks_by_status": {
                 "queued": len([t for t in self.tasks.values() if t.status == TaskStatus.QUEUED]),
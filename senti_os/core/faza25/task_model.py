@@ -21,6 +21,13 @@ class TaskStatus(Enum):
     CANCELLED = "cancelled"
 
 
+class ExecutionMode(Enum):
+    """Execution backend a task is routed to"""
+    ASYNCIO = "asyncio"  # Coroutine on the worker event loop
+    THREAD = "thread"    # Thread pool (blocking I/O)
+    PROCESS = "process"  # Process pool (CPU-bound, pickled)
+
+
 @dataclass
 class Task:
     """
@@ -37,12 +44,14 @@ class Task:
         error_message: Error description if status is ERROR
         context: Additional parameters and data for task execution
         task_type: Type of task (e.g., "pipeline", "generic", "service")
-        executor: Async function to execute the task
+        execution_mode: Backend that runs the executor (asyncio/thread/process)
+        executor: Function to execute the task (async for ASYNCIO mode)
     """
     name: str
     executor: Callable[['Task'], Awaitable[Any]]
     priority: int = 5
     task_type: str = "generic"
+    execution_mode: ExecutionMode = ExecutionMode.ASYNCIO
     context: Dict[str, Any] = field(default_factory=dict)
 
     id: str = field(default_factory=lambda: str(uuid.uuid4()))
@@ -68,6 +77,7 @@ class Task:
             "status": self.status.value,
             "priority": self.priority,
             "task_type": self.task_type,
+            "execution_mode": self.execution_mode.value,
             "created_at": self.created_at.isoformat(),
             "started_at": self.started_at.isoformat() if self.started_at else None,
             "completed_at": self.completed_at.isoformat() if self.completed_at else None,
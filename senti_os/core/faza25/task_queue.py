@@ -2,15 +2,19 @@
 FAZA 25 - Orchestration Execution Engine
 Priority Task Queue
 
-Thread-safe priority queue implementation using heapq.
+Thread-safe priority queue implementation using an indexed heap.
 Higher priority tasks are executed first.
+Consumers wait on a condition (threads) or on waiter futures woken by
+put() (coroutines, on any event loop) instead of polling.
 """
 
 import asyncio
-import heapq
 import threading
-from typing import Optional
+import time
+from collections import deque
+from typing import Any, Dict, Optional
 
+from senti_core_module.senti_queue import IndexedPriorityQueue, aging_key
 from senti_os.core.faza25.task_model import Task, TaskStatus
 
 
@@ -18,15 +22,31 @@ class PriorityTaskQueue:
     """
     Thread-safe priority queue for tasks.
 
-    Uses heapq to maintain priority ordering.
+    Uses an IndexedPriorityQueue to maintain priority ordering, so
+    remove_task / update_priority / get_task are O(log n) or O(1).
     Higher priority values (e.g., 10) are executed before lower values (e.g., 1).
+    Same-priority tasks run FIFO.
+
+    With aging_interval set, a waiting task gains one priority level per
+    aging_interval seconds (virtual clock, entries are never rewritten).
     """
 
-    def __init__(self):
-        self._heap = []
+    def __init__(self, aging_interval: Optional[float] = None):
+        """
+        Initialize queue.
+
+        Args:
+            aging_interval: Seconds of waiting worth one priority level
+                (None = no aging)
+        """
+        self.aging_interval = aging_interval
+        self._queue: IndexedPriorityQueue[Task] = IndexedPriorityQueue()
+        self._enqueued_at: Dict[str, float] = {}
         self._lock = threading.Lock()
-        self._condition = asyncio.Condition()
-        self._counter = 0  # Tie-breaker for tasks with same priority
+        self._not_empty = threading.Condition(self._lock)
+
+        # Coroutines blocked in get(): (loop, future), oldest first
+        self._async_waiters: deque = deque()
 
     def put(self, task: Task) -> None:
         """
@@ -37,11 +57,58 @@ class PriorityTaskQueue:
             task: Task to add to queue
         """
         with self._lock:
-            # heapq is a min-heap, but we want max priority first
-            # Task.__lt__ handles priority inversion
-            # Counter ensures FIFO for same-priority tasks
-            heapq.heappush(self._heap, (task, self._counter))
-            self._counter += 1
+            self._enqueued_at[task.id] = time.monotonic()
+            self._queue.push(task.id, task, self._key(task), group=task.priority)
+            self._not_empty.notify()
+            waiter = self._async_waiters.popleft() if self._async_waiters else None
+
+        if waiter is not None:
+            self._wake(waiter)
+
+    def _key(self, task: Task) -> Any:
+        """Heap key: smallest first, so priority is negated."""
+        if self.aging_interval is None:
+            return -task.priority
+        return aging_key(-task.priority, self._enqueued_at[task.id], self.aging_interval)
+
+    def _pop(self) -> Optional[Task]:
+        """Pop the next task (caller holds the lock)."""
+        popped = self._queue.pop()
+        if popped is None:
+            return None
+        task_id, task = popped
+        self._enqueued_at.pop(task_id, None)
+        return task
+
+    def _wake(self, waiter) -> None:
+        """
+        Resolve an async waiter's future on its own loop.
+
+        Args:
+            waiter: (loop, future) pair from _async_waiters
+        """
+        loop, future = waiter
+
+        def resolve():
+            if future.done():
+                # Waiter was cancelled meanwhile: pass the wakeup on
+                self._wake_next()
+            else:
+                future.set_result(None)
+
+        try:
+            loop.call_soon_threadsafe(resolve)
+        except RuntimeError:
+            # Loop closed: pass the wakeup on
+            self._wake_next()
+
+    def _wake_next(self) -> None:
+        """Wake the next async waiter if a task is still queued."""
+        with self._lock:
+            if not self._queue or not self._async_waiters:
+                return
+            waiter = self._async_waiters.popleft()
+        self._wake(waiter)
 
     def get_nowait(self) -> Optional[Task]:
         """
@@ -52,25 +119,51 @@ class PriorityTaskQueue:
             Highest priority task or None if queue is empty
         """
         with self._lock:
-            if not self._heap:
-                return None
-            task, _ = heapq.heappop(self._heap)
-            return task
+            return self._pop()
 
     async def get(self) -> Task:
         """
         Get highest priority task from queue.
-        Waits asynchronously if queue is empty.
+        Waits asynchronously if queue is empty; put() wakes one waiter.
 
         Returns:
             Highest priority task
         """
+        loop = asyncio.get_running_loop()
         while True:
-            task = self.get_nowait()
-            if task is not None:
-                return task
-            # Wait a bit before checking again
-            await asyncio.sleep(0.1)
+            with self._lock:
+                if self._queue:
+                    return self._pop()
+                # Registered under the lock: a put() after this point
+                # sees the waiter, so no wakeup is lost
+                waiter = (loop, loop.create_future())
+                self._async_waiters.append(waiter)
+
+            try:
+                await waiter[1]
+            except asyncio.CancelledError:
+                with self._lock:
+                    try:
+                        self._async_waiters.remove(waiter)
+                    except ValueError:
+                        # Already picked by put(): resolve() passes it on
+                        pass
+                raise
+
+    def get_blocking(self, timeout: Optional[float] = None) -> Optional[Task]:
+        """
+        Get highest priority task, blocking the calling thread.
+
+        Args:
+            timeout: Maximum wait time in seconds (None = no limit)
+
+        Returns:
+            Highest priority task or None on timeout
+        """
+        with self._not_empty:
+            if not self._not_empty.wait_for(lambda: len(self._queue), timeout):
+                return None
+            return self._pop()
 
     def size(self) -> int:
         """
@@ -81,7 +174,7 @@ class PriorityTaskQueue:
             Number of tasks in queue
         """
         with self._lock:
-            return len(self._heap)
+            return len(self._queue)
 
     def is_empty(self) -> bool:
         """
@@ -92,12 +185,12 @@ class PriorityTaskQueue:
             True if queue is empty
         """
         with self._lock:
-            return len(self._heap) == 0
+            return len(self._queue) == 0
 
     def remove_task(self, task_id: str) -> bool:
         """
         Remove a task from the queue by ID.
-        Thread-safe operation.
+        Thread-safe operation, O(log n).
 
         Args:
             task_id: ID of task to remove
@@ -106,15 +199,75 @@ class PriorityTaskQueue:
             True if task was found and removed, False otherwise
         """
         with self._lock:
-            for i, (task, counter) in enumerate(self._heap):
-                if task.id == task_id:
-                    # Mark task as cancelled
-                    task.mark_cancelled()
-                    # Remove from heap and re-heapify
-                    self._heap.pop(i)
-                    heapq.heapify(self._heap)
-                    return True
-            return False
+            task = self._queue.remove(task_id)
+            if task is None:
+                return False
+            self._enqueued_at.pop(task_id, None)
+            # Mark task as cancelled
+            task.mark_cancelled()
+            return True
+
+    def update_priority(self, task_id: str, priority: int) -> bool:
+        """
+        Change the priority of a queued task.
+        Thread-safe operation, O(log n).
+
+        Args:
+            task_id: ID of task
+            priority: New priority (0-10, higher = more important)
+
+        Returns:
+            True if updated, False if task is not queued
+        """
+        with self._lock:
+            task = self._queue.get(task_id)
+            if task is None:
+                return False
+            task.priority = priority
+            return self._queue.update(task_id, self._key(task), group=priority)
+
+    def get_task(self, task_id: str) -> Optional[Task]:
+        """
+        Get a queued task by ID.
+        Thread-safe operation, O(1).
+
+        Args:
+            task_id: ID of task
+
+        Returns:
+            Task or None if not queued
+        """
+        with self._lock:
+            return self._queue.get(task_id)
+
+    def get_position(self, task_id: str) -> Optional[int]:
+        """
+        Get the position a queued task will be dequeued at (0 = next).
+        Thread-safe operation, O(n).
+
+        Args:
+            task_id: ID of task
+
+        Returns:
+            Position or None if task is not queued
+        """
+        with self._lock:
+            return self._queue.rank(task_id)
+
+    def get_statistics(self) -> Dict[str, Any]:
+        """
+        Get queue statistics.
+        Thread-safe operation, O(priority levels).
+
+        Returns:
+            Dictionary with queue size and task count per priority
+        """
+        with self._lock:
+            return {
+                "size": len(self._queue),
+                "tasks_by_priority": dict(sorted(self._queue.group_counts().items(), reverse=True)),
+                "aging_interval": self.aging_interval
+            }
 
     def get_all_tasks(self) -> list[Task]:
         """
@@ -125,7 +278,7 @@ class PriorityTaskQueue:
             List of all tasks in queue
         """
         with self._lock:
-            return [task for task, _ in self._heap]
+            return list(self._queue.items())
 
     def clear(self) -> None:
         """
@@ -134,8 +287,8 @@ class PriorityTaskQueue:
         """
         with self._lock:
             # Mark all tasks as cancelled
-            for task, _ in self._heap:
+            for task in self._queue.items():
                 if task.status == TaskStatus.QUEUED:
                     task.mark_cancelled()
-            self._heap.clear()
-            self._counter = 0
+            self._queue.clear()
+            self._enqueued_at.clear()
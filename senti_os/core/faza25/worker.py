@@ -3,13 +3,19 @@ FAZA 25 - Orchestration Execution Engine
 Task Workers
 
 Asynchronous worker implementation for task execution.
+Tasks run on the execution backend selected by Task.execution_mode.
 """
 
 import asyncio
 import logging
-from typing import Optional
-
-from senti_os.core.faza25.task_model import Task, TaskStatus
+from typing import Dict, Optional, Set
+
+from senti_os.core.faza25.backends import (
+    AsyncioBackend,
+    ExecutionBackend,
+    create_default_backends
+)
+from senti_os.core.faza25.task_model import ExecutionMode, Task, TaskStatus
 from senti_os.core.faza25.task_queue import PriorityTaskQueue
 
 
@@ -21,22 +27,32 @@ class TaskWorker:
     Asynchronous task worker that processes tasks from the priority queue.
 
     Each worker runs in its own asyncio task and continuously processes
-    tasks from the queue until stopped.
+    tasks from the queue until stopped. ASYNCIO tasks are awaited by the
+    worker itself; thread/process tasks are dispatched once their backend
+    has a free slot, and the worker moves on to the next task.
     """
 
-    def __init__(self, worker_id: int, task_queue: PriorityTaskQueue):
+    def __init__(
+        self,
+        worker_id: int,
+        task_queue: PriorityTaskQueue,
+        backends: Optional[Dict[ExecutionMode, ExecutionBackend]] = None
+    ):
         """
         Initialize worker.
 
         Args:
             worker_id: Unique identifier for this worker
             task_queue: Priority queue to get tasks from
+            backends: Execution backends by mode (default: asyncio only)
         """
         self.worker_id = worker_id
         self.task_queue = task_queue
+        self.backends = backends or {ExecutionMode.ASYNCIO: AsyncioBackend()}
         self.is_running = False
         self.current_task: Optional[Task] = None
         self._task_handle: Optional[asyncio.Task] = None
+        self._dispatched: Set[asyncio.Task] = set()
 
     async def start(self) -> None:
         """
@@ -61,13 +77,14 @@ class TaskWorker:
 
         self.is_running = False
 
+        handles = list(self._dispatched)
         if self._task_handle and not self._task_handle.done():
-            # Cancel the worker task
-            self._task_handle.cancel()
-            try:
-                await self._task_handle
-            except asyncio.CancelledError:
-                pass
+            handles.append(self._task_handle)
+
+        # Cancel the worker task and tasks dispatched to pool backends
+        for handle in handles:
+            handle.cancel()
+        await asyncio.gather(*handles, return_exceptions=True)
 
         logger.info(f"Worker {self.worker_id} stopped")
 
@@ -88,8 +105,7 @@ class TaskWorker:
                     logger.info(f"Worker {self.worker_id}: Task {task.id} was cancelled")
                     continue
 
-                # Execute the task
-                await self._execute_task(task)
+                await self._dispatch(task)
 
             except asyncio.CancelledError:
                 logger.info(f"Worker {self.worker_id} was cancelled")
@@ -98,15 +114,50 @@ class TaskWorker:
                 logger.error(f"Worker {self.worker_id} loop error: {e}", exc_info=True)
                 await asyncio.sleep(1)  # Prevent tight error loop
 
-    async def _execute_task(self, task: Task) -> None:
+    async def _dispatch(self, task: Task) -> None:
         """
-        Execute a single task.
+        Route a task to its execution backend.
 
         Args:
             task: Task to execute
         """
-        self.current_task = task
+        backend = self.backends.get(task.execution_mode)
+        if backend is None:
+            task.mark_error(f"No backend for execution mode '{task.execution_mode.value}'")
+            logger.error(f"Worker {self.worker_id}: Task {task.id} has no backend")
+            return
+
+        if backend.inline:
+            self.current_task = task
+            try:
+                await self._execute_task(task, backend)
+            finally:
+                self.current_task = None
+            return
+
+        # Wait for a pool slot (backpressure keeps the rest in the queue)
+        try:
+            await backend.acquire()
+        except asyncio.CancelledError:
+            task.mark_cancelled()
+            raise
+        handle = asyncio.create_task(self._execute_task(task, backend))
+        self._dispatched.add(handle)
+
+        def on_done(finished: asyncio.Task) -> None:
+            self._dispatched.discard(finished)
+            backend.release()
+
+        handle.add_done_callback(on_done)
+
+    async def _execute_task(self, task: Task, backend: ExecutionBackend) -> None:
+        """
+        Execute a single task.
 
+        Args:
+            task: Task to execute
+            backend: Backend that runs the executor
+        """
         try:
             logger.info(f"Worker {self.worker_id}: Starting task {task.id} ({task.name})")
 
@@ -114,7 +165,7 @@ class TaskWorker:
             task.mark_running()
 
             # Execute the task
-            result = await task.run()
+            result = await backend.run(task)
 
             # Mark task as done
             task.mark_done(result)
@@ -133,9 +184,6 @@ class TaskWorker:
             task.mark_error(error_msg)
             logger.error(f"Worker {self.worker_id}: Task {task.id} failed: {error_msg}", exc_info=True)
 
-        finally:
-            self.current_task = None
-
     def get_status(self) -> dict:
         """
         Get current worker status.
@@ -146,26 +194,35 @@ class TaskWorker:
         return {
             "worker_id": self.worker_id,
             "is_running": self.is_running,
-            "current_task": self.current_task.to_dict() if self.current_task else None
+            "current_task": self.current_task.to_dict() if self.current_task else None,
+            "dispatched_tasks": len(self._dispatched)
         }
 
 
 class WorkerPool:
     """
     Pool of task workers.
-    Manages multiple workers and their lifecycle.
+    Manages multiple workers, their execution backends and lifecycle.
     """
 
-    def __init__(self, num_workers: int, task_queue: PriorityTaskQueue):
+    def __init__(
+        self,
+        num_workers: int,
+        task_queue: PriorityTaskQueue,
+        backends: Optional[Dict[ExecutionMode, ExecutionBackend]] = None
+    ):
         """
         Initialize worker pool.
 
         Args:
             num_workers: Number of workers to create
             task_queue: Priority queue for tasks
+            backends: Execution backends by mode (default: asyncio, thread
+                and process pools, see create_default_backends)
         """
         self.num_workers = num_workers
         self.task_queue = task_queue
+        self.backends = backends or create_default_backends(num_workers)
         self.workers: list[TaskWorker] = []
 
     async def start(self) -> None:
@@ -174,8 +231,14 @@ class WorkerPool:
         """
         logger.info(f"Starting worker pool with {self.num_workers} workers")
 
+        for backend in self.backends.values():
+            if backend.inline:
+                # Inline backends run one task per worker
+                backend.max_workers = self.num_workers
+            backend.start()
+
         for i in range(self.num_workers):
-            worker = TaskWorker(worker_id=i, task_queue=self.task_queue)
+            worker = TaskWorker(worker_id=i, task_queue=self.task_queue, backends=self.backends)
             await worker.start()
             self.workers.append(worker)
 
@@ -191,6 +254,8 @@ class WorkerPool:
         await asyncio.gather(*stop_tasks, return_exceptions=True)
 
         self.workers.clear()
+        for backend in self.backends.values():
+            backend.shutdown()
         logger.info("Worker pool stopped")
 
     def get_status(self) -> dict:
@@ -198,9 +263,13 @@ class WorkerPool:
         Get status of all workers.
 
         Returns:
-            Dictionary with worker pool status
+            Dictionary with worker pool and per-backend status
         """
         return {
             "num_workers": len(self.workers),
-            "workers": [worker.get_status() for worker in self.workers]
+            "workers": [worker.get_status() for worker in self.workers],
+            "backends": {
+                mode.value: backend.get_status()
+                for mode, backend in self.backends.items()
+            }
         }
@@ -4,12 +4,25 @@ Graph Analyzer
 
 Advanced graph analysis including cycle detection, bottleneck identification,
 influence ranking, parallelization analysis, and health scoring.
+
+Results are cached per graph version (TaskGraph.version). Node levels and
+earliest start times (critical path) are kept up to date incrementally:
+after a mutation only the changed nodes and their descendants whose values
+actually change are recomputed, in topological order. Large graphs use a
+NumPy path (CSR adjacency) for full level and influence computations when
+NumPy is installed.
 """
 
+import heapq
 import logging
-from typing import Dict, List, Set, Tuple, Any, Optional
+from typing import Callable, Dict, List, Set, Tuple, Any, Optional
 from collections import defaultdict, deque
 
+try:
+    import numpy as np
+except ImportError:  # Optional: pure-Python fallback
+    np = None
+
 from senti_os.core.faza27.task_graph import TaskGraph
 from senti_os.core.faza27.task_node import TaskNode, NodeStatus
 from senti_os.core.faza27.task_edge import TaskEdge, EdgeType
@@ -23,17 +36,269 @@ class GraphAnalyzer:
 
     Provides cycle detection, bottleneck identification, influence ranking,
     parallelization analysis, and comprehensive health scoring.
+
+    Structural changes are tracked through the graph version. Node cost
+    models are not versioned: call clear_cache() after changing durations
+    or costs of nodes already in the graph.
     """
 
-    def __init__(self, graph: TaskGraph):
+    NUMPY_MIN_NODES = 500  # Below this the pure-Python path is faster
+
+    def __init__(self, graph: TaskGraph, use_numpy: Optional[bool] = None):
         """
         Initialize analyzer with graph.
 
         Args:
             graph: TaskGraph to analyze
+            use_numpy: Force (True) or disable (False) the NumPy path;
+                None uses it for graphs of NUMPY_MIN_NODES nodes or more
         """
+        if use_numpy and np is None:
+            raise ImportError("NumPy is required for use_numpy=True")
+
         self.graph = graph
-        self._analysis_cache: Dict[str, Any] = {}
+        self.use_numpy = use_numpy
+        self._analysis_cache: Dict[Any, Any] = {}
+        self._cache_version = graph.version
+
+        # Incrementally maintained longest paths (None = full recompute)
+        self._levels: Optional[Dict[str, int]] = None
+        self._starts: Optional[Dict[str, float]] = None
+        self._dirty: Set[str] = set()
+
+    # ==================== Cache ====================
+
+    def _sync(self) -> None:
+        """Drop results of older graph versions and collect changed nodes"""
+        version = self.graph.version
+        if version == self._cache_version:
+            return
+
+        self._analysis_cache.clear()
+        if self._levels is not None:
+            changed = self.graph.changes_since(self._cache_version)
+            if changed is None:
+                self._levels = self._starts = None
+                self._dirty.clear()
+            else:
+                self._dirty.update(changed)
+        self._cache_version = version
+
+    def _cached(self, key: Any, compute: Callable[[], Any]) -> Any:
+        """Return the result for key at the current graph version"""
+        self._sync()
+        if key not in self._analysis_cache:
+            self._analysis_cache[key] = compute()
+        return self._analysis_cache[key]
+
+    def _numpy_enabled(self) -> bool:
+        if self.use_numpy is not None:
+            return self.use_numpy
+        return np is not None and len(self.graph.nodes) >= self.NUMPY_MIN_NODES
+
+    # ==================== Levels & Critical Path ====================
+
+    def get_node_levels(self) -> Dict[str, int]:
+        """
+        Topological level of each node (0 = root level).
+
+        Returns:
+            Dict mapping node_id to level
+
+        Raises:
+            ValueError: If graph contains cycle
+        """
+        self._update_paths()
+        return dict(self._levels)
+
+    def get_critical_path(self) -> Tuple[List[str], float]:
+        """
+        Critical path (longest path by estimated duration).
+
+        Returns:
+            Tuple of (node_ids in critical path, total duration)
+
+        Raises:
+            ValueError: If graph contains cycle
+        """
+        return self._cached("critical_path", self._compute_critical_path)
+
+    def _compute_critical_path(self) -> Tuple[List[str], float]:
+        self._update_paths()
+        nodes = self.graph.nodes
+        starts = self._starts
+
+        # Find node with maximum finish time
+        max_finish = 0
+        end_node = None
+        for node_id, node in nodes.items():
+            finish_time = starts[node_id] + node.cost_model.estimated_duration
+            if finish_time > max_finish:
+                max_finish = finish_time
+                end_node = node_id
+
+        # Backtrack through the dependency that finishes last
+        path = []
+        current = end_node
+        while current is not None:
+            path.append(current)
+            nodes[current].critical_path = True
+            best_finish = 0
+            predecessor = None
+            for dep in self.graph._rev_adj_list.get(current, ()):
+                finish_time = starts[dep] + nodes[dep].cost_model.estimated_duration
+                if finish_time > best_finish:
+                    best_finish = finish_time
+                    predecessor = dep
+            current = predecessor
+
+        path.reverse()
+        return path, max_finish
+
+    def _update_paths(self) -> None:
+        """Bring levels and earliest start times up to date"""
+        self._sync()
+        if self._levels is not None and not self._dirty:
+            return
+
+        # Incremental update needs the graph's online topological order
+        if self._levels is not None and self.graph._ord is not None:
+            self._propagate_paths(self._dirty)
+        elif self._numpy_enabled():
+            self._levels, self._starts = self._compute_paths_numpy()
+        else:
+            self._levels, self._starts = self._compute_paths()
+        self._dirty.clear()
+
+    def _compute_paths(self) -> Tuple[Dict[str, int], Dict[str, float]]:
+        """Levels and earliest start times in topological order (O(V+E))"""
+        nodes = self.graph.nodes
+        levels: Dict[str, int] = {}
+        starts: Dict[str, float] = {}
+
+        for node_id in self.graph.topological_sort():
+            level = 0
+            start = 0
+            for dep in self.graph._rev_adj_list.get(node_id, ()):
+                if levels[dep] + 1 > level:
+                    level = levels[dep] + 1
+                finish_time = starts[dep] + nodes[dep].cost_model.estimated_duration
+                if finish_time > start:
+                    start = finish_time
+            levels[node_id] = level
+            starts[node_id] = start
+            nodes[node_id].level = level
+
+        return levels, starts
+
+    def _propagate_paths(self, changed: Set[str]) -> None:
+        """
+        Recompute levels and start times of changed nodes and, while
+        values change, their dependents (each node at most once).
+
+        Args:
+            changed: Node ids added, removed or with changed dependencies
+        """
+        graph = self.graph
+        nodes = graph.nodes
+        order = graph._ord
+        levels, starts = self._levels, self._starts
+
+        heap = []
+        for node_id in changed:
+            if node_id in nodes:
+                heap.append((order[node_id], node_id))
+            else:
+                levels.pop(node_id, None)
+                starts.pop(node_id, None)
+        heapq.heapify(heap)
+        queued = {node_id for _, node_id in heap}
+
+        # Min-ord first: all changed dependencies of a node are final
+        # before the node itself is recomputed
+        while heap:
+            _, node_id = heapq.heappop(heap)
+            level = 0
+            start = 0
+            for dep in graph._rev_adj_list.get(node_id, ()):
+                if levels[dep] + 1 > level:
+                    level = levels[dep] + 1
+                finish_time = starts[dep] + nodes[dep].cost_model.estimated_duration
+                if finish_time > start:
+                    start = finish_time
+
+            if levels.get(node_id) == level and starts.get(node_id) == start:
+                continue
+            levels[node_id] = level
+            starts[node_id] = start
+            nodes[node_id].level = level
+
+            for dependent in graph._adj_list.get(node_id, ()):
+                if dependent not in queued:
+                    queued.add(dependent)
+                    heapq.heappush(heap, (order[dependent], dependent))
+
+    def _csr_adjacency(self) -> Tuple[List[str], Any, Any]:
+        """
+        Outgoing adjacency as CSR arrays.
+
+        Returns:
+            Tuple of (node ids, indptr, indices); the dependents of node i
+            are indices[indptr[i]:indptr[i + 1]]
+        """
+        node_ids = list(self.graph.nodes)
+        index = {node_id: i for i, node_id in enumerate(node_ids)}
+        adj = self.graph._adj_list
+
+        counts = np.fromiter((len(adj.get(node_id, ())) for node_id in node_ids),
+                             dtype=np.int64, count=len(node_ids))
+        indptr = np.zeros(len(node_ids) + 1, dtype=np.int64)
+        np.cumsum(counts, out=indptr[1:])
+        indices = np.fromiter((index[t] for node_id in node_ids for t in adj.get(node_id, ())),
+                              dtype=np.int64, count=int(indptr[-1]))
+        return node_ids, indptr, indices
+
+    def _compute_paths_numpy(self) -> Tuple[Dict[str, int], Dict[str, float]]:
+        """Levels and earliest start times, one vectorized step per level"""
+        nodes = self.graph.nodes
+        node_ids, indptr, indices = self._csr_adjacency()
+        n = len(node_ids)
+
+        durations = np.fromiter((nodes[node_id].cost_model.estimated_duration for node_id in node_ids),
+                                dtype=np.float64, count=n)
+        in_degree = np.bincount(indices, minlength=n)
+        levels = np.zeros(n, dtype=np.int64)
+        starts = np.zeros(n, dtype=np.float64)
+
+        # Kahn by frontier: a node enters the frontier once all its
+        # dependencies are done, i.e. at its level
+        frontier = np.flatnonzero(in_degree == 0)
+        level = 0
+        processed = 0
+        while frontier.size:
+            processed += frontier.size
+            levels[frontier] = level
+
+            counts = indptr[frontier + 1] - indptr[frontier]
+            total = int(counts.sum())
+            if total == 0:
+                break
+            sources = np.repeat(frontier, counts)
+            offsets = np.arange(total) - np.repeat(np.cumsum(counts) - counts, counts)
+            targets = indices[np.repeat(indptr[frontier], counts) + offsets]
+
+            np.maximum.at(starts, targets, starts[sources] + durations[sources])
+            np.subtract.at(in_degree, targets, 1)
+            frontier = np.unique(targets[in_degree[targets] == 0])
+            level += 1
+
+        if processed < n:
+            raise ValueError("Graph contains cycle, cannot perform topological sort")
+
+        level_map = dict(zip(node_ids, levels.tolist()))
+        for node_id, node_level in level_map.items():
+            nodes[node_id].level = node_level
+        return level_map, dict(zip(node_ids, starts.tolist()))
 
     # ==================== Cycle Analysis ====================
 
@@ -44,8 +309,13 @@ class GraphAnalyzer:
         Returns:
             List of cycles, each cycle is list of node IDs
         """
-        if "cycles" in self._analysis_cache:
-            return self._analysis_cache["cycles"]
+        return self._cached("cycles", self._find_all_cycles)
+
+    def _find_all_cycles(self) -> List[List[str]]:
+        # The graph keeps a topological order exactly while it is acyclic
+        if self.graph._ord is not None:
+            logger.info("Found 0 cycles in graph")
+            return []
 
         cycles = []
         visited = set()
@@ -73,7 +343,6 @@ class GraphAnalyzer:
             if node_id not in visited:
                 dfs(node_id)
 
-        self._analysis_cache["cycles"] = cycles
         logger.info(f"Found {len(cycles)} cycles in graph")
         return cycles
 
@@ -102,6 +371,9 @@ class GraphAnalyzer:
         Returns:
             List of bottleneck info dicts
         """
+        return self._cached(("bottlenecks", threshold), lambda: self._find_bottlenecks(threshold))
+
+    def _find_bottlenecks(self, threshold: int) -> List[Dict[str, Any]]:
         bottlenecks = []
 
         for node in self.graph.get_all_nodes():
@@ -129,7 +401,7 @@ class GraphAnalyzer:
         Returns:
             List of node IDs on critical path
         """
-        critical_path, _ = self.graph.calculate_critical_path()
+        critical_path, _ = self.get_critical_path()
         return critical_path
 
     def calculate_node_criticality(self) -> Dict[str, float]:
@@ -144,6 +416,9 @@ class GraphAnalyzer:
         Returns:
             Dict mapping node_id to criticality score
         """
+        return self._cached("criticality", self._calculate_node_criticality)
+
+    def _calculate_node_criticality(self) -> Dict[str, float]:
         criticality = {}
         critical_nodes = set(self.find_critical_nodes())
         max_dependents = max(len(n.dependents) for n in self.graph.get_all_nodes()) or 1
@@ -179,50 +454,83 @@ class GraphAnalyzer:
         Returns:
             Dict mapping node_id to influence score
         """
-        if "influence" in self._analysis_cache:
-            return self._analysis_cache["influence"]
+        return self._cached(
+            ("influence", iterations, damping),
+            lambda: self._calculate_influence_scores(iterations, damping)
+        )
 
+    def _calculate_influence_scores(self, iterations: int, damping: float) -> Dict[str, float]:
         nodes = list(self.graph.nodes.keys())
         n = len(nodes)
         if n == 0:
             return {}
 
+        if self._numpy_enabled():
+            scores = self._influence_numpy(iterations, damping)
+        else:
+            scores = self._influence_python(nodes, iterations, damping)
+
+        # Normalize to 0-1 range
+        max_score = max(scores.values()) if scores else 1.0
+        if max_score > 0:
+            scores = {k: v / max_score for k, v in scores.items()}
+
+        # Update node objects
+        for node_id, score in scores.items():
+            self.graph.nodes[node_id].influence_score = score
+
+        logger.info("Calculated influence scores for all nodes")
+        return scores
+
+    def _influence_python(self, nodes: List[str], iterations: int, damping: float) -> Dict[str, float]:
+        n = len(nodes)
+
         # Initialize scores
         scores = {node_id: 1.0 / n for node_id in nodes}
 
-        # Build reverse adjacency (who points to me)
-        incoming: Dict[str, Set[str]] = defaultdict(set)
-        outgoing_count: Dict[str, int] = defaultdict(int)
-
-        for edge in self.graph.edges:
-            incoming[edge.target_id].add(edge.source_id)
-            outgoing_count[edge.source_id] += 1
+        # Reverse adjacency (who points to me) and outgoing edge counts
+        incoming = self.graph._rev_adj_list
+        outgoing_count = self._outgoing_edge_counts()
 
         # PageRank iterations
         for _ in range(iterations):
             new_scores = {}
             for node_id in nodes:
                 rank_sum = 0.0
-                for source in incoming[node_id]:
-                    if outgoing_count[source] > 0:
+                for source in incoming.get(node_id, ()):
+                    if outgoing_count.get(source, 0) > 0:
                         rank_sum += scores[source] / outgoing_count[source]
 
                 new_scores[node_id] = (1 - damping) / n + damping * rank_sum
 
             scores = new_scores
 
-        # Normalize to 0-1 range
-        max_score = max(scores.values()) if scores else 1.0
-        if max_score > 0:
-            scores = {k: v / max_score for k, v in scores.items()}
+        return scores
 
-        # Update node objects
-        for node_id, score in scores.items():
-            self.graph.nodes[node_id].influence_score = score
+    def _influence_numpy(self, iterations: int, damping: float) -> Dict[str, float]:
+        node_ids, indptr, indices = self._csr_adjacency()
+        n = len(node_ids)
 
-        self._analysis_cache["influence"] = scores
-        logger.info("Calculated influence scores for all nodes")
-        return scores
+        # Each edge (source -> target) passes score / out-edge count
+        out_count = self._outgoing_edge_counts()
+        weights = np.fromiter((1.0 / out_count[node_id] if out_count.get(node_id) else 0.0
+                               for node_id in node_ids), dtype=np.float64, count=n)
+        sources = np.repeat(np.arange(n), np.diff(indptr))
+
+        scores = np.full(n, 1.0 / n)
+        for _ in range(iterations):
+            rank_sum = np.bincount(indices, weights=(scores * weights)[sources], minlength=n)
+            scores = (1 - damping) / n + damping * rank_sum
+
+        return dict(zip(node_ids, scores.tolist()))
+
+    def _outgoing_edge_counts(self) -> Dict[str, int]:
+        """Number of edges leaving each node (parallel edges count)"""
+        return {
+            node_id: sum(len(edges) for edges in targets.values())
+            for node_id, targets in self.graph._out_edges.items()
+            if targets
+        }
 
     def find_most_influential_nodes(self, top_n: int = 5) -> List[Tuple[str, float]]:
         """
@@ -252,7 +560,11 @@ class GraphAnalyzer:
         if len(self.graph.nodes) == 0:
             return 0.0
 
-        levels = self.graph.calculate_node_levels()
+        return self._cached("parallelization_index", self._calculate_parallelization_index)
+
+    def _calculate_parallelization_index(self) -> float:
+        self._update_paths()
+        levels = self._levels
         max_level = max(levels.values()) + 1 if levels else 1
 
         # Count nodes per level
@@ -276,7 +588,8 @@ class GraphAnalyzer:
         Returns:
             Dict mapping level to list of node IDs
         """
-        levels = self.graph.calculate_node_levels()
+        self._update_paths()
+        levels = self._levels
         stages: Dict[int, List[str]] = defaultdict(list)
 
         for node_id, level in levels.items():
@@ -321,6 +634,9 @@ class GraphAnalyzer:
         Returns:
             Health report with score (0-100) and details
         """
+        return self._cached("health", self._calculate_graph_health)
+
+    def _calculate_graph_health(self) -> Dict[str, Any]:
         health_score = 100.0
         issues = []
 
@@ -369,6 +685,9 @@ class GraphAnalyzer:
         Returns:
             Quality report with various metrics
         """
+        return self._cached("quality", self._check_graph_quality)
+
+    def _check_graph_quality(self) -> Dict[str, Any]:
         nodes = self.graph.get_all_nodes()
         edges = self.graph.edges
 
@@ -422,7 +741,7 @@ class GraphAnalyzer:
             total_io += cm.io_operations
 
         # Calculate critical path duration
-        _, critical_duration = self.graph.calculate_critical_path()
+        _, critical_duration = self.get_critical_path()
 
         return {
             "total_duration_sequential": round(total_duration, 2),
@@ -554,18 +873,21 @@ class GraphAnalyzer:
         return report
 
     def clear_cache(self) -> None:
-        """Clear analysis cache"""
+        """Clear analysis cache (forces full recomputation)"""
         self._analysis_cache.clear()
+        self._levels = self._starts = None
+        self._dirty.clear()
 
 
-def create_graph_analyzer(graph: TaskGraph) -> GraphAnalyzer:
+def create_graph_analyzer(graph: TaskGraph, use_numpy: Optional[bool] = None) -> GraphAnalyzer:
     """
     Factory function to create GraphAnalyzer instance.
 
     Args:
         graph: TaskGraph to analyze
+        use_numpy: Force or disable the NumPy path (None = automatic)
 
     Returns:
         GraphAnalyzer instance
     """
-    return GraphAnalyzer(graph)
+    return GraphAnalyzer(graph, use_numpy)
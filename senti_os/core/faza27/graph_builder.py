@@ -157,13 +157,14 @@ class GraphBuilder:
 
         # Add dependencies based on order (sequential pipeline)
         if detect_dependencies and len(tasks) > 1:
-            for i in range(len(tasks) - 1):
-                edge = TaskEdge(
+            graph.add_edges(
+                TaskEdge(
                     source_id=tasks[i].id,
                     target_id=tasks[i + 1].id,
                     edge_type=EdgeType.DEPENDENCY
                 )
-                graph.add_edge(edge)
+                for i in range(len(tasks) - 1)
+            )
 
         logger.info(f"Converted {len(tasks)} FAZA 25 tasks to TaskGraph with {len(graph.edges)} edges")
         return graph
@@ -284,13 +285,14 @@ class GraphBuilder:
             graph.add_node(node)
 
         # Create sequential edges
-        for i in range(len(node_ids) - 1):
-            edge = TaskEdge(
+        graph.add_edges(
+            TaskEdge(
                 source_id=node_ids[i],
                 target_id=node_ids[i + 1],
                 edge_type=EdgeType.DEPENDENCY
             )
-            graph.add_edge(edge)
+            for i in range(len(node_ids) - 1)
+        )
 
         logger.info(f"Created sequential TaskGraph with {len(node_ids)} nodes")
         return graph
@@ -335,21 +337,22 @@ class GraphBuilder:
                 new_node.status = node.status
                 merged.add_node(new_node)
 
-        # Add all edges
+        # Add all edges (one acyclicity check for the whole merge)
+        new_edges = []
         for graph in graphs:
             for edge in graph.edges:
                 source_id = f"{graph.graph_id}_{edge.source_id}"
                 target_id = f"{graph.graph_id}_{edge.target_id}"
 
-                new_edge = TaskEdge(
+                new_edges.append(TaskEdge(
                     source_id=source_id,
                     target_id=target_id,
                     edge_type=edge.edge_type,
                     weight=edge.weight,
                     constraints=edge.constraints.copy(),
                     metadata=edge.metadata.copy()
-                )
-                merged.add_edge(new_edge)
+                ))
+        merged.add_edges(new_edges)
 
         logger.info(f"Merged {len(graphs)} graphs into {merged_graph_id}")
         return merged
@@ -4,10 +4,21 @@ Task Graph
 
 Main graph structure with nodes, edges, and graph operations.
 Provides DAG validation, topological sorting, and critical path analysis.
+
+Cycle detection is incremental: a topological order of all nodes is
+maintained online (Pearce-Kelly). An edge that agrees with the order is
+accepted in O(1); otherwise only the nodes between target and source in
+the order are searched and reordered. add_edges() validates a whole
+batch with one O(V+E) pass, falling back to per-edge checks when the
+result has a cycle (which may run through weak edges only).
+
+Every mutation bumps graph.version and logs the nodes whose dependencies
+changed, so analyzers can cache results per version and update them
+incrementally (see changes_since()).
 """
 
 import json
-from typing import Dict, List, Set, Optional, Any, Tuple
+from typing import Dict, Iterable, List, Set, Optional, Any, Tuple
 from collections import deque, defaultdict
 
 from senti_os.core.faza27.task_node import TaskNode, NodeStatus
@@ -22,6 +33,8 @@ class TaskGraph:
     validation, and execution planning capabilities.
     """
 
+    CHANGE_LOG_SIZE = 1024  # Versions kept for incremental analysis
+
     def __init__(self, graph_id: str = "default", metadata: Optional[Dict[str, Any]] = None):
         """
         Initialize task graph.
@@ -35,17 +48,30 @@ class TaskGraph:
 
         # Graph data structures
         self.nodes: Dict[str, TaskNode] = {}
-        self.edges: List[TaskEdge] = []
+        self._edges: Dict[int, TaskEdge] = {}  # id(edge) -> edge, insertion order
+
+        # Per-node edge indexes: node_id -> neighbor_id -> edges
+        self._out_edges: Dict[str, Dict[str, List[TaskEdge]]] = defaultdict(dict)
+        self._in_edges: Dict[str, Dict[str, List[TaskEdge]]] = defaultdict(dict)
 
         # Adjacency lists (updated on edge add/remove)
         self._adj_list: Dict[str, Set[str]] = defaultdict(set)  # node_id -> dependents
         self._rev_adj_list: Dict[str, Set[str]] = defaultdict(set)  # node_id -> dependencies
 
+        # Online topological order (node_id -> position); None while the
+        # graph has a cycle through non-strong edges
+        self._ord: Optional[Dict[str, int]] = {}
+        self._next_ord = 0
+
         # Cached analysis results
         self._topological_order: Optional[List[str]] = None
         self._critical_path: Optional[List[str]] = None
         self._is_validated: bool = False
 
+        # Structure version and (version, changed node ids) log
+        self.version = 0
+        self._changes: deque = deque(maxlen=self.CHANGE_LOG_SIZE)
+
     # ==================== Node Operations ====================
 
     def add_node(self, node: TaskNode) -> None:
@@ -62,7 +88,10 @@ class TaskGraph:
             raise ValueError(f"Node {node.node_id} already exists in graph")
 
         self.nodes[node.node_id] = node
-        self._invalidate_cache()
+        if self._ord is not None:
+            self._ord[node.node_id] = self._next_ord
+            self._next_ord += 1
+        self._invalidate_cache((node.node_id,))
 
     def remove_node(self, node_id: str) -> None:
         """
@@ -77,21 +106,25 @@ class TaskGraph:
         if node_id not in self.nodes:
             raise KeyError(f"Node {node_id} not found in graph")
 
-        # Remove all edges connected to this node
-        self.edges = [e for e in self.edges if e.source_id != node_id and e.target_id != node_id]
+        # Remove all edges connected to this node (via the edge indexes)
+        for target_id in list(self._adj_list.get(node_id, ())):
+            self.remove_edge(node_id, target_id)
+        for source_id in list(self._rev_adj_list.get(node_id, ())):
+            self.remove_edge(source_id, node_id)
 
-        # Remove from adjacency lists (use pop to avoid KeyError)
+        # Remove from adjacency lists and edge indexes (use pop to avoid KeyError)
         self._adj_list.pop(node_id, None)
         self._rev_adj_list.pop(node_id, None)
-
-        for deps in self._adj_list.values():
-            deps.discard(node_id)
-        for deps in self._rev_adj_list.values():
-            deps.discard(node_id)
+        self._out_edges.pop(node_id, None)
+        self._in_edges.pop(node_id, None)
 
         # Remove node
         del self.nodes[node_id]
-        self._invalidate_cache()
+        if self._ord is not None:
+            self._ord.pop(node_id, None)
+        else:
+            self._rebuild_order()
+        self._invalidate_cache((node_id,))
 
     def get_node(self, node_id: str) -> TaskNode:
         """Get node by ID"""
@@ -109,6 +142,11 @@ class TaskGraph:
 
     # ==================== Edge Operations ====================
 
+    @property
+    def edges(self) -> List[TaskEdge]:
+        """All edges in insertion order (read-only view)"""
+        return list(self._edges.values())
+
     def add_edge(self, edge: TaskEdge) -> None:
         """
         Add edge to graph.
@@ -120,38 +158,53 @@ class TaskGraph:
             ValueError: If source or target node doesn't exist
             ValueError: If edge creates cycle
         """
-        if edge.source_id not in self.nodes:
-            raise ValueError(f"Source node {edge.source_id} not found")
-        if edge.target_id not in self.nodes:
-            raise ValueError(f"Target node {edge.target_id} not found")
-
-        # Check for self-loop
-        if edge.source_id == edge.target_id:
-            raise ValueError("Self-loops not allowed in DAG")
+        self._check_edge(edge)
+        self._link_edge(edge)
+        self._invalidate_cache((edge.target_id,))
 
-        # Add to edge list
-        self.edges.append(edge)
+    def add_edges(self, edges: Iterable[TaskEdge]) -> None:
+        """
+        Add many edges, validating acyclicity once at the end.
 
-        # Update adjacency lists
-        self._adj_list[edge.source_id].add(edge.target_id)
-        self._rev_adj_list[edge.target_id].add(edge.source_id)
+        All-or-nothing: if any edge is invalid, or a DEPENDENCY/CONSTRAINT
+        edge closes a cycle, no edge is added. Cycles through weak edges
+        only are accepted, as with add_edge().
 
-        # Update node dependencies
-        self.nodes[edge.source_id].dependents.add(edge.target_id)
-        self.nodes[edge.target_id].dependencies.add(edge.source_id)
-
-        # Check for cycles (strong dependencies only)
-        if edge.edge_type in [EdgeType.DEPENDENCY, EdgeType.CONSTRAINT]:
-            if self.has_cycle():
-                # Rollback edge addition
-                self.edges.pop()
-                self._adj_list[edge.source_id].remove(edge.target_id)
-                self._rev_adj_list[edge.target_id].remove(edge.source_id)
-                self.nodes[edge.source_id].dependents.remove(edge.target_id)
-                self.nodes[edge.target_id].dependencies.remove(edge.source_id)
-                raise ValueError(f"Adding edge {edge.source_id} -> {edge.target_id} creates cycle")
+        Args:
+            edges: TaskEdges to add
 
-        self._invalidate_cache()
+        Raises:
+            ValueError: If a source or target node doesn't exist
+            ValueError: If the edges create a cycle
+        """
+        edges = list(edges)
+        for edge in edges:
+            self._check_edge(edge)
+
+        for edge in edges:
+            self._attach_edge(edge)
+
+        strong = any(e.edge_type in [EdgeType.DEPENDENCY, EdgeType.CONSTRAINT] for e in edges)
+        if not self._rebuild_order() and strong:
+            # Some cycle exists, possibly through weak edges only: replay
+            # the batch edge by edge so only a strong edge closing a cycle
+            # is rejected
+            for edge in reversed(edges):
+                self._detach_edge(edge)
+            self._rebuild_order()
+
+            linked = []
+            try:
+                for edge in edges:
+                    self._link_edge(edge)
+                    linked.append(edge)
+            except ValueError:
+                for edge in reversed(linked):
+                    self._detach_edge(edge)
+                self._rebuild_order()
+                raise
+
+        self._invalidate_cache({edge.target_id for edge in edges})
 
     def remove_edge(self, source_id: str, target_id: str) -> None:
         """
@@ -161,8 +214,11 @@ class TaskGraph:
             source_id: Source node ID
             target_id: Target node ID
         """
-        # Remove from edge list
-        self.edges = [e for e in self.edges if not (e.source_id == source_id and e.target_id == target_id)]
+        # Remove from edge indexes
+        removed = self._out_edges.get(source_id, {}).pop(target_id, [])
+        self._in_edges.get(target_id, {}).pop(source_id, None)
+        for edge in removed:
+            del self._edges[id(edge)]
 
         # Update adjacency lists
         self._adj_list[source_id].discard(target_id)
@@ -174,52 +230,195 @@ class TaskGraph:
         if target_id in self.nodes:
             self.nodes[target_id].dependencies.discard(source_id)
 
-        self._invalidate_cache()
+        # Removing edges keeps a topological order valid; a cyclic graph
+        # may have become acyclic
+        if removed and self._ord is None:
+            self._rebuild_order()
+
+        self._invalidate_cache((target_id,))
 
     def get_edges_from(self, node_id: str) -> List[TaskEdge]:
         """Get all edges starting from node"""
-        return [e for e in self.edges if e.source_id == node_id]
+        return [e for edges in self._out_edges.get(node_id, {}).values() for e in edges]
 
     def get_edges_to(self, node_id: str) -> List[TaskEdge]:
         """Get all edges ending at node"""
-        return [e for e in self.edges if e.target_id == node_id]
+        return [e for edges in self._in_edges.get(node_id, {}).values() for e in edges]
 
     def has_edge(self, source_id: str, target_id: str) -> bool:
         """Check if edge exists"""
-        return any(e.source_id == source_id and e.target_id == target_id for e in self.edges)
+        return target_id in self._out_edges.get(source_id, {})
 
-    # ==================== Graph Analysis ====================
+    def _check_edge(self, edge: TaskEdge) -> None:
+        """Validate edge endpoints (raises ValueError)"""
+        if edge.source_id not in self.nodes:
+            raise ValueError(f"Source node {edge.source_id} not found")
+        if edge.target_id not in self.nodes:
+            raise ValueError(f"Target node {edge.target_id} not found")
 
-    def has_cycle(self) -> bool:
-        """
-        Check if graph contains cycle using DFS.
+        # Check for self-loop
+        if edge.source_id == edge.target_id:
+            raise ValueError("Self-loops not allowed in DAG")
 
-        Returns:
-            True if cycle detected, False otherwise
+    def _link_edge(self, edge: TaskEdge) -> None:
+        """Order and attach a checked edge (raises ValueError on a strong cycle)"""
+        # Check for cycles (strong dependencies only) before mutating
+        acyclic = self._insert_order(edge.source_id, edge.target_id)
+        if not acyclic:
+            if edge.edge_type in [EdgeType.DEPENDENCY, EdgeType.CONSTRAINT]:
+                raise ValueError(f"Adding edge {edge.source_id} -> {edge.target_id} creates cycle")
+            # Weak edges may close a cycle: no topological order until it is broken
+            self._ord = None
+
+        self._attach_edge(edge)
+
+    def _attach_edge(self, edge: TaskEdge) -> None:
+        """Add edge to edge indexes, adjacency lists and nodes (no checks)"""
+        self._edges[id(edge)] = edge
+        self._out_edges[edge.source_id].setdefault(edge.target_id, []).append(edge)
+        self._in_edges[edge.target_id].setdefault(edge.source_id, []).append(edge)
+
+        # Update adjacency lists
+        self._adj_list[edge.source_id].add(edge.target_id)
+        self._rev_adj_list[edge.target_id].add(edge.source_id)
+
+        # Update node dependencies
+        if edge.source_id in self.nodes:
+            self.nodes[edge.source_id].dependents.add(edge.target_id)
+        if edge.target_id in self.nodes:
+            self.nodes[edge.target_id].dependencies.add(edge.source_id)
+
+    def _detach_edge(self, edge: TaskEdge) -> None:
+        """Remove one specific edge (other edges between the pair stay)"""
+        parallel = self._out_edges[edge.source_id][edge.target_id]
+        parallel.remove(edge)
+        del self._edges[id(edge)]
+
+        if not parallel:
+            del self._out_edges[edge.source_id][edge.target_id]
+            del self._in_edges[edge.target_id][edge.source_id]
+            self._adj_list[edge.source_id].discard(edge.target_id)
+            self._rev_adj_list[edge.target_id].discard(edge.source_id)
+            self.nodes[edge.source_id].dependents.discard(edge.target_id)
+            self.nodes[edge.target_id].dependencies.discard(edge.source_id)
+
+    # ==================== Incremental Ordering ====================
+
+    def _insert_order(self, source_id: str, target_id: str) -> bool:
         """
-        visited = set()
-        rec_stack = set()
+        Update the topological order for a new edge source -> target.
+
+        Pearce-Kelly: if source already precedes target nothing changes.
+        Otherwise the nodes reachable from target and the nodes reaching
+        source, both within the order window [ord(target), ord(source)],
+        are searched; reaching source means a cycle, else the two sets
+        swap places in the window.
 
-        def dfs_cycle(node_id: str) -> bool:
-            visited.add(node_id)
-            rec_stack.add(node_id)
+        Args:
+            source_id: Edge source
+            target_id: Edge target
 
-            for neighbor in self._adj_list.get(node_id, []):
-                if neighbor not in visited:
-                    if dfs_cycle(neighbor):
-                        return True
-                elif neighbor in rec_stack:
+        Returns:
+            True if the edge keeps the graph acyclic
+        """
+        if self._ord is None:
+            return not self._reaches(target_id, source_id)
+
+        order = self._ord
+        lower, upper = order[target_id], order[source_id]
+        if lower > upper:
+            return True
+
+        # Forward search from target, bounded by ord(source)
+        forward = []
+        seen = {target_id}
+        stack = [target_id]
+        while stack:
+            node_id = stack.pop()
+            forward.append(node_id)
+            for neighbor in self._adj_list.get(node_id, ()):
+                if neighbor == source_id:
+                    return False
+                if neighbor not in seen and order[neighbor] < upper:
+                    seen.add(neighbor)
+                    stack.append(neighbor)
+
+        # Backward search from source, bounded by ord(target)
+        backward = []
+        seen = {source_id}
+        stack = [source_id]
+        while stack:
+            node_id = stack.pop()
+            backward.append(node_id)
+            for neighbor in self._rev_adj_list.get(node_id, ()):
+                if neighbor not in seen and order[neighbor] > lower:
+                    seen.add(neighbor)
+                    stack.append(neighbor)
+
+        # Reassign the affected positions: backward set first, then forward
+        backward.sort(key=order.__getitem__)
+        forward.sort(key=order.__getitem__)
+        slots = sorted(order[n] for n in backward + forward)
+        for node_id, slot in zip(backward + forward, slots):
+            order[node_id] = slot
+
+        return True
+
+    def _reaches(self, start_id: str, goal_id: str) -> bool:
+        """Check whether goal is reachable from start (iterative DFS)"""
+        seen = {start_id}
+        stack = [start_id]
+        while stack:
+            for neighbor in self._adj_list.get(stack.pop(), ()):
+                if neighbor == goal_id:
                     return True
+                if neighbor not in seen:
+                    seen.add(neighbor)
+                    stack.append(neighbor)
+        return False
+
+    def _rebuild_order(self) -> bool:
+        """
+        Recompute the topological order from scratch (Kahn, O(V+E)).
 
-            rec_stack.remove(node_id)
+        Returns:
+            True if the graph is acyclic (order restored)
+        """
+        order = self._kahn_order()
+        if order is None:
+            self._ord = None
             return False
 
-        for node_id in self.nodes:
-            if node_id not in visited:
-                if dfs_cycle(node_id):
-                    return True
+        self._ord = {node_id: i for i, node_id in enumerate(order)}
+        self._next_ord = len(order)
+        return True
 
-        return False
+    def _kahn_order(self) -> Optional[List[str]]:
+        """Topological order by Kahn's algorithm, or None if cyclic"""
+        in_degree = {node_id: len(self._rev_adj_list.get(node_id, ())) for node_id in self.nodes}
+        queue = deque([node_id for node_id, degree in in_degree.items() if degree == 0])
+        result = []
+
+        while queue:
+            node_id = queue.popleft()
+            result.append(node_id)
+            for neighbor in self._adj_list.get(node_id, ()):
+                in_degree[neighbor] -= 1
+                if in_degree[neighbor] == 0:
+                    queue.append(neighbor)
+
+        return result if len(result) == len(self.nodes) else None
+
+    # ==================== Graph Analysis ====================
+
+    def has_cycle(self) -> bool:
+        """
+        Check if graph contains cycle (Kahn's algorithm, iterative).
+
+        Returns:
+            True if cycle detected, False otherwise
+        """
+        return self._kahn_order() is None
 
     def is_acyclic(self) -> bool:
         """Check if graph is acyclic (DAG)"""
@@ -238,24 +437,8 @@ class TaskGraph:
         if self._topological_order is not None:
             return self._topological_order
 
-        # Calculate in-degree for each node
-        in_degree = {node_id: len(self._rev_adj_list.get(node_id, set())) for node_id in self.nodes}
-
-        # Queue of nodes with in-degree 0
-        queue = deque([node_id for node_id, degree in in_degree.items() if degree == 0])
-        result = []
-
-        while queue:
-            node_id = queue.popleft()
-            result.append(node_id)
-
-            # Reduce in-degree of neighbors
-            for neighbor in self._adj_list.get(node_id, []):
-                in_degree[neighbor] -= 1
-                if in_degree[neighbor] == 0:
-                    queue.append(neighbor)
-
-        if len(result) != len(self.nodes):
+        result = self._kahn_order()
+        if result is None:
             raise ValueError("Graph contains cycle, cannot perform topological sort")
 
         self._topological_order = result
@@ -363,7 +546,7 @@ class TaskGraph:
             errors.append("Graph contains cycles")
 
         # Check edge consistency
-        for edge in self.edges:
+        for edge in self._edges.values():
             if edge.source_id not in self.nodes:
                 errors.append(f"Edge references non-existent source node: {edge.source_id}")
             if edge.target_id not in self.nodes:
@@ -391,9 +574,9 @@ class TaskGraph:
             "graph_id": self.graph_id,
             "metadata": self.metadata,
             "nodes": {node_id: node.to_dict() for node_id, node in self.nodes.items()},
-            "edges": [edge.to_dict() for edge in self.edges],
+            "edges": [edge.to_dict() for edge in self._edges.values()],
             "node_count": len(self.nodes),
-            "edge_count": len(self.edges)
+            "edge_count": len(self._edges)
         }
 
     def to_json(self) -> str:
@@ -425,33 +608,66 @@ class TaskGraph:
         for edge_data in data.get("edges", []):
             edge = TaskEdge.from_dict(edge_data)
             # Manually add without cycle check (already validated)
-            graph.edges.append(edge)
+            graph._edges[id(edge)] = edge
+            graph._out_edges[edge.source_id].setdefault(edge.target_id, []).append(edge)
+            graph._in_edges[edge.target_id].setdefault(edge.source_id, []).append(edge)
             graph._adj_list[edge.source_id].add(edge.target_id)
             graph._rev_adj_list[edge.target_id].add(edge.source_id)
 
+        graph._rebuild_order()
         return graph
 
     # ==================== Utility ====================
 
-    def _invalidate_cache(self) -> None:
-        """Invalidate cached analysis results"""
+    def _invalidate_cache(self, changed: Iterable[str] = ()) -> None:
+        """
+        Invalidate cached analysis results and bump the graph version.
+
+        Args:
+            changed: Node ids added, removed or with changed dependencies
+        """
         self._topological_order = None
         self._critical_path = None
         self._is_validated = False
+        self.version += 1
+        self._changes.append((self.version, tuple(changed)))
+
+    def changes_since(self, version: int) -> Optional[Set[str]]:
+        """
+        Nodes added, removed or with changed dependencies after a version.
+
+        Args:
+            version: Graph version the caller is up to date with
+
+        Returns:
+            Set of node ids, or None if the change log no longer reaches
+            back that far (the caller must recompute from scratch)
+        """
+        if version == self.version:
+            return set()
+        if version > self.version or not self._changes or self._changes[0][0] > version + 1:
+            return None
+
+        changed: Set[str] = set()
+        for change_version, node_ids in reversed(self._changes):
+            if change_version <= version:
+                break
+            changed.update(node_ids)
+        return changed
 
     def get_stats(self) -> Dict[str, Any]:
         """Get graph statistics"""
         return {
             "graph_id": self.graph_id,
             "node_count": len(self.nodes),
-            "edge_count": len(self.edges),
+            "edge_count": len(self._edges),
             "root_count": len(self.get_root_nodes()),
             "leaf_count": len(self.get_leaf_nodes()),
             "is_acyclic": self.is_acyclic()
         }
 
     def __repr__(self) -> str:
-        return f"<TaskGraph: {self.graph_id} ({len(self.nodes)} nodes, {len(self.edges)} edges)>"
+        return f"<TaskGraph: {self.graph_id} ({len(self.nodes)} nodes, {len(self._edges)} edges)>"
 
     def __str__(self) -> str:
-        return f"TaskGraph[{self.graph_id}]: {len(self.nodes)} nodes, {len(self.edges)} edges"
+        return f"TaskGraph[{self.graph_id}]: {len(self.nodes)} nodes, {len(self._edges)} edges"
@@ -15,7 +15,7 @@ Architecture:
     AgentManager      - Agent registry and lifecycle
     EventBus          - Inter-agent event system
     Scheduler         - Agent selection logic
-    StateContext      - Shared state management
+    StateContext      - Shared state management (versioned snapshots)
     AELController     - Main loop orchestrator
 
 Usage:
@@ -79,6 +79,8 @@ from senti_os.core.faza28.scheduler import (
 # State Management
 from senti_os.core.faza28.state_context import (
     StateContext,
+    StateSnapshot,
+    StateTransaction,
     get_state_context,
     create_state_context
 )
@@ -86,6 +88,7 @@ from senti_os.core.faza28.state_context import (
 # Main Loop
 from senti_os.core.faza28.ael_loop import (
     AELController,
+    LoopTelemetry,
     get_ael_controller,
     create_ael_controller,
     run_ael_loop
@@ -113,11 +116,14 @@ __all__ = [
 
     # State Management
     "StateContext",
+    "StateSnapshot",
+    "StateTransaction",
     "get_state_context",
     "create_state_context",
 
     # Main Loop (primary API)
     "AELController",
+    "LoopTelemetry",
     "get_ael_controller",
     "create_ael_controller",
     "run_ael_loop",
@@ -3,21 +3,124 @@ FAZA 28 – Agent Execution Loop (AEL)
 Main Loop Controller
 
 Core execution loop orchestrating all agents.
+
+Tick modes:
+- sequential: selected agents tick one after another
+- concurrent: independent agents tick together (asyncio.gather), bounded
+  by max_concurrency; agents sharing a tick_group stay serialized
+
+Either mode can cancel agent ticks that exceed a per-agent deadline.
+
+With isolated state (default in concurrent mode) every agent reads the
+same StateContext snapshot taken at the start of the iteration and its
+writes are buffered; the buffers are committed in scheduler order at the
+end of the iteration, with conflicts reported. Agents sharing a tick_group
+run in order and depend on each other, so each one reads a fresh snapshot
+and commits as soon as its tick ends, before the next member ticks.
 """
 
 import logging
 import asyncio
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, List, Tuple
 from datetime import datetime
 import signal
 
+from senti_core_module.senti_stats import P2Quantile, RunningStats
+
+from .agent_base import AgentBase
 from .agent_manager import AgentManager, get_agent_manager
 from .event_bus import EventBus, Event, get_event_bus
 from .scheduler import Scheduler, create_scheduler
-from .state_context import StateContext, get_state_context
+from .state_context import StateContext, StateTransaction, get_state_context
 
 logger = logging.getLogger(__name__)
 
+TICK_MODES = ("sequential", "concurrent")
+
+
+class LoopTelemetry:
+    """
+    AEL timing telemetry.
+
+    Iteration wall time and per-agent tick latency are streamed (running
+    moments and P2 p50 / p99 sketches, constant memory per agent);
+    deadline misses, tick_rate overruns and state conflicts are counted.
+    """
+
+    def __init__(self):
+        """Initialize telemetry"""
+        self.iterations = RunningStats()
+        self.last_iteration_time = 0.0
+        self.overruns = 0
+        self.state_conflicts = 0
+        self.deadline_misses: Dict[str, int] = {}
+        self._iteration_p99 = P2Quantile(0.99)
+        self._agent_latency: Dict[str, Tuple[P2Quantile, P2Quantile]] = {}
+
+    def record_iteration(self, duration: float, overrun: bool = False) -> None:
+        """Record the wall time of one loop iteration."""
+        self.iterations.add(duration)
+        self._iteration_p99.add(duration)
+        self.last_iteration_time = duration
+        if overrun:
+            self.overruns += 1
+
+    def record_agent(self, agent_name: str, latency: float) -> None:
+        """Record one agent tick latency."""
+        if agent_name not in self._agent_latency:
+            self._agent_latency[agent_name] = (P2Quantile(0.5), P2Quantile(0.99))
+        p50, p99 = self._agent_latency[agent_name]
+        p50.add(latency)
+        p99.add(latency)
+
+    def record_deadline_miss(self, agent_name: str) -> None:
+        """Record a tick cancelled at its deadline."""
+        self.deadline_misses[agent_name] = self.deadline_misses.get(agent_name, 0) + 1
+
+    def get_agent_latency(self, agent_name: str) -> Dict[str, Any]:
+        """
+        Get tick latency percentiles of an agent.
+
+        Args:
+            agent_name: Agent name
+
+        Returns:
+            Dictionary with ticks, p50 and p99 (seconds, None if no ticks)
+        """
+        p50, p99 = self._agent_latency.get(agent_name, (P2Quantile(0.5), P2Quantile(0.99)))
+        return {"ticks": p50.count, "p50": p50.value, "p99": p99.value}
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get telemetry snapshot.
+
+        Returns:
+            Dictionary with iteration and per-agent timing
+        """
+        return {
+            "iterations": self.iterations.count,
+            "iteration_time_last": self.last_iteration_time,
+            "iteration_time_mean": self.iterations.mean,
+            "iteration_time_p99": self._iteration_p99.value,
+            "overruns": self.overruns,
+            "deadline_misses": sum(self.deadline_misses.values()),
+            "state_conflicts": self.state_conflicts,
+            "agents": {
+                name: dict(self.get_agent_latency(name), deadline_misses=self.deadline_misses.get(name, 0))
+                for name in self._agent_latency
+            }
+        }
+
+    def reset(self) -> None:
+        """Reset all telemetry"""
+        self.iterations.clear()
+        self.last_iteration_time = 0.0
+        self.overruns = 0
+        self.state_conflicts = 0
+        self.deadline_misses.clear()
+        self._iteration_p99 = P2Quantile(0.99)
+        self._agent_latency.clear()
+
 
 class AELController:
     """
@@ -30,7 +133,6 @@ class AELController:
     - Shared state management
     - System-wide coordination
 
-    TODO: Add performance monitoring
     TODO: Add adaptive tick rate
     TODO: Add agent isolation/sandboxing
     TODO: Add distributed execution support
@@ -43,7 +145,11 @@ class AELController:
         scheduler: Optional[Scheduler] = None,
         state_context: Optional[StateContext] = None,
         tick_rate: float = 1.0,
-        strategy: str = "priority"
+        strategy: str = "priority",
+        tick_mode: str = "sequential",
+        max_concurrency: Optional[int] = None,
+        agent_deadline: Optional[float] = None,
+        isolate_state: Optional[bool] = None
     ):
         """
         Initialize AEL Controller.
@@ -55,14 +161,30 @@ class AELController:
             state_context: StateContext instance (None = use singleton)
             tick_rate: Loop iteration rate in seconds
             strategy: Scheduling strategy ('priority', 'round_robin', 'load_aware')
+            tick_mode: 'sequential' or 'concurrent'
+            max_concurrency: Concurrent mode: maximum agents ticking at once
+                (None = unbounded)
+            agent_deadline: Default per-agent tick deadline in seconds; ticks
+                running longer are cancelled (None = no deadline)
+            isolate_state: Agents read an iteration snapshot and their writes
+                are committed at iteration end (None = in concurrent mode only)
         """
+        if tick_mode not in TICK_MODES:
+            raise ValueError(f"Unknown tick_mode: {tick_mode}")
+
         self.agent_manager = agent_manager or get_agent_manager()
         self.event_bus = event_bus or get_event_bus()
         self.scheduler = scheduler or create_scheduler(strategy=strategy)
+        self.scheduler.set_concurrency(tick_mode == "concurrent", max_concurrency)
         self.state_context = state_context or get_state_context()
 
         self.tick_rate = tick_rate
         self.strategy = strategy
+        self.tick_mode = tick_mode
+        self.max_concurrency = max_concurrency
+        self.agent_deadline = agent_deadline
+        self.isolate_state = tick_mode == "concurrent" if isolate_state is None else isolate_state
+        self.telemetry = LoopTelemetry()
 
         self._running = False
         self._iteration = 0
@@ -132,8 +254,6 @@ class AELController:
         4. Update state
         5. Check for shutdown
 
-        TODO: Add iteration timeout
-        TODO: Add performance metrics collection
         TODO: Add adaptive sleep timing
         """
         logger.info("Entering main loop...")
@@ -143,39 +263,7 @@ class AELController:
             iteration_start = asyncio.get_event_loop().time()
 
             try:
-                # Update iteration state
-                self.state_context.set("ael_iteration", self._iteration)
-                self.state_context.set("ael_last_tick", datetime.now().isoformat())
-
-                # Select agents to run
-                agents = self.agent_manager.get_agents_by_priority(enabled_only=True)
-                selected_agents = self.scheduler.select_agents(agents)
-
-                logger.debug(f"Iteration {self._iteration}: {len(selected_agents)} agents selected")
-
-                # Execute agent ticks
-                for agent in selected_agents:
-                    if not self.scheduler.should_run_agent(agent, self._iteration):
-                        continue
-
-                    try:
-                        agent_start = asyncio.get_event_loop().time()
-                        await agent.on_tick(self.state_context)
-                        agent_duration = asyncio.get_event_loop().time() - agent_start
-
-                        # Record execution
-                        self.scheduler.record_execution(agent.name, agent_duration)
-
-                    except Exception as e:
-                        logger.error(f"Error in agent {agent.name} tick: {e}")
-                        await agent.on_error(e, self.state_context)
-
-                        # Emit error event
-                        self.event_bus.emit("agent_error", "ael_controller", data={
-                            "agent": agent.name,
-                            "error": str(e),
-                            "iteration": self._iteration
-                        })
+                await self._run_iteration()
 
                 # TODO: Process pending events from event_bus
                 # TODO: Submit tasks to FAZA 25 orchestrator
@@ -186,6 +274,7 @@ class AELController:
                 # Calculate sleep time
                 iteration_duration = asyncio.get_event_loop().time() - iteration_start
                 sleep_time = max(0, self.tick_rate - iteration_duration)
+                self.telemetry.record_iteration(iteration_duration, overrun=sleep_time <= 0)
 
                 if sleep_time > 0:
                     await asyncio.sleep(sleep_time)
@@ -202,6 +291,170 @@ class AELController:
 
         logger.info("Main loop exited")
 
+    async def _run_iteration(self) -> None:
+        """Select agents and run their ticks for the current iteration."""
+        # Update iteration state
+        self.state_context.set("ael_iteration", self._iteration)
+        self.state_context.set("ael_last_tick", datetime.now().isoformat())
+
+        # Select agents to run
+        agents = self.agent_manager.get_agents_by_priority(enabled_only=True)
+        selected_agents = self.scheduler.select_agents(agents)
+
+        logger.debug(f"Iteration {self._iteration}: {len(selected_agents)} agents selected")
+
+        runnable = [a for a in selected_agents if self.scheduler.should_run_agent(a, self._iteration)]
+
+        # One snapshot for the whole iteration, one write buffer per agent;
+        # tick_group members get theirs when they tick (see _tick_member)
+        contexts: Dict[str, Any] = {}
+        if self.isolate_state:
+            snapshot = self.state_context.snapshot()
+            for agent in runnable:
+                if agent.tick_group is None:
+                    contexts[agent.name] = self.state_context.transaction(agent.name, snapshot)
+
+        # Execute agent ticks
+        if self.tick_mode == "concurrent":
+            await self._tick_concurrent(runnable, contexts)
+        else:
+            for agent in runnable:
+                await self._tick_member(agent, contexts)
+
+        # Merge buffered writes in scheduler order
+        for agent in runnable:
+            transaction = contexts.get(agent.name)
+            if transaction is not None:
+                self._commit_state(transaction)
+
+    def _commit_state(self, transaction: StateTransaction) -> None:
+        """Commit an agent's buffered writes and report conflicts."""
+        conflicts = self.state_context.commit(transaction)
+        if conflicts:
+            self.telemetry.state_conflicts += len(conflicts)
+
+            # Emit conflict event
+            self.event_bus.emit("state_conflict", "ael_controller", data={
+                "agent": transaction.owner,
+                "keys": conflicts,
+                "iteration": self._iteration
+            })
+
+    async def _tick_concurrent(self, agents: List[AgentBase], contexts: Dict[str, Any]) -> None:
+        """
+        Tick agents concurrently.
+
+        Each tick_group is one lane ticking its agents in order; ungrouped
+        agents get a lane each. Lanes run together, with at most
+        max_concurrency ticks in flight.
+
+        Args:
+            agents: Agents to tick, in scheduler order
+            contexts: Per-agent state transactions (empty = shared state)
+        """
+        lanes: Dict[Tuple[str, str], List[AgentBase]] = {}
+        for agent in agents:
+            key = ("group", agent.tick_group) if agent.tick_group is not None else ("agent", agent.name)
+            lanes.setdefault(key, []).append(agent)
+
+        semaphore = asyncio.Semaphore(self.max_concurrency) if self.max_concurrency else None
+
+        async def run_lane(lane: List[AgentBase]) -> None:
+            for agent in lane:
+                if semaphore is None:
+                    await self._tick_member(agent, contexts)
+                else:
+                    async with semaphore:
+                        await self._tick_member(agent, contexts)
+
+        await asyncio.gather(*(run_lane(lane) for lane in lanes.values()))
+
+    async def _tick_member(self, agent: AgentBase, contexts: Dict[str, Any]) -> None:
+        """
+        Tick one agent of a lane.
+
+        With isolated state, a tick_group member reads a fresh snapshot and
+        commits right after its tick, so the next member of the group sees
+        its writes; other agents use their iteration transaction.
+
+        Args:
+            agent: Agent to tick
+            contexts: Per-agent state transactions (empty = shared state)
+        """
+        if self.isolate_state and agent.tick_group is not None:
+            transaction = self.state_context.transaction(agent.name)
+            await self._tick_agent(agent, transaction)
+            self._commit_state(transaction)
+        else:
+            await self._tick_agent(agent, contexts.get(agent.name))
+
+    async def _tick_agent(self, agent: AgentBase, context: Optional[Any] = None) -> None:
+        """
+        Run one agent tick under its deadline.
+
+        Records the latency with the scheduler and telemetry. A tick that
+        exceeds its deadline is cancelled and reported as a deadline miss
+        (its buffered state writes are discarded); other exceptions go to
+        the agent's on_error().
+
+        Args:
+            agent: Agent to tick
+            context: State the agent sees (None = shared state context)
+        """
+        context = context if context is not None else self.state_context
+        deadline = agent.tick_deadline if agent.tick_deadline is not None else self.agent_deadline
+        loop = asyncio.get_event_loop()
+        agent_start = loop.time()
+
+        try:
+            if deadline is None:
+                await agent.on_tick(context)
+            else:
+                await asyncio.wait_for(agent.on_tick(context), deadline)
+            agent_duration = loop.time() - agent_start
+
+            # Record execution
+            self.scheduler.record_execution(agent.name, agent_duration)
+            self.telemetry.record_agent(agent.name, agent_duration)
+
+        except asyncio.TimeoutError as e:
+            agent_duration = loop.time() - agent_start
+            if deadline is None or agent_duration < deadline:
+                # Raised by the agent itself, not the deadline
+                await self._handle_agent_error(agent, e, context)
+                return
+
+            self.scheduler.record_execution(agent.name, agent_duration)
+            self.telemetry.record_agent(agent.name, agent_duration)
+            self.telemetry.record_deadline_miss(agent.name)
+            logger.warning(f"Agent {agent.name} missed its {deadline:.3f}s tick deadline (cancelled)")
+
+            # Drop the cancelled tick's partial writes
+            if isinstance(context, StateTransaction):
+                context.rollback()
+
+            # Emit deadline event
+            self.event_bus.emit("agent_deadline_missed", "ael_controller", data={
+                "agent": agent.name,
+                "deadline": deadline,
+                "iteration": self._iteration
+            })
+
+        except Exception as e:
+            await self._handle_agent_error(agent, e, context)
+
+    async def _handle_agent_error(self, agent: AgentBase, error: Exception, context: Any) -> None:
+        """Report an agent tick error."""
+        logger.error(f"Error in agent {agent.name} tick: {error}")
+        await agent.on_error(error, context)
+
+        # Emit error event
+        self.event_bus.emit("agent_error", "ael_controller", data={
+            "agent": agent.name,
+            "error": str(error),
+            "iteration": self._iteration
+        })
+
     async def _shutdown(self) -> None:
         """
         Graceful shutdown.
@@ -253,7 +506,10 @@ class AELController:
             "uptime_seconds": uptime,
             "tick_rate": self.tick_rate,
             "strategy": self.strategy,
+            "tick_mode": self.tick_mode,
+            "isolate_state": self.isolate_state,
             "start_time": self._start_time.isoformat() if self._start_time else None,
+            "telemetry": self.telemetry.get_stats(),
             "agent_manager": self.agent_manager.get_stats(),
             "event_bus": self.event_bus.get_stats(),
             "scheduler": self.scheduler.get_stats(),
@@ -270,7 +526,8 @@ _ael_controller_instance: Optional[AELController] = None
 
 def get_ael_controller(
     tick_rate: float = 1.0,
-    strategy: str = "priority"
+    strategy: str = "priority",
+    **kwargs
 ) -> AELController:
     """
     Get singleton AELController instance.
@@ -278,6 +535,7 @@ def get_ael_controller(
     Args:
         tick_rate: Loop iteration rate (only used on first call)
         strategy: Scheduling strategy (only used on first call)
+        **kwargs: Other AELController arguments (only used on first call)
 
     Returns:
         Global AELController instance
@@ -286,14 +544,16 @@ def get_ael_controller(
     if _ael_controller_instance is None:
         _ael_controller_instance = AELController(
             tick_rate=tick_rate,
-            strategy=strategy
+            strategy=strategy,
+            **kwargs
         )
     return _ael_controller_instance
 
 
 def create_ael_controller(
     tick_rate: float = 1.0,
-    strategy: str = "priority"
+    strategy: str = "priority",
+    **kwargs
 ) -> AELController:
     """
     Factory function: create new AELController instance.
@@ -301,11 +561,13 @@ def create_ael_controller(
     Args:
         tick_rate: Loop iteration rate in seconds
         strategy: Scheduling strategy
+        **kwargs: Other AELController arguments (tick_mode, max_concurrency,
+            agent_deadline, ...)
 
     Returns:
         New AELController instance
     """
-    return AELController(tick_rate=tick_rate, strategy=strategy)
+    return AELController(tick_rate=tick_rate, strategy=strategy, **kwargs)
 
 
 async def run_ael_loop(
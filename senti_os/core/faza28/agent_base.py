@@ -27,11 +27,16 @@ class AgentBase:
     1. Inherit from AgentBase
     2. Set unique 'name' attribute
     3. Override at least on_tick() method
+
+    In concurrent tick mode, agents sharing a tick_group tick one after
+    another (scheduler order); other agents tick concurrently.
     """
 
     name: str = "abstract_agent"
     priority: int = 5  # 0-10, higher = more important
     enabled: bool = True
+    tick_group: Optional[str] = None  # Serialize ticks with agents in the same group
+    tick_deadline: Optional[float] = None  # Seconds (None = controller default)
 
     def __init__(self):
         """Initialize agent"""
@@ -116,6 +121,7 @@ class AgentBase:
             "name": self.name,
             "priority": self.priority,
             "enabled": self.enabled,
+            "tick_group": self.tick_group,
             "tick_count": self.tick_count,
             "error_count": self.error_count,
             "metadata": self.metadata
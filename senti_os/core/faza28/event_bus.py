@@ -6,15 +6,30 @@ Internal event system for inter-agent communication.
 Provides publish/subscribe mechanism for agent coordination.
 """
 
+import asyncio
+import inspect
 import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from typing import Dict, List, Callable, Any, Optional
 from datetime import datetime
-from collections import defaultdict
+from collections import defaultdict, deque
 
 logger = logging.getLogger(__name__)
 
 
+# Dispatch modes
+DISPATCH_SYNC = "sync"          # callbacks run inline on the publisher's stack
+DISPATCH_THREADED = "threaded"  # callbacks run on a worker thread pool
+DISPATCH_ASYNC = "async"        # callbacks run as asyncio tasks on the bus loop
+
+# Backpressure policies for full subscriber queues
+BACKPRESSURE_BLOCK = "block"
+BACKPRESSURE_DROP_OLDEST = "drop_oldest"
+BACKPRESSURE_DROP_NEWEST = "drop_newest"
+
+
 @dataclass
 class Event:
     """
@@ -37,6 +52,110 @@ class Event:
         return f"<Event: {self.type} from {self.source}>"
 
 
+class _SubscriberQueue:
+    """
+    Bounded delivery queue for one subscriber.
+
+    At most one drain runs at a time, so a subscriber sees its events in
+    publish order even when the worker pool has several threads.
+    """
+
+    def __init__(self, name: str, maxsize: int, policy: str, block_timeout: Optional[float]):
+        self.name = name
+        self.maxsize = maxsize
+        self.policy = policy
+        self.block_timeout = block_timeout
+
+        self.items: deque = deque()
+        self.cond = threading.Condition()
+        self.scheduled = False
+
+        self.delivered = 0
+        self.dropped = 0
+        self.errors = 0
+
+    def offer(self, item: tuple, can_block: bool = True) -> bool:
+        """
+        Enqueue (callback, event).
+
+        Returns:
+            True if the caller must schedule a drain
+        """
+        with self.cond:
+            if len(self.items) >= self.maxsize:
+                if self.policy == BACKPRESSURE_DROP_OLDEST:
+                    self.items.popleft()
+                    self.dropped += 1
+                elif self.policy == BACKPRESSURE_BLOCK and can_block:
+                    if not self.cond.wait_for(lambda: len(self.items) < self.maxsize,
+                                              timeout=self.block_timeout):
+                        self.dropped += 1
+                        return False
+                else:
+                    self.dropped += 1
+                    return False
+
+            self.items.append(item)
+            if self.scheduled:
+                return False
+            self.scheduled = True
+            return True
+
+    def _next(self) -> Optional[tuple]:
+        with self.cond:
+            if not self.items:
+                self.scheduled = False
+                self.cond.notify_all()
+                return None
+            item = self.items.popleft()
+            self.cond.notify_all()
+            return item
+
+    def _failed(self, error: Exception) -> None:
+        self.errors += 1
+        logger.error(f"Error in event handler for {self.name}: {error}")
+
+    def drain(self) -> None:
+        """Deliver queued events on the calling (worker) thread."""
+        while True:
+            item = self._next()
+            if item is None:
+                return
+            callback, event = item
+            try:
+                result = callback(event)
+                if inspect.isawaitable(result):
+                    asyncio.run(result)
+                self.delivered += 1
+            except Exception as e:
+                self._failed(e)
+
+    async def drain_async(self) -> None:
+        """Deliver queued events as an asyncio task."""
+        while True:
+            item = self._next()
+            if item is None:
+                return
+            callback, event = item
+            try:
+                result = callback(event)
+                if inspect.isawaitable(result):
+                    await result
+                self.delivered += 1
+            except Exception as e:
+                self._failed(e)
+            # Let other tasks (including the AEL tick) run between events
+            await asyncio.sleep(0)
+
+    def is_idle(self) -> bool:
+        with self.cond:
+            return not self.items and not self.scheduled
+
+    def wait_idle(self, timeout: Optional[float]) -> bool:
+        with self.cond:
+            return self.cond.wait_for(lambda: not self.items and not self.scheduled, timeout=timeout)
+
+
 class EventBus:
     """
     Internal event bus for agent communication.
@@ -46,20 +165,66 @@ class EventBus:
     - Event subscription with callbacks
     - Event filtering by type
     - Subscription management
+    - Optional asynchronous dispatch through bounded per-subscriber
+      queues (worker thread pool or asyncio tasks) with backpressure
 
     TODO: Add event persistence/logging
     TODO: Add event replay functionality
-    TODO: Add async event handlers
     TODO: Add event priority/ordering
     """
 
-    def __init__(self):
-        """Initialize event bus"""
+    def __init__(
+        self,
+        dispatch_mode: str = DISPATCH_SYNC,
+        queue_size: int = 1000,
+        backpressure: str = BACKPRESSURE_BLOCK,
+        block_timeout: Optional[float] = None,
+        max_workers: int = 4,
+        max_history: int = 1000,
+        loop: Optional[asyncio.AbstractEventLoop] = None
+    ):
+        """
+        Initialize event bus.
+
+        Args:
+            dispatch_mode: 'sync', 'threaded' or 'async'
+            queue_size: Per-subscriber queue bound (threaded/async)
+            backpressure: 'block', 'drop_oldest' or 'drop_newest' when full
+            block_timeout: Max seconds a publisher blocks before dropping
+            max_workers: Worker threads for threaded dispatch
+            max_history: Events kept in the history ring buffer
+            loop: Event loop for async dispatch (default: running loop)
+        """
+        if dispatch_mode not in (DISPATCH_SYNC, DISPATCH_THREADED, DISPATCH_ASYNC):
+            raise ValueError(f"Unknown dispatch mode: {dispatch_mode}")
+        if backpressure not in (BACKPRESSURE_BLOCK, BACKPRESSURE_DROP_OLDEST, BACKPRESSURE_DROP_NEWEST):
+            raise ValueError(f"Unknown backpressure policy: {backpressure}")
+
         # Subscriptions: event_type -> list of (subscriber_name, callback)
         self._subscriptions: Dict[str, List[tuple[str, Callable]]] = defaultdict(list)
-        self._event_history: List[Event] = []
-        self._max_history = 1000  # Keep last 1000 events
-        logger.info("EventBus initialized")
+
+        # History ring buffer plus per-type/per-source rings that evict in
+        # step with it, so filtered history never scans the full ring.
+        self._max_history = max_history  # Keep last max_history events
+        self._event_history: deque = deque(maxlen=max_history)
+        self._history_by_type: Dict[str, deque] = {}
+        self._history_by_source: Dict[str, deque] = {}
+        self._history_lock = threading.Lock()
+
+        # Asynchronous dispatch
+        self.dispatch_mode = dispatch_mode
+        self.queue_size = queue_size
+        self.backpressure = backpressure
+        self.block_timeout = block_timeout
+        self._queues: Dict[str, _SubscriberQueue] = {}
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._loop = loop
+
+        if dispatch_mode == DISPATCH_THREADED:
+            self._executor = ThreadPoolExecutor(max_workers=max_workers,
+                                                thread_name_prefix="EventBus")
+
+        logger.info(f"EventBus initialized (dispatch={dispatch_mode})")
 
     def subscribe(self, event_type: str, subscriber_name: str, callback: Callable[[Event], None]) -> None:
         """
@@ -68,7 +233,8 @@ class EventBus:
         Args:
             event_type: Type of event to subscribe to (e.g., 'task_completed')
             subscriber_name: Name of subscriber (usually agent name)
-            callback: Function to call when event is published
+            callback: Function to call when event is published (may be a
+                coroutine function in threaded/async dispatch)
 
         TODO: Add subscription filters (by source, data patterns)
         TODO: Add subscription priority
@@ -103,33 +269,47 @@ class EventBus:
         """
         for event_type in list(self._subscriptions.keys()):
             self.unsubscribe(event_type, subscriber_name)
+        self._queues.pop(subscriber_name, None)
         logger.debug(f"All subscriptions removed for: {subscriber_name}")
 
     def publish(self, event: Event) -> None:
         """
         Publish an event to all subscribers.
 
+        In sync mode callbacks run inline. Otherwise the event is offered
+        to each subscriber's bounded queue and delivered on a worker
+        thread / asyncio task; publish only blocks under the 'block'
+        backpressure policy (never on the bus's own event loop).
+
         Args:
             event: Event instance to publish
 
-        TODO: Add async event dispatch
         TODO: Add event validation
         TODO: Add rate limiting per source
         """
         logger.debug(f"Publishing event: {event.type} from {event.source}")
 
         # Add to history
-        self._event_history.append(event)
-        if len(self._event_history) > self._max_history:
-            self._event_history.pop(0)
+        self._record_history(event)
+
+        subscribers = self._subscriptions.get(event.type)
+        if not subscribers:
+            return
 
         # Notify subscribers
-        if event.type in self._subscriptions:
-            for subscriber_name, callback in self._subscriptions[event.type]:
+        if self.dispatch_mode == DISPATCH_SYNC:
+            for subscriber_name, callback in subscribers:
                 try:
                     callback(event)
                 except Exception as e:
                     logger.error(f"Error in event handler for {subscriber_name}: {e}")
+            return
+
+        on_bus_loop = self.dispatch_mode == DISPATCH_ASYNC and self._on_bus_loop()
+        for subscriber_name, callback in subscribers:
+            queue = self._queue_for(subscriber_name)
+            if queue.offer((callback, event), can_block=not on_bus_loop):
+                self._schedule_drain(queue)
 
     def emit(self, event_type: str, source: str, data: Any = None, metadata: Optional[Dict] = None) -> None:
         """
@@ -149,6 +329,98 @@ class EventBus:
         )
         self.publish(event)
 
+    # =====================================================
+    # ASYNCHRONOUS DISPATCH
+    # =====================================================
+
+    def _queue_for(self, subscriber_name: str) -> _SubscriberQueue:
+        queue = self._queues.get(subscriber_name)
+        if queue is None:
+            queue = self._queues.setdefault(
+                subscriber_name,
+                _SubscriberQueue(subscriber_name, self.queue_size,
+                                 self.backpressure, self.block_timeout)
+            )
+        return queue
+
+    def _on_bus_loop(self) -> bool:
+        try:
+            running = asyncio.get_running_loop()
+        except RuntimeError:
+            return False
+        if self._loop is None:
+            self._loop = running
+        return running is self._loop
+
+    def _schedule_drain(self, queue: _SubscriberQueue) -> None:
+        if self.dispatch_mode == DISPATCH_THREADED:
+            self._executor.submit(queue.drain)
+            return
+
+        if self._loop is None or self._loop.is_closed():
+            # No loop to deliver on yet: fall back to inline delivery
+            logger.warning("EventBus async dispatch has no event loop; delivering inline")
+            queue.drain()
+            return
+
+        if self._on_bus_loop():
+            self._loop.create_task(queue.drain_async())
+        else:
+            self._loop.call_soon_threadsafe(
+                lambda: self._loop.create_task(queue.drain_async())
+            )
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """
+        Wait until every subscriber queue is drained (threaded dispatch).
+
+        Args:
+            timeout: Max seconds to wait per queue
+
+        Returns:
+            True if all queues are idle
+        """
+        return all(queue.wait_idle(timeout) for queue in list(self._queues.values()))
+
+    async def flush_async(self) -> None:
+        """Yield to the event loop until every subscriber queue is drained."""
+        while not all(queue.is_idle() for queue in list(self._queues.values())):
+            await asyncio.sleep(0.001)
+
+    def shutdown(self, wait: bool = True) -> None:
+        """Stop dispatch workers (threaded dispatch)."""
+        if self._executor is not None:
+            if wait:
+                self.flush()
+            self._executor.shutdown(wait=wait)
+            self._executor = None
+            self.dispatch_mode = DISPATCH_SYNC
+
+    # =====================================================
+    # HISTORY
+    # =====================================================
+
+    def _record_history(self, event: Event) -> None:
+        if self._max_history <= 0:
+            return
+
+        with self._history_lock:
+            if len(self._event_history) == self._event_history.maxlen:
+                evicted = self._event_history[0]
+                self._evict_index(self._history_by_type, evicted.type)
+                self._evict_index(self._history_by_source, evicted.source)
+
+            self._event_history.append(event)
+            self._history_by_type.setdefault(event.type, deque()).append(event)
+            self._history_by_source.setdefault(event.source, deque()).append(event)
+
+    @staticmethod
+    def _evict_index(index: Dict[str, deque], key: str) -> None:
+        ring = index[key]
+        ring.popleft()
+        if not ring:
+            del index[key]
+
     def get_event_history(self, event_type: Optional[str] = None, source: Optional[str] = None) -> List[Event]:
         """
         Get event history with optional filtering.
@@ -160,19 +432,29 @@ class EventBus:
         Returns:
             List of events matching filters
         """
-        events = self._event_history
+        with self._history_lock:
+            if event_type and source:
+                by_type = self._history_by_type.get(event_type, ())
+                by_source = self._history_by_source.get(source, ())
+                # Scan the shorter index
+                if len(by_type) <= len(by_source):
+                    return [e for e in by_type if e.source == source]
+                return [e for e in by_source if e.type == event_type]
 
-        if event_type:
-            events = [e for e in events if e.type == event_type]
+            if event_type:
+                return list(self._history_by_type.get(event_type, ()))
 
-        if source:
-            events = [e for e in events if e.source == source]
+            if source:
+                return list(self._history_by_source.get(source, ()))
 
-        return events
+            return list(self._event_history)
 
     def clear_history(self) -> None:
         """Clear event history"""
-        self._event_history.clear()
+        with self._history_lock:
+            self._event_history.clear()
+            self._history_by_type.clear()
+            self._history_by_source.clear()
         logger.debug("Event history cleared")
 
     def get_stats(self) -> Dict[str, Any]:
@@ -182,18 +464,31 @@ class EventBus:
         Returns:
             Dictionary with statistics
         """
-        event_types = set(e.type for e in self._event_history)
-        event_sources = set(e.source for e in self._event_history)
+        with self._history_lock:
+            total_events = len(self._event_history)
+            event_types = len(self._history_by_type)
+            event_sources = len(self._history_by_source)
 
         return {
-            "total_events": len(self._event_history),
-            "event_types": len(event_types),
-            "event_sources": len(event_sources),
+            "total_events": total_events,
+            "event_types": event_types,
+            "event_sources": event_sources,
             "subscriptions": {
                 event_type: len(subscribers)
                 for event_type, subscribers in self._subscriptions.items()
             },
-            "max_history": self._max_history
+            "max_history": self._max_history,
+            "dispatch_mode": self.dispatch_mode,
+            "backpressure": self.backpressure,
+            "queues": {
+                name: {
+                    "depth": len(queue.items),
+                    "delivered": queue.delivered,
+                    "dropped": queue.dropped,
+                    "errors": queue.errors
+                }
+                for name, queue in list(self._queues.items())
+            }
         }
 
     def __repr__(self) -> str:
@@ -217,11 +512,14 @@ def get_event_bus() -> EventBus:
     return _event_bus_instance
 
 
-def create_event_bus() -> EventBus:
+def create_event_bus(**kwargs) -> EventBus:
     """
     Factory function: create new EventBus instance.
 
+    Args:
+        **kwargs: EventBus options (dispatch_mode, queue_size, backpressure, ...)
+
     Returns:
         New EventBus instance
     """
-    return EventBus()
+    return EventBus(**kwargs)
@@ -8,6 +8,9 @@ Determines which agents to run in each loop iteration.
 
 import logging
 from typing import List, Optional, Dict, Any
+
+from senti_core_module.senti_stats import EWMStats
+
 from .agent_base import AgentBase
 
 logger = logging.getLogger(__name__)
@@ -22,25 +25,60 @@ class Scheduler:
     - Round-robin: Fair scheduling across all agents
     - Load-aware: Consider agent execution time and load
 
+    Execution times reported via record_execution() are smoothed per
+    agent (EWMA); the load-aware strategy uses them to keep the selected
+    agents within an optional time budget. An agent skipped for the
+    budget max_skips times in a row is selected anyway, so a stale slow
+    estimate gets re-measured instead of excluding the agent for good.
+
     TODO: Add time-based scheduling (cron-like)
     TODO: Add conditional scheduling (event-triggered)
     TODO: Add agent throttling/rate limiting
     TODO: Add agent dependency scheduling
     """
 
-    def __init__(self, strategy: str = "priority"):
+    LATENCY_ALPHA = 0.2  # EWMA weight of the newest execution time
+
+    def __init__(self, strategy: str = "priority", time_budget: Optional[float] = None, max_skips: int = 5):
         """
         Initialize scheduler.
 
         Args:
             strategy: Scheduling strategy ('priority', 'round_robin', 'load_aware')
+            time_budget: Load-aware only: expected wall seconds per
+                iteration (None = no budget)
+            max_skips: Load-aware only: consecutive budget skips after which
+                an agent is selected regardless of its estimate
         """
         self.strategy = strategy
+        self.time_budget = time_budget
+        self.max_skips = max_skips
         self._round_robin_index = 0
         self._execution_counts: Dict[str, int] = {}
         self._last_execution_times: Dict[str, float] = {}
+        self._latencies: Dict[str, EWMStats] = {}
+        self._skip_counts: Dict[str, int] = {}
+
+        # How selected agents execute (see set_concurrency)
+        self.concurrent = False
+        self.max_concurrency: Optional[int] = None
         logger.info(f"Scheduler initialized with strategy: {strategy}")
 
+    def set_concurrency(self, concurrent: bool, max_concurrency: Optional[int] = None) -> None:
+        """
+        Tell the load-aware budget how selected agents execute.
+
+        Sequential agents cost the sum of their latencies. Concurrent agents
+        cost the longest lane (a tick_group, or a single ungrouped agent),
+        or total / max_concurrency if that is larger.
+
+        Args:
+            concurrent: Agents tick concurrently
+            max_concurrency: Maximum ticks in flight (None = unbounded)
+        """
+        self.concurrent = concurrent
+        self.max_concurrency = max_concurrency
+
     def select_agents(self, agents: List[AgentBase], max_agents: Optional[int] = None) -> List[AgentBase]:
         """
         Select agents to run in this iteration.
@@ -129,6 +167,12 @@ class Scheduler:
         """
         Select agents considering execution load.
 
+        Agents are ordered by priority, then fewer executions first. With a
+        time_budget, agents whose smoothed execution time no longer fits the
+        estimated iteration wall time are skipped (the first agent is always
+        selected; agents without measurements count as free; agents skipped
+        max_skips times in a row are selected anyway).
+
         Args:
             agents: List of enabled agents
             max_agents: Maximum number to select
@@ -136,24 +180,50 @@ class Scheduler:
         Returns:
             Selected agents
 
-        TODO: Use actual execution time measurements
         TODO: Consider agent error rates
         TODO: Add dynamic priority adjustment
         """
-        # For now, use priority-based with execution count balancing
         sorted_agents = sorted(
             agents,
             key=lambda a: (
                 a.priority,  # Primary: priority
-                -self._execution_counts.get(a.name, 0)  # Secondary: fewer executions first
+                -self._execution_counts.get(a.name, 0),  # Secondary: fewer executions first
+                -self.get_expected_latency(a.name)  # Tertiary: faster first
             ),
             reverse=True
         )
 
+        if self.time_budget is not None:
+            selected = []
+            lanes: Dict[str, float] = {}
+            total = 0.0
+            for agent in sorted_agents:
+                cost = self.get_expected_latency(agent.name)
+                lane = agent.tick_group if agent.tick_group is not None else agent.name
+                starved = self._skip_counts.get(agent.name, 0) >= self.max_skips
+                if selected and not starved and self._wall_time(lanes, total, lane, cost) > self.time_budget:
+                    self._skip_counts[agent.name] = self._skip_counts.get(agent.name, 0) + 1
+                    continue
+                selected.append(agent)
+                lanes[lane] = lanes.get(lane, 0.0) + cost
+                total += cost
+                self._skip_counts.pop(agent.name, None)
+            sorted_agents = selected
+
         if max_agents:
             return sorted_agents[:max_agents]
         return sorted_agents
 
+    def _wall_time(self, lanes: Dict[str, float], total: float, lane: str, cost: float) -> float:
+        """Estimated iteration wall time after adding cost to lane."""
+        if not self.concurrent:
+            return total + cost
+
+        longest = max(max(lanes.values(), default=0.0), lanes.get(lane, 0.0) + cost)
+        if self.max_concurrency:
+            return max(longest, (total + cost) / self.max_concurrency)
+        return longest
+
     def record_execution(self, agent_name: str, execution_time: float) -> None:
         """
         Record agent execution for scheduling decisions.
@@ -162,13 +232,29 @@ class Scheduler:
             agent_name: Name of executed agent
             execution_time: Time taken to execute (seconds)
 
-        TODO: Use execution time for load balancing
         TODO: Track execution patterns
         TODO: Emit execution_recorded event
         """
         self._execution_counts[agent_name] = self._execution_counts.get(agent_name, 0) + 1
         self._last_execution_times[agent_name] = execution_time
 
+        if agent_name not in self._latencies:
+            self._latencies[agent_name] = EWMStats(self.LATENCY_ALPHA)
+        self._latencies[agent_name].add(execution_time)
+
+    def get_expected_latency(self, agent_name: str) -> float:
+        """
+        Smoothed execution time of an agent.
+
+        Args:
+            agent_name: Agent name
+
+        Returns:
+            EWMA of recorded execution times (0.0 if never recorded)
+        """
+        latency = self._latencies.get(agent_name)
+        return latency.mean if latency is not None else 0.0
+
     def should_run_agent(self, agent: AgentBase, iteration: int) -> bool:
         """
         Determine if an agent should run in this iteration.
@@ -214,7 +300,9 @@ class Scheduler:
             "round_robin_index": self._round_robin_index,
             "total_executions": sum(self._execution_counts.values()),
             "execution_counts": dict(self._execution_counts),
-            "last_execution_times": dict(self._last_execution_times)
+            "last_execution_times": dict(self._last_execution_times),
+            "expected_latencies": {name: ewm.mean for name, ewm in self._latencies.items()},
+            "budget_skips": dict(self._skip_counts)
         }
 
     def reset(self) -> None:
@@ -222,20 +310,23 @@ class Scheduler:
         self._round_robin_index = 0
         self._execution_counts.clear()
         self._last_execution_times.clear()
+        self._latencies.clear()
+        self._skip_counts.clear()
         logger.debug("Scheduler state reset")
 
     def __repr__(self) -> str:
         return f"<Scheduler: {self.strategy}, {sum(self._execution_counts.values())} total executions>"
 
 
-def create_scheduler(strategy: str = "priority") -> Scheduler:
+def create_scheduler(strategy: str = "priority", time_budget: Optional[float] = None) -> Scheduler:
     """
     Factory function: create new Scheduler instance.
 
     Args:
         strategy: Scheduling strategy
+        time_budget: Load-aware execution budget per iteration (seconds)
 
     Returns:
         New Scheduler instance
     """
-    return Scheduler(strategy=strategy)
+    return Scheduler(strategy=strategy, time_budget=time_budget)
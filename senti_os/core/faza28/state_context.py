@@ -4,45 +4,187 @@ State Context
 
 Shared state management for agent coordination.
 Provides thread-safe state access across agents.
+
+Versioned store:
+- Reads are lock-free (single dict lookups / copies); writes take a short
+  lock and bump a global version plus the per-key version
+- snapshot(): immutable view of one version (cached until the next write)
+- transaction(): reads one snapshot, buffers writes; commit() merges them
+  and reports keys another writer changed since the snapshot (conflicts)
+- History is a ring buffer indexed by key
 """
 
 import logging
-from typing import Any, Dict, Optional, List
+from typing import Any, Dict, Iterator, Optional, List
 from threading import Lock
 from datetime import datetime
+from collections import deque
+from types import MappingProxyType
 import json
 
 logger = logging.getLogger(__name__)
 
+_DELETED = object()  # Buffered delete marker
+
+
+class StateSnapshot:
+    """
+    Immutable view of the state at one version.
+
+    Safe to read from any agent or thread without locking.
+    """
+
+    __slots__ = ("version", "_data")
+
+    def __init__(self, version: int, data: Dict[str, Any]):
+        self.version = version
+        self._data = MappingProxyType(data)
+
+    def get(self, key: str, default: Any = None) -> Any:
+        """Get value by key."""
+        return self._data.get(key, default)
+
+    def has(self, key: str) -> bool:
+        """Check if key exists."""
+        return key in self._data
+
+    def get_all(self) -> Dict[str, Any]:
+        """Copy of the snapshot as a dictionary."""
+        return dict(self._data)
+
+    def __getitem__(self, key: str) -> Any:
+        return self._data[key]
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._data
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._data)
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def __repr__(self) -> str:
+        return f"<StateSnapshot: v{self.version}, {len(self._data)} keys>"
+
+
+class StateTransaction:
+    """
+    Buffered writes against a snapshot.
+
+    Exposes the StateContext read / write API: reads see the snapshot plus
+    this transaction's own writes; nothing reaches the shared state until
+    StateContext.commit(). Other attributes are looked up on the context.
+    """
+
+    def __init__(self, context: "StateContext", snapshot: StateSnapshot, owner: Optional[str] = None):
+        """
+        Initialize transaction.
+
+        Args:
+            context: StateContext to commit to
+            snapshot: Snapshot reads are served from
+            owner: Writer identifier (e.g. agent name), for history / conflicts
+        """
+        self.context = context
+        self.snapshot = snapshot
+        self.owner = owner
+        self._writes: Dict[str, Any] = {}
+        self._data = snapshot._data
+
+    def get(self, key: str, default: Any = None) -> Any:
+        """Get state value (own writes first, then the snapshot)."""
+        writes = self._writes
+        if key in writes:
+            value = writes[key]
+            return default if value is _DELETED else value
+        return self._data.get(key, default)
+
+    def set(self, key: str, value: Any) -> None:
+        """Buffer a state write."""
+        self._writes[key] = value
+
+    def update(self, updates: Dict[str, Any]) -> None:
+        """Buffer multiple state writes."""
+        self._writes.update(updates)
+
+    def delete(self, key: str) -> bool:
+        """Buffer a delete; True if the key currently exists."""
+        existed = self.has(key)
+        self._writes[key] = _DELETED
+        return existed
+
+    def has(self, key: str) -> bool:
+        """Check if state key exists (own writes first, then the snapshot)."""
+        if key in self._writes:
+            return self._writes[key] is not _DELETED
+        return key in self.snapshot
+
+    def get_all(self) -> Dict[str, Any]:
+        """Snapshot merged with own writes."""
+        state = self.snapshot.get_all()
+        for key, value in self._writes.items():
+            if value is _DELETED:
+                state.pop(key, None)
+            else:
+                state[key] = value
+        return state
+
+    def rollback(self) -> None:
+        """Discard buffered writes."""
+        self._writes = {}
+
+    @property
+    def pending(self) -> int:
+        """Number of buffered writes."""
+        return len(self._writes)
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self.context, name)
+
+    def __repr__(self) -> str:
+        return f"<StateTransaction: {self.owner}, v{self.snapshot.version}, {len(self._writes)} writes>"
+
 
 class StateContext:
     """
     Shared state context for agent coordination.
 
     Provides:
-    - Thread-safe state storage
+    - Thread-safe state storage (lock-free reads)
     - Key-value state access
+    - Versioned snapshots and buffered transactions
     - State persistence (optional)
     - State history tracking
 
-    TODO: Add state versioning
     TODO: Add state rollback/undo
     TODO: Add state change notifications
     TODO: Add distributed state sync
     """
 
-    def __init__(self, name: str = "global"):
+    def __init__(self, name: str = "global", max_history: int = 100):
         """
         Initialize state context.
 
         Args:
             name: Context name identifier
+            max_history: Number of change records kept
         """
         self.name = name
         self._state: Dict[str, Any] = {}
-        self._lock = Lock()
-        self._history: List[Dict[str, Any]] = []
-        self._max_history = 100
+        self._lock = Lock()  # Writers only
+        self._history: deque = deque(maxlen=max_history)
+        self._history_by_key: Dict[Optional[str], deque] = {}
+        self._max_history = max_history
+
+        # Versioning
+        self.version = 0
+        self._key_versions: Dict[str, int] = {}
+        self._cleared_version = 0
+        self._snapshot: Optional[StateSnapshot] = None
+        self._commits = 0
+        self._conflicts = 0
+
         logger.info(f"StateContext initialized: {name}")
 
     def get(self, key: str, default: Any = None) -> Any:
@@ -56,10 +198,9 @@ class StateContext:
         Returns:
             State value or default
 
-        Thread-safe.
+        Thread-safe (lock-free).
         """
-        with self._lock:
-            return self._state.get(key, default)
+        return self._state.get(key, default)
 
     def set(self, key: str, value: Any) -> None:
         """
@@ -76,12 +217,7 @@ class StateContext:
         TODO: Add state constraints
         """
         with self._lock:
-            old_value = self._state.get(key)
-            self._state[key] = value
-
-            # Record change in history
-            self._record_change(key, old_value, value)
-
+            self._apply(key, value, self._next_version())
             logger.debug(f"State updated: {key} = {value}")
 
     def delete(self, key: str) -> bool:
@@ -100,8 +236,7 @@ class StateContext:
         """
         with self._lock:
             if key in self._state:
-                old_value = self._state.pop(key)
-                self._record_change(key, old_value, None, operation="delete")
+                self._apply(key, _DELETED, self._next_version())
                 logger.debug(f"State deleted: {key}")
                 return True
             return False
@@ -116,10 +251,9 @@ class StateContext:
         Returns:
             True if key exists
 
-        Thread-safe.
+        Thread-safe (lock-free).
         """
-        with self._lock:
-            return key in self._state
+        return key in self._state
 
     def get_all(self) -> Dict[str, Any]:
         """
@@ -128,10 +262,9 @@ class StateContext:
         Returns:
             Copy of entire state
 
-        Thread-safe.
+        Thread-safe (lock-free).
         """
-        with self._lock:
-            return dict(self._state)
+        return self._state.copy()
 
     def update(self, updates: Dict[str, Any]) -> None:
         """
@@ -140,15 +273,12 @@ class StateContext:
         Args:
             updates: Dictionary of key-value pairs to update
 
-        Thread-safe.
-
-        TODO: Add atomic transaction support
+        Thread-safe. Applied as one version.
         """
         with self._lock:
+            version = self._next_version()
             for key, value in updates.items():
-                old_value = self._state.get(key)
-                self._state[key] = value
-                self._record_change(key, old_value, value)
+                self._apply(key, value, version)
             logger.debug(f"State bulk update: {len(updates)} keys")
 
     def clear(self) -> None:
@@ -161,10 +291,104 @@ class StateContext:
         TODO: Emit state_cleared event
         """
         with self._lock:
-            self._state.clear()
+            self._cleared_version = self._next_version()
+            self._state = {}
+            self._key_versions.clear()
             self._record_change(None, None, None, operation="clear")
             logger.info(f"State cleared: {self.name}")
 
+    def snapshot(self) -> StateSnapshot:
+        """
+        Get an immutable snapshot of the current version.
+
+        The snapshot is cached until the next write, so repeated calls
+        between writes are O(1).
+
+        Returns:
+            StateSnapshot
+        """
+        snapshot = self._snapshot
+        if snapshot is not None and snapshot.version == self.version:
+            return snapshot
+
+        with self._lock:
+            if self._snapshot is None or self._snapshot.version != self.version:
+                self._snapshot = StateSnapshot(self.version, self._state.copy())
+            return self._snapshot
+
+    def transaction(
+        self,
+        owner: Optional[str] = None,
+        snapshot: Optional[StateSnapshot] = None
+    ) -> StateTransaction:
+        """
+        Start a buffered transaction.
+
+        Args:
+            owner: Writer identifier (e.g. agent name)
+            snapshot: Snapshot to read from (None = current version)
+
+        Returns:
+            StateTransaction, applied with commit()
+        """
+        return StateTransaction(self, snapshot or self.snapshot(), owner)
+
+    def commit(self, transaction: StateTransaction) -> List[str]:
+        """
+        Merge a transaction's buffered writes.
+
+        Writes are applied as one version (last writer wins). A key is in
+        conflict when it was changed after the transaction's snapshot,
+        by another commit or a direct write.
+
+        Args:
+            transaction: Transaction to apply
+
+        Returns:
+            Conflicting keys (empty if none)
+        """
+        if not transaction.pending:
+            return []
+
+        base = transaction.snapshot.version
+        with self._lock:
+            conflicts = [
+                key for key in transaction._writes
+                if max(self._key_versions.get(key, 0), self._cleared_version) > base
+            ]
+
+            version = self._next_version()
+            for key, value in transaction._writes.items():
+                self._apply(key, value, version)
+            transaction._writes = {}
+
+            self._commits += 1
+            self._conflicts += len(conflicts)
+
+        if conflicts:
+            logger.warning(f"State conflict ({transaction.owner}): {conflicts} changed since v{base}")
+        return conflicts
+
+    def _next_version(self) -> int:
+        """Bump the global version (assumes lock is held)."""
+        self.version += 1
+        return self.version
+
+    def _apply(self, key: str, value: Any, version: int) -> None:
+        """
+        Apply one write or delete at a version.
+
+        Internal method (not thread-safe, assumes lock is held).
+        """
+        old_value = self._state.get(key)
+        if value is _DELETED:
+            self._state.pop(key, None)
+            self._record_change(key, old_value, None, operation="delete")
+        else:
+            self._state[key] = value
+            self._record_change(key, old_value, value)
+        self._key_versions[key] = version
+
     def _record_change(
         self,
         key: Optional[str],
@@ -185,17 +409,28 @@ class StateContext:
         """
         change = {
             "timestamp": datetime.now().isoformat(),
+            "version": self.version,
             "operation": operation,
             "key": key,
             "old_value": old_value,
             "new_value": new_value
         }
 
-        self._history.append(change)
+        if self._max_history <= 0:
+            return
+
+        # Ring buffer: the evicted record is the oldest of its key too
+        if len(self._history) == self._max_history:
+            evicted = self._history[0]["key"]
+            key_history = self._history_by_key[evicted]
+            key_history.popleft()
+            if not key_history:
+                del self._history_by_key[evicted]
 
-        # Limit history size
-        if len(self._history) > self._max_history:
-            self._history.pop(0)
+        self._history.append(change)
+        if key not in self._history_by_key:
+            self._history_by_key[key] = deque()
+        self._history_by_key[key].append(change)
 
     def get_history(self, key: Optional[str] = None) -> List[Dict[str, Any]]:
         """
@@ -212,19 +447,20 @@ class StateContext:
         with self._lock:
             if key is None:
                 return list(self._history)
-            return [h for h in self._history if h.get("key") == key]
+            return list(self._history_by_key.get(key, ()))
 
     def to_json(self) -> str:
         """
         Export state to JSON string.
 
+        Serializes a snapshot, so writers are not blocked meanwhile.
+
         Returns:
             JSON representation of state
 
         TODO: Handle non-serializable objects
         """
-        with self._lock:
-            return json.dumps(self._state, indent=2, default=str)
+        return json.dumps(self.snapshot().get_all(), indent=2, default=str)
 
     def from_json(self, json_str: str) -> None:
         """
@@ -238,7 +474,10 @@ class StateContext:
         """
         data = json.loads(json_str)
         with self._lock:
+            version = self._next_version()
             self._state.update(data)
+            for key in data:
+                self._key_versions[key] = version
             logger.info(f"State loaded from JSON: {len(data)} keys")
 
     def save_to_file(self, filepath: str) -> None:
@@ -281,12 +520,15 @@ class StateContext:
             return {
                 "name": self.name,
                 "total_keys": len(self._state),
+                "version": self.version,
                 "history_size": len(self._history),
-                "max_history": self._max_history
+                "max_history": self._max_history,
+                "commits": self._commits,
+                "conflicts": self._conflicts
             }
 
     def __repr__(self) -> str:
-        return f"<StateContext: {self.name}, {len(self._state)} keys>"
+        return f"<StateContext: {self.name}, {len(self._state)} keys, v{self.version}>"
 
 
 # Singleton instance
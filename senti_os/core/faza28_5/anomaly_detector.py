@@ -15,14 +15,21 @@ Anomalies detected:
 - Missing ticks
 - High error ratio
 - Deviation from expected trace
+
+Score and tick-interval statistics are streamed (senti_stats sliding
+windows): per-sample cost is constant, not O(history). detect_batch()
+scores all agents of a tick in one vectorized pass.
 """
 
 import logging
-from typing import Dict, List, Optional, Any
+from collections import deque
+from typing import Deque, Dict, List, Optional, Any, Set
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta
 from enum import Enum
-import statistics
+
+from senti_core_module.senti_stats import BatchAnomaly, SlidingWindow, score_moments
+from senti_core_module.senti_stats.batch import DROP, OUTLIER, SPIKE
 
 logger = logging.getLogger(__name__)
 
@@ -90,6 +97,8 @@ class AnomalyDetector:
     Maintains history for statistical analysis.
     """
 
+    TIMING_WINDOW = 10  # Tick intervals used for timing deviation
+
     def __init__(
         self,
         score_drop_threshold: float = 0.3,
@@ -117,10 +126,11 @@ class AnomalyDetector:
         self.outlier_z_score = outlier_z_score
         self.history_size = history_size
 
-        # Historical data for agents
-        self.score_history: Dict[str, List[float]] = {}
-        self.tick_history: Dict[str, List[datetime]] = {}
-        self.error_history: Dict[str, List[datetime]] = {}
+        # Historical data for agents (bounded to history_size)
+        self.score_history: Dict[str, SlidingWindow] = {}
+        self.tick_history: Dict[str, Deque[datetime]] = {}
+        self.tick_intervals: Dict[str, SlidingWindow] = {}
+        self.error_history: Dict[str, Deque[datetime]] = {}
 
         # Detected anomalies
         self.anomalies: List[Anomaly] = []
@@ -139,6 +149,8 @@ class AnomalyDetector:
         """
         Run all anomaly detection methods.
 
+        Single-agent form of detect_batch().
+
         Args:
             agent_name: Name of agent to check
             current_score: Current meta-score
@@ -150,92 +162,184 @@ class AnomalyDetector:
             List of detected Anomaly objects
 
         TODO: Add detection timeout
-        TODO: Add parallel detection
         """
-        anomalies = []
+        return self.detect_batch(
+            {agent_name: current_score},
+            tick_time=tick_time,
+            errors={agent_name} if had_error else None,
+            metrics={agent_name: metrics} if metrics else None
+        )[agent_name]
+
+    def detect_batch(
+        self,
+        scores: Dict[str, Optional[float]],
+        tick_time: Optional[datetime] = None,
+        errors: Optional[Set[str]] = None,
+        metrics: Optional[Dict[str, Dict[str, Any]]] = None
+    ) -> Dict[str, List[Anomaly]]:
+        """
+        Run all anomaly detection methods for many agents in one pass.
+
+        Score drops / spikes and statistical outliers are scored for all
+        agents at once (senti_stats batch scoring, vectorized for large
+        batches); Anomaly objects are only built for flagged agents.
+
+        Args:
+            scores: Current meta-score per agent (None = no score this tick)
+            tick_time: Timestamp of this tick (shared by all agents)
+            errors: Agents that had an error this tick
+            metrics: Additional metrics per agent for threshold detection
+
+        Returns:
+            Dictionary mapping agent name to its detected anomalies
+        """
+        names = list(scores)
+        errors = errors or set()
+        metrics = metrics or {}
 
         # Update history
-        if current_score is not None:
-            self._update_score_history(agent_name, current_score)
+        for agent_name in names:
+            if scores[agent_name] is not None:
+                self._update_score_history(agent_name, scores[agent_name])
 
-        if tick_time is not None:
-            self._update_tick_history(agent_name, tick_time)
+            if tick_time is not None:
+                self._update_tick_history(agent_name, tick_time)
 
-        if had_error:
-            self._update_error_history(agent_name)
+            if agent_name in errors:
+                self._update_error_history(agent_name)
 
-        # Run detection methods
-        anomalies.extend(self._detect_score_anomalies(agent_name, current_score))
-        anomalies.extend(self._detect_timing_anomalies(agent_name, tick_time))
-        anomalies.extend(self._detect_error_anomalies(agent_name))
-        anomalies.extend(self._detect_statistical_anomalies(agent_name, current_score))
+        flags = self._score_flags(names, [scores[agent_name] for agent_name in names])
 
-        if metrics:
-            anomalies.extend(self._detect_threshold_anomalies(agent_name, metrics))
+        results: Dict[str, List[Anomaly]] = {}
+        for index, agent_name in enumerate(names):
+            agent_flags = flags.get(index, ())
+            anomalies = [self._flag_anomaly(agent_name, f) for f in agent_flags if f.kind != OUTLIER]
 
-        # Store detected anomalies
-        for anomaly in anomalies:
-            self.anomalies.append(anomaly)
-            logger.warning(f"Anomaly detected: {anomaly}")
+            # Run remaining detection methods
+            anomalies.extend(self._detect_timing_anomalies(agent_name, tick_time))
+            anomalies.extend(self._detect_error_anomalies(agent_name))
+            anomalies.extend(self._flag_anomaly(agent_name, f) for f in agent_flags if f.kind == OUTLIER)
+
+            if metrics.get(agent_name):
+                anomalies.extend(self._detect_threshold_anomalies(agent_name, metrics[agent_name]))
+
+            # Store detected anomalies
+            for anomaly in anomalies:
+                self.anomalies.append(anomaly)
+                logger.warning(f"Anomaly detected: {anomaly}")
+
+            results[agent_name] = anomalies
 
         # Limit anomaly history
         if len(self.anomalies) > self.max_anomaly_history:
             self.anomalies = self.anomalies[-self.max_anomaly_history:]
 
-        return anomalies
+        return results
 
-    def _detect_score_anomalies(
+    def _score_flags(
         self,
-        agent_name: str,
-        current_score: Optional[float]
-    ) -> List[Anomaly]:
+        names: List[str],
+        current_scores: List[Optional[float]]
+    ) -> Dict[int, List[BatchAnomaly]]:
         """
-        Detect sudden score changes (rule-based).
+        Batch-score current scores against each agent's score history.
 
         Args:
-            agent_name: Name of agent
-            current_score: Current score
+            names: Agent names
+            current_scores: Current score per agent (already in history)
 
         Returns:
-            List of detected anomalies
+            Flagged records grouped by agent index
         """
-        if current_score is None:
-            return []
-
-        history = self.score_history.get(agent_name, [])
-        if len(history) < 2:
-            return []
-
-        anomalies = []
-        previous_score = history[-2]
-        score_change = current_score - previous_score
+        previous, centers, scales = [], [], []
+        for agent_name, score in zip(names, current_scores):
+            history = self.score_history.get(agent_name, ())
+            if score is None or len(history) < 2:
+                previous.append(None)
+            else:
+                previous.append(history[-2])
+
+            # Need sufficient data for statistics
+            if score is None or len(history) < 30:
+                centers.append(None)
+                scales.append(None)
+            else:
+                centers.append(history.mean)
+                scales.append(history.std())
+
+        flags: Dict[int, List[BatchAnomaly]] = {}
+        for flag in score_moments(
+            current_scores, centers, scales, previous,
+            threshold=self.outlier_z_score,
+            drop_threshold=self.score_drop_threshold,
+            spike_threshold=self.score_spike_threshold
+        ):
+            flags.setdefault(flag.agent, []).append(flag)
+        return flags
+
+    def _flag_anomaly(self, agent_name: str, flag: BatchAnomaly) -> Anomaly:
+        """Build the Anomaly for a batch scoring record."""
+        current_score = flag.value
 
         # Sudden score drop
-        if score_change < -self.score_drop_threshold:
+        if flag.kind == DROP:
+            score_change = flag.score
             severity = AnomalySeverity.CRITICAL if abs(score_change) > 0.5 else AnomalySeverity.HIGH
-            anomalies.append(Anomaly(
+            return Anomaly(
                 anomaly_type=AnomalyType.SCORE_DROP,
                 severity=severity,
                 agent_name=agent_name,
-                description=f"Sudden score drop: {previous_score:.3f} -> {current_score:.3f}",
+                description=f"Sudden score drop: {flag.expected:.3f} -> {current_score:.3f}",
                 value=current_score,
-                expected=previous_score,
+                expected=flag.expected,
                 confidence=min(1.0, abs(score_change) / self.score_drop_threshold)
-            ))
+            )
 
         # Sudden score spike (may indicate manipulation)
-        elif score_change > self.score_spike_threshold:
-            anomalies.append(Anomaly(
+        if flag.kind == SPIKE:
+            return Anomaly(
                 anomaly_type=AnomalyType.SCORE_SPIKE,
                 severity=AnomalySeverity.MEDIUM,
                 agent_name=agent_name,
-                description=f"Unexpected score spike: {previous_score:.3f} -> {current_score:.3f}",
+                description=f"Unexpected score spike: {flag.expected:.3f} -> {current_score:.3f}",
                 value=current_score,
-                expected=previous_score,
-                confidence=min(1.0, score_change / self.score_spike_threshold)
-            ))
+                expected=flag.expected,
+                confidence=min(1.0, flag.score / self.score_spike_threshold)
+            )
+
+        # Statistical outlier
+        z_score = abs(flag.score)
+        mean = flag.expected
+        stdev = self.score_history[agent_name].std()
+        severity = AnomalySeverity.HIGH if z_score > 5.0 else AnomalySeverity.MEDIUM
+        return Anomaly(
+            anomaly_type=AnomalyType.STATISTICAL_OUTLIER,
+            severity=severity,
+            agent_name=agent_name,
+            description=f"Statistical outlier detected: Z-score={z_score:.2f}",
+            value=current_score,
+            expected=mean,
+            confidence=min(1.0, z_score / self.outlier_z_score),
+            metadata={"z_score": z_score, "mean": mean, "stdev": stdev}
+        )
 
-        return anomalies
+    def _detect_score_anomalies(
+        self,
+        agent_name: str,
+        current_score: Optional[float]
+    ) -> List[Anomaly]:
+        """
+        Detect sudden score changes (rule-based).
+
+        Args:
+            agent_name: Name of agent
+            current_score: Current score
+
+        Returns:
+            List of detected anomalies
+        """
+        flags = self._score_flags([agent_name], [current_score]).get(0, ())
+        return [self._flag_anomaly(agent_name, f) for f in flags if f.kind != OUTLIER]
 
     def _detect_timing_anomalies(
         self,
@@ -255,7 +359,7 @@ class AnomalyDetector:
         if tick_time is None:
             return []
 
-        history = self.tick_history.get(agent_name, [])
+        history = self.tick_history.get(agent_name, ())
         if len(history) < 2:
             return []
 
@@ -276,11 +380,11 @@ class AnomalyDetector:
                 confidence=min(1.0, time_since_tick / self.missing_tick_window)
             ))
 
-        # Calculate average tick interval
-        if len(history) >= 10:
-            intervals = [(history[i] - history[i-1]).total_seconds() for i in range(-10, 0)]
-            avg_interval = statistics.mean(intervals)
-            stdev_interval = statistics.stdev(intervals) if len(intervals) > 1 else 0
+        # Average of the last TIMING_WINDOW tick intervals
+        intervals = self.tick_intervals.get(agent_name)
+        if intervals is not None and intervals.is_full():
+            avg_interval = intervals.mean
+            stdev_interval = intervals.std()
 
             # Detect significant deviation from average
             if stdev_interval > 0:
@@ -309,10 +413,11 @@ class AnomalyDetector:
         Returns:
             List of detected anomalies
         """
-        error_history = self.error_history.get(agent_name, [])
-        tick_history = self.tick_history.get(agent_name, [])
+        error_history = self.error_history.get(agent_name, ())
+        tick_history = self.tick_history.get(agent_name, ())
 
-        if not tick_history:
+        # No errors recorded: error rate is zero
+        if not tick_history or not error_history:
             return []
 
         anomalies = []
@@ -356,39 +461,8 @@ class AnomalyDetector:
         Returns:
             List of detected anomalies
         """
-        if current_score is None:
-            return []
-
-        history = self.score_history.get(agent_name, [])
-        if len(history) < 30:  # Need sufficient data for statistics
-            return []
-
-        anomalies = []
-
-        try:
-            mean = statistics.mean(history)
-            stdev = statistics.stdev(history)
-
-            if stdev > 0:
-                z_score = abs(current_score - mean) / stdev
-
-                if z_score > self.outlier_z_score:
-                    severity = AnomalySeverity.HIGH if z_score > 5.0 else AnomalySeverity.MEDIUM
-                    anomalies.append(Anomaly(
-                        anomaly_type=AnomalyType.STATISTICAL_OUTLIER,
-                        severity=severity,
-                        agent_name=agent_name,
-                        description=f"Statistical outlier detected: Z-score={z_score:.2f}",
-                        value=current_score,
-                        expected=mean,
-                        confidence=min(1.0, z_score / self.outlier_z_score),
-                        metadata={"z_score": z_score, "mean": mean, "stdev": stdev}
-                    ))
-
-        except statistics.StatisticsError as e:
-            logger.debug(f"Statistical calculation failed for {agent_name}: {e}")
-
-        return anomalies
+        flags = self._score_flags([agent_name], [current_score]).get(0, ())
+        return [self._flag_anomaly(agent_name, f) for f in flags if f.kind == OUTLIER]
 
     def _detect_threshold_anomalies(
         self,
@@ -441,36 +515,28 @@ class AnomalyDetector:
     def _update_score_history(self, agent_name: str, score: float) -> None:
         """Update score history for an agent"""
         if agent_name not in self.score_history:
-            self.score_history[agent_name] = []
-
-        self.score_history[agent_name].append(score)
+            self.score_history[agent_name] = SlidingWindow(self.history_size)
 
-        # Limit history size
-        if len(self.score_history[agent_name]) > self.history_size:
-            self.score_history[agent_name] = self.score_history[agent_name][-self.history_size:]
+        self.score_history[agent_name].push(score)
 
     def _update_tick_history(self, agent_name: str, tick_time: datetime) -> None:
-        """Update tick history for an agent"""
+        """Update tick history (and tick intervals) for an agent"""
         if agent_name not in self.tick_history:
-            self.tick_history[agent_name] = []
+            self.tick_history[agent_name] = deque(maxlen=self.history_size)
+            self.tick_intervals[agent_name] = SlidingWindow(self.TIMING_WINDOW)
 
-        self.tick_history[agent_name].append(tick_time)
-
-        # Limit history size
-        if len(self.tick_history[agent_name]) > self.history_size:
-            self.tick_history[agent_name] = self.tick_history[agent_name][-self.history_size:]
+        history = self.tick_history[agent_name]
+        if history:
+            self.tick_intervals[agent_name].push((tick_time - history[-1]).total_seconds())
+        history.append(tick_time)
 
     def _update_error_history(self, agent_name: str) -> None:
         """Update error history for an agent"""
         if agent_name not in self.error_history:
-            self.error_history[agent_name] = []
+            self.error_history[agent_name] = deque(maxlen=self.history_size)
 
         self.error_history[agent_name].append(datetime.now())
 
-        # Limit history size
-        if len(self.error_history[agent_name]) > self.history_size:
-            self.error_history[agent_name] = self.error_history[agent_name][-self.history_size:]
-
     def get_recent_anomalies(
         self,
         agent_name: Optional[str] = None,
@@ -533,11 +599,13 @@ class AnomalyDetector:
         if agent_name:
             self.score_history.pop(agent_name, None)
             self.tick_history.pop(agent_name, None)
+            self.tick_intervals.pop(agent_name, None)
             self.error_history.pop(agent_name, None)
             logger.info(f"Cleared history for agent: {agent_name}")
         else:
             self.score_history.clear()
             self.tick_history.clear()
+            self.tick_intervals.clear()
             self.error_history.clear()
             self.anomalies.clear()
             logger.info("Cleared all history")
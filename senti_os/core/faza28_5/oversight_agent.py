@@ -135,14 +135,13 @@ class OversightAgent:
         # 3. Detect anomalies
         anomalies = []
         if self.anomaly_detector:
-            for agent_name, score in scores.items():
-                detected = self.anomaly_detector.detect_all(
-                    agent_name=agent_name,
-                    current_score=score.meta_score,
-                    tick_time=datetime.now(),
-                    metrics=agent_metrics.get(agent_name, {})
-                )
-                anomalies.extend(detected)
+            detected = self.anomaly_detector.detect_batch(
+                {agent_name: score.meta_score for agent_name, score in scores.items()},
+                tick_time=datetime.now(),
+                metrics=agent_metrics
+            )
+            for agent_anomalies in detected.values():
+                anomalies.extend(agent_anomalies)
 
         # 4. Analyze stability
         stability_issues = []
@@ -9,6 +9,7 @@ Features:
 - Health scoring
 - Predictive failure analysis
 - Multi-source fault detection
+- Batch metric anomaly scoring across agents
 """
 
 import logging
@@ -18,6 +19,8 @@ from datetime import datetime, timedelta
 from enum import Enum
 from collections import deque
 
+from senti_core_module.senti_stats import RobustZScore, SlidingWindow, score_windows, score_moments
+
 logger = logging.getLogger(__name__)
 
 
@@ -80,19 +83,28 @@ class DetectedFault:
 
 
 class AnomalyDetector:
-    """Detects anomalies using statistical methods"""
+    """
+    Detects anomalies using statistical methods.
 
-    def __init__(self, window_size: int = 20, threshold: float = 3.0):
+    Per-metric statistics are streamed (O(1) per sample): a sliding window
+    z-score by default, or with robust=True a median / MAD z-score over
+    the whole metric stream (P2 sketches), which outliers cannot inflate.
+    """
+
+    def __init__(self, window_size: int = 20, threshold: float = 3.0, robust: bool = False):
         """
         Initialize anomaly detector.
         
         Args:
             window_size: Size of sliding window
             threshold: Z-score threshold for anomaly
+            robust: Use robust (median / MAD) z-scores
         """
         self.window_size = window_size
         self.threshold = threshold
-        self.history: Dict[str, deque] = {}
+        self.robust = robust
+        self.history: Dict[str, SlidingWindow] = {}
+        self.robust_scores: Dict[str, RobustZScore] = {}
 
     def detect_anomaly(self, metric_name: str, value: float) -> bool:
         """
@@ -105,31 +117,55 @@ class AnomalyDetector:
         Returns:
             True if anomalous, False otherwise
         """
-        if metric_name not in self.history:
-            self.history[metric_name] = deque(maxlen=self.window_size)
+        return metric_name in self.detect_batch({metric_name: value})
 
-        history = self.history[metric_name]
-        
-        # Need enough history
-        if len(history) < self.window_size // 2:
-            history.append(value)
-            return False
-
-        # Calculate z-score
-        mean = sum(history) / len(history)
-        variance = sum((x - mean) ** 2 for x in history) / len(history)
-        std = variance ** 0.5
+    def detect_batch(self, samples: Dict[str, float]) -> Dict[str, float]:
+        """
+        Score one sample of many metrics in a single pass.
 
-        if std == 0:
-            history.append(value)
-            return False
+        Each sample is z-scored against its metric's history before being
+        added to it; the threshold check runs vectorized over the batch.
 
-        z_score = abs((value - mean) / std)
-        is_anomaly = z_score > self.threshold
+        Args:
+            samples: Current value per metric
 
-        history.append(value)
+        Returns:
+            Dictionary mapping each anomalous metric to its z-score
+        """
+        names = list(samples)
+        values, centers, scales = [], [], []
+        for metric_name in names:
+            value = samples[metric_name]
+            if metric_name not in self.history:
+                self.history[metric_name] = SlidingWindow(self.window_size)
+                if self.robust:
+                    self.robust_scores[metric_name] = RobustZScore()
+
+            history = self.history[metric_name]
+            robust = self.robust_scores.get(metric_name)
+
+            # Need enough history
+            if len(history) < self.window_size // 2:
+                centers.append(None)
+                scales.append(None)
+            elif robust is not None:
+                mad = robust.mad
+                centers.append(robust.median)
+                scales.append(mad / RobustZScore.SCALE if mad else None)
+            else:
+                # Population z-score against the window
+                centers.append(history.mean)
+                scales.append(history.std(ddof=0))
+
+            values.append(value)
+            history.push(value)
+            if robust is not None:
+                robust.add(value)
 
-        return is_anomaly
+        return {
+            names[flag.agent]: flag.score
+            for flag in score_moments(values, centers, scales, threshold=self.threshold)
+        }
 
 
 class DetectionEngine:
@@ -182,7 +218,8 @@ class DetectionEngine:
         faza27_metrics: Optional[Dict[str, Any]] = None,
         faza28_metrics: Optional[Dict[str, Any]] = None,
         faza28_5_metrics: Optional[Dict[str, Any]] = None,
-        faza29_metrics: Optional[Dict[str, Any]] = None
+        faza29_metrics: Optional[Dict[str, Any]] = None,
+        agent_metrics: Optional[Dict[str, Dict[str, float]]] = None
     ) -> List[DetectedFault]:
         """
         Detect faults from all FAZA layers.
@@ -193,6 +230,7 @@ class DetectionEngine:
             faza28_metrics: FAZA 28 agent metrics
             faza28_5_metrics: FAZA 28.5 meta-layer metrics
             faza29_metrics: FAZA 29 governance metrics
+            agent_metrics: Per-agent metric samples for anomaly detection
             
         Returns:
             List of detected faults
@@ -210,6 +248,8 @@ class DetectionEngine:
             faults.extend(self._detect_faza28_5_faults(faza28_5_metrics))
         if faza29_metrics:
             faults.extend(self._detect_faza29_faults(faza29_metrics))
+        if agent_metrics:
+            faults.extend(self.detect_agent_anomalies(agent_metrics))
 
         # Store faults
         self.detected_faults.extend(faults)
@@ -231,6 +271,92 @@ class DetectionEngine:
 
         return faults
 
+    def detect_agent_anomalies(
+        self,
+        agent_metrics: Dict[str, Dict[str, float]]
+    ) -> List[DetectedFault]:
+        """
+        Detect metric anomalies for all agents in one batch.
+
+        Every agent / metric pair keeps its own streamed history in the
+        anomaly detector; the current tick is scored in a single pass.
+
+        Args:
+            agent_metrics: Current metric values per agent
+
+        Returns:
+            List of detected faults (one per anomalous metric)
+        """
+        keys = {}
+        samples = {}
+        for agent_name, metrics in agent_metrics.items():
+            for metric_name, value in metrics.items():
+                key = f"{agent_name}.{metric_name}"
+                keys[key] = (agent_name, metric_name)
+                samples[key] = value
+
+        anomalous = self.anomaly_detector.detect_batch(samples)
+        faults = [
+            self._metric_fault(*keys[key], samples[key], z_score)
+            for key, z_score in anomalous.items()
+        ]
+        self.stats["anomalies_detected"] += len(faults)
+        return faults
+
+    def detect_window_anomalies(
+        self,
+        windows: Any,
+        agent_names: List[str],
+        metric_names: List[str]
+    ) -> List[DetectedFault]:
+        """
+        Detect metric anomalies from a raw sample matrix.
+
+        Scores the newest sample of each series against the samples before
+        it, with the anomaly detector's threshold and warm-up rules.
+
+        Args:
+            windows: Samples, agents x metrics x window (oldest first,
+                NaN-padded at the front for shorter histories)
+            agent_names: Agent name per row
+            metric_names: Metric name per column
+
+        Returns:
+            List of detected faults (one per anomalous metric)
+        """
+        detector = self.anomaly_detector
+        records = score_windows(
+            windows,
+            threshold=detector.threshold,
+            ddof=0,
+            include_current=False,
+            min_samples=max(1, detector.window_size // 2)
+        )
+        faults = [
+            self._metric_fault(agent_names[r.agent], metric_names[r.metric], r.value, r.score)
+            for r in records
+        ]
+        self.stats["anomalies_detected"] += len(faults)
+        return faults
+
+    def _metric_fault(
+        self,
+        agent_name: str,
+        metric_name: str,
+        value: float,
+        z_score: float
+    ) -> DetectedFault:
+        """Build the fault for an anomalous agent metric."""
+        threshold = self.anomaly_detector.threshold
+        return DetectedFault(
+            fault_id=f"metric_{agent_name}_{metric_name}_{datetime.now().timestamp()}",
+            source=FaultSource.FAZA28_AGENT_LOOP,
+            severity=FaultSeverity.HIGH if abs(z_score) > 2 * threshold else FaultSeverity.MEDIUM,
+            fault_type="metric_anomaly",
+            description=f"Anomalous {metric_name} for {agent_name}: {value:.3f} (z={z_score:.2f})",
+            metrics={"agent": agent_name, "metric": metric_name, "value": value, "z_score": z_score}
+        )
+
     def _detect_faza25_faults(self, metrics: Dict[str, Any]) -> List[DetectedFault]:
         """Detect FAZA 25 orchestrator faults"""
         faults = []
@@ -173,6 +173,56 @@ class TestPriorityQueue(unittest.TestCase):
         stats = self.queue.get_statistics()
         self.assertEqual(stats.total_enqueued, 1)
 
+    def test_update_priority_reorders(self):
+        """Test that updated priority changes dequeue order."""
+        self.queue.enqueue(QueuedTask("first", Priority.NORMAL, datetime.now(), 60, 1.0))
+        self.queue.enqueue(QueuedTask("second", Priority.LOW, datetime.now(), 60, 1.0))
+        self.assertEqual(self.queue.get_position("second"), 1)
+        self.queue.update_priority("second", Priority.HIGH)
+        self.assertEqual(self.queue.get_position("second"), 0)
+        self.assertEqual(self.queue.get_statistics().tasks_by_priority["high"], 1)
+        self.assertEqual(self.queue.dequeue().task_id, "second")
+
+    def test_remove_task(self):
+        """Test removing a queued task."""
+        self.queue.enqueue(QueuedTask("keep", Priority.NORMAL, datetime.now(), 60, 1.0))
+        self.queue.enqueue(QueuedTask("drop", Priority.HIGH, datetime.now(), 60, 1.0))
+        self.assertTrue(self.queue.remove_task("drop"))
+        self.assertFalse(self.queue.remove_task("drop"))
+        self.assertIsNone(self.queue.get_task("drop"))
+        self.assertEqual(self.queue.size(), 1)
+        self.assertEqual(self.queue.dequeue().task_id, "keep")
+
+    def test_aging_prevents_starvation(self):
+        """Test that a long-waiting low-priority task overtakes newer tasks."""
+        waited = timedelta(seconds=2 * self.queue.STARVATION_THRESHOLD_SECONDS + 1)
+        self.queue.enqueue(QueuedTask("fresh_high", Priority.HIGH, datetime.now(), 60, 1.0))
+        self.queue.enqueue(QueuedTask("old_low", Priority.LOW, datetime.now() - waited, 60, 1.0))
+        self.assertEqual(self.queue.get_effective_priority("old_low"), Priority.HIGH)
+        self.assertEqual(self.queue.get_statistics().tasks_by_priority["low"], 1)
+        self.assertEqual(self.queue.dequeue().task_id, "old_low")
+
+    def test_get_task_after_completion(self):
+        """Test looking up completed tasks."""
+        self.queue.enqueue(QueuedTask("done_task", Priority.NORMAL, datetime.now(), 60, 1.0))
+        self.queue.dequeue()
+        self.queue.mark_completed("done_task")
+        self.assertEqual(self.queue.get_task("done_task").task_id, "done_task")
+
+    def test_import_does_not_load_faza25(self):
+        """Test that the FAZA 17 queue does not pull in the FAZA 25 layer."""
+        import subprocess
+        import sys
+
+        code = (
+            "import sys, senti_os.core.faza17.priority_queue; "
+            "print(any(m.startswith('senti_os.core.faza25') for m in sys.modules))"
+        )
+        output = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True, check=True
+        ).stdout
+        self.assertEqual(output.strip(), "False")
+
 
 class TestModelEnsembleEngine(unittest.TestCase):
     """Tests for Model Ensemble Engine."""
@@ -12,6 +12,7 @@ import unittest
 from datetime import datetime, timedelta
 import sys
 import os
+import threading
 
 # Add project root to path
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../../..')))
@@ -288,11 +289,14 @@ class TestPermissionManager(unittest.TestCase):
 
 
 class TestUILEventBus(unittest.TestCase):
-    """Test cases for UILEventBus (10 tests)."""
+    """Test cases for UILEventBus (15 tests)."""
 
     def setUp(self):
         self.event_bus = UILEventBus()
 
+    def tearDown(self):
+        self.event_bus.shutdown()
+
     def test_subscribe(self):
         """Test event subscription."""
         called = []
@@ -314,6 +318,7 @@ class TestUILEventBus(unittest.TestCase):
             "task_complete",
             {"task_id": "task_1"}
         )
+        self.assertTrue(self.event_bus.flush(timeout=5))
         self.assertEqual(len(called), 1)
 
     def test_event_history(self):
@@ -345,6 +350,7 @@ class TestUILEventBus(unittest.TestCase):
         self.event_bus.subscribe(EventCategory.LLM_ROUTING, lambda e: called2.append(e))
 
         self.event_bus.publish(EventCategory.LLM_ROUTING, "route", {})
+        self.event_bus.flush(timeout=5)
         self.assertEqual(len(called1), 1)
         self.assertEqual(len(called2), 1)
 
@@ -355,6 +361,7 @@ class TestUILEventBus(unittest.TestCase):
 
         data = {"explanation": "Test explanation", "confidence": 0.95}
         self.event_bus.publish(EventCategory.EXPLAINABILITY, "explain", data)
+        self.event_bus.flush(timeout=5)
 
         self.assertEqual(called[0].data, data)
 
@@ -369,6 +376,7 @@ class TestUILEventBus(unittest.TestCase):
             {},
             source_device_id="device_1"
         )
+        self.event_bus.flush(timeout=5)
         self.assertEqual(called[0].source_device_id, "device_1")
 
     def test_subscriber_error_isolation(self):
@@ -384,6 +392,7 @@ class TestUILEventBus(unittest.TestCase):
         self.event_bus.subscribe(EventCategory.ERROR, good_callback)
 
         self.event_bus.publish(EventCategory.ERROR, "error", {})
+        self.event_bus.flush(timeout=5)
         self.assertEqual(len(good_called), 1)
 
     def test_event_timestamp(self):
@@ -392,6 +401,93 @@ class TestUILEventBus(unittest.TestCase):
         history = self.event_bus.get_event_history()
         self.assertIsInstance(history[0].timestamp, datetime)
 
+    def test_history_ring_buffer(self):
+        """Test history is bounded per category and limit returns newest."""
+        event_bus = UILEventBus(history_size=5)
+        for i in range(8):
+            event_bus.publish(EventCategory.WARNING, f"warning_{i}", {})
+        event_bus.publish(EventCategory.ERROR, "error", {})
+
+        warnings = event_bus.get_event_history(category=EventCategory.WARNING)
+        self.assertEqual([e.event_type for e in warnings],
+                         [f"warning_{i}" for i in range(3, 8)])
+
+        latest = event_bus.get_event_history(category=EventCategory.WARNING, limit=2)
+        self.assertEqual([e.event_type for e in latest], ["warning_6", "warning_7"])
+        self.assertEqual(len(event_bus.get_event_history()), 5)
+        self.assertEqual(event_bus.get_stats()["events_published"], 9)
+
+    def test_slow_subscriber_does_not_block_publishers(self):
+        """Test publish() returns while a slow callback is still running."""
+        entered = threading.Event()
+        release = threading.Event()
+        fast_done = threading.Event()
+        slow_received = []
+        fast_received = []
+
+        def slow_callback(event):
+            entered.set()
+            release.wait(timeout=5)
+            slow_received.append(event.event_type)
+
+        def fast_callback(event):
+            fast_received.append(event.event_type)
+            fast_done.set()
+
+        self.event_bus.subscribe(EventCategory.OS_STATUS, slow_callback)
+        self.event_bus.subscribe(EventCategory.OS_STATUS, fast_callback)
+
+        # A single-threaded publisher is not held up by the slow callback
+        self.event_bus.publish(EventCategory.OS_STATUS, "status_1", {})
+        self.assertTrue(entered.wait(timeout=5))
+        self.event_bus.publish(EventCategory.OS_STATUS, "status_2", {})
+        self.assertTrue(fast_done.wait(timeout=5))
+        self.assertEqual(slow_received, [])
+        self.assertFalse(self.event_bus.flush(timeout=0.05))
+
+        # Queued events reach the slow subscriber in order
+        release.set()
+        self.assertTrue(self.event_bus.flush(timeout=5))
+        self.assertEqual(slow_received, ["status_1", "status_2"])
+        self.assertEqual(fast_received, ["status_1", "status_2"])
+
+    def test_sync_delivery_caps_inline_work(self):
+        """Test opt-in sync delivery runs inline and caps events per publish."""
+        event_bus = UILEventBus(delivery="sync", max_inline=2)
+        received = []
+
+        def callback(event):
+            received.append(event.event_type)
+            if event.event_type == "first":
+                # Re-entrant publishes only enqueue
+                for i in range(4):
+                    event_bus.publish(EventCategory.TASK_PROGRESS, f"nested_{i}", {})
+
+        event_bus.subscribe(EventCategory.TASK_PROGRESS, callback)
+        event_bus.publish(EventCategory.TASK_PROGRESS, "first", {})
+
+        self.assertEqual(received, ["first", "nested_0"])
+        self.assertTrue(event_bus.flush())
+        self.assertEqual(received, ["first"] + [f"nested_{i}" for i in range(4)])
+        self.assertEqual(event_bus.get_stats()["delivery"], "sync")
+
+    def test_invalid_delivery_mode(self):
+        """Test unknown delivery modes are rejected."""
+        with self.assertRaises(ValueError):
+            UILEventBus(delivery="inline")
+
+    def test_latency_stats(self):
+        """Test per-category latency histograms and subscriber stats."""
+        sub_id = self.event_bus.subscribe(EventCategory.LLM_ROUTING, lambda e: None)
+        self.event_bus.publish(EventCategory.LLM_ROUTING, "route", {})
+        self.event_bus.flush(timeout=5)
+
+        stats = self.event_bus.get_stats()
+        self.assertEqual(stats["publish_latency"]["llm_routing"]["count"], 1)
+        self.assertEqual(stats["deliver_latency"]["llm_routing"]["count"], 1)
+        self.assertEqual(stats["subscribers"][sub_id]["delivered"], 1)
+        self.assertEqual(stats["subscribers"][sub_id]["dropped"], 0)
+
 
 class TestUILProtocol(unittest.TestCase):
     """Test cases for UILProtocol (8 tests)."""
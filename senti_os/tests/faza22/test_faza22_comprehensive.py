@@ -583,6 +583,121 @@ class TestLogsManager:
         assert summary["total_entries"] == 3
         assert summary["error_count"] >= 1
 
+    def test_logs_manager_subscribe(self, logs_manager):
+        """Test 59b: Subscribers receive new entries until unsubscribed."""
+        received = []
+        logs_manager.subscribe(received.append)
+        logs_manager.append_log("warning", "Pushed", component="boot")
+        logs_manager.unsubscribe(received.append)
+        logs_manager.append_log("info", "Not pushed")
+
+        assert len(received) == 1
+        assert received[0]["message"] == "Pushed"
+        assert received[0]["component"] == "boot"
+
+    def test_logs_manager_indexes_follow_rolling_window(self, logs_manager):
+        """Test 59c: Level/component indexes and summary track evictions."""
+        for i in range(150):
+            level = "error" if i % 10 == 0 else "info"
+            logs_manager.append_log(level, f"Message {i}", component=f"c{i % 3}")
+
+        # Only entries 50..149 are retained
+        errors = logs_manager.get_logs(level="error")
+        assert [e["message"] for e in errors] == [f"Message {i}" for i in range(50, 150, 10)]
+
+        both = logs_manager.get_logs(level="error", component="c0", limit=2)
+        assert [e["message"] for e in both] == ["Message 90", "Message 120"]
+
+        assert len(logs_manager.get_component_logs("c1", limit=1000)) == 33
+
+        summary = logs_manager.get_log_summary()
+        assert summary["total_entries"] == 100
+        assert summary["error_count"] == 10
+        assert summary["info_count"] == 90
+
+    def test_logs_manager_seq_cursor(self, logs_manager):
+        """Test 59d: get_logs_since_seq pages forward from a cursor."""
+        for i in range(5):
+            logs_manager.append_log("info", f"Message {i}")
+
+        first_page = logs_manager.get_logs_since_seq(0, limit=2)
+        assert [e["seq"] for e in first_page] == [1, 2]
+
+        rest = logs_manager.get_logs_since_seq(first_page[-1]["seq"])
+        assert [e["message"] for e in rest] == ["Message 2", "Message 3", "Message 4"]
+        assert logs_manager.get_logs_since_seq(5) == []
+
+    def test_logs_manager_segmented_persistence(self, temp_storage_dir):
+        """Test 59e: Segments support tail, time range and seq reads."""
+        log_file = str(Path(temp_storage_dir) / "senti_os.log")
+        manager = LogsManager(
+            max_entries=10,
+            persist_to_disk=True,
+            log_file=log_file,
+            segment_max_bytes=1024
+        )
+        for i in range(50):
+            manager.append_log("info", f"Message {i}")
+        middle = datetime.fromisoformat(manager.get_logs_since_seq(24, limit=1)[0]["timestamp"])
+        for i in range(50, 100):
+            manager.append_log("info", f"Message {i}")
+        manager.close()
+
+        assert len(list(Path(temp_storage_dir).glob("senti_os-*.jsonl"))) > 1
+
+        tail = manager.tail_persisted_logs(3)
+        assert [e["seq"] for e in tail] == [98, 99, 100]
+
+        in_range = manager.get_persisted_logs(since=middle, limit=3)
+        assert datetime.fromisoformat(in_range[0]["timestamp"]) >= middle
+        assert in_range[0]["seq"] <= 25
+
+        # Cursor older than the in-memory window falls back to disk
+        older = manager.get_logs_since_seq(10, limit=2)
+        assert [e["seq"] for e in older] == [11, 12]
+
+        # Seq numbers continue across restarts
+        reopened = LogsManager(persist_to_disk=True, log_file=log_file)
+        reopened.append_log("info", "After restart")
+        assert reopened.get_recent_logs(1)[0]["seq"] == 101
+        reopened.close()
+
+    def test_logs_manager_export_import(self, logs_manager, temp_storage_dir):
+        """Test 59f: Exported JSON arrays and JSONL are imported in order."""
+        for i in range(5):
+            logs_manager.append_log("warning", f"Message {i}", component="io")
+
+        for name in ("logs.json", "logs.jsonl"):
+            path = str(Path(temp_storage_dir) / name)
+            assert logs_manager.export_logs(path)
+
+            target = LogsManager(max_entries=100)
+            assert target.import_logs(path)
+            imported = target.get_logs(component="io")
+            assert [e["message"] for e in imported] == [f"Message {i}" for i in range(5)]
+            assert [e["seq"] for e in imported] == [1, 2, 3, 4, 5]
+
+    def test_logs_manager_since_after_import(self, logs_manager, temp_storage_dir):
+        """Test 59g: get_logs_since sees live entries around older imports."""
+        for i in range(3):
+            logs_manager.append_log("info", f"Old {i}")
+        path = str(Path(temp_storage_dir) / "old.jsonl")
+        assert logs_manager.export_logs(path)
+
+        target = LogsManager(max_entries=100)
+        target.append_log("info", "Live 0")
+        since = datetime.now()
+        target.append_log("info", "Live 1")
+        assert target.import_logs(path)
+        target.append_log("info", "Live 2")
+
+        recent = target.get_logs_since(since)
+        assert [e["message"] for e in recent] == ["Live 1", "Live 2"]
+        assert [e["message"] for e in target.get_logs_since(since, limit=1)] == ["Live 2"]
+
+        everything = target.get_logs_since(datetime.min)
+        assert len(everything) == 6
+
 
 # ============================================================================
 # SENTINEL PROCESS TESTS (8 tests)
@@ -764,6 +879,129 @@ def test_faza22_get_info():
     assert info["privacy_compliant"] == "true"
 
 
+# ============================================================================
+# BOOT DEPENDENCY GRAPH TESTS (5 tests)
+# ============================================================================
+
+class FakeStack:
+    """Stack stand-in with a slow constructor."""
+
+    DELAY = 0.1
+
+    def __init__(self, name, log, **kwargs):
+        time.sleep(self.DELAY)
+        self.name = name
+        self.kwargs = kwargs
+        self.running = False
+        log.append(name)
+
+    def start(self):
+        self.running = True
+
+    def stop(self):
+        self.running = False
+
+
+@pytest.fixture
+def fake_stacks(tmp_path):
+    """Build FakeStacks instead of real FAZA stacks; yields construction log."""
+    log = []
+
+    def import_stack(self, stack_name):
+        return lambda **kwargs: FakeStack(stack_name, log, **kwargs)
+
+    with patch.object(BootManager, "STATE_FILE", str(tmp_path / "boot_state.json")), \
+            patch.object(BootManager, "_import_stack", import_stack):
+        yield log
+
+
+def test_boot_sequence_respects_dependencies(fake_stacks):
+    """Test 74: Boot sequence places every stack after its dependencies."""
+    manager = BootManager()
+    sequence = manager.boot_sequence
+
+    assert sorted(sequence) == sorted(BootManager.BOOT_ORDER)
+    for stack_name, dependencies in BootManager.STACK_DEPENDENCIES.items():
+        for dep in dependencies:
+            assert sequence.index(dep) < sequence.index(stack_name)
+    assert ServiceRegistry().validate_boot_order(sequence)["valid"]
+
+    manager = BootManager()
+    assert not manager.parallel_boot
+    assert manager.start()
+    assert fake_stacks == sequence
+
+
+def test_parallel_boot_overlaps_independent_stacks(fake_stacks, temp_storage_dir):
+    """Test 75: Independent stacks are constructed concurrently."""
+    manager = BootManager(storage_dir=temp_storage_dir, parallel_boot=True)
+
+    started = time.perf_counter()
+    assert manager.start()
+    elapsed = time.perf_counter() - started
+
+    # Three dependency levels of 0.1s each, not six stacks in a row
+    assert elapsed < 5 * FakeStack.DELAY
+    assert manager.is_healthy()
+
+    faza20 = manager.get_stack("faza20")
+    assert faza20.kwargs["faza16_llm_control"] is manager.get_stack("faza16")
+    assert faza20.kwargs["faza21_persistence"] is manager.get_stack("faza21")
+    assert manager.get_stack("faza21").kwargs == {"storage_dir": temp_storage_dir}
+
+    status = manager.get_status()
+    assert set(status["system"]["phase_seconds"]) == {"load", "init", "start"}
+    timings = status["stacks"]["faza19"]["timings"]
+    assert set(timings) == {"import", "load", "init", "start"}
+    assert timings["load"] >= FakeStack.DELAY
+    assert status["stacks"]["faza20"]["dependencies"] == BootManager.STACK_DEPENDENCIES["faza20"]
+
+
+def test_lazy_stack_loaded_on_first_access(fake_stacks):
+    """Test 76: Lazy stacks are built on first get_stack()."""
+    manager = BootManager(enable_ux=False, lazy_stacks=["faza17"])
+    assert manager.start()
+
+    assert "faza17" not in fake_stacks
+    assert manager.stacks["faza17"].lazy
+    assert manager.stacks["faza17"].status == StackStatus.NOT_LOADED
+    assert manager.is_healthy()
+
+    faza17 = manager.get_stack("faza17")
+    assert faza17 is not None and faza17.running
+    assert manager.stacks["faza17"].status == StackStatus.RUNNING
+    assert manager.get_stack("faza17") is faza17
+    assert fake_stacks.count("faza17") == 1
+
+    # Restart defers the lazy stack again
+    assert manager.restart()
+    assert manager.stacks["faza17"].status == StackStatus.NOT_LOADED
+    assert manager.get_stack("faza17") is not faza17
+
+
+def test_lazy_stack_required_by_eager_stack(fake_stacks):
+    """Test 77: A lazy stack an eager stack depends on boots eagerly."""
+    manager = BootManager(lazy_stacks=["faza17"])
+    assert manager.start()
+
+    assert "faza17" in fake_stacks
+    assert not manager.stacks["faza17"].lazy
+    assert manager.stacks["faza17"].status == StackStatus.RUNNING
+
+
+def test_boot_manager_rejects_invalid_dependencies(fake_stacks):
+    """Test 78: Dependency cycles and unknown lazy stacks are rejected."""
+
+    class CyclicBootManager(BootManager):
+        STACK_DEPENDENCIES = {**BootManager.STACK_DEPENDENCIES, "faza21": ["faza19"]}
+
+    with pytest.raises(ValueError):
+        CyclicBootManager()
+
+    with pytest.raises(ValueError):
+        BootManager(lazy_stacks=["faza99"])
+
+
 # ============================================================================
 # RUN ALL TESTS
 # ============================================================================
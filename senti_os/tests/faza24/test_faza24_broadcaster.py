@@ -0,0 +1,171 @@
+"""
+FAZA 24 - Dashboard Broadcaster Test Suite
+
+Test Coverage:
+- json_diff / apply_patch round trips
+- StatusBroadcaster snapshot, patch and slow-client resync
+- LogBroadcaster push fan-out from LogsManager
+
+Author: SENTI OS Core Team
+License: Proprietary
+Version: 1.0.0
+"""
+
+import asyncio
+import json
+
+import pytest
+
+# senti_os.core.faza24 imports the FastAPI dashboard app on package import
+pytest.importorskip("fastapi")
+
+from senti_os.core.faza22.logs_manager import LogsManager
+from senti_os.core.faza24.broadcaster import (
+    json_diff,
+    apply_patch,
+    StatusBroadcaster,
+    LogBroadcaster
+)
+
+
+class FakeWebSocket:
+    """Minimal socket: records sent text, disconnects on demand."""
+
+    def __init__(self):
+        self.sent = []
+        self.closed = asyncio.Event()
+
+    async def send_text(self, text):
+        self.sent.append(json.loads(text))
+
+    async def receive_text(self):
+        await self.closed.wait()
+        raise ConnectionError("disconnected")
+
+
+async def settle():
+    for _ in range(5):
+        await asyncio.sleep(0)
+
+
+# ============================================================================
+# JSON PATCH TESTS
+# ============================================================================
+
+class TestJsonPatch:
+    """Test suite for json_diff / apply_patch."""
+
+    def test_diff_only_changed_fields(self):
+        """Test 1: Only changed leaves produce operations."""
+        old = {"system": {"state": "running", "uptime": 1}, "stacks": {"a": 1}}
+        new = {"system": {"state": "running", "uptime": 2}, "stacks": {"a": 1}}
+        assert json_diff(old, new) == [{"op": "replace", "path": "/system/uptime", "value": 2}]
+
+    def test_round_trip(self):
+        """Test 2: Applying the diff reproduces the new document."""
+        old = {"a": 1, "b": {"c": [1, 2]}, "gone": True, "x/y": 1}
+        new = {"a": 2, "b": {"c": [1, 2, 3], "d": None}, "x/y": 2}
+        patched = apply_patch(json.loads(json.dumps(old)), json_diff(old, new))
+        assert patched == new
+
+
+# ============================================================================
+# BROADCASTER TESTS
+# ============================================================================
+
+class TestStatusBroadcaster:
+    """Test suite for StatusBroadcaster."""
+
+    def test_shared_snapshot_and_patches(self):
+        """Test 3: One status call per refresh, patches for all clients."""
+        calls = []
+        status = {
+            "system": {"state": "running", "uptime": 0},
+            "stacks": {f"faza{i}": {"status": "running", "error": None} for i in range(16, 22)}
+        }
+
+        def get_status():
+            calls.append(1)
+            return status
+
+        async def scenario():
+            broadcaster = StatusBroadcaster(get_status, interval=3600)
+            sockets = [FakeWebSocket() for _ in range(3)]
+            tasks = [asyncio.ensure_future(broadcaster.serve(ws)) for ws in sockets]
+            await settle()
+
+            status["system"]["uptime"] = 5
+            broadcaster.refresh()
+            assert broadcaster.refresh() is None  # unchanged
+            await settle()
+
+            for ws in sockets:
+                assert ws.sent[0]["type"] == "snapshot"
+                assert apply_patch(ws.sent[0]["data"], ws.sent[1]["ops"]) == status
+
+            for ws in sockets:
+                ws.closed.set()
+            await asyncio.gather(*tasks)
+            assert broadcaster.client_count() == 0
+
+        asyncio.run(scenario())
+        assert len(calls) == 3
+
+    def test_slow_client_resync(self):
+        """Test 4: A full client queue is replaced by a fresh snapshot."""
+        status = {"value": 0}
+
+        async def scenario():
+            broadcaster = StatusBroadcaster(lambda: status, interval=3600, queue_size=2)
+            ws = FakeWebSocket()
+            blocked = asyncio.Event()
+
+            async def slow_send(text):
+                await blocked.wait()
+                ws.sent.append(json.loads(text))
+
+            ws.send_text = slow_send
+            task = asyncio.ensure_future(broadcaster.serve(ws))
+            await settle()
+
+            for i in range(1, 6):
+                status["value"] = i
+                broadcaster.refresh()
+
+            blocked.set()
+            await settle()
+            assert ws.sent[-1] == {"type": "snapshot", "data": {"value": 5}}
+
+            ws.closed.set()
+            await task
+
+        asyncio.run(scenario())
+
+
+class TestLogBroadcaster:
+    """Test suite for LogBroadcaster."""
+
+    def test_push_new_entries(self):
+        """Test 5: New log entries are pushed without polling."""
+        logs_manager = LogsManager(max_entries=100)
+        logs_manager.append_log("info", "before")
+
+        async def scenario():
+            broadcaster = LogBroadcaster(logs_manager, backlog=10)
+            ws = FakeWebSocket()
+            task = asyncio.ensure_future(broadcaster.serve(ws))
+            await settle()
+
+            logs_manager.append_log("error", "first")
+            logs_manager.append_log("info", "second")
+            await settle()
+
+            assert [e["message"] for e in ws.sent[0]["entries"]] == ["before"]
+            assert ws.sent[1]["type"] == "append"
+            assert [e["message"] for e in ws.sent[1]["entries"]] == ["first", "second"]
+
+            ws.closed.set()
+            await task
+            assert logs_manager._subscribers == []
+
+        asyncio.run(scenario())
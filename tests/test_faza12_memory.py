@@ -18,6 +18,8 @@ from senti_core_module.senti_memory import (
     EpisodicMemory,
     SemanticMemory,
     MemoryStore,
+    WALMemoryStore,
+    InvertedIndex,
     MemoryRules,
     MemoryEvents,
     ConsolidationService
@@ -80,6 +82,43 @@ class TestWorkingMemory(unittest.TestCase):
         # key2 should still exist
         self.assertIsNotNone(self.working.get("key2"))
 
+    def test_lru_eviction(self):
+        """Test max_items evicts the least recently used item."""
+        working = WorkingMemory(default_ttl_seconds=60, max_items=2)
+        working.add("a", 1)
+        working.add("b", 2)
+        working.get("a")
+        working.add("c", 3)
+
+        self.assertIsNone(working.get("b"))
+        self.assertEqual(working.get("a"), 1)
+        self.assertEqual(working.get("c"), 3)
+
+        stats = working.get_stats()
+        self.assertEqual(stats["evictions"], 1)
+        self.assertEqual(stats["hits"], 3)
+        self.assertEqual(stats["misses"], 1)
+
+    def test_max_bytes(self):
+        """Test max_bytes bounds total value size."""
+        working = WorkingMemory(default_ttl_seconds=60, max_bytes=300)
+        for i in range(10):
+            working.add(f"k{i}", "x" * 100)
+
+        stats = working.get_stats()
+        self.assertLessEqual(stats["total_bytes"], 300)
+        self.assertEqual(stats["valid_items"], 2)
+        self.assertEqual(working.get_all_keys(), ["k8", "k9"])
+
+    def test_expired_reclaimed_on_add(self):
+        """Test due deadlines are popped lazily by add()."""
+        self.working.add("short", 1, ttl_seconds=0)
+        time.sleep(0.01)
+        self.working.add("long", 3, ttl_seconds=60)
+
+        self.assertNotIn("short", self.working.memory)
+        self.assertEqual(self.working.get_stats()["expirations"], 1)
+
 
 class TestEpisodicMemory(unittest.TestCase):
     """Test episodic memory functionality."""
@@ -117,6 +156,104 @@ class TestEpisodicMemory(unittest.TestCase):
         remaining = self.episodic.get_events()
         self.assertEqual(len(remaining), 50)
 
+    def test_prune_old_events_keep_none(self):
+        """Test pruning every event across several buckets."""
+        episodic, _ = self._seed([(5, "a"), (3, "b"), (3, "a"), (0, "c")])
+
+        self.assertEqual(episodic.prune_old_events(keep_count=0), 4)
+        self.assertEqual(episodic.get_events(), [])
+        self.assertEqual(episodic.get_stats()["total_events"], 0)
+
+    def _seed(self, hours_ago_and_types):
+        """Create EpisodicMemory over events with explicit timestamps."""
+        from datetime import datetime, timedelta
+        now = datetime.now()
+        events = [
+            {
+                "event_type": event_type,
+                "timestamp": (now - timedelta(hours=hours)).isoformat(),
+                "payload": {"hours_ago": hours}
+            }
+            for hours, event_type in hours_ago_and_types
+        ]
+        self.store.save_episodic_events(events)
+        return EpisodicMemory(self.store), now
+
+    def test_time_range_and_type_index(self):
+        """Test since/type/limit queries over indexed buckets."""
+        from datetime import timedelta
+        # Deliberately unsorted on disk
+        episodic, now = self._seed([(5, "a"), (1, "b"), (30, "a"), (2, "a"), (0, "b")])
+
+        since = (now - timedelta(hours=3)).isoformat()
+        recent = episodic.get_events(since=since)
+        self.assertEqual([e["payload"]["hours_ago"] for e in recent], [0, 1, 2])
+
+        type_a = episodic.get_events(filter_type="a", limit=2)
+        self.assertEqual([e["payload"]["hours_ago"] for e in type_a], [2, 5])
+        self.assertEqual(episodic.events[0]["payload"]["hours_ago"], 30)
+
+    def test_prune_by_age_and_stats(self):
+        """Test bucket pruning keeps counters in step."""
+        episodic, _ = self._seed([(72, "a"), (50, "b"), (49, "a"), (1, "a"), (0, "c")])
+
+        removed = episodic.prune_by_age(days=2)
+        self.assertEqual(removed, 3)
+
+        stats = episodic.get_stats()
+        self.assertEqual(stats["total_events"], 2)
+        self.assertEqual(stats["type_distribution"], {"a": 1, "c": 1})
+        self.assertEqual(len(self.store.load_episodic_events()), 2)
+
+    def test_clear_by_type(self):
+        """Test removing one event type across buckets."""
+        episodic, _ = self._seed([(3, "a"), (2, "b"), (1, "a"), (0, "b")])
+
+        self.assertEqual(episodic.clear_by_type("a"), 2)
+        self.assertEqual(episodic.get_event_types(), ["b"])
+        self.assertEqual(len(episodic.get_events()), 2)
+        self.assertEqual(episodic.get_events(filter_type="a"), [])
+
+    def test_search_uses_text_index(self):
+        """Test indexed search tracks record and prune."""
+        self.episodic.record("module_loaded", {"name": "alpha"})
+        self.episodic.record("task_failed", {"error": "Timeout in alpha"})
+        self.episodic.record("task_failed", {"error": "disk full"})
+
+        self.assertEqual(len(self.episodic.search("alpha")), 2)
+        self.assertEqual(len(self.episodic.search("task time")), 1)
+        self.assertEqual(self.episodic.search("error")[0]["payload"]["error"], "disk full")
+
+        self.episodic.prune_old_events(keep_count=1)
+        self.assertEqual(self.episodic.search("alpha"), [])
+
+    def test_search_prefix_only_unless_substring(self):
+        """Test mid-token queries need substring=True."""
+        self.episodic.record("service_start", {"name": "db"})
+        self.episodic.record("service_restart", {"name": "db"})
+        self.episodic.record("task_failed", {"error": "connection_timeout"})
+
+        self.assertEqual([e["event_type"] for e in self.episodic.search("start")], ["service_start"])
+        self.assertEqual([e["event_type"] for e in self.episodic.search("timeout")], ["task_failed"])
+        self.assertEqual(self.episodic.search("tart"), [])
+        self.assertEqual(self.episodic.search("ailed"), [])
+
+        hits = self.episodic.search("start", substring=True)
+        self.assertEqual({e["event_type"] for e in hits}, {"service_start", "service_restart"})
+        self.assertEqual(len(self.episodic.search("ailed", substring=True)), 1)
+
+    def test_index_ids_stable_across_prune_and_restart(self):
+        """Test a stale persisted index cannot map ids to other events."""
+        # Same timestamp: the events differ only in content
+        episodic, _ = self._seed([(2, "alpha"), (2, "beta"), (1, "gamma")])
+        self.assertTrue(episodic.save_index())
+
+        # Prune, then "crash" before the index is saved again
+        episodic.prune_old_events(keep_count=2)
+        reloaded = EpisodicMemory(self.store)
+        self.assertEqual(reloaded.search("alpha"), [])
+        self.assertEqual([e["event_type"] for e in reloaded.search("beta")], ["beta"])
+
 
 class TestSemanticMemory(unittest.TestCase):
     """Test semantic memory functionality."""
@@ -154,6 +291,196 @@ class TestSemanticMemory(unittest.TestCase):
         self.assertEqual(self.semantic.get_fact("fact1"), "value1")
         self.assertEqual(self.semantic.get_fact("fact2"), "value2")
 
+    def test_search_index_and_regex_fallback(self):
+        """Test indexed search, deletes and regex fallback."""
+        self.semantic.save_fact("user_name", "John Smith")
+        self.semantic.save_fact("user_age", 30)
+        self.semantic.save_fact("owner", "user john")
+
+        self.assertEqual(set(self.semantic.search("john")), {"user_name", "owner"})
+        self.assertEqual(set(self.semantic.search("user jo")), {"user_name", "owner"})
+        self.assertEqual(set(self.semantic.search("^user_a")), {"user_age"})
+
+        self.semantic.delete_fact("owner")
+        self.assertEqual(set(self.semantic.search("john")), {"user_name"})
+
+    def test_search_prefix_only_unless_substring(self):
+        """Test mid-token queries need substring=True."""
+        self.semantic.save_fact("service_start", "ok")
+        self.semantic.save_fact("db_restart", "ok")
+        self.semantic.save_fact("user_name", "John")
+
+        self.assertEqual(set(self.semantic.search("start")), {"service_start"})
+        self.assertEqual(set(self.semantic.search("name")), {"user_name"})
+        self.assertEqual(self.semantic.search("tart"), {})
+        self.assertEqual(self.semantic.search("ohn"), {})
+
+        self.assertEqual(set(self.semantic.search("start", substring=True)), {"service_start", "db_restart"})
+        self.assertEqual(set(self.semantic.search("ohn", substring=True)), {"user_name"})
+
+    def test_index_persistence(self):
+        """Test persisted index is repaired incrementally on reload."""
+        self.semantic.save_fact("alpha", "first value")
+        self.semantic.save_fact("beta", "second value")
+        self.assertTrue(self.semantic.save_index())
+
+        # Change facts after the index was saved
+        self.semantic.save_fact("beta", "changed")
+        self.semantic.save_fact("gamma", "third value")
+
+        reloaded = SemanticMemory(self.store)
+        self.assertEqual(set(reloaded.search("value")), {"alpha", "gamma"})
+        self.assertEqual(set(reloaded.search("changed")), {"beta"})
+
+    def test_background_flusher(self):
+        """Test deferred persistence is bounded and flushed on close."""
+        semantic = SemanticMemory(self.store, flush_interval=60)
+        semantic.save_fact("deferred", "value")
+
+        self.assertEqual(semantic.get_fact("deferred"), "value")
+        self.assertEqual(semantic.get_stats()["pending_flush"], 1)
+
+        semantic.close()
+        self.assertIn("deferred", self.store.load_semantic_facts())
+
+    def test_concurrent_writers_and_readers(self):
+        """Test sharded writes from many threads are all visible and persisted."""
+        import threading
+
+        def writer(worker):
+            for i in range(50):
+                self.semantic.save_fact(f"w{worker}_{i}", i)
+
+        def reader():
+            for _ in range(200):
+                self.semantic.get_fact("w0_0")
+                self.semantic.fact_exists("w1_1")
+
+        threads = [threading.Thread(target=writer, args=(w,)) for w in range(4)]
+        threads += [threading.Thread(target=reader) for _ in range(4)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        self.assertEqual(len(self.semantic.get_all_keys()), 200)
+        self.assertEqual(len(self.store.load_semantic_facts()), 200)
+
+
+class TestInvertedIndex(unittest.TestCase):
+    """Test inverted text index."""
+
+    def test_bm25_ranking(self):
+        """Test documents with more matching terms rank first."""
+        index = InvertedIndex()
+        index.add("a", "error error disk")
+        index.add("b", "error network timeout retry backoff")
+        index.add("c", "success")
+
+        ranked = [doc_id for doc_id, _ in index.search("err")]
+        self.assertEqual(ranked, ["a", "b"])
+        self.assertEqual(index.match("error disk"), {"a"})
+
+        index.remove("a")
+        self.assertEqual(index.match("disk"), set())
+
+
+class TestWALMemoryStore(unittest.TestCase):
+    """Test write-ahead log storage backend."""
+
+    def setUp(self):
+        self.temp_dir = Path(tempfile.mkdtemp())
+        self.store = WALMemoryStore(self.temp_dir, compact_min_records=50)
+
+    def test_append_and_replay(self):
+        """Test that appended events survive a reopen."""
+        episodic = EpisodicMemory(self.store)
+        for i in range(10):
+            episodic.record("test", {"index": i})
+        self.store.close()
+
+        reopened = EpisodicMemory(WALMemoryStore(self.temp_dir))
+        self.assertEqual(len(reopened.events), 10)
+        self.assertEqual(reopened.events[-1]["payload"]["index"], 9)
+
+    def test_semantic_set_delete(self):
+        """Test fact set/delete records replay correctly."""
+        semantic = SemanticMemory(self.store)
+        semantic.save_fact("a", 1)
+        semantic.save_facts_batch({"b": 2, "c": 3})
+        semantic.delete_fact("b")
+        self.store.close()
+
+        reopened = SemanticMemory(WALMemoryStore(self.temp_dir))
+        self.assertEqual(sorted(reopened.get_all_keys()), ["a", "c"])
+
+    def test_semantic_commit_passes_only_changes(self):
+        """Test write-through hands the WAL only the changed entries."""
+        semantic = SemanticMemory(self.store)
+        semantic.save_facts_batch({f"k{i}": i for i in range(100)})
+
+        calls = []
+        commit = self.store.commit_semantic_facts
+
+        def spy(changes, snapshot):
+            calls.append(dict(changes))
+            return commit(changes, lambda: self.fail("full snapshot built"))
+
+        self.store.commit_semantic_facts = spy
+        semantic.save_fact("k1", "new")
+        semantic.delete_fact("k2")
+
+        self.assertEqual([sorted(c) for c in calls], [["k1"], ["k2"]])
+        self.assertIsNone(calls[1]["k2"])
+        self.store.close()
+
+        reopened = SemanticMemory(WALMemoryStore(self.temp_dir))
+        self.assertEqual(reopened.get_fact("k1"), "new")
+        self.assertFalse(reopened.fact_exists("k2"))
+
+    def test_compaction(self):
+        """Test WAL is folded into the snapshot past the threshold."""
+        for i in range(120):
+            self.store.append_episodic_event({"event_type": "t", "payload": {"i": i}})
+
+        stats = self.store.get_storage_stats()
+        self.assertEqual(stats["episodic_count"], 120)
+        self.assertLess(stats["episodic_wal"]["wal_records"], 50)
+        self.assertTrue(self.store.episodic_snapshot_file.exists())
+
+    def test_torn_tail_recovery(self):
+        """Test a partially written last record is discarded."""
+        for i in range(3):
+            self.store.append_episodic_event({"event_type": "t", "payload": {"i": i}})
+        self.store.close()
+
+        segment = sorted((self.temp_dir / "wal").glob("episodic-*.jsonl"))[-1]
+        with open(segment, "a") as f:
+            f.write('{"op":"append","event":{"event_')
+
+        reopened = WALMemoryStore(self.temp_dir)
+        self.assertEqual(len(reopened.load_episodic_events()), 3)
+        reopened.append_episodic_event({"event_type": "t", "payload": {"i": 3}})
+        self.assertEqual(len(reopened.load_episodic_events()), 4)
+
+    def test_legacy_json_import(self):
+        """Test existing JSON store files are picked up on first start."""
+        legacy_dir = Path(tempfile.mkdtemp())
+        MemoryStore(legacy_dir).save_semantic_facts({"k": {"value": "v"}})
+
+        store = WALMemoryStore(legacy_dir)
+        self.assertEqual(store.load_semantic_facts(), {"k": {"value": "v"}})
+
+    def test_manager_wal_backend(self):
+        """Test MemoryManager runs on the WAL backend."""
+        manager = MemoryManager(self.temp_dir, MockEventBus(), store_backend="wal")
+        self.assertEqual(manager.start()["status"], "success")
+        self.assertIsInstance(manager.store, WALMemoryStore)
+
+        engine = manager.get_engine()
+        engine.remember("v", memory_type="semantic", key="k")
+        self.assertEqual(manager.stop()["status"], "success")
+
 
 class TestMemoryRules(unittest.TestCase):
     """Test memory security rules."""
@@ -250,6 +577,73 @@ class TestConsolidationService(unittest.TestCase):
         facts = self.semantic.get_all_keys()
         self.assertGreater(len(facts), 0)
 
+    def test_incremental_consolidation(self):
+        """Test incremental runs only process events past the high-water mark."""
+        for i in range(20):
+            self.episodic.record("task", {"status": "success", "i": i})
+
+        first = self.consolidation.consolidate(min_events=10, incremental=True)
+        self.assertEqual(first["events_processed"], 20)
+        self.assertEqual(first["events_pruned"], 10)
+
+        skipped = self.consolidation.consolidate(min_events=1, incremental=True)
+        self.assertEqual(skipped["status"], "skipped")
+
+        for i in range(12):
+            self.episodic.record("error", {"error": "boom"})
+
+        second = self.consolidation.consolidate(min_events=10, incremental=True)
+        self.assertEqual(second["events_processed"], 12)
+        self.assertEqual(
+            self.semantic.get_fact("event_type_frequency"),
+            {"task": 20, "error": 12}
+        )
+        self.assertEqual(self.semantic.get_fact("success_count"), 20)
+        self.assertEqual(self.semantic.get_fact("error_count"), 12)
+
+    def test_incremental_keeps_events_at_high_water_mark(self):
+        """Test late events sharing the high-water timestamp are consolidated."""
+        from datetime import datetime
+        from unittest import mock
+
+        frozen = datetime.now()
+
+        class FrozenDatetime(datetime):
+            @classmethod
+            def now(cls, tz=None):
+                return frozen
+
+        with mock.patch("senti_core_module.senti_memory.episodic_memory.datetime", FrozenDatetime):
+            for i in range(10):
+                self.episodic.record("task", {"i": i})
+            first = self.consolidation.consolidate(min_events=10, incremental=True)
+            self.assertEqual(first["high_water_mark"], frozen.isoformat())
+
+            for i in range(3):
+                self.episodic.record("late", {"i": i})
+            second = self.consolidation.consolidate(min_events=1, incremental=True)
+
+        self.assertEqual(second["events_processed"], 3)
+        self.assertEqual(
+            self.semantic.get_fact("event_type_frequency"),
+            {"task": 10, "late": 3}
+        )
+        skipped = self.consolidation.consolidate(min_events=1, incremental=True)
+        self.assertEqual(skipped["status"], "skipped")
+
+    def test_streaming_extraction(self):
+        """Test single-pass extraction over a generator."""
+        for i in range(5):
+            self.episodic.record("module_event", {"module": f"m{i}"})
+
+        facts = self.consolidation._extract_facts(self.episodic.iter_events())
+        self.assertEqual(facts["event_type_frequency"], {"module_event": 5})
+        self.assertEqual(facts["module_activity_count"], 5)
+        self.assertEqual(facts["recent_activity_count"], 5)
+
+        newest = self.episodic.get_events(limit=2)[-1]["timestamp"]
+        self.assertEqual(len(list(self.episodic.iter_events(after=newest))), 1)
+
 
 class TestMemoryEngine(unittest.TestCase):
     """Test high-level memory engine API."""
@@ -371,6 +765,8 @@ def run_tests():
     suite.addTests(loader.loadTestsFromTestCase(TestWorkingMemory))
     suite.addTests(loader.loadTestsFromTestCase(TestEpisodicMemory))
     suite.addTests(loader.loadTestsFromTestCase(TestSemanticMemory))
+    suite.addTests(loader.loadTestsFromTestCase(TestWALMemoryStore))
+    suite.addTests(loader.loadTestsFromTestCase(TestInvertedIndex))
     suite.addTests(loader.loadTestsFromTestCase(TestMemoryRules))
     suite.addTests(loader.loadTestsFromTestCase(TestMemoryEvents))
     suite.addTests(loader.loadTestsFromTestCase(TestConsolidationService))
@@ -6,17 +6,25 @@ Comprehensive test suite for FAZA 25 components:
 - Priority task queue
 - Worker execution
 - Orchestrator manager API
+- Execution backends (asyncio / thread / process)
 - Pipeline integration with FAZA 17
 """
 
 import asyncio
+import os
+import threading
+import time
 from datetime import datetime
 
 from senti_os.core.faza25 import (
     Task,
     TaskStatus,
+    ExecutionMode,
     PriorityTaskQueue,
     OrchestratorManager,
+    AsyncioBackend,
+    ThreadPoolBackend,
+    ProcessPoolBackend,
     submit_pipeline_task,
     get_pipeline_task_result
 )
@@ -205,6 +213,54 @@ class TestPriorityTaskQueue:
         assert task1.status == TaskStatus.CANCELLED
         assert task2.status == TaskStatus.CANCELLED
 
+    def test_queue_update_priority_and_position(self):
+        """Test reprioritizing a queued task and its queue position"""
+        queue = PriorityTaskQueue()
+
+        tasks = [Task(name=f"Task {i}", executor=self.dummy_executor, priority=5) for i in range(4)]
+        for task in tasks:
+            queue.put(task)
+
+        assert queue.get_position(tasks[3].id) == 3
+        assert queue.update_priority(tasks[3].id, 9)
+        assert queue.get_position(tasks[3].id) == 0
+        assert queue.get_task(tasks[3].id).priority == 9
+        assert queue.get_statistics()["tasks_by_priority"] == {9: 1, 5: 3}
+        assert not queue.update_priority("non-existent-id", 1)
+
+        assert queue.remove_task(tasks[1].id)
+        assert queue.get_position(tasks[1].id) is None
+        order = [queue.get_nowait().name for _ in range(3)]
+        assert order == ["Task 3", "Task 0", "Task 2"]
+
+    def test_queue_aging(self):
+        """Test that long-waiting tasks overtake higher priorities"""
+        queue = PriorityTaskQueue(aging_interval=0.05)
+
+        old_low = Task(name="Old low", executor=self.dummy_executor, priority=2)
+        queue.put(old_low)
+        time.sleep(0.25)  # Worth 5 priority levels
+        queue.put(Task(name="New medium", executor=self.dummy_executor, priority=5))
+        queue.put(Task(name="New high", executor=self.dummy_executor, priority=9))
+
+        assert [queue.get_nowait().name for _ in range(3)] == ["New high", "Old low", "New medium"]
+
+    def test_queue_get_wakes_on_put(self):
+        """Test that waiting consumers are woken by put()"""
+        queue = PriorityTaskQueue()
+        task = Task(name="Late", executor=self.dummy_executor)
+
+        async def consume():
+            loop = asyncio.get_running_loop()
+            loop.call_later(0.02, queue.put, task)
+            return await asyncio.wait_for(queue.get(), timeout=1.0)
+
+        assert asyncio.run(consume()).id == task.id
+
+        threading.Timer(0.02, queue.put, args=(task,)).start()
+        assert queue.get_blocking(timeout=1.0).id == task.id
+        assert queue.get_blocking(timeout=0.01) is None
+
 
 class TestOrchestratorManager:
     """Tests for orchestrator manager"""
@@ -387,6 +443,121 @@ class TestOrchestratorManager:
         await orchestrator.stop()
 
 
+def cpu_executor(task: Task):
+    """Module-level (picklable) executor for the process backend"""
+    return {"pid": os.getpid(), "total": sum(range(task.context["n"]))}
+
+
+def failing_cpu_executor(task: Task):
+    """Module-level executor that raises in the child process"""
+    raise ValueError("child failed")
+
+
+class TestExecutionBackends:
+    """Tests for execution backend routing"""
+
+    async def _run_tasks(self, orchestrator, submissions, timeout=10.0):
+        """Start orchestrator, submit tasks, wait until all finish, stop"""
+        await orchestrator.start()
+        try:
+            task_ids = [orchestrator.submit_task(**kwargs) for kwargs in submissions]
+            deadline = time.time() + timeout
+            while time.time() < deadline:
+                tasks = [orchestrator.tasks[task_id] for task_id in task_ids]
+                if all(t.status not in (TaskStatus.QUEUED, TaskStatus.RUNNING) for t in tasks):
+                    break
+                await asyncio.sleep(0.01)
+            status = orchestrator.get_worker_status()
+        finally:
+            await orchestrator.stop()
+        return tasks, status
+
+    def test_process_backend(self):
+        """Test that process tasks run in child processes with pickled results"""
+        orchestrator = OrchestratorManager(num_workers=1, backends={
+            ExecutionMode.ASYNCIO: AsyncioBackend(),
+            ExecutionMode.PROCESS: ProcessPoolBackend(max_workers=2),
+        })
+        submissions = [
+            {"name": f"CPU {i}", "executor": cpu_executor,
+             "context": {"n": 1000 + i}, "execution_mode": "process"}
+            for i in range(4)
+        ]
+        submissions.append({"name": "Fails", "executor": failing_cpu_executor,
+                            "execution_mode": ExecutionMode.PROCESS})
+
+        tasks, status = asyncio.run(self._run_tasks(orchestrator, submissions))
+
+        for i, task in enumerate(tasks[:4]):
+            assert task.status == TaskStatus.DONE
+            assert task.result["total"] == sum(range(1000 + i))
+            assert task.result["pid"] != os.getpid()
+        assert tasks[4].status == TaskStatus.ERROR
+        assert "child failed" in tasks[4].error_message
+
+        process_status = status["backends"]["process"]
+        assert process_status["completed"] == 4
+        assert process_status["failed"] == 1
+        assert process_status["queue_depth"] == 0
+
+    def test_thread_backend_runs_blocking_tasks_concurrently(self):
+        """Test that blocking thread tasks overlap and don't block the loop"""
+        def blocking_executor(task: Task):
+            time.sleep(0.2)
+            return threading.current_thread().name
+
+        orchestrator = OrchestratorManager(num_workers=1, backends={
+            ExecutionMode.ASYNCIO: AsyncioBackend(),
+            ExecutionMode.THREAD: ThreadPoolBackend(max_workers=4),
+        })
+        submissions = [
+            {"name": f"IO {i}", "executor": blocking_executor, "execution_mode": "thread"}
+            for i in range(4)
+        ]
+
+        start = time.perf_counter()
+        tasks, status = asyncio.run(self._run_tasks(orchestrator, submissions))
+        elapsed = time.perf_counter() - start
+
+        assert all(task.status == TaskStatus.DONE for task in tasks)
+        assert all(task.result.startswith("faza25-task") for task in tasks)
+        assert elapsed < 0.6, f"Thread tasks should overlap ({elapsed:.2f}s)"
+        assert status["backends"]["thread"]["max_workers"] == 4
+        assert status["backends"]["asyncio"]["max_workers"] == 1
+
+    def test_unknown_backend_rejected(self):
+        """Test that submitting to an unconfigured backend fails"""
+        async def run():
+            orchestrator = OrchestratorManager(num_workers=1, backends={
+                ExecutionMode.ASYNCIO: AsyncioBackend(),
+            })
+            await orchestrator.start()
+            try:
+                orchestrator.submit_task(name="X", executor=cpu_executor, execution_mode="process")
+            finally:
+                await orchestrator.stop()
+
+        try:
+            asyncio.run(run())
+            assert False, "Expected ValueError"
+        except ValueError as e:
+            assert "process" in str(e)
+
+    def test_backend_base_classes_are_abstract(self):
+        """Test that backends missing an override cannot be instantiated"""
+        from senti_os.core.faza25.backends import ExecutionBackend, PoolBackend
+
+        class NoExecutor(PoolBackend):
+            pass
+
+        for backend_class in (ExecutionBackend, PoolBackend, NoExecutor):
+            try:
+                backend_class(max_workers=1)
+                assert False, f"Expected TypeError for {backend_class.__name__}"
+            except TypeError:
+                pass
+
+
 class TestPipelineIntegration:
     """Tests for FAZA 17 pipeline integration"""
 
@@ -477,8 +648,18 @@ def run_sync_tests():
     test_queue.test_queue_remove_task()
     test_queue.test_queue_get_all_tasks()
     test_queue.test_queue_clear()
+    test_queue.test_queue_update_priority_and_position()
+    test_queue.test_queue_aging()
+    test_queue.test_queue_get_wakes_on_put()
     print("✓ All priority queue tests passed")
 
+    print("\n=== Running Execution Backend Tests ===")
+    test_backends = TestExecutionBackends()
+    test_backends.test_process_backend()
+    test_backends.test_thread_backend_runs_blocking_tasks_concurrently()
+    test_backends.test_unknown_backend_rejected()
+    print("✓ All execution backend tests passed")
+
 
 async def run_async_tests():
     """Run asynchronous tests"""
@@ -30,6 +30,7 @@ from senti_os.core.faza27 import (
     create_graph_exporter,
     create_graph_monitor
 )
+from senti_os.core.faza27 import graph_analyzer as graph_analyzer_module
 
 
 # ==================== Mock FAZA 25/26 Structures ====================
@@ -261,6 +262,118 @@ class TestTaskGraph(unittest.TestCase):
 
         self.assertTrue(graph.is_acyclic())
 
+    def test_incremental_cycle_detection_matches_reachability(self):
+        """Test incremental cycle checks against brute-force reachability"""
+        import random
+        rng = random.Random(27)
+        graph = TaskGraph()
+        ids = [f"n{i}" for i in range(40)]
+        for node_id in ids:
+            graph.add_node(TaskNode(node_id, node_id))
+
+        def reaches(start, goal):
+            seen, stack = {start}, [start]
+            while stack:
+                for nxt in graph._adj_list.get(stack.pop(), ()):
+                    if nxt == goal:
+                        return True
+                    if nxt not in seen:
+                        seen.add(nxt)
+                        stack.append(nxt)
+            return False
+
+        for _ in range(300):
+            source, target = rng.sample(ids, 2)
+            expect_cycle = reaches(target, source)
+            try:
+                graph.add_edge(TaskEdge(source, target))
+                self.assertFalse(expect_cycle, f"{source} -> {target} should be rejected")
+            except ValueError:
+                self.assertTrue(expect_cycle, f"{source} -> {target} should be accepted")
+
+        # Maintained order must be a valid topological order
+        for edge in graph.edges:
+            self.assertLess(graph._ord[edge.source_id], graph._ord[edge.target_id])
+        self.assertTrue(graph.is_acyclic())
+
+    def test_add_edges_bulk(self):
+        """Test bulk edge insertion is validated once and all-or-nothing"""
+        graph = TaskGraph()
+        for i in range(4):
+            graph.add_node(TaskNode(f"t{i}", f"Task {i}"))
+
+        graph.add_edges([TaskEdge("t0", "t1"), TaskEdge("t1", "t2")])
+        self.assertEqual(len(graph.edges), 2)
+
+        with self.assertRaises(ValueError):
+            graph.add_edges([TaskEdge("t2", "t3"), TaskEdge("t3", "t0")])
+        self.assertEqual(len(graph.edges), 2)
+        self.assertFalse(graph.has_edge("t2", "t3"))
+        self.assertNotIn("t2", graph.get_node("t3").dependencies)
+
+        # Order is still maintained after a bulk insert
+        with self.assertRaises(ValueError):
+            graph.add_edge(TaskEdge("t2", "t0"))
+
+    def test_add_edges_with_weak_cycle(self):
+        """Test bulk insertion accepts weak cycles but not strong ones"""
+        graph = TaskGraph()
+        for i in range(4):
+            graph.add_node(TaskNode(f"t{i}", f"Task {i}"))
+
+        graph.add_edges([
+            TaskEdge("t0", "t1"),
+            TaskEdge("t1", "t2", edge_type=EdgeType.DATA_FLOW),
+            TaskEdge("t2", "t1", edge_type=EdgeType.DATA_FLOW)
+        ])
+        self.assertEqual(len(graph.edges), 3)
+        self.assertTrue(graph.has_cycle())
+
+        # A later strong batch is judged edge by edge, all-or-nothing
+        graph.add_edges([TaskEdge("t0", "t3")])
+        self.assertTrue(graph.has_edge("t0", "t3"))
+        with self.assertRaises(ValueError):
+            graph.add_edges([TaskEdge("t2", "t3"), TaskEdge("t3", "t0")])
+        self.assertEqual(len(graph.edges), 4)
+        self.assertFalse(graph.has_edge("t2", "t3"))
+
+    def test_edge_indexes(self):
+        """Test per-node edge lookups and node removal"""
+        graph = TaskGraph()
+        for i in range(3):
+            graph.add_node(TaskNode(f"t{i}", f"Task {i}"))
+        graph.add_edge(TaskEdge("t0", "t1"))
+        graph.add_edge(TaskEdge("t0", "t2", edge_type=EdgeType.DATA_FLOW))
+        graph.add_edge(TaskEdge("t1", "t2"))
+
+        self.assertEqual({e.target_id for e in graph.get_edges_from("t0")}, {"t1", "t2"})
+        self.assertEqual({e.source_id for e in graph.get_edges_to("t2")}, {"t0", "t1"})
+
+        graph.remove_node("t1")
+        self.assertEqual(len(graph.edges), 1)
+        self.assertEqual(graph.get_edges_to("t2")[0].source_id, "t0")
+        self.assertNotIn("t1", graph.get_node("t0").dependents)
+        self.assertTrue(graph.validate()[0])
+
+    def test_weak_edge_cycle(self):
+        """Test weak edges may close a cycle; strong edges may not"""
+        graph = TaskGraph()
+        for i in range(4):
+            graph.add_node(TaskNode(f"t{i}", f"Task {i}"))
+        graph.add_edge(TaskEdge("t0", "t1"))
+        graph.add_edge(TaskEdge("t1", "t0", edge_type=EdgeType.WEAK))
+        self.assertTrue(graph.has_cycle())
+
+        # Unrelated strong edge is still accepted
+        graph.add_edge(TaskEdge("t2", "t3"))
+        with self.assertRaises(ValueError):
+            graph.add_edge(TaskEdge("t3", "t2"))
+
+        graph.remove_edge("t1", "t0")
+        self.assertFalse(graph.has_cycle())
+        with self.assertRaises(ValueError):
+            graph.add_edge(TaskEdge("t1", "t0"))
+
     def test_self_loop_prevention(self):
         """Test self-loop prevention"""
         graph = TaskGraph()
@@ -491,6 +604,22 @@ class TestGraphBuilder(unittest.TestCase):
         merged = builder.merge_graphs([graph1, graph2])
         self.assertEqual(len(merged.nodes), 2)
 
+    def test_merge_graphs_with_weak_cycle(self):
+        """Test merging a graph whose weak edges form a cycle"""
+        builder = GraphBuilder()
+
+        graph = TaskGraph(graph_id="g")
+        for node_id in ("a", "b", "c"):
+            graph.add_node(TaskNode(node_id, node_id.upper()))
+        graph.add_edge(TaskEdge("a", "b"))
+        graph.add_edge(TaskEdge("b", "c", edge_type=EdgeType.DATA_FLOW))
+        graph.add_edge(TaskEdge("c", "b", edge_type=EdgeType.DATA_FLOW))
+
+        merged = builder.merge_graphs([graph])
+        self.assertEqual(len(merged.edges), 3)
+        self.assertTrue(merged.has_edge("g_a", "g_b"))
+        self.assertTrue(merged.has_edge("g_c", "g_b"))
+
     def test_custom_cost_model(self):
         """Test custom cost model registration"""
         builder = GraphBuilder()
@@ -612,6 +741,52 @@ class TestGraphAnalyzer(unittest.TestCase):
         self.assertIn("quality", report)
         self.assertIn("costs", report)
 
+    def test_cache_follows_graph_version(self):
+        """Test cached results are dropped when the graph changes"""
+        analyzer = GraphAnalyzer(self.graph)
+        health = analyzer.calculate_graph_health()
+        self.assertIs(analyzer.calculate_graph_health(), health)
+
+        self.graph.add_node(TaskNode("task4", "Task 4"))
+        self.assertIsNot(analyzer.calculate_graph_health(), health)
+        self.assertEqual(analyzer.check_graph_quality()["node_count"], 4)
+
+    def test_incremental_levels_and_critical_path(self):
+        """Test levels and critical path follow single edge changes"""
+        for node in self.graph.get_all_nodes():
+            node.cost_model.estimated_duration = 1.0
+        self.graph.add_node(TaskNode("task0", "Task 0", cost_model=CostModel(estimated_duration=5.0)))
+        analyzer = GraphAnalyzer(self.graph, use_numpy=False)
+        self.assertEqual(analyzer.get_node_levels()["task3"], 2)
+        self.assertEqual(analyzer.get_critical_path()[1], 5.0)
+
+        self.graph.add_edge(TaskEdge("task0", "task1"))
+        self.assertEqual(analyzer.get_node_levels(), self.graph.calculate_node_levels())
+        self.assertEqual(analyzer.get_critical_path(), (["task0", "task1", "task2", "task3"], 8.0))
+
+        self.graph.remove_edge("task1", "task2")
+        self.assertEqual(analyzer.get_node_levels(), self.graph.calculate_node_levels())
+        self.assertEqual(analyzer.get_critical_path(), (["task0", "task1"], 6.0))
+
+    @unittest.skipIf(graph_analyzer_module.np is None, "NumPy not installed")
+    def test_numpy_path_matches_python(self):
+        """Test NumPy and pure-Python analytics agree"""
+        graph = TaskGraph()
+        for i in range(20):
+            graph.add_node(TaskNode(f"task{i}", f"Task {i}", cost_model=CostModel(estimated_duration=i % 4)))
+        for i in range(20):
+            for j in (i + 1, i + 3, i * 2):
+                if i < j < 20:
+                    graph.add_edge(TaskEdge(f"task{i}", f"task{j}"))
+
+        python = GraphAnalyzer(graph, use_numpy=False)
+        vectorized = GraphAnalyzer(graph, use_numpy=True)
+        self.assertEqual(vectorized.get_node_levels(), python.get_node_levels())
+        self.assertEqual(vectorized.get_critical_path()[1], python.get_critical_path()[1])
+        expected = python.calculate_influence_scores()
+        for node_id, score in vectorized.calculate_influence_scores().items():
+            self.assertAlmostEqual(score, expected[node_id])
+
 
 # ==================== GraphExporter Tests ====================
 
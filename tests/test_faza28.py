@@ -12,6 +12,8 @@ Tests all components:
 """
 
 import asyncio
+import threading
+import time
 from typing import Any
 
 from senti_os.core.faza28 import (
@@ -88,6 +90,23 @@ class ErrorAgent(AgentBase):
         raise RuntimeError("Intentional error for testing")
 
 
+class SleepyAgent(AgentBase):
+    """Agent whose tick sleeps and logs start / end"""
+    priority = 10
+
+    def __init__(self, name: str, delay: float, log: list, tick_group: str = None):
+        super().__init__()
+        self.name = name
+        self.delay = delay
+        self.log = log
+        self.tick_group = tick_group
+
+    async def on_tick(self, context: Any) -> None:
+        self.log.append(("start", self.name))
+        await asyncio.sleep(self.delay)
+        self.log.append(("end", self.name))
+
+
 # Test Classes
 
 class TestAgentBase:
@@ -342,6 +361,103 @@ class TestEventBus:
         source1_history = bus.get_event_history(source="source1")
         assert len(source1_history) == 1
 
+    def test_history_ring_eviction(self):
+        """Test history ring keeps per-type/per-source indexes in step"""
+        bus = EventBus(max_history=3)
+
+        bus.emit("event1", "source1")
+        bus.emit("event2", "source1")
+        bus.emit("event1", "source2")
+        bus.emit("event3", "source2")
+
+        assert len(bus.get_event_history()) == 3
+        assert len(bus.get_event_history(event_type="event1")) == 1
+        assert len(bus.get_event_history(source="source1")) == 1
+        assert len(bus.get_event_history(event_type="event1", source="source2")) == 1
+        assert bus.get_stats()["event_types"] == 3
+
+    def test_history_disabled(self):
+        """Test max_history=0 keeps no history and still delivers events"""
+        bus = EventBus(max_history=0)
+        received = []
+        bus.subscribe("event1", "listener", received.append)
+
+        bus.emit("event1", "source1")
+        bus.emit("event1", "source2")
+
+        assert len(received) == 2
+        assert bus.get_event_history() == []
+        assert bus.get_event_history(event_type="event1") == []
+        assert bus.get_stats()["event_types"] == 0
+
+    def test_threaded_dispatch(self):
+        """Test threaded dispatch does not block on slow subscribers"""
+        bus = EventBus(dispatch_mode="threaded")
+        received = []
+        release = threading.Event()
+
+        def slow_handler(event):
+            release.wait(timeout=5)
+            received.append(event.data)
+
+        bus.subscribe("test_event", "slow", slow_handler)
+
+        start = time.monotonic()
+        for i in range(5):
+            bus.emit("test_event", "source1", data=i)
+        assert time.monotonic() - start < 1.0
+
+        release.set()
+        assert bus.flush(timeout=5)
+        assert received == [0, 1, 2, 3, 4]
+        assert bus.get_stats()["queues"]["slow"]["delivered"] == 5
+        bus.shutdown()
+
+    def test_backpressure_drop_policies(self):
+        """Test drop_oldest / drop_newest on a full subscriber queue"""
+        for policy, expected in (("drop_oldest", [0, 3, 4]), ("drop_newest", [0, 1, 2])):
+            bus = EventBus(dispatch_mode="threaded", queue_size=2,
+                           backpressure=policy, max_workers=1)
+            received = []
+            started = threading.Event()
+            release = threading.Event()
+
+            def handler(event):
+                started.set()
+                release.wait(timeout=5)
+                received.append(event.data)
+
+            bus.subscribe("test_event", "sub", handler)
+            bus.emit("test_event", "source1", data=0)
+            started.wait(timeout=5)
+            for i in range(1, 5):
+                bus.emit("test_event", "source1", data=i)
+
+            release.set()
+            assert bus.flush(timeout=5)
+            assert received == expected
+            assert bus.get_stats()["queues"]["sub"]["dropped"] == 2
+            bus.shutdown()
+
+    def test_async_dispatch(self):
+        """Test async dispatch awaits coroutine handlers off the publisher"""
+        received = []
+
+        async def handler(event):
+            await asyncio.sleep(0)
+            received.append(event.data)
+
+        async def scenario():
+            bus = EventBus(dispatch_mode="async")
+            bus.subscribe("test_event", "async_sub", handler)
+            for i in range(3):
+                bus.emit("test_event", "source1", data=i)
+            assert received == []
+            await bus.flush_async()
+
+        asyncio.run(scenario())
+        assert received == [0, 1, 2]
+
 
 class TestScheduler:
     """Tests for Scheduler"""
@@ -405,6 +521,66 @@ class TestScheduler:
 
         stats = scheduler.get_stats()
         assert stats["execution_counts"]["agent1"] == 2
+        assert 0.3 < stats["expected_latencies"]["agent1"] < 0.5
+
+    def test_load_aware_time_budget(self):
+        """Test load-aware selection keeps measured latencies within budget"""
+        scheduler = Scheduler(strategy="load_aware", time_budget=0.5)
+        agents = [SleepyAgent(f"agent{i}", 0.0, []) for i in range(4)]
+        for agent, latency in zip(agents, [0.4, 0.3, 0.05, 0.05]):
+            scheduler.record_execution(agent.name, latency)
+
+        selected = scheduler.select_agents(agents)
+        assert sum(scheduler.get_expected_latency(a.name) for a in selected) <= 0.5
+        assert [a.name for a in selected] == ["agent2", "agent3", "agent1"]
+
+    def test_load_aware_skipped_agent_recovers(self):
+        """Test an agent skipped after a slow outlier is re-measured"""
+        scheduler = Scheduler(strategy="load_aware", time_budget=0.5, max_skips=3)
+        first = SleepyAgent("first", 0.0, [])
+        outlier = SleepyAgent("outlier", 0.0, [])
+        outlier.priority = 5
+        scheduler.record_execution("first", 0.3)
+        scheduler.record_execution("outlier", 2.0)
+
+        picks = []
+        for _ in range(4):
+            picks.append([a.name for a in scheduler.select_agents([first, outlier])])
+        assert picks == [["first"]] * 3 + [["first", "outlier"]]
+
+        # The forced ticks run fast; once the estimate fits it is kept
+        for _ in range(15):
+            scheduler.record_execution("outlier", 0.1)
+        assert scheduler.get_expected_latency("outlier") < 0.2
+        selected = scheduler.select_agents([first, outlier])
+        assert [a.name for a in selected] == ["first", "outlier"]
+        assert scheduler.get_stats()["budget_skips"] == {}
+
+    def test_load_aware_budget_concurrent_wall_time(self):
+        """Test concurrent agents are budgeted by lane, not by sum"""
+        agents = [SleepyAgent(f"agent{i}", 0.0, []) for i in range(4)]
+        agents[2].tick_group = agents[3].tick_group = "pipeline"
+
+        def pick(scheduler):
+            for agent in agents:
+                scheduler.record_execution(agent.name, 0.3)
+            return sorted(a.name for a in scheduler.select_agents(agents))
+
+        sequential = Scheduler(strategy="load_aware", time_budget=0.5)
+        assert len(pick(sequential)) == 1
+
+        # Three lanes of 0.3s fit; the second pipeline member would make 0.6s
+        concurrent = Scheduler(strategy="load_aware", time_budget=0.5)
+        concurrent.set_concurrency(True)
+        selected = pick(concurrent)
+        assert selected[:2] == ["agent0", "agent1"] and len(selected) == 3
+
+        # Two ticks in flight: 0.9s of work takes at least 0.45s
+        bounded = Scheduler(strategy="load_aware", time_budget=0.5)
+        bounded.set_concurrency(True, max_concurrency=2)
+        assert len(pick(bounded)) == 3
+        bounded.set_concurrency(True, max_concurrency=1)
+        assert len(pick(bounded)) == 1
 
 
 class TestStateContext:
@@ -482,6 +658,55 @@ class TestStateContext:
         key1_history = state.get_history(key="key1")
         assert len(key1_history) == 3
 
+    def test_history_ring_buffer(self):
+        """Test history keeps the newest records, indexed by key"""
+        state = StateContext(max_history=5)
+
+        for i in range(4):
+            state.set("a", i)
+        for i in range(3):
+            state.set("b", i)
+
+        assert len(state.get_history()) == 5
+        assert [h["new_value"] for h in state.get_history("a")] == [2, 3]
+        assert [h["new_value"] for h in state.get_history("b")] == [0, 1, 2]
+
+    def test_history_disabled(self):
+        """Test max_history=0 keeps no history and never fails a write"""
+        state = StateContext(max_history=0)
+        state.set("a", 1)
+        state.update({"b": 2})
+        state.delete("a")
+
+        assert state.get("b") == 2
+        assert state.get_history() == []
+        assert state.get_history("b") == []
+
+    def test_snapshot_and_transactions(self):
+        """Test snapshot reads, buffered writes and conflict detection"""
+        state = StateContext()
+        state.set("shared", 1)
+
+        snapshot = state.snapshot()
+        first = state.transaction("first", snapshot)
+        second = state.transaction("second", snapshot)
+
+        first.set("shared", 2)
+        first.set("own", "x")
+        assert first.get("shared") == 2
+        assert second.get("shared") == 1
+        assert state.get("own") is None
+
+        second.set("shared", 3)
+        assert state.commit(first) == []
+        assert state.commit(second) == ["shared"]
+
+        assert state.get("shared") == 3
+        assert state.get("own") == "x"
+        assert snapshot.get("shared") == 1
+        assert state.snapshot().version == state.version
+        assert state.get_stats()["conflicts"] == 1
+
     def test_json_export_import(self):
         """Test JSON export/import"""
         state = StateContext()
@@ -559,6 +784,129 @@ class TestAELController:
         assert normal_agent.tick_calls >= 1
         assert error_agent.error_count >= 1
 
+    def test_concurrent_tick_mode(self):
+        """Test concurrent ticks, tick groups and deadlines"""
+        log = []
+        manager = AgentManager()
+        for agent in [
+            SleepyAgent("free1", 0.05, log),
+            SleepyAgent("free2", 0.05, log),
+            SleepyAgent("grouped1", 0.05, log, tick_group="db"),
+            SleepyAgent("grouped2", 0.05, log, tick_group="db"),
+            SleepyAgent("slow", 5.0, log)
+        ]:
+            manager.register(agent)
+        manager.get_agent("slow").tick_deadline = 0.1
+
+        controller = AELController(
+            agent_manager=manager,
+            event_bus=EventBus(),
+            state_context=StateContext(),
+            tick_mode="concurrent",
+            max_concurrency=4
+        )
+        controller._iteration = 1
+
+        start = time.perf_counter()
+        asyncio.run(controller._run_iteration())
+        elapsed = time.perf_counter() - start
+
+        # Groups serialize, everything else overlaps; slow agent is cancelled
+        assert elapsed < 0.5
+        grouped = [entry for entry in log if entry[1].startswith("grouped")]
+        assert [kind for kind, _ in grouped] == ["start", "end", "start", "end"]
+        assert ("end", "slow") not in log
+
+        telemetry = controller.get_stats()["telemetry"]
+        assert telemetry["deadline_misses"] == 1
+        assert telemetry["agents"]["slow"]["deadline_misses"] == 1
+        assert telemetry["agents"]["free1"]["p50"] >= 0.05
+
+    def test_isolated_state_iteration(self):
+        """Test agents read the iteration snapshot and writes merge at the end"""
+        seen = {}
+
+        class WriterAgent(AgentBase):
+            priority = 10
+
+            def __init__(self, name: str, value: int):
+                super().__init__()
+                self.name = name
+                self.value = value
+
+            async def on_tick(self, context: Any) -> None:
+                seen[self.name] = context.get("counter")
+                await asyncio.sleep(0.01)
+                context.set("counter", self.value)
+
+        manager = AgentManager()
+        manager.register(WriterAgent("writer1", 1))
+        manager.register(WriterAgent("writer2", 2))
+
+        state = StateContext()
+        state.set("counter", 0)
+        controller = AELController(
+            agent_manager=manager,
+            event_bus=EventBus(),
+            state_context=state,
+            tick_mode="concurrent"
+        )
+        controller._iteration = 1
+        asyncio.run(controller._run_iteration())
+
+        assert seen == {"writer1": 0, "writer2": 0}
+        assert state.get("counter") in (1, 2)
+        assert controller.get_stats()["telemetry"]["state_conflicts"] == 1
+
+    def test_isolated_state_tick_group_reads_own_writes(self):
+        """Test tick_group members see earlier members' writes in one iteration"""
+        seen = {}
+
+        class StageAgent(AgentBase):
+            priority = 10
+            tick_group = "pipeline"
+
+            def __init__(self, name: str, stage: str):
+                super().__init__()
+                self.name = name
+                self.stage = stage
+
+            async def on_tick(self, context: Any) -> None:
+                seen[self.name] = context.get("stage")
+                await asyncio.sleep(0.01)
+                context.set("stage", self.stage)
+                context.set("count", context.get("count", 0) + 1)
+
+        class FreeAgent(AgentBase):
+            priority = 10
+            name = "free"
+
+            async def on_tick(self, context: Any) -> None:
+                seen[self.name] = context.get("stage")
+
+        manager = AgentManager()
+        manager.register(StageAgent("stage_a", "a"))
+        manager.register(StageAgent("stage_b", "b"))
+        manager.register(FreeAgent())
+
+        state = StateContext()
+        events = EventBus()
+        controller = AELController(
+            agent_manager=manager,
+            event_bus=events,
+            state_context=state,
+            tick_mode="concurrent"
+        )
+        controller._iteration = 1
+        asyncio.run(controller._run_iteration())
+
+        # stage_b ticks after stage_a and reads its write; the free agent
+        # still reads the iteration snapshot
+        assert seen == {"stage_a": None, "stage_b": "a", "free": None}
+        assert state.get("stage") == "b"
+        assert state.get("count") == 2
+        assert controller.get_stats()["telemetry"]["state_conflicts"] == 0
+
     def test_controller_stats(self):
         """Test getting controller statistics"""
         controller = AELController(tick_rate=1.0)
@@ -658,6 +1006,18 @@ def run_all_tests():
     test_bus.test_event_history()
     print("✓ Event history")
 
+    test_bus.test_history_ring_eviction()
+    print("✓ History ring eviction")
+
+    test_bus.test_threaded_dispatch()
+    print("✓ Threaded dispatch")
+
+    test_bus.test_backpressure_drop_policies()
+    print("✓ Backpressure drop policies")
+
+    test_bus.test_async_dispatch()
+    print("✓ Async dispatch")
+
     # Scheduler tests
     print("\n" + "=" * 70)
     print("Running Scheduler Tests")
@@ -291,6 +291,44 @@ class TestAnomalyDetector:
         # Test passes if no exception is raised
         assert isinstance(anomalies, list)
 
+    def test_detect_timing_at_full_interval_window(self):
+        """Test timing detection once exactly TIMING_WINDOW intervals are recorded"""
+        detector = create_anomaly_detector(missing_tick_window=60.0)
+
+        tick_time = datetime.now()
+        for i in range(detector.TIMING_WINDOW + 1):
+            tick_time += timedelta(seconds=1.0 + (i % 2) * 0.1)
+            detector._update_tick_history("agent1", tick_time)
+            assert detector._detect_timing_anomalies("agent1", tick_time) == []
+
+        tick_time += timedelta(seconds=90.0)
+        detector._update_tick_history("agent1", tick_time)
+        anomalies = detector._detect_timing_anomalies("agent1", tick_time)
+
+        assert AnomalyType.MISSING_TICK in [a.anomaly_type for a in anomalies]
+
+    def test_detect_batch_matches_detect_all(self):
+        """Test batch detection gives the per-agent results"""
+        single = create_anomaly_detector()
+        batch = create_anomaly_detector()
+        agents = [f"agent{i}" for i in range(80)]
+
+        tick_time = datetime.now()
+        for tick in range(40):
+            tick_time += timedelta(seconds=1.0)
+            scores = {
+                name: 0.8 + (tick % 3) * 0.01 - (0.5 if tick == 39 and i % 2 else 0.0)
+                for i, name in enumerate(agents)
+            }
+            results = batch.detect_batch(scores, tick_time=tick_time)
+            for name in agents:
+                expected = single.detect_all(name, scores[name], tick_time)
+                assert [(a.anomaly_type, a.description) for a in results[name]] == \
+                    [(a.anomaly_type, a.description) for a in expected]
+
+        assert AnomalyType.SCORE_DROP in [a.anomaly_type for a in results["agent1"]]
+        assert results["agent0"] == []
+
     def test_detect_error_anomaly(self):
         """Test detecting high error rate"""
         detector = create_anomaly_detector(error_rate_threshold=0.1)
@@ -158,6 +158,26 @@ class TestDetectionEngine(unittest.TestCase):
         stats = self.engine.get_statistics()
         self.assertIn('total_detections', stats)
 
+    def test_detect_agent_metric_anomalies(self):
+        """Test batch agent metric anomalies match the window matrix path."""
+        agents = [f'agent{i}' for i in range(100)]
+        samples = [[10.0 + (t % 3) * 0.5, 1.0 + (t % 2) * 0.1] for t in range(20)]
+        samples.append([10.5, 9.0])
+
+        for latency, load in samples:
+            faults = self.engine.detect_faults(agent_metrics={
+                name: {'latency': latency, 'load': load} for name in agents
+            })
+
+        self.assertEqual(len(faults), len(agents))
+        self.assertEqual({f.metrics['metric'] for f in faults}, {'load'})
+        self.assertEqual(self.engine.stats['anomalies_detected'], len(agents))
+
+        windows = [[[s[0] for s in samples], [s[1] for s in samples]] for _ in agents]
+        window_faults = DetectionEngine().detect_window_anomalies(windows, agents, ['latency', 'load'])
+        self.assertEqual([(f.metrics['agent'], f.metrics['metric']) for f in window_faults],
+                         [(f.metrics['agent'], f.metrics['metric']) for f in faults])
+
 
 # ======================
 # Test Classification Engine
@@ -0,0 +1,225 @@
+"""
+Logging Manager Test Suite
+Location: tests/test_logging_manager.py
+
+Tests the buffered AsyncSink writer and FileSink rotation.
+"""
+
+import glob
+import gzip
+import os
+import re
+import shutil
+import tempfile
+import threading
+import unittest
+
+from senti_core_module.senti_llm.runtime.logging_manager import (
+    AsyncSink,
+    FileSink,
+    LogLevel,
+    LogRecord,
+    LogSink,
+    LoggingManager
+)
+
+
+class RecordingSink(LogSink):
+    """Sink that remembers records and the thread that wrote them."""
+
+    def __init__(self, gate=None):
+        self.records = []
+        self.batch_sizes = []
+        self.threads = set()
+        self.flushes = 0
+        self.closed = False
+        self.gate = gate
+
+    def write(self, record):
+        self.write_batch([record])
+
+    def write_batch(self, records):
+        if self.gate is not None:
+            self.gate.wait(5)
+        self.records.extend(records)
+        self.batch_sizes.append(len(records))
+        self.threads.add(threading.current_thread().name)
+
+    def flush(self):
+        self.flushes += 1
+
+    def close(self):
+        self.closed = True
+
+
+def _record(message):
+    return LogRecord(LogLevel.INFO, message, module_name="test")
+
+
+class TestAsyncSink(unittest.TestCase):
+    """Test the background batch writer."""
+
+    def test_threaded_writer_batches(self):
+        """Test records from many threads are written in batches off-thread."""
+        target = RecordingSink()
+        sink = AsyncSink(target, batch_size=50, flush_interval=0.05)
+
+        def producer(worker):
+            for i in range(100):
+                sink.write(_record(f"{worker}-{i}"))
+
+        threads = [threading.Thread(target=producer, args=(w,)) for w in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        sink.close()
+
+        self.assertEqual(len(target.records), 400)
+        self.assertEqual(target.threads, {"LogWriter"})
+        self.assertLess(len(target.batch_sizes), 400)
+        self.assertTrue(target.closed)
+        self.assertEqual(sink.get_stats()["written"], 400)
+
+    def test_flush_waits_for_queued_records(self):
+        """Test flush() returns only after earlier records are written."""
+        target = RecordingSink()
+        sink = AsyncSink(target, batch_size=1000, flush_interval=60)
+
+        for i in range(10):
+            sink.write(_record(str(i)))
+        self.assertEqual(target.records, [])
+
+        sink.flush()
+        self.assertEqual([r.message for r in target.records], [str(i) for i in range(10)])
+        self.assertGreaterEqual(target.flushes, 1)
+        sink.close()
+
+    def test_dropped_records_counted(self):
+        """Test a full queue drops and counts records instead of blocking."""
+        gate = threading.Event()
+        target = RecordingSink(gate=gate)
+        sink = AsyncSink(target, queue_size=5, batch_size=1, flush_interval=60)
+
+        sink.write(_record("first"))
+        # Wait until the writer is blocked inside the sink with an empty queue
+        for _ in range(500):
+            if not sink._queue:
+                break
+            threading.Event().wait(0.01)
+
+        for i in range(8):
+            sink.write(_record(str(i)))
+        self.assertEqual(sink.get_stats()["dropped"], 3)
+
+        manager = LoggingManager()
+        manager.add_sink(sink)
+        self.assertEqual(manager.get_stats()["dropped"], 3)
+
+        gate.set()
+        manager.close()
+        self.assertEqual(len(target.records), 6)
+
+        sink.write(_record("after close"))
+        self.assertEqual(sink.dropped, 4)
+
+
+class TestFileSink(unittest.TestCase):
+    """Test file rotation, compression and pruning."""
+
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.path = os.path.join(self.temp_dir, "system.log")
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def _segments(self):
+        """Rotated segments, oldest first (stamp, then sequence suffix)."""
+        def key(path):
+            match = re.fullmatch(r"(\d{8}-\d{6})(?:-(\d+))?(?:\.gz)?", path[len(self.path) + 1:])
+            return match.group(1), int(match.group(2) or 0)
+        return sorted(glob.glob(self.path + ".*"), key=key)
+
+    def test_size_rotation(self):
+        """Test segments never exceed max_bytes."""
+        sink = FileSink(self.path, max_bytes=400, backup_count=100)
+        sink.write_batch([_record(f"line {i:03d}") for i in range(30)])
+        sink.close()
+
+        segments = self._segments()
+        self.assertEqual(len(segments), sink.rotations)
+        self.assertGreater(sink.rotations, 0)
+        for path in segments + [self.path]:
+            self.assertLessEqual(os.path.getsize(path), 400)
+
+        lines = []
+        for path in segments + [self.path]:
+            with open(path, encoding="utf-8") as f:
+                lines.extend(f.read().splitlines())
+        self.assertEqual(len(lines), 30)
+        self.assertTrue(lines[0].endswith("line 000"))
+        self.assertTrue(lines[-1].endswith("line 029"))
+
+    def test_gzip_compression(self):
+        """Test rotated segments are gzipped and readable."""
+        sink = FileSink(self.path, max_bytes=200, backup_count=100, compress=True)
+        for i in range(10):
+            sink.write(_record(f"entry {i}"))
+        sink.close()
+
+        segments = self._segments()
+        self.assertTrue(segments)
+        self.assertTrue(all(path.endswith(".gz") for path in segments))
+        with gzip.open(segments[0], "rt", encoding="utf-8") as f:
+            self.assertTrue(f.readline().rstrip().endswith("entry 0"))
+
+    def test_backup_count_pruning(self):
+        """Test only the newest backup_count segments are kept."""
+        sink = FileSink(self.path, max_bytes=100, backup_count=2)
+        for i in range(10):
+            sink.write(_record(f"entry {i}"))
+        sink.close()
+
+        segments = self._segments()
+        self.assertEqual(len(segments), 2)
+        self.assertGreater(sink.rotations, 2)
+
+        # Within one second every segment shares a stamp; the survivors
+        # must still be the two newest (highest sequence numbers).
+        with open(self.path, encoding="utf-8") as f:
+            current = f.read()
+        with open(segments[-1], encoding="utf-8") as f:
+            newest = f.read()
+        self.assertIn("entry 9", current)
+        self.assertIn("entry 8", newest)
+
+    def test_prune_orders_by_name_not_mtime(self):
+        """Test pruning ignores mtimes and keeps the newest stamped segments."""
+        names = [
+            "20260101-120000",
+            "20260101-120000-2",
+            "20260101-120000-10",
+            "20260102-080000.gz"
+        ]
+        for name in names:
+            with open(f"{self.path}.{name}", "w") as f:
+                f.write(name)
+            # Oldest name gets the newest mtime
+            os.utime(f"{self.path}.{name}", (1000, 1000 - len(name)))
+        with open(f"{self.path}.notes", "w") as f:
+            f.write("not a segment")
+
+        sink = FileSink(self.path, backup_count=2)
+        sink._prune()
+
+        remaining = sorted(os.path.basename(p) for p in glob.glob(self.path + ".*"))
+        self.assertEqual(remaining, [
+            "system.log.20260101-120000-10",
+            "system.log.20260102-080000.gz",
+            "system.log.notes"
+        ])
+
+
+if __name__ == "__main__":
+    unittest.main()
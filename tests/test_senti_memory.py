@@ -0,0 +1,68 @@
+"""
+Senti Memory Module Test Suite
+Location: tests/test_senti_memory.py
+
+Tests the JSON and SQLite backends of modules/processing/senti_memory.
+"""
+
+import sqlite3
+import tempfile
+import unittest
+from pathlib import Path
+
+from modules.processing.senti_memory.senti_memory import SentiMemory
+from modules.processing.senti_memory.sqlite_store import migrate_json_store
+
+
+METADATA = {"module": "test", "timestamp": "2025-01-01T00:00:00Z"}
+
+
+class TestSentiMemorySQLite(unittest.TestCase):
+    """Test SQLite backend store/recall and JSON migration."""
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.root = Path(self.temp_dir.name)
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def test_store_recall(self):
+        """Test recall is a case-insensitive substring match ordered by priority."""
+        memory = SentiMemory(backend="sqlite", memory_root=self.root)
+        memory.store({"analysis": "Market Trend"}, "trading", METADATA)
+        memory.store({"analysis": "trend up", "steps": [1], "decision": "buy"}, "system", METADATA)
+        memory.store({"analysis": "unrelated"}, "unknown", METADATA)
+
+        results = memory.recall("TREND")["results"]
+        self.assertEqual(len(results), 2)
+        self.assertEqual(results[0]["category"], "system")
+        self.assertGreater(results[0]["priority"], results[1]["priority"])
+
+        self.assertEqual(len(memory.recall("trend", "trading")["results"]), 1)
+        self.assertEqual(memory.recall("unrel")["results"][0]["category"], "misc")
+        self.assertEqual(len(memory.recall("t")["results"]), 3)
+
+    def test_wal_mode(self):
+        """Test the database runs in WAL mode."""
+        memory = SentiMemory(backend="sqlite", memory_root=self.root)
+        conn = sqlite3.connect(str(memory.sqlite_store.db_path))
+        self.assertEqual(conn.execute("PRAGMA journal_mode").fetchone()[0], "wal")
+        conn.close()
+
+    def test_json_migration(self):
+        """Test JSON category files are imported once."""
+        legacy = SentiMemory(memory_root=self.root)
+        stored = legacy.store({"analysis": "legacy item"}, "seo", METADATA)["stored_item"]
+
+        memory = SentiMemory(backend="sqlite", memory_root=self.root)
+        results = memory.recall("legacy")["results"]
+        self.assertEqual(results, [stored])
+
+        # Already migrated: a second run imports nothing
+        self.assertEqual(migrate_json_store(self.root, memory.sqlite_store), {})
+        self.assertEqual(migrate_json_store(self.root, memory.sqlite_store, force=True), {"seo": 0})
+
+
+if __name__ == "__main__":
+    unittest.main()
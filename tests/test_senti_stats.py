@@ -0,0 +1,185 @@
+"""
+Senti Stats Test Suite
+Location: tests/test_senti_stats.py
+
+Tests the streaming statistics shared by the anomaly detectors.
+"""
+
+import random
+import statistics
+import unittest
+
+from senti_core_module.senti_stats import (
+    RunningStats,
+    EWMStats,
+    SlidingWindow,
+    P2Quantile,
+    RobustZScore,
+    score_moments,
+    score_windows
+)
+from senti_core_module.senti_stats import batch as batch_module
+from senti_core_module.senti_stats import window as window_module
+
+
+class TestRunningStats(unittest.TestCase):
+    """Test Welford accumulator."""
+
+    def setUp(self):
+        rng = random.Random(1)
+        self.values = [rng.gauss(10.0, 3.0) for _ in range(500)]
+
+    def test_matches_statistics(self):
+        """Test mean / stdev match the statistics module."""
+        stats = RunningStats.from_values(self.values)
+        self.assertAlmostEqual(stats.mean, statistics.mean(self.values))
+        self.assertAlmostEqual(stats.std(), statistics.stdev(self.values))
+        self.assertAlmostEqual(stats.std(ddof=0), statistics.pstdev(self.values))
+
+    def test_remove_and_merge(self):
+        """Test remove undoes add and merge combines partitions."""
+        stats = RunningStats.from_values(self.values)
+        for value in self.values[:200]:
+            stats.remove(value)
+        self.assertAlmostEqual(stats.std(), statistics.stdev(self.values[200:]))
+
+        merged = RunningStats.from_values(self.values[:100])
+        merged.merge(RunningStats.from_values(self.values[100:]))
+        self.assertAlmostEqual(merged.std(), statistics.stdev(self.values))
+
+    def test_ewm_tracks_level_shift(self):
+        """Test EWMA follows a level shift."""
+        ewm = EWMStats.from_span(10)
+        for value in [0.0] * 50 + [10.0] * 50:
+            ewm.add(value)
+        self.assertAlmostEqual(ewm.mean, 10.0, places=2)
+
+
+class TestSlidingWindow(unittest.TestCase):
+    """Test ring buffer window (NumPy and list backed)."""
+
+    def _check_window(self):
+        rng = random.Random(2)
+        values = [rng.uniform(0, 100) for _ in range(1000)]
+        window = SlidingWindow(50)
+        for value in values:
+            window.push(value)
+
+        self.assertEqual(len(window), 50)
+        self.assertEqual(window.values(), values[-50:])
+        self.assertEqual(window[-2], values[-2])
+        self.assertAlmostEqual(window.mean, statistics.mean(values[-50:]))
+        self.assertAlmostEqual(window.std(), statistics.stdev(values[-50:]))
+
+    def test_window_stats(self):
+        """Test window moments and indexing."""
+        self._check_window()
+
+    def test_window_without_numpy(self):
+        """Test the list-backed fallback."""
+        np = window_module.np
+        window_module.np = None
+        try:
+            self._check_window()
+        finally:
+            window_module.np = np
+
+
+class TestQuantiles(unittest.TestCase):
+    """Test P2 sketches and robust z-scores."""
+
+    def test_p2_quantiles(self):
+        """Test P2 estimates are close to exact quantiles."""
+        rng = random.Random(3)
+        values = [rng.gauss(0.0, 1.0) for _ in range(5000)]
+        median, p90 = P2Quantile(0.5), P2Quantile(0.9)
+        for value in values:
+            median.add(value)
+            p90.add(value)
+
+        self.assertAlmostEqual(median.value, statistics.median(values), delta=0.05)
+        self.assertAlmostEqual(p90.value, statistics.quantiles(values, n=10)[-1], delta=0.05)
+
+    def test_p2_small_sample_exact(self):
+        """Test the first samples give exact quantiles."""
+        sketch = P2Quantile(0.5)
+        for value in [5.0, 1.0, 3.0]:
+            sketch.add(value)
+        self.assertEqual(sketch.value, 3.0)
+
+    def test_robust_zscore_ignores_outliers(self):
+        """Test outliers do not inflate the robust scale."""
+        rng = random.Random(4)
+        robust = RobustZScore()
+        for i in range(2000):
+            robust.add(1000.0 if i % 50 == 0 else rng.gauss(0.0, 1.0))
+
+        self.assertAlmostEqual(robust.median, 0.0, delta=0.1)
+        self.assertGreater(robust.score(5.0), 3.0)
+
+
+class TestBatchScoring(unittest.TestCase):
+    """Test vectorized batch scoring (NumPy and pure-Python paths)."""
+
+    def setUp(self):
+        rng = random.Random(5)
+        # Odd agents have a shorter (NaN-padded) history
+        self.windows = [
+            [[float("nan")] * (agent % 2) * 10 +
+             [rng.gauss(0.0, 1.0) for _ in range(30 - (agent % 2) * 10)] +
+             [rng.choice([0.0, 8.0, -8.0])]
+             for _ in range(4)]
+            for agent in range(50)
+        ]
+
+    def _expected(self, include_current):
+        expected = []
+        for agent, row in enumerate(self.windows):
+            for metric, series in enumerate(row):
+                series = [x for x in series if x == x]
+                sample = series if include_current else series[:-1]
+                z = (series[-1] - statistics.mean(sample)) / statistics.stdev(sample)
+                if abs(z) > 3.0:
+                    expected.append((agent, metric))
+        return expected
+
+    @staticmethod
+    def _paths():
+        """Return the scoring paths available in this environment."""
+        return (True, False) if batch_module.np is not None else (False,)
+
+    def test_score_windows_paths_agree(self):
+        """Test both paths flag the z-score breaches."""
+        for include_current in (True, False):
+            expected = self._expected(include_current)
+            self.assertTrue(expected)
+            for use_numpy in self._paths():
+                records = score_windows(self.windows, include_current=include_current,
+                                        use_numpy=use_numpy)
+                self.assertEqual([(r.agent, r.metric) for r in records], expected)
+
+    def test_score_moments_drops_and_spikes(self):
+        """Test drop / spike flags and missing entries."""
+        values = [0.2, 0.9, 0.5, None]
+        previous = [0.8, 0.4, 0.45, 0.5]
+        for use_numpy in self._paths():
+            records = score_moments(values, [None] * 4, [None] * 4, previous,
+                                    drop_threshold=0.3, spike_threshold=0.3,
+                                    use_numpy=use_numpy)
+            self.assertEqual([(r.agent, r.kind) for r in records],
+                             [(0, batch_module.DROP), (1, batch_module.SPIKE)])
+            self.assertAlmostEqual(records[0].score, -0.6)
+
+    def test_score_without_numpy(self):
+        """Test automatic fallback when NumPy is missing."""
+        np = batch_module.np
+        batch_module.np = None
+        try:
+            records = score_windows(self.windows)
+        finally:
+            batch_module.np = np
+        self.assertEqual([(r.agent, r.metric) for r in records], self._expected(True))
+
+
+if __name__ == "__main__":
+    unittest.main()